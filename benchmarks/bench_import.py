@@ -0,0 +1,64 @@
+"""Import time benchmark for OpenTISim.
+
+Batch runs start many short-lived processes, so the time needed for ``import opentisim`` is paid for every run. This
+benchmark imports the package in fresh interpreters and reports the median wall time, both in total and on top of
+numpy and pandas (which every run needs anyway). The latter is checked against IMPORT_TIME_BUDGET. It also checks that
+none of the plotting, geo, DES and scipy analysis packages are loaded by the import.
+
+Run from the root of the repository with::
+
+    python benchmarks/bench_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+# budget in seconds for the median import time of opentisim on top of numpy and pandas
+IMPORT_TIME_BUDGET = 0.25
+
+# packages that should only be imported when the methods that need them are called
+LAZY_MODULES = ['matplotlib', 'networkx', 'simpy', 'simplekml', 'shapely', 'pyproj', 'numpy.matlib', 'scipy.stats',
+                'scipy.optimize']
+
+_IMPORT_CODE = """
+import sys, time
+{preload}
+t = time.perf_counter()
+import {module}
+print(time.perf_counter() - t)
+print(','.join(name for name in {lazy_modules!r} if name in sys.modules))
+"""
+
+
+def time_import(module='opentisim', preload=(), repeat=5):
+    """Import module in repeat fresh interpreters and return the import times and the lazy modules that were loaded"""
+
+    code = _IMPORT_CODE.format(
+        preload='\n'.join('import ' + name for name in preload), module=module, lazy_modules=LAZY_MODULES)
+
+    times = []
+    loaded = set()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.split('\n')
+        times.append(float(output[0]))
+        loaded.update(name for name in output[1].split(',') if name)
+
+    return times, sorted(loaded)
+
+
+def main(repeat=5):
+    total, loaded = time_import(repeat=repeat)
+    own, _ = time_import(preload=('numpy', 'pandas'), repeat=repeat)
+
+    print('import opentisim: {:.3f} s (median of {})'.format(statistics.median(total), repeat))
+    print('import opentisim on top of numpy and pandas: {:.3f} s (budget: {:.3f} s)'.format(
+        statistics.median(own), IMPORT_TIME_BUDGET))
+    print('lazy modules loaded by the import: {}'.format(', '.join(loaded) if loaded else 'none'))
+
+    return statistics.median(own) <= IMPORT_TIME_BUDGET and not loaded
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
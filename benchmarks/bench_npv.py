@@ -0,0 +1,17 @@
+"""Benchmark for the cash flow aggregation and NPV of a simulated terminal."""
+
+import opentisim
+
+import cases
+
+
+@cases.parametrize()
+def bench_core_npv(lifecycle, size):
+    terminal = cases.simulated_liquidbulk_terminal(lifecycle, size)
+    labour = opentisim.liquidbulk.Labour(**opentisim.liquidbulk.labour_data)
+
+    def run():
+        opentisim.core.NPV(terminal, labour)
+        return len(terminal.elements)
+
+    return run
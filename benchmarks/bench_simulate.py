@@ -0,0 +1,40 @@
+"""Benchmarks for the simulate method of each terminal type.
+
+Each benchmark builds a fresh terminal and returns the simulation to be timed, which returns the number of elements of
+the simulated terminal.
+"""
+
+import cases
+
+
+def simulation(terminal):
+    def run():
+        terminal.simulate()
+        return len(terminal.elements)
+
+    return run
+
+
+@cases.parametrize()
+def bench_containers_simulate(lifecycle, size):
+    return simulation(cases.containers_terminal(lifecycle, size))
+
+
+@cases.parametrize()
+def bench_liquidbulk_simulate(lifecycle, size):
+    return simulation(cases.liquidbulk_terminal(lifecycle, size))
+
+
+@cases.parametrize()
+def bench_export_terminal_simulate(lifecycle, size):
+    return simulation(cases.export_terminal(lifecycle, size))
+
+
+@cases.parametrize()
+def bench_end_use_location_simulate(lifecycle, size):
+    return simulation(cases.end_use_location(lifecycle, size))
+
+
+@cases.parametrize()
+def bench_drybulk_simulate(lifecycle, size):
+    return simulation(cases.drybulk_terminal(lifecycle, size))
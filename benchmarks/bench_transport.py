@@ -0,0 +1,77 @@
+"""Benchmarks for the fleet and pipe builders of transport_plots.
+
+For the fleet builders the size is the number of transport units in the last year; units are added every year, so
+each year of the lifecycle gives a cohort. The pipe builder is run on a simulated import terminal of the given size.
+"""
+
+import numpy as np
+import pandas as pd
+
+import opentisim
+from opentisim.liquidbulk import transport_plots
+
+import cases
+
+
+def fleet_terminal(lifecycle):
+    """Import terminal with only a commodity, on which the transport elements are created"""
+
+    years = list(range(cases.STARTYEAR, cases.STARTYEAR + lifecycle))
+
+    lhydrogen = opentisim.liquidbulk.Commodity(**opentisim.liquidbulk.commodity_lhydrogen_data)
+    terminal = opentisim.liquidbulk.System(
+        startyear=cases.STARTYEAR,
+        lifecycle=lifecycle,
+        elements=[lhydrogen],
+        commodity_type_defaults=opentisim.liquidbulk.commodity_lhydrogen_data)
+    terminal.modelframe = years
+    terminal.years = years
+
+    return terminal
+
+
+def fleet_development(lifecycle, size):
+    """Fleet that grows every year to size units in the last year"""
+
+    years = list(range(cases.STARTYEAR, cases.STARTYEAR + lifecycle))
+    counts = np.ceil(np.linspace(size / lifecycle, size, lifecycle)).astype(int)
+
+    return pd.DataFrame({'year': years, 'vessel count': counts})
+
+
+@cases.parametrize()
+def bench_vessel_objects(lifecycle, size):
+    terminal = fleet_terminal(lifecycle)
+    dataframe_vessel = fleet_development(lifecycle, size)
+
+    def run():
+        seaborne_transport = transport_plots.vessel_objects(
+            terminal, dataframe_vessel, opentisim.liquidbulk.largehydrogen_data, 10.5, 14)
+        return len(seaborne_transport)
+
+    return run
+
+
+@cases.parametrize()
+def bench_inland_objects(lifecycle, size):
+    terminal = fleet_terminal(lifecycle)
+    terminal.transport_sc2 = 'barge'
+    dataframe_vessel = fleet_development(lifecycle, size)
+
+    def run():
+        inland_transport = transport_plots.inland_objects(
+            terminal, dataframe_vessel, opentisim.liquidbulk.hydrogen_barge_data, 2.0, 40, 300)
+        return len(inland_transport)
+
+    return run
+
+
+@cases.parametrize()
+def bench_pipe_objects(lifecycle, size):
+    terminal = cases.simulated_liquidbulk_terminal(lifecycle, size)
+
+    def run():
+        pipe_transport = transport_plots.pipe_objects(terminal, 300, 60, 40, opentisim.liquidbulk.pipe_CGH2_data)
+        return len(pipe_transport)
+
+    return run
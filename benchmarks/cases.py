@@ -0,0 +1,206 @@
+"""Terminal cases for the OpenTISim benchmarks.
+
+Each case builder returns a terminal that is ready to be simulated for a lifecycle (in years) and a size. The size is
+the approximate number of elements the terminal holds at the end of its lifecycle: the demand grows linearly to twice
+its initial volume over the lifecycle, and the initial volumes below are chosen such that a simulated terminal ends up
+with about 10, 100 or 1000 elements. The smallest terminals hold 10 to 30 elements, because the commodity and vessel
+elements are always present.
+
+The container terminal is limited to about 300 elements: beyond 10 berths occupancy_to_waitingfactor has no waiting
+time factors, so its largest size uses the largest demand that can be simulated.
+"""
+
+import functools
+
+import pandas as pd
+
+import opentisim
+
+# lifecycles and sizes of the full benchmark matrix, and the subset that is run with --quick
+LIFECYCLES = [10, 30, 100]
+SIZES = [10, 100, 1000]
+QUICK_LIFECYCLES = [10]
+QUICK_SIZES = [10, 100]
+
+# initial demand volume [t/y or TEU/y] per terminal type and size
+VOLUMES = {
+    'containers': {10: 20_000, 100: 300_000, 1000: 1_000_000},
+    'liquidbulk': {10: 60_000, 100: 1_700_000, 1000: 19_000_000},
+    'export': {10: 60_000, 100: 1_500_000, 1000: 16_000_000},
+    'enduse': {10: 300_000, 100: 3_700_000, 1000: 37_000_000},
+    'drybulk': {10: 30_000, 100: 3_500_000, 1000: 52_000_000}}
+
+STARTYEAR = 2020
+
+
+def parametrize(lifecycles=LIFECYCLES, sizes=SIZES):
+    """Attach the lifecycles and sizes to run a benchmark function for"""
+
+    def decorator(func):
+        func.lifecycles = lifecycles
+        func.sizes = sizes
+        return func
+
+    return decorator
+
+
+def scenario_data(lifecycle, volume):
+    """Demand scenario that grows linearly from volume to twice the volume over the lifecycle"""
+
+    years = list(range(STARTYEAR, STARTYEAR + lifecycle))
+    demand = [volume * (1 + index / lifecycle) for index in range(lifecycle)]
+
+    return pd.DataFrame(data={'year': years, 'volume': demand})
+
+
+def containers_terminal(lifecycle, size):
+    """Container terminal with the vessel mix of test_containers_02"""
+
+    containers = opentisim.containers
+
+    commodity_data = dict(containers.container_data, fully_cellular_perc=0, panamax_perc=0, panamax_max_perc=0,
+                          post_panamax_I_perc=40, post_panamax_II_perc=0, new_panamax_perc=0, VLCS_perc=30,
+                          ULCS_perc=30)
+    container = containers.Commodity(**commodity_data)
+    container.scenario_data = scenario_data(lifecycle, VOLUMES['containers'][size])
+
+    vessels = [containers.Vessel(**vessel_data) for vessel_data in [
+        containers.fully_cellular_data, containers.panamax_data, containers.panamax_max_data,
+        containers.post_panamax_I_data, containers.post_panamax_II_data, containers.new_panamax_data,
+        containers.VLCS_data, containers.ULCS_data]]
+
+    terminal = containers.System(
+        startyear=STARTYEAR,
+        lifecycle=lifecycle,
+        elements=[container] + vessels,
+        operational_hours=8592,
+        crane_type_defaults=containers.sts_crane_data,
+        stack_equipment='sc',
+        laden_stack='sc')
+    terminal.modelframe = list(range(STARTYEAR, STARTYEAR + lifecycle))
+    terminal.revenues = []
+    terminal.demurrage = []
+
+    return terminal
+
+
+def hydrogen_elements(lifecycle, volume, vessels=True):
+    """Liquid hydrogen commodity (and vessels) for the liquid bulk terminal types"""
+
+    liquidbulk = opentisim.liquidbulk
+
+    commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50,
+                          historic_data=[])
+    lhydrogen = liquidbulk.Commodity(**commodity_data)
+    lhydrogen.scenario_data = scenario_data(lifecycle, volume)
+
+    elements = [lhydrogen]
+    if vessels:
+        elements += [liquidbulk.Vessel(**vessel_data) for vessel_data in [
+            liquidbulk.smallhydrogen_data, liquidbulk.largehydrogen_data, liquidbulk.smallammonia_data,
+            liquidbulk.largeammonia_data, liquidbulk.handysize_data, liquidbulk.panamax_data, liquidbulk.vlcc_data]]
+
+    return elements, commodity_data
+
+
+def liquidbulk_terminal(lifecycle, size):
+    """Liquid hydrogen import terminal with the supply chain of test_liquidbulk_02"""
+
+    liquidbulk = opentisim.liquidbulk
+
+    elements, commodity_data = hydrogen_elements(lifecycle, VOLUMES['liquidbulk'][size])
+
+    terminal = liquidbulk.System(
+        startyear=STARTYEAR,
+        lifecycle=lifecycle,
+        elements=elements,
+        operational_hours=16 * 365,
+        terminal_supply_chain={'berth_jetty', 'pipeline_jetty_-_terminal', 'storage', 'h2_retrieval'},
+        commodity_type_defaults=commodity_data,
+        storage_type_defaults=liquidbulk.storage_lh2_data,
+        h2retrieval_type_defaults=liquidbulk.h2retrieval_lh2_data,
+        allowable_dwelltime=14 / 365)
+    terminal.modelframe = list(range(STARTYEAR, STARTYEAR + lifecycle))
+    terminal.revenues = []
+    terminal.demurrage = []
+    terminal.place = 'centralized'
+
+    return terminal
+
+
+def export_terminal(lifecycle, size):
+    """Liquid hydrogen export terminal with a conversion plant"""
+
+    liquidbulk = opentisim.liquidbulk
+
+    elements, commodity_data = hydrogen_elements(lifecycle, VOLUMES['export'][size])
+
+    terminal = liquidbulk.ExportTerminal(
+        startyear=STARTYEAR,
+        lifecycle=lifecycle,
+        elements=elements,
+        operational_hours=16 * 365,
+        terminal_supply_chain={'berth_jetty', 'pipeline_jetty_-_terminal', 'storage', 'h2_conversion'},
+        commodity_type_defaults=commodity_data,
+        storage_type_defaults=liquidbulk.storage_lh2_data,
+        h2conversion_type_defaults=liquidbulk.h2conversion_lh2_data,
+        allowable_dwelltime=30 / 365)
+    terminal.modelframe = list(range(STARTYEAR, STARTYEAR + lifecycle))
+    terminal.revenues = []
+    terminal.demurrage = []
+
+    return terminal
+
+
+def end_use_location(lifecycle, size):
+    """Liquid hydrogen end use location with storage and a retrieval plant"""
+
+    liquidbulk = opentisim.liquidbulk
+
+    elements, commodity_data = hydrogen_elements(lifecycle, VOLUMES['enduse'][size], vessels=False)
+
+    terminal = liquidbulk.EndUseLocation(
+        startyear=STARTYEAR,
+        lifecycle=lifecycle,
+        elements=elements,
+        operational_hours=16 * 365,
+        terminal_supply_chain={'storage', 'h2_retrieval'},
+        commodity_type_defaults=commodity_data,
+        storage_type_defaults=liquidbulk.storage_lh2_data,
+        h2retrieval_type_defaults=liquidbulk.h2retrieval_lh2_data,
+        allowable_dwelltime=15 / 365)
+    terminal.modelframe = list(range(STARTYEAR, STARTYEAR + lifecycle))
+    terminal.revenues = []
+    terminal.demurrage = []
+    terminal.place = 'decentralized'
+
+    return terminal
+
+
+def drybulk_terminal(lifecycle, size):
+    """Agribulk terminal for maize with mobile cranes and silos"""
+
+    drybulk = opentisim.drybulk
+
+    maize = drybulk.Commodity(**dict(drybulk.maize_data, historic_data=[]))
+    maize.scenario_data = scenario_data(lifecycle, VOLUMES['drybulk'][size])
+
+    vessels = [drybulk.Vessel(**vessel_data) for vessel_data in [
+        drybulk.handysize_data, drybulk.handymax_data, drybulk.panamax_data]]
+
+    return drybulk.System(
+        startyear=STARTYEAR,
+        lifecycle=lifecycle,
+        elements=[maize] + vessels,
+        crane_type_defaults=drybulk.mobile_crane_data,
+        storage_type_defaults=drybulk.silo_data)
+
+
+@functools.lru_cache(maxsize=None)
+def simulated_liquidbulk_terminal(lifecycle, size):
+    """Simulated liquid hydrogen import terminal, shared by the benchmarks that only read from it"""
+
+    terminal = liquidbulk_terminal(lifecycle, size)
+    terminal.simulate()
+
+    return terminal
@@ -0,0 +1,163 @@
+"""Run the OpenTISim benchmark suite and keep a machine-readable history of the results.
+
+The benchmarks are the functions named bench_* in the bench_*.py modules of this directory. A benchmark function is
+called with a lifecycle and a size, sets up its case and returns a callable; only that callable is timed. It may return
+the number of elements it produced, which is stored with the timings.
+
+Every run appends one JSON record per benchmark, lifecycle and size to the history file (JSON lines), together with
+the opentisim version, the git commit and the machine it ran on. The best time of each benchmark is compared with the
+last earlier record of the same benchmark, lifecycle and size on the same machine; the run fails when it is slower by
+more than the threshold factor.
+
+Run from the root of the repository with::
+
+    python benchmarks/run.py                    # full matrix: lifecycles 10/30/100, sizes 10/100/1000
+    python benchmarks/run.py --quick            # lifecycle 10, sizes 10/100
+    python benchmarks/run.py -k liquidbulk      # only the benchmarks whose name contains 'liquidbulk'
+"""
+
+import argparse
+import contextlib
+import datetime
+import glob
+import importlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_HISTORY = os.path.join(BENCHMARK_DIR, 'results', 'history.jsonl')
+
+sys.path.insert(0, BENCHMARK_DIR)
+sys.path.insert(1, os.path.dirname(BENCHMARK_DIR))
+
+import cases  # noqa: E402
+
+
+def collect_benchmarks(keyword=None):
+    """Return (name, function) for all benchmark functions, optionally only those whose name contains keyword"""
+
+    benchmarks = []
+    for path in sorted(glob.glob(os.path.join(BENCHMARK_DIR, 'bench_*.py'))):
+        module = importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+        for attribute in sorted(dir(module)):
+            function = getattr(module, attribute)
+            if attribute.startswith('bench_') and callable(function) and hasattr(function, 'lifecycles'):
+                name = '{}.{}'.format(module.__name__, attribute)
+                if keyword is None or keyword in name:
+                    benchmarks.append((name, function))
+
+    return benchmarks
+
+
+def time_benchmark(function, lifecycle, size, repeat):
+    """Set up and time a benchmark repeat times, printed output of the model is discarded"""
+
+    times = []
+    elements = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            run = function(lifecycle=lifecycle, size=size)
+            start = time.perf_counter()
+            result = run()
+            times.append(time.perf_counter() - start)
+        if isinstance(result, int):
+            elements = result
+
+    return times, elements
+
+
+def environment():
+    """Version, commit and machine information stored with every record"""
+
+    import opentisim
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BENCHMARK_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {'version': opentisim.__version__,
+            'commit': commit,
+            'machine': platform.node(),
+            'python': platform.python_version()}
+
+
+def read_history(path):
+    if not os.path.exists(path):
+        return []
+
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_record(history, record):
+    """Return the last record in history of the same benchmark, lifecycle and size on the same machine"""
+
+    for earlier in reversed(history):
+        if all(earlier.get(key) == record[key] for key in ['benchmark', 'lifecycle', 'size', 'machine']):
+            return earlier
+
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', dest='keyword', default=None, help='only run benchmarks whose name contains this')
+    parser.add_argument('--quick', action='store_true', help='only run the quick subset of lifecycles and sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs per benchmark')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON lines file to append the results to')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown factor relative to the previous record that counts as a regression')
+    parser.add_argument('--label', default=None, help='free text label stored with the records')
+    args = parser.parse_args(argv)
+
+    history = read_history(args.history)
+    env = environment()
+    timestamp = datetime.datetime.now().isoformat(timespec='seconds')
+
+    records = []
+    regressions = []
+    for name, function in collect_benchmarks(args.keyword):
+        lifecycles = cases.QUICK_LIFECYCLES if args.quick else function.lifecycles
+        sizes = cases.QUICK_SIZES if args.quick else function.sizes
+        for lifecycle in lifecycles:
+            for size in sizes:
+                times, elements = time_benchmark(function, lifecycle, size, args.repeat)
+
+                record = dict(benchmark=name, lifecycle=lifecycle, size=size, elements=elements, times=times,
+                              min=min(times), median=statistics.median(times), timestamp=timestamp,
+                              label=args.label, **env)
+
+                earlier = previous_record(history, record)
+                ratio = record['min'] / earlier['min'] if earlier is not None and earlier['min'] > 0 else None
+                if ratio is not None and ratio > args.threshold:
+                    regressions.append((record, earlier, ratio))
+
+                print('{:<55} lifecycle {:>3}  size {:>4}  elements {:>5}  min {:8.4f} s  median {:8.4f} s{}'.format(
+                    name, lifecycle, size, elements if elements is not None else '-', record['min'],
+                    record['median'], '  ({:.2f}x previous)'.format(ratio) if ratio is not None else ''))
+
+                records.append(record)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+    with open(args.history, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+    for record, earlier, ratio in regressions:
+        print('REGRESSION {} lifecycle {} size {}: {:.4f} s is {:.2f}x {:.4f} s of commit {}'.format(
+            record['benchmark'], record['lifecycle'], record['size'], record['min'], ratio, earlier['min'],
+            earlier['commit']))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
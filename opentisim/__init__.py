@@ -6,7 +6,17 @@ import opentisim.core as core
 import opentisim.plot as plot
 import opentisim.liquidbulk as liquidbulk
 import opentisim.containers as containers
-#import opentisim.drybulk as drybulk
+
+# the drybulk terminal model is only imported when opentisim.drybulk is first accessed
+_lazy_subpackages = ['drybulk']
+
+
+def __getattr__(name):
+    if name in _lazy_subpackages:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
 
 __author__ = """Mark van Koningsveld"""
 __email__ = 'M.vanKoningsveld@tudelft.nl'
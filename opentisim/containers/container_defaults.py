@@ -713,3 +713,12 @@ indirect_costs_data = {"name": 'Indirect_Costs',
                        "miscellaneous": 0.15,
                        "electrical_works_fuel_terminal": 0.12,
                        "electrical_works_power_terminal": 0.15}
+
+
+def default_config():
+    """Return the current values of the defaults dicts of this module as a frozen opentisim.core.Config"""
+
+    import sys
+    from opentisim.core.config import Config
+
+    return Config.from_module(sys.modules[__name__])
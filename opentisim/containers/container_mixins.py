@@ -25,26 +25,28 @@
 """
 
 # package for unique identifiers
-import uuid
 
 import numpy as np
-import pandas as pd
 
-import matplotlib.pyplot as plt
+from opentisim.core.elements import new_id
+from opentisim.core.scenarios import random_growth
+
 
 
 class identifiable_properties_mixin(object):
     """Something that has a name and id
 
     name: a name
-    id: a unique id generated with uuid"""
+    id: a unique id (sequential number)"""
+
+    __slots__ = ()
 
-    def __init__(self, name=[], id=None, *args, **kwargs):
+    def __init__(self, name=(), id=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.name = name
-        # generate some id, in this case based on m
-        self.id = id if id else str(uuid.uuid1())
+        # generate a sequential id
+        self.id = id if id else new_id()
 
 
 class history_properties_mixin(object):
@@ -53,7 +55,9 @@ class history_properties_mixin(object):
     purchase_date: year in which the decision was made to add another element
     online_date: year by which the elements starts to perform"""
 
-    def __init__(self, year_purchase=[], year_online=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, year_purchase=(), year_online=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.year_purchase = year_purchase
@@ -65,7 +69,9 @@ class hascapex_properties_mixin(object):
 
     capex: list with cost to be applied from investment year"""
 
-    def __init__(self, capex=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, capex=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.capex = capex
@@ -76,8 +82,10 @@ class hasopex_properties_mixin(object):
 
     opex: list with cost to be applied from investment year"""
 
-    def __init__(self, labour=[], maintenance=[], energy=[], insurance=[],
-                 lease=[], demurrage=[], residual=[], fuel = [], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, labour=(), maintenance=(), energy=(), insurance=(),
+                 lease=(), demurrage=(), residual=(), fuel=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.labour = labour
@@ -95,7 +103,9 @@ class hasrevenue_properties_mixin(object):
 
     revenue: list with revenues to be applied from investment year"""
 
-    def __init__(self, renevue=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, renevue=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.renevue = renevue
@@ -106,7 +116,9 @@ class hasland_properties_mixin(object):
 
     land_use: list with land use to be applied from investment year"""
 
-    def __init__(self, land_use=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, land_use=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.land_use = land_use
@@ -117,13 +129,17 @@ class hastriggers_properties_mixin(object):
 
     triggers: list with revenues to be applied from investment year"""
 
-    def __init__(self, triggers=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, triggers=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.triggers = triggers
 
 
 class quay_wall_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation_min, mobilisation_perc,
                  maintenance_perc, insurance_perc, berthing_gap, freeboard, Gijt_constant, Gijt_coefficient, max_sinkage, wave_motion,
                  safety_margin, apron_width, apron_pavement, *args, **kwargs):
@@ -148,6 +164,8 @@ class quay_wall_properties_mixin(object):
 
 
 class berth_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, crane_type, max_cranes, delivery_time, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -157,6 +175,8 @@ class berth_properties_mixin(object):
 
 
 class cyclic_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, unit_rate, mobilisation_perc, maintenance_perc,
                  consumption, insurance_perc, crew, crane_type, lifting_capacity, hourly_cycles, eff_fact,
                  *args, **kwargs):
@@ -181,6 +201,8 @@ class cyclic_properties_mixin(object):
 
 
 class transport_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation,
                  maintenance_perc, insurance_perc,
                  crew, salary, utilisation, fuel_consumption, productivity, required, non_essential_moves,  *args, **kwargs):
@@ -204,6 +226,8 @@ class transport_properties_mixin(object):
 
 
 class container_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, type, teu_factor, dwell_time, peak_factor, stack_ratio, stack_occupancy,
                  width, height, length, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -220,6 +244,8 @@ class container_properties_mixin (object):
 
 
 class laden_stack_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation, maintenance_perc,
                  gross_tgs, area_factor, pavement, drainage, household, digout_margin,
                  reefer_factor, consumption, reefer_rack, reefers_present, *args, **kwargs):
@@ -243,6 +269,8 @@ class laden_stack_properties_mixin (object):
 
 
 class reefer_stack_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation, maintenance_perc,
                  gross_tgs, area_factor, pavement, drainage, household, digout_margin,
                  reefer_factor, consumption, reefer_rack, reefers_present, *args, **kwargs):
@@ -266,6 +294,8 @@ class reefer_stack_properties_mixin (object):
 
 
 class empty_stack_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation, maintenance_perc, width, height,
                  length, capacity, gross_tgs, area_factor, pavement, drainage, household, digout, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -288,6 +318,8 @@ class empty_stack_properties_mixin (object):
 
 
 class oog_stack_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation, maintenance_perc, width, height,
                  length, capacity, gross_tgs, area_factor, pavement, drainage, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -308,6 +340,8 @@ class oog_stack_properties_mixin (object):
 
 
 class stack_equipment_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation, maintenance_perc, insurance_perc, crew,
                  salary, required, fuel_consumption, power_consumption, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -328,6 +362,8 @@ class stack_equipment_properties_mixin (object):
 
 
 class gate_properties_mixin (object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation, maintenance_perc, crew,
                  salary, canopy_costs, area, staff_gates, service_gates, design_capacity, exit_inspection_time, entry_inspection_time,
                  peak_hour, peak_day, peak_factor, truck_moves, operating_days, capacity, *args, **kwargs):
@@ -358,6 +394,8 @@ class gate_properties_mixin (object):
 
 
 class empty_handler_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation,
                  maintenance_perc, crew, salary, fuel_consumption, required,  *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -376,6 +414,8 @@ class empty_handler_properties_mixin(object):
 
 
 class commodity_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, handling_fee, fully_cellular_perc, panamax_perc, panamax_max_perc, post_panamax_I_perc,
                  post_panamax_II_perc, new_panamax_perc, VLCS_perc, ULCS_perc, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -392,6 +432,8 @@ class commodity_properties_mixin(object):
 
 
 class vessel_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, delivery_time, call_size, LOA, draught, beam, max_cranes, all_turn_time,
                  mooring_time, demurrage_rate, transport_costs, all_in_transport_costs, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -411,6 +453,8 @@ class vessel_properties_mixin(object):
 
 
 class labour_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, international_salary, international_staff, local_salary, local_staff, operational_salary,
                  shift_length, annual_shifts, daily_shifts, blue_collar_salary, white_collar_salary, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -427,6 +471,8 @@ class labour_properties_mixin(object):
 
 
 class energy_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, price, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.price = price
@@ -438,31 +484,29 @@ class hasscenario_properties_mixin(object):
     historic_data: observed demand
     scenario_data: generated estimates of future demand"""
 
-    def __init__(self, historic_data=[], scenario_data=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, historic_data=(), scenario_data=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.historic_data = historic_data
         self.scenario_data = scenario_data
 
-    def scenario_random(self, startyear=2019, lifecycle=20, rate=1.02, mu=0.01, sigma=0.065):
-        """trend generated from random growth rate increments"""
-        # package(s) used for probability
+    def scenario_random(self, startyear=2019, lifecycle=20, rate=1.02, mu=0.01, sigma=0.065, seed=None):
+        """trend generated from random growth rate increments
+
+        seed: integer or numpy.random.Generator for a reproducible trend (see opentisim.core.random_growth for
+        ensembles of many trends)"""
         years = range(startyear, startyear + lifecycle)
         volume = self.historic_data[self.historic_data.year == startyear - 1].volume.item()
 
-        volumes = []
-        for year in years:
-            change = np.random.normal(mu, sigma, 1)
-            new_rate = rate + change
-            volume = volume * new_rate
-            volumes.append(np.int(volume))
-
-        scenario_data = {'year': years, 'volume': volumes}
-
-        self.scenario_data = pd.DataFrame(data=scenario_data)
+        self.scenario_data = random_growth(volume, years, 1, rate, mu, sigma, seed).scenario(0)
 
     def plot_demand(self, width=0.1, alpha=0.6, fontsize=20):
         """generate a histogram of the demand data"""
+
+        import matplotlib.pyplot as plt
+
         # generate plot
         fig, ax = plt.subplots(figsize=(20, 10))
 
@@ -493,6 +537,8 @@ class hasscenario_properties_mixin(object):
         fig.subplots_adjust(bottom=0.18)
 
 class general_services_mixin(object):
+    __slots__ = ()
+
     def __init__(self,
                  type, office, office_cost, workshop, workshop_cost, fuel_station_cost, scanning_inspection_area,
                  scanning_inspection_area_cost, lighting_mast_required, lighting_mast_cost, firefight_cost,
@@ -532,6 +578,8 @@ class general_services_mixin(object):
         self.general_consumption = general_consumption
 
 class indirect_costs_mixin(object):
+    __slots__ = ()
+
     def __init__(self, preliminaries, engineering, miscellaneous, electrical_works_fuel_terminal,
                  electrical_works_power_terminal, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -542,6 +590,8 @@ class indirect_costs_mixin(object):
         self.electrical_works_power_terminal = electrical_works_power_terminal
 
 class land_price_mixin(object):
+    __slots__ = ()
+
     def __init__(self, price, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.price = price
@@ -1,7 +1,6 @@
 # package(s) for data handling
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .container_defaults import *
 from .container_objects import *
@@ -24,8 +23,8 @@ class System:
     """
 
     def __init__(self, terminal_name='Terminal', startyear=2020, lifecycle=10, operational_hours=7500, debug=False,
-                 elements=[],
-                 crane_type_defaults=sts_crane_data,
+                 elements=None,
+                 crane_type_defaults=None,
                  stack_equipment='rs', laden_stack='rs',
                  kendall='E2/E2/n',
                  allowable_waiting_service_time_ratio_berth=0.1, allowable_berth_occupancy=0.6,
@@ -33,7 +32,7 @@ class System:
                  laden_teu_factor=1.6, reefer_teu_factor=1.75, empty_teu_factor=1.55, oog_teu_factor=1.55,
                  import_perc=0.15, export_perc=0.16, transhipment_ratio=0.69,
                  teu_factor=1.6, peak_factor=1.3,
-                 energy_price=0.17, fuel_price=1, land_price=0):
+                 energy_price=0.17, fuel_price=1, land_price=0, sink=None, config=None):
         # identity
         self.terminal_name = terminal_name
 
@@ -43,14 +42,20 @@ class System:
         self.lifecycle = lifecycle
         self.operational_hours = operational_hours
 
-        # provide intermediate outputs via print statements if debug = True
+        # log investment decisions and per-year KPIs to sink (printed to the console if debug = True)
         self.debug = debug
+        self.logger = opentisim.core.EventLogger(sink, debug=debug)
 
-        # collection of all terminal objects
-        self.elements = elements
+        # frozen copy of the defaults dicts that the methods read (see opentisim.core.config)
+        self.config = config if config is not None else default_config()
+
+        # collection of all terminal objects (a list of its own, so terminals never share their elements list)
+        self.elements = [] if elements is None else list(elements)
 
         # default values to use in case various types can be selected
-        self.crane_type_defaults = crane_type_defaults
+        if crane_type_defaults is None:
+            crane_type_defaults = self.config.sts_crane_data
+        self.crane_type_defaults = opentisim.core.freeze(crane_type_defaults)
         self.stack_equipment = stack_equipment
         self.laden_stack = laden_stack
 
@@ -137,45 +142,32 @@ class System:
             - operational objective: Annually invest in infrastructure upgrades when performance criteria are triggered
             """
             self.years.append(year)
-            if self.debug:
-                print('')
-                print('### Simulate year: {} ############################'.format(year))
+            self.logger.start_year(year)
 
             # 1. for each year estimate the anticipated vessel arrivals based on the expected demand
             fully_cellular_calls, panamax_calls, panamax_max_calls, post_panamax_I_calls, post_panamax_II_calls, \
                 new_panamax_calls, VLCS_calls, ULCS_calls, total_calls, total_vol = self.calculate_vessel_calls(year)
-            if self.debug:
-                print('--- Cargo volume and vessel calls for {} ---------'.format(year))
-                print('  Total cargo volume: {}'.format(total_vol))
-                print('  Total vessel calls: {}'.format(total_calls))
-                print('     Fully cellular calls: {}'.format(fully_cellular_calls))
-                print('     Panamax calls: {}'.format(panamax_calls))
-                print('     Panamax max calls: {}'.format(panamax_max_calls))
-                print('     Post Panamax I calls: {}'.format(post_panamax_I_calls))
-                print('     Post Panamax II calls: {}'.format(post_panamax_II_calls))
-                print('     New Panamax calls: {}'.format(new_panamax_calls))
-                print('     VLCS calls: {}'.format(VLCS_calls))
-                print('     ULCS calls: {}'.format(ULCS_calls))
-                print('----------------------------------------------------')
+            self.logger.kpi('vessel_calls', total_vol=total_vol, total_calls=total_calls,
+                            fully_cellular_calls=fully_cellular_calls, panamax_calls=panamax_calls,
+                            panamax_max_calls=panamax_max_calls, post_panamax_I_calls=post_panamax_I_calls,
+                            post_panamax_II_calls=post_panamax_II_calls, new_panamax_calls=new_panamax_calls,
+                            VLCS_calls=VLCS_calls, ULCS_calls=ULCS_calls)
 
             # self.access_channel_invest(year, fully_cellular, panamax, panamax_max, post_panamax_I, post_panamax_II, new_panamax, VLCS, ULCS)
 
             # 2. for each year evaluate which investment are needed given the strategic and operational objectives
             self.berth_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check horizontal transport (coupled with quay crane presence) -----------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check horizontal transport (coupled with quay crane presence) -----------')
             self.horizontal_transport_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check laden stack investments (coupled with demand) ----------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check laden stack investments (coupled with demand) ----------')
             self.laden_stack_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check reefer stack investments (coupled with demand) ----------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check reefer stack investments (coupled with demand) ----------')
             self.reefer_stack_invest(year)
 
             # if self.debug:
@@ -183,29 +175,24 @@ class System:
             #     print('$$$ Check laden and reefer stack investments (coupled with demand) ----------')
             # self.laden_reefer_stack_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check empty stack investments (coupled with demand) ---------------------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check empty stack investments (coupled with demand) ---------------------')
             self.empty_stack_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check oog stack investments (coupled with demand) -----------------------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check oog stack investments (coupled with demand) -----------------------')
             self.oog_stack_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check stacking equipment investment (coupled with quay crane presence) --')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check stacking equipment investment (coupled with quay crane presence) --')
             self.stack_equipment_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check empty handlers (coupled with quay crane presence) -----------------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check empty handlers (coupled with quay crane presence) -----------------')
             self.empty_handler_invest(year)
 
-            if self.debug:
-                print('')
-                print('$$$ Check gate investments (coupled with quay crane presence) ---------------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check gate investments (coupled with quay crane presence) ---------------')
             self.gate_invest(year)
 
         #     if self.debug:
@@ -228,7 +215,8 @@ class System:
         # for year in range(self.startyear, self.startyear + self.lifecycle):
         #     self.calculate_demurrage_cost(year)
 
-        # Todo: see if here a method can be implemented to estimate the revenue that is needed to get NPV = 0
+        # no revenues are booked, so the NPV of the terminal is minus its costs. opentisim.core.break_even_fee(self)
+        # gives the handling fee at which the NPV would be zero; its curve is a what-if, not the NPV of this terminal
         # 5.  for each year calculate terminal revenues
         # self.revenues = []
         # for year in range(self.startyear, self.startyear + self.lifecycle):
@@ -294,9 +282,8 @@ class System:
         """
 
         # report on the status of all berth elements
-        if self.debug:
-            print('')
-            print('--- Status terminal @ start of year ----------------')
+        if self.logger.enabled:
+            self.logger.message('--- Status terminal @ start of year ----------------')
 
         opentisim.core.report_element(self, Berth, year)
         opentisim.core.report_element(self, Quay_wall, year)
@@ -320,19 +307,17 @@ class System:
         else:
             planned_waiting_service_time_ratio_berth = np.inf
 
-        if self.debug:
+        if self.logger.enabled:
             # print('     Berth occupancy online (@ start of year): {:.2f} (trigger level: {:.2f})'.format(
             #     berth_occupancy_online, self.allowable_berth_occupancy))
             # print('     Berth occupancy planned (@ start of year): {:.2f} (trigger level: {:.2f})'.format(
             #     berth_occupancy_planned, self.allowable_berth_occupancy))
-            print(
-                '     Planned waiting time service time factor (@ start of year): {:.2f} (trigger level: {:.2f})'.format(
-                    planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth))
+            self.logger.message(
+                '     Planned waiting time service time factor (@ start of year): {:.2f} (trigger level: {:.2f})',
+                planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth)
 
-            print('')
-            print('--- Start investment analysis ----------------------')
-            print('')
-            print('$$$ Check berth elements (coupled with berth occupancy) ---------------')
+            self.logger.message('--- Start investment analysis ----------------------')
+            self.logger.message('$$$ Check berth elements (coupled with berth occupancy) ---------------')
 
         opentisim.core.report_element(self, Berth, year)
         opentisim.core.report_element(self, Quay_wall, year)
@@ -344,10 +329,10 @@ class System:
 
             # while planned waiting service time ratio is too large add a berth when no crane slots are available
             if not (self.check_crane_slot_available()):
-                if self.debug:
-                    print('  *** add Berth to elements')
+                if self.logger.enabled:
+                    self.logger.invest('Berth')
 
-                berth = Berth(**berth_data)
+                berth = Berth(**self.config.berth_data)
                 berth.year_online = year + berth.delivery_time
                 self.elements.append(berth)
 
@@ -357,35 +342,35 @@ class System:
             if berths > quay_walls:
                 # bug fixed, should only take the value of the vessels that actually come
                 Ls_max = max([
-                    int(not container_data['fully_cellular_perc'] == 0) * fully_cellular_data["LOA"],
-                    int(not container_data['panamax_perc'] == 0) * panamax_data["LOA"],
-                    int(not container_data['panamax_max_perc'] == 0) * panamax_max_data["LOA"],
-                    int(not container_data['post_panamax_I_perc'] == 0) * post_panamax_I_data["LOA"],
-                    int(not container_data['post_panamax_II_perc'] == 0) * post_panamax_II_data["LOA"],
-                    int(not container_data['new_panamax_perc'] == 0) * new_panamax_data["LOA"],
-                    int(not container_data['VLCS_perc'] == 0) * VLCS_data["LOA"],
-                    int(not container_data['ULCS_perc'] == 0) * ULCS_data["LOA"]
+                    int(not self.config.container_data['fully_cellular_perc'] == 0) * self.config.fully_cellular_data["LOA"],
+                    int(not self.config.container_data['panamax_perc'] == 0) * self.config.panamax_data["LOA"],
+                    int(not self.config.container_data['panamax_max_perc'] == 0) * self.config.panamax_max_data["LOA"],
+                    int(not self.config.container_data['post_panamax_I_perc'] == 0) * self.config.post_panamax_I_data["LOA"],
+                    int(not self.config.container_data['post_panamax_II_perc'] == 0) * self.config.post_panamax_II_data["LOA"],
+                    int(not self.config.container_data['new_panamax_perc'] == 0) * self.config.new_panamax_data["LOA"],
+                    int(not self.config.container_data['VLCS_perc'] == 0) * self.config.VLCS_data["LOA"],
+                    int(not self.config.container_data['ULCS_perc'] == 0) * self.config.ULCS_data["LOA"]
                     ])  # max size
 
                 draught = max([
-                    int(not container_data['fully_cellular_perc'] == 0) * fully_cellular_data["draught"],
-                    int(not container_data['panamax_perc'] == 0) * panamax_data["draught"],
-                    int(not container_data['panamax_max_perc'] == 0) * panamax_max_data["draught"],
-                    int(not container_data['post_panamax_I_perc'] == 0) * post_panamax_I_data["draught"],
-                    int(not container_data['post_panamax_II_perc'] == 0) * post_panamax_II_data["draught"],
-                    int(not container_data['new_panamax_perc'] == 0) * new_panamax_data["draught"],
-                    int(not container_data['VLCS_perc'] == 0) * VLCS_data["draught"],
-                    int(not container_data['ULCS_perc'] == 0) * ULCS_data["draught"]
+                    int(not self.config.container_data['fully_cellular_perc'] == 0) * self.config.fully_cellular_data["draught"],
+                    int(not self.config.container_data['panamax_perc'] == 0) * self.config.panamax_data["draught"],
+                    int(not self.config.container_data['panamax_max_perc'] == 0) * self.config.panamax_max_data["draught"],
+                    int(not self.config.container_data['post_panamax_I_perc'] == 0) * self.config.post_panamax_I_data["draught"],
+                    int(not self.config.container_data['post_panamax_II_perc'] == 0) * self.config.post_panamax_II_data["draught"],
+                    int(not self.config.container_data['new_panamax_perc'] == 0) * self.config.new_panamax_data["draught"],
+                    int(not self.config.container_data['VLCS_perc'] == 0) * self.config.VLCS_data["draught"],
+                    int(not self.config.container_data['ULCS_perc'] == 0) * self.config.ULCS_data["draught"]
                     ])  # max draught
 
-                Ls_avg = (fully_cellular_calls * fully_cellular_data["LOA"] +
-                          panamax_calls * panamax_data["LOA"] +
-                          panamax_max_calls * panamax_max_data["LOA"] +
-                          post_panamax_I_calls * post_panamax_I_data["LOA"] +
-                          post_panamax_II_calls * post_panamax_II_data["LOA"] +
-                          new_panamax_calls * new_panamax_data["LOA"] +
-                          VLCS_calls * VLCS_data["LOA"] +
-                          ULCS_calls * ULCS_data["LOA"]) / \
+                Ls_avg = (fully_cellular_calls * self.config.fully_cellular_data["LOA"] +
+                          panamax_calls * self.config.panamax_data["LOA"] +
+                          panamax_max_calls * self.config.panamax_max_data["LOA"] +
+                          post_panamax_I_calls * self.config.post_panamax_I_data["LOA"] +
+                          post_panamax_II_calls * self.config.post_panamax_II_data["LOA"] +
+                          new_panamax_calls * self.config.new_panamax_data["LOA"] +
+                          VLCS_calls * self.config.VLCS_data["LOA"] +
+                          ULCS_calls * self.config.ULCS_data["LOA"]) / \
                           (fully_cellular_calls + panamax_calls + panamax_max_calls + post_panamax_I_calls + post_panamax_II_calls + new_panamax_calls +
                           VLCS_calls + ULCS_calls)
 
@@ -395,7 +380,7 @@ class System:
                 # follows the 1.1 * Lav rule. This might give a slight overestimation (!).
 
                 # - length (apply PIANC 2014)
-                berthing_gap = quay_wall_data["berthing_gap"]
+                berthing_gap = self.config.quay_wall_data["berthing_gap"]
                 if quay_walls == 0:  # - length when next quay is n = 1
                     # Lq = Ls,max + (2 x 15) ref: PIANC 2014, p 98
                     length = Ls_max + 2 * berthing_gap
@@ -405,7 +390,7 @@ class System:
                     length = 1.1 * (Ls_avg + berthing_gap)
 
                 # - depth
-                quay_wall = Quay_wall(**quay_wall_data)
+                quay_wall = Quay_wall(**self.config.quay_wall_data)
                 depth = np.sum([draught, quay_wall.max_sinkage, quay_wall.wave_motion, quay_wall.safety_margin])
 
                 # add a quay to self.elements
@@ -422,11 +407,13 @@ class System:
                 planned_waiting_service_time_ratio_berth = opentisim.core.occupancy_to_waitingfactor(
                     utilisation=berth_occupancy_planned, nr_of_servers_to_chk=berths, kendall=self.kendall)
 
-                if self.debug:
-                    print('     Berth occupancy planned (after adding berth): {:.2f})'.format(
-                        berth_occupancy_planned))
-                    print('     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})'.format(
-                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth))
+                if self.logger.enabled:
+                    self.logger.message(
+                        '     Berth occupancy planned (after adding berth): {:.2f})',
+                        berth_occupancy_planned)
+                    self.logger.message(
+                        '     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})',
+                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth)
 
     def quay_invest(self, year, length, depth):
         """
@@ -446,10 +433,10 @@ class System:
               - quay_wall.freeboard must be high enough to accommodate largest expected vessel
         """
 
-        if self.debug:
-            print('  *** add Quay to elements')
+        if self.logger.enabled:
+            self.logger.invest('Quay')
         # add a Quay_wall element
-        quay_wall = Quay_wall(**quay_wall_data)
+        quay_wall = Quay_wall(**self.config.quay_wall_data)
 
         # add length and depth to the elements (useful for later reporting)
         quay_wall.length = length
@@ -490,8 +477,8 @@ class System:
            waiting over service time ratio
         """
 
-        if self.debug:
-            print('  *** add STS crane to elements')
+        if self.logger.enabled:
+            self.logger.invest('STS crane')
         # add unloader object
         if (self.crane_type_defaults["crane_type"] == 'Gantry crane' or
                 self.crane_type_defaults["crane_type"] == 'Harbour crane' or
@@ -509,7 +496,7 @@ class System:
         crane.maintenance = unit_rate * crane.maintenance_perc
 
         #   labour
-        labour = Labour(**labour_data)
+        labour = Labour(**self.config.labour_data)
         crane.shift = crane.crew * labour.daily_shifts
         crane.labour = crane.shift * labour.blue_collar_salary
         # Todo: check if the number of shifts (crane.shift) is modelled correctly
@@ -553,21 +540,21 @@ class System:
                 if year >= element.year_online:
                     hor_transport_online += 1
 
-        if self.debug:
-            print('     Number of STS cranes online (@start of year): {}'.format(cranes_online))
-            print('     Number of STS cranes planned (@start of year): {}'.format(cranes_planned))
-            print('     Horizontal transport online (@ start of year): {}'.format(hor_transport_online))
-            print('     Horizontal transport planned (@ start of year): {}'.format(hor_transport_planned))
+        if self.logger.enabled:
+            self.logger.message('     Number of STS cranes online (@start of year): {}', cranes_online)
+            self.logger.message('     Number of STS cranes planned (@start of year): {}', cranes_planned)
+            self.logger.message('     Horizontal transport online (@ start of year): {}', hor_transport_online)
+            self.logger.message('     Horizontal transport planned (@ start of year): {}', hor_transport_planned)
 
         # object needs to be instantiated here so that tractor.required may be determined
-        tractor = Horizontal_Transport(**tractor_trailer_data)
+        tractor = Horizontal_Transport(**self.config.tractor_trailer_data)
 
         # when the total number of online horizontal transporters < total number of transporters required by the cranes
         while cranes_planned * tractor.required > hor_transport_planned:
             # add a tractor to elements
-            if self.debug:
-                print('  *** add tractor trailer to elements')
-            tractor = Horizontal_Transport(**tractor_trailer_data)
+            if self.logger.enabled:
+                self.logger.invest('tractor trailer')
+            tractor = Horizontal_Transport(**self.config.tractor_trailer_data)
 
             # - capex
             unit_rate = tractor.unit_rate
@@ -579,7 +566,7 @@ class System:
             tractor.maintenance = unit_rate * tractor.maintenance_perc
 
             # - labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             # Todo: check if the number of shifts is calculated properly
             tractor.shift = tractor.crew * labour.daily_shifts
             tractor.labour = tractor.shift * labour.blue_collar_salary
@@ -595,9 +582,10 @@ class System:
 
             hor_transport_planned += 1
 
-            if self.debug:
-                print('     a total of {} tractor trailers is online; {} tractor trailers still pending'.format(
-                    hor_transport_online, hor_transport_planned - hor_transport_online))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} tractor trailers is online; {} tractor trailers still pending',
+                    hor_transport_online, hor_transport_planned - hor_transport_online)
 
     def laden_stack_invest(self, year):
         """current strategy is to add stacks as soon as trigger is achieved
@@ -609,27 +597,31 @@ class System:
 
         stack_capacity_planned, stack_capacity_required = self.laden_stack_capacity(year)
 
-        if self.debug:
-            print('     Laden stack capacity planned (@ start of year): {:.2f} teu'.format(stack_capacity_planned))
-            print('     Laden stack capacity required (@ start of year): {:.2f} teu'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message(
+                '     Laden stack capacity planned (@ start of year): {:.2f} teu',
+                stack_capacity_planned)
+            self.logger.message(
+                '     Laden stack capacity required (@ start of year): {:.2f} teu',
+                stack_capacity_required)
 
         # Required capacity should be ≤ Stack capacity planned.
         # While this is not the case, add stacks (PIANC (2014b), p63)
         while stack_capacity_required > stack_capacity_planned:
-            if self.debug:
-                print('  *** add laden stack to elements')
+            if self.logger.enabled:
+                self.logger.invest('laden stack')
 
-            laden = Container(**laden_container_data)
+            laden = Container(**self.config.laden_container_data)
             if self.stack_equipment == 'rtg':  # Rubber Tired Gantry Crane
-                stack = Laden_Stack(**rtg_stack_data)
+                stack = Laden_Stack(**self.config.rtg_stack_data)
             elif self.stack_equipment == 'rmg':  # Rail Mounted Gantry Crane
-                stack = Laden_Stack(**rmg_stack_data)
+                stack = Laden_Stack(**self.config.rmg_stack_data)
             elif self.stack_equipment == 'sc':  # Straddle Carrier
-                stack = Laden_Stack(**sc_stack_data)
+                stack = Laden_Stack(**self.config.sc_stack_data)
             elif self.stack_equipment == 'rs':  # Reach Stacker
-                stack = Laden_Stack(**rs_stack_data)
+                stack = Laden_Stack(**self.config.rs_stack_data)
             else:  # Rubber Tired Gantry
-                stack = Laden_Stack(**rtg_stack_data)
+                stack = Laden_Stack(**self.config.rtg_stack_data)
             stack.capacity = laden.width * laden.length * laden.height
 
             # - per stack that is added determine the land use
@@ -660,9 +652,9 @@ class System:
 
             stack_capacity_planned, stack_capacity_required = self.laden_stack_capacity(year)
 
-        if self.debug:
-            print('     Laden stack capacity planned (@ start of year): {:.2f}'.format(stack_capacity_planned))
-            print('     Laden stack capacity required (@ start of year): {:.2f}'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message('     Laden stack capacity planned (@ start of year): {:.2f}', stack_capacity_planned)
+            self.logger.message('     Laden stack capacity required (@ start of year): {:.2f}', stack_capacity_required)
 
     def laden_stack_capacity(self, year):
 
@@ -676,7 +668,7 @@ class System:
         laden_box_ts, reefer_box_ts, empty_box_ts, oog_box_ts = self.cargo_split_terminal_throughput(year)
 
         # instantiate laden, reefer and stack objects (needed to get properties)
-        laden = Container(**laden_container_data)
+        laden = Container(**self.config.laden_container_data)
 
         # calculate operational days
         operational_days = self.operational_hours / 24
@@ -700,27 +692,31 @@ class System:
 
         stack_capacity_planned, stack_capacity_required = self.reefer_stack_capacity(year)
 
-        if self.debug:
-            print('     Reefer stack capacity planned (@ start of year): {:.2f} teu'.format(stack_capacity_planned))
-            print('     Reefer stack capacity required (@ start of year): {:.2f} teu'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message(
+                '     Reefer stack capacity planned (@ start of year): {:.2f} teu',
+                stack_capacity_planned)
+            self.logger.message(
+                '     Reefer stack capacity required (@ start of year): {:.2f} teu',
+                stack_capacity_required)
 
         # Required capacity should be ≤ Stack capacity planned.
         # While this is not the case, add stacks (PIANC (2014b), p63)
         while stack_capacity_required > stack_capacity_planned:
-            if self.debug:
-                print('  *** add reefer stack to elements')
+            if self.logger.enabled:
+                self.logger.invest('reefer stack')
 
-            reefer = Container(**reefer_container_data)
+            reefer = Container(**self.config.reefer_container_data)
             if self.stack_equipment == 'rtg':  # Rubber Tired Gantry Crane
-                stack = Reefer_Stack(**rtg_stack_data)
+                stack = Reefer_Stack(**self.config.rtg_stack_data)
             elif self.stack_equipment == 'rmg':  # Rail Mounted Gantry Crane
-                stack = Reefer_Stack(**rmg_stack_data)
+                stack = Reefer_Stack(**self.config.rmg_stack_data)
             elif self.stack_equipment == 'sc':  # Straddle Carrier
-                stack = Reefer_Stack(**sc_stack_data)
+                stack = Reefer_Stack(**self.config.sc_stack_data)
             elif self.stack_equipment == 'rs':  # Reach Stacker
-                stack = Reefer_Stack(**rs_stack_data)
+                stack = Reefer_Stack(**self.config.rs_stack_data)
             else:  # Rubber Tired Gantry
-                stack = Reefer_Stack(**rtg_stack_data)
+                stack = Reefer_Stack(**self.config.rtg_stack_data)
             stack.capacity = reefer.width * reefer.length * reefer.height
 
             # - per stack that is added determine the land use
@@ -751,9 +747,11 @@ class System:
 
             stack_capacity_planned, stack_capacity_required = self.reefer_stack_capacity(year)
 
-        if self.debug:
-            print('     Reefer stack capacity planned (@ start of year): {:.2f}'.format(stack_capacity_planned))
-            print('     Reefer stack capacity required (@ start of year): {:.2f}'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message('     Reefer stack capacity planned (@ start of year): {:.2f}', stack_capacity_planned)
+            self.logger.message(
+                '     Reefer stack capacity required (@ start of year): {:.2f}',
+                stack_capacity_required)
 
     def reefer_stack_capacity(self, year):
 
@@ -767,7 +765,7 @@ class System:
         laden_box_ts, reefer_box_ts, empty_box_ts, oog_box_ts = self.cargo_split_terminal_throughput(year)
 
         # instantiate laden, reefer and stack objects (needed to get properties)
-        reefer = Container(**reefer_container_data)
+        reefer = Container(**self.config.reefer_container_data)
 
         # calculate operational days
         operational_days = self.operational_hours / 24
@@ -791,16 +789,16 @@ class System:
 
         stack_capacity_planned, stack_capacity_required = self.empty_stack_capacity(year)
 
-        if self.debug:
-            print('     Empty stack capacity planned (@ start of year): {:.2f}'.format(stack_capacity_planned))
-            print('     Empty stack capacity required (@ start of year): {:.2f}'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message('     Empty stack capacity planned (@ start of year): {:.2f}', stack_capacity_planned)
+            self.logger.message('     Empty stack capacity required (@ start of year): {:.2f}', stack_capacity_required)
 
         while stack_capacity_required > stack_capacity_planned:
-            if self.debug:
-                print('  *** add empty stack to elements')
+            if self.logger.enabled:
+                self.logger.invest('empty stack')
 
-            empty = Container(**empty_container_data)
-            stack = Empty_Stack(**empty_stack_data)
+            empty = Container(**self.config.empty_container_data)
+            stack = Empty_Stack(**self.config.empty_stack_data)
             stack.capacity = empty.width * empty.length * empty.height
 
             # - per stack that is added determine the land use
@@ -840,9 +838,9 @@ class System:
 
             stack_capacity_planned, stack_capacity_required = self.empty_stack_capacity(year)
 
-        if self.debug:
-            print('     Empty stack capacity planned (@ start of year): {:.2f}'.format(stack_capacity_planned))
-            print('     Empty stack capacity required (@ start of year): {:.2f}'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message('     Empty stack capacity planned (@ start of year): {:.2f}', stack_capacity_planned)
+            self.logger.message('     Empty stack capacity required (@ start of year): {:.2f}', stack_capacity_required)
 
     def empty_stack_capacity(self, year):
         """Calculate the stack capacity for empty containers"""
@@ -862,7 +860,7 @@ class System:
         # total positions = half of the amount that it transhipped + the full amount of what is not transhipped
 
         # instantiate laden, reefer and stack objects
-        empty = Container(**empty_container_data)
+        empty = Container(**self.config.empty_container_data)
 
         # calculate operational days
         operational_days = self.operational_hours / 24
@@ -887,16 +885,16 @@ class System:
 
         stack_capacity_planned, stack_capacity_required = self.oog_stack_capacity(year)
 
-        if self.debug:
-            print('     OOG slots planned (@ start of year): {:.2f}'.format(stack_capacity_planned))
-            print('     OOG slots required (@ start of year): {:.2f}'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message('     OOG slots planned (@ start of year): {:.2f}', stack_capacity_planned)
+            self.logger.message('     OOG slots required (@ start of year): {:.2f}', stack_capacity_required)
 
         while stack_capacity_required > stack_capacity_planned:
-            if self.debug:
-                print('  *** add OOG stack to elements')
+            if self.logger.enabled:
+                self.logger.invest('OOG stack')
 
-            oog = Container(**oog_container_data)
-            stack = OOG_Stack(**oog_stack_data)
+            oog = Container(**self.config.oog_container_data)
+            stack = OOG_Stack(**self.config.oog_stack_data)
             stack.capacity = oog.width * oog.length * oog.height
 
             # - per stack that is added determine the land use
@@ -933,9 +931,9 @@ class System:
 
             stack_capacity_planned, stack_capacity_required = self.oog_stack_capacity(year)
 
-        if self.debug:
-            print('     OOG slots planned (@ start of year): {:.2f}'.format(stack_capacity_planned))
-            print('     OOG slots required (@ start of year): {:.2f}'.format(stack_capacity_required))
+        if self.logger.enabled:
+            self.logger.message('     OOG slots planned (@ start of year): {:.2f}', stack_capacity_planned)
+            self.logger.message('     OOG slots required (@ start of year): {:.2f}', stack_capacity_required)
 
     def oog_stack_capacity(self, year):
         """Calculate the stack capacity for OOG containers"""
@@ -951,7 +949,7 @@ class System:
         laden_box_ts, reefer_box_ts, empty_box_ts, oog_box_ts = self.cargo_split_terminal_throughput(year)
 
         # instantiate laden, reefer and stack objects
-        oog = Container(**oog_container_data)
+        oog = Container(**self.config.oog_container_data)
 
         # calculate operational days
         operational_days = self.operational_hours / 24
@@ -996,16 +994,16 @@ class System:
                     stacks_online += 1
 
         if self.stack_equipment == 'rtg':
-            stack_equipment = Stack_Equipment(**rtg_data)
+            stack_equipment = Stack_Equipment(**self.config.rtg_data)
         elif self.stack_equipment == 'rmg':
-            stack_equipment = Stack_Equipment(**rmg_data)
+            stack_equipment = Stack_Equipment(**self.config.rmg_data)
         elif self.stack_equipment == 'sc':
-            stack_equipment = Stack_Equipment(**sc_data)
+            stack_equipment = Stack_Equipment(**self.config.sc_data)
         elif self.stack_equipment == 'rs':
-            stack_equipment = Stack_Equipment(**rs_data)
+            stack_equipment = Stack_Equipment(**self.config.rs_data)
 
-        if self.debug:
-            print('     Number of stack equipment online (@ start of year): {}'.format(stack_equipment_online))
+        if self.logger.enabled:
+            self.logger.message('     Number of stack equipment online (@ start of year): {}', stack_equipment_online)
 
         # the rtg, sc and rs are coupled with the STS cranes, the rmg with the stack
         if (self.stack_equipment == 'rtg' or
@@ -1018,8 +1016,8 @@ class System:
         while governing_object * stack_equipment.required > stack_equipment_planned:
 
             # add stack equipment when not enough to serve number of STS cranes
-            if self.debug:
-                print('  *** add stack equipment to elements')
+            if self.logger.enabled:
+                self.logger.invest('stack equipment')
 
             # - capex
             unit_rate = stack_equipment.unit_rate
@@ -1031,7 +1029,7 @@ class System:
             stack_equipment.maintenance = unit_rate * stack_equipment.maintenance_perc
 
             #   labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             stack_equipment.shift = stack_equipment.crew * labour.daily_shifts
             stack_equipment.labour = stack_equipment.shift * labour.blue_collar_salary
 
@@ -1051,9 +1049,10 @@ class System:
             # add one to planned stack equipment (important for while loop)
             stack_equipment_planned += 1
 
-            if self.debug:
-                print('     a total of {} stack equipment is online; {} stack equipment still pending'.format(
-                    stack_equipment_online, stack_equipment_planned - stack_equipment_online))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} stack equipment is online; {} stack equipment still pending',
+                    stack_equipment_online, stack_equipment_planned - stack_equipment_online)
 
     def empty_handler_invest(self, year):
         """current strategy is to add empty hanlders as soon as a service trigger is achieved
@@ -1072,15 +1071,15 @@ class System:
                 if year >= element.year_online:
                     empty_handlers_online += 1
 
-        if self.debug:
-            print('     Empty handlers planned (@ start of year): {}'.format(empty_handlers_planned))
+        if self.logger.enabled:
+            self.logger.message('     Empty handlers planned (@ start of year): {}', empty_handlers_planned)
 
         # object needs to be instantiated here so that empty_handler.required may be determined
-        empty_handler = Empty_Handler(**empty_handler_data)
+        empty_handler = Empty_Handler(**self.config.empty_handler_data)
         while sts_cranes_planned * empty_handler.required > empty_handlers_planned:
             # add a tractor when not enough to serve number of STS cranes
-            if self.debug:
-                print('  *** add empty handler to elements')
+            if self.logger.enabled:
+                self.logger.invest('empty handler')
 
             # - capex
             unit_rate = empty_handler.unit_rate
@@ -1091,7 +1090,7 @@ class System:
             empty_handler.maintenance = unit_rate * empty_handler.maintenance_perc
 
             #   labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             empty_handler.shift = empty_handler.crew * labour.daily_shifts
             empty_handler.labour = empty_handler.shift * labour.blue_collar_salary
 
@@ -1110,9 +1109,10 @@ class System:
 
             empty_handlers_planned += 1
 
-            if self.debug:
-                print('     a total of {} empty handlers is online; {} empty handlers still pending'.format(
-                    empty_handlers_online, empty_handlers_planned - empty_handlers_online))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} empty handlers is online; {} empty handlers still pending',
+                    empty_handlers_online, empty_handlers_planned - empty_handlers_online)
 
     def gate_invest(self, year):
         """current strategy is to add gates as soon as trigger is achieved
@@ -1136,7 +1136,7 @@ class System:
         import_box_moves = import_teu / self.teu_factor
         export_box_moves = export_teu / self.teu_factor
 
-        gate = Gate(**gate_data)
+        gate = Gate(**self.config.gate_data)
 
         # operational weeks per year
         weeks_year = self.operational_hours/(gate.operating_days*24)
@@ -1154,12 +1154,11 @@ class System:
         # calculate exit gate minutes
         exit_gate_minutes_required = import_box_moves * (gate.truck_moves / weeks_year) *\
             gate.peak_factor * gate.peak_day * gate.peak_hour * gate.exit_inspection_time * gate.design_capacity
-        print('exit_gate_minutes_required {:.2f}'.format(exit_gate_minutes_required))
         while exit_gate_minutes_required > exit_gate_minutes_planned:
-            if self.debug:
-                print('  *** add exit gate to elements')
+            if self.logger.enabled:
+                self.logger.invest('exit gate')
 
-            gate = Gate(**gate_data)
+            gate = Gate(**self.config.gate_data)
             gate.type = 'exit'
 
             # - land use
@@ -1175,7 +1174,7 @@ class System:
             gate.maintenance = unit_rate * gate.maintenance_perc
 
             #   labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             gate.shift = gate.crew * labour.daily_shifts
             gate.labour = gate.shift * labour.blue_collar_salary
 
@@ -1190,18 +1189,16 @@ class System:
             self.elements.append(gate)
 
             exit_gate_minutes_planned += gate.capacity
-        print('exit_gate_minutes_planned {:.2f}'.format(exit_gate_minutes_planned))
-        print('')
+        self.logger.kpi('exit_gate_minutes', required=exit_gate_minutes_required, planned=exit_gate_minutes_planned)
 
         # calculate entry gate minutes
         entry_gate_minutes_required = export_box_moves * (gate.truck_moves / weeks_year) *  \
             gate.peak_factor * gate.peak_day * gate.peak_hour * gate.entry_inspection_time * gate.design_capacity
-        print('entry_gate_minutes_required {:.2f}'.format(entry_gate_minutes_required))
         while entry_gate_minutes_required > entry_gate_minutes_planned:
-            if self.debug:
-                print('  *** add entry gate to elements')
+            if self.logger.enabled:
+                self.logger.invest('entry gate')
 
-            gate = Gate(**gate_data)
+            gate = Gate(**self.config.gate_data)
             gate.type = 'entry'
 
             # - land use
@@ -1217,7 +1214,7 @@ class System:
             gate.maintenance = unit_rate * gate.maintenance_perc
 
             #   labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             gate.shift = gate.crew * labour.daily_shifts
             gate.labour = gate.shift * labour.blue_collar_salary
 
@@ -1232,7 +1229,7 @@ class System:
             self.elements.append(gate)
 
             entry_gate_minutes_planned += gate.capacity
-        print('entry_gate_minutes_planned {:.2f}'.format(entry_gate_minutes_planned))
+        self.logger.kpi('entry_gate_minutes', required=entry_gate_minutes_required, planned=entry_gate_minutes_planned)
 
     def general_services_invest(self, year):
 
@@ -1249,7 +1246,7 @@ class System:
                 if year >= element.year_online:
                     general += 1
 
-        general = General_Services(**general_services_data)
+        general = General_Services(**self.config.general_services_data)
 
         quay_land_use = 0
         stack_land_use = 0
@@ -1280,8 +1277,8 @@ class System:
 
         if year == (self.startyear + 1):
             # add general services as soon as berth  is online
-            if self.debug:
-                print('  *** add general services to elements')
+            if self.logger.enabled:
+                self.logger.invest('general services')
 
             # land use
             general.land_use = general.office + general.workshop + general.scanning_inspection_area \
@@ -1378,7 +1375,7 @@ class System:
                 element.df.loc[element.df['year'] == year, 'energy'] = 0
 
         # Calculate general power use
-        general = General_Services(**general_services_data)
+        general = General_Services(**self.config.general_services_data)
 
         # - lighting
         quay_land_use = 0
@@ -1423,10 +1420,10 @@ class System:
     def calculate_general_labour_cost(self, year):
         """General labour"""
 
-        general = General_Services(**general_services_data)
+        general = General_Services(**self.config.general_services_data)
         laden_teu, reefer_teu, empty_teu, oog_teu = self.throughput_characteristics(year)
         throughput = laden_teu + reefer_teu + oog_teu + empty_teu
-        labour = Labour(**labour_data)
+        labour = Labour(**self.config.labour_data)
 
         cranes = 0
         for element in self.elements:
@@ -1548,7 +1545,7 @@ class System:
 
         # Find the demurrage cost per type of vessel
         if service_rate != 0:
-            fully_cellular = Vessel(**fully_cellular_data)
+            fully_cellular = Vessel(**self.config.fully_cellular_data)
             service_time_fully_cellular = fully_cellular.call_size / service_rate
             waiting_time_hours_fully_cellular = waiting_factor * service_time_fully_cellular
             port_time_fully_cellular = waiting_time_hours_fully_cellular + service_time_fully_cellular + fully_cellular.mooring_time
@@ -1556,7 +1553,7 @@ class System:
             demurrage_time_fully_cellular = penalty_time_fully_cellular * fully_cellular_calls
             demurrage_cost_fully_cellular = demurrage_time_fully_cellular * fully_cellular.demurrage_rate
 
-            panamax = Vessel(**panamax_data)
+            panamax = Vessel(**self.config.panamax_data)
             service_time_panamax = panamax.call_size / service_rate
             waiting_time_hours_panamax = waiting_factor * service_time_panamax
             port_time_panamax = waiting_time_hours_panamax + service_time_panamax + panamax.mooring_time
@@ -1564,7 +1561,7 @@ class System:
             demurrage_time_panamax = penalty_time_panamax * panamax_calls
             demurrage_cost_panamax = demurrage_time_panamax * panamax.demurrage_rate
 
-            panamax_max = Vessel(**panamax_max_data)
+            panamax_max = Vessel(**self.config.panamax_max_data)
             service_time_panamax_max = panamax_max.call_size / service_rate
             waiting_time_hours_panamax_max = waiting_factor * service_time_panamax_max
             port_time_panamax_max = waiting_time_hours_panamax_max + service_time_panamax_max + panamax_max.mooring_time
@@ -1572,7 +1569,7 @@ class System:
             demurrage_time_panamax_max = penalty_time_panamax_max * panamax_max_calls
             demurrage_cost_panamax_max = demurrage_time_panamax_max * panamax_max.demurrage_rate
 
-            post_panamax_I = Vessel(**post_panamax_I_data)
+            post_panamax_I = Vessel(**self.config.post_panamax_I_data)
             service_time_post_panamax_I = post_panamax_I.call_size / service_rate
             waiting_time_hours_post_panamax_I = waiting_factor * service_time_post_panamax_I
             port_time_post_panamax_I = waiting_time_hours_post_panamax_I + service_time_post_panamax_I + post_panamax_I.mooring_time
@@ -1580,7 +1577,7 @@ class System:
             demurrage_time_post_panamax_I = penalty_time_post_panamax_I * post_panamax_I_calls
             demurrage_cost_post_panamax_I = demurrage_time_post_panamax_I * post_panamax_I.demurrage_rate
 
-            post_panamax_II = Vessel(**post_panamax_II_data)
+            post_panamax_II = Vessel(**self.config.post_panamax_II_data)
             service_time_post_panamax_II = post_panamax_II.call_size / service_rate
             waiting_time_hours_post_panamax_II = waiting_factor * service_time_post_panamax_II
             port_time_post_panamax_II = waiting_time_hours_post_panamax_II + service_time_post_panamax_II + post_panamax_II.mooring_time
@@ -1588,7 +1585,7 @@ class System:
             demurrage_time_post_panamax_II = penalty_time_post_panamax_II * post_panamax_II_calls
             demurrage_cost_post_panamax_II = demurrage_time_post_panamax_II * post_panamax_II.demurrage_rate
 
-            new_panamax = Vessel(**new_panamax_data)
+            new_panamax = Vessel(**self.config.new_panamax_data)
             service_time_new_panamax = new_panamax.call_size / service_rate
             waiting_time_hours_new_panamax = waiting_factor * service_time_new_panamax
             port_time_new_panamax = waiting_time_hours_new_panamax + service_time_new_panamax + new_panamax.mooring_time
@@ -1596,7 +1593,7 @@ class System:
             demurrage_time_new_panamax = penalty_time_new_panamax * new_panamax_calls
             demurrage_cost_new_panamax = demurrage_time_new_panamax * new_panamax.demurrage_rate
 
-            VLCS = Vessel(**VLCS_data)
+            VLCS = Vessel(**self.config.VLCS_data)
             service_time_VLCS = VLCS.call_size / service_rate
             waiting_time_hours_VLCS = waiting_factor * service_time_VLCS
             port_time_VLCS = waiting_time_hours_VLCS + service_time_VLCS + VLCS.mooring_time
@@ -1604,7 +1601,7 @@ class System:
             demurrage_time_VLCS = penalty_time_VLCS * VLCS_calls
             demurrage_cost_VLCS = demurrage_time_VLCS * VLCS.demurrage_rate
 
-            ULCS = Vessel(**ULCS_data)
+            ULCS = Vessel(**self.config.ULCS_data)
             service_time_ULCS = ULCS.call_size / service_rate
             waiting_time_hours_ULCS = waiting_factor * service_time_ULCS
             port_time_ULCS = waiting_time_hours_ULCS + service_time_ULCS + ULCS.mooring_time
@@ -1631,10 +1628,10 @@ class System:
     def calculate_indirect_costs(self):
         """Indirect costs are a function of overall CAPEX."""
         # Todo: check why this is not done per year
-        indirect = Indirect_Costs(**indirect_costs_data)
+        indirect = Indirect_Costs(**self.config.indirect_costs_data)
 
         # collect CAPEX from terminal elements
-        cash_flows, cash_flows_WACC_real =opentisim.core.add_cashflow_elements(self, Labour(**labour_data))
+        cash_flows, cash_flows_WACC_real =opentisim.core.add_cashflow_elements(self, Labour(**self.config.labour_data))
         capex = cash_flows['capex'].values
 
         # add indirect costs for different stack equipment:
@@ -1648,7 +1645,7 @@ class System:
         engineering = indirect.engineering * capex
 
         indirect_costs = capex + electrical_works + miscellaneous + preliminaries + engineering
-        print(indirect_costs)
+        self.logger.message('     Indirect costs: {}', indirect_costs)
 
         cash_flows['capex'].values = indirect_costs
 
@@ -1752,21 +1749,21 @@ class System:
 
             # time at berth per vessel type
             time_mooring_unmooring_fully_cellular = fully_cellular_calls * \
-                fully_cellular_data["mooring_time"]
+                self.config.fully_cellular_data["mooring_time"]
             time_mooring_unmooring_panamax = panamax_calls * \
-                panamax_data["mooring_time"]
+                self.config.panamax_data["mooring_time"]
             time_mooring_unmooring_panamax_max = panamax_max_calls * \
-                panamax_max_data["mooring_time"]
+                self.config.panamax_max_data["mooring_time"]
             time_mooring_unmooring_post_panamax_I = post_panamax_I_calls * \
-                post_panamax_I_data["mooring_time"]
+                self.config.post_panamax_I_data["mooring_time"]
             time_mooring_unmooring_post_panamax_II = post_panamax_II_calls * \
-                post_panamax_II_data["mooring_time"]
+                self.config.post_panamax_II_data["mooring_time"]
             time_mooring_unmooring_new_panamax = new_panamax_calls * \
-                new_panamax_data["mooring_time"]
+                self.config.new_panamax_data["mooring_time"]
             time_mooring_unmooring_VLCS = VLCS_calls * \
-                VLCS_data["mooring_time"]
+                self.config.VLCS_data["mooring_time"]
             time_mooring_unmooring_ULCS = ULCS_calls * \
-                ULCS_data["mooring_time"]
+                self.config.ULCS_data["mooring_time"]
 
             # total time at berth
             total_time_mooring_unmooring_planned = np.sum(
@@ -1796,21 +1793,21 @@ class System:
             if service_rate_online != 0:  # when some cranes are actually online
 
                 time_at_cranes_online_fully_cellular = fully_cellular_calls * \
-                    (fully_cellular_data["call_size"] / service_rate_online)
+                    (self.config.fully_cellular_data["call_size"] / service_rate_online)
                 time_at_cranes_online_panamax = panamax_calls * \
-                    (panamax_data["call_size"] / service_rate_online)
+                    (self.config.panamax_data["call_size"] / service_rate_online)
                 time_at_cranes_online_panamax_max = panamax_max_calls * \
-                    (panamax_max_data["call_size"] / service_rate_online)
+                    (self.config.panamax_max_data["call_size"] / service_rate_online)
                 time_at_cranes_online_post_panamax_I = post_panamax_I_calls * \
-                    (post_panamax_I_data["call_size"] / service_rate_online)
+                    (self.config.post_panamax_I_data["call_size"] / service_rate_online)
                 time_at_cranes_online_post_panamax_II = post_panamax_II_calls * \
-                    (post_panamax_II_data["call_size"] / service_rate_online)
+                    (self.config.post_panamax_II_data["call_size"] / service_rate_online)
                 time_at_cranes_online_new_panamax = new_panamax_calls * \
-                    (new_panamax_data["call_size"] / service_rate_online)
+                    (self.config.new_panamax_data["call_size"] / service_rate_online)
                 time_at_cranes_online_VLCS = VLCS_calls * \
-                    (VLCS_data["call_size"] / service_rate_online)
+                    (self.config.VLCS_data["call_size"] / service_rate_online)
                 time_at_cranes_online_ULCS = ULCS_calls * \
-                    (ULCS_data["call_size"] / service_rate_online)
+                    (self.config.ULCS_data["call_size"] / service_rate_online)
 
                 total_time_at_berth_online = np.sum(
                     [time_mooring_unmooring_fully_cellular + time_at_cranes_online_fully_cellular,
@@ -1849,6 +1846,17 @@ class System:
 
         return berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online
 
+    def berth_occupancies(self, year):
+        """Return the planned and online berth and crane occupancy in year as a dict"""
+
+        # the vessel calls per vessel type, without the totals
+        calls = self.calculate_vessel_calls(year)[:8]
+        occupancies = self.calculate_berth_occupancy(year, *calls)
+        names = ['berth_occupancy_planned', 'berth_occupancy_online', 'crane_occupancy_planned',
+                 'crane_occupancy_online']
+
+        return dict(zip(names, occupancies))
+
     def check_crane_slot_available(self):
         # find number of available crane slots
         list_of_elements =opentisim.core.find_elements(self, Berth)
@@ -1898,6 +1906,13 @@ class System:
 
         return throughput_online
 
+    def throughput_timeline(self):
+        """Return the online throughput for each year in self.years as an array (cached, see
+        opentisim.core.throughput_timeline)"""
+
+        return opentisim.core.throughput_timeline(self, self.calculate_throughput,
+                                                  key=opentisim.core.scenario_key(self))
+
     def cargo_split_quay_throughput(self, year):
         # Calculate the cargo split over the quay
         commodities =opentisim.core.find_elements(self, Commodity)
@@ -2007,24 +2022,24 @@ class System:
         sts_moves = throughput_box
 
         # calculate the number of tractor moves
-        tractor = Horizontal_Transport(**tractor_trailer_data)
+        tractor = Horizontal_Transport(**self.config.tractor_trailer_data)
         tractor_moves = throughput_box * tractor.non_essential_moves
 
         # calculate the number of empty moves
-        empty = Empty_Stack(**empty_stack_data)
+        empty = Empty_Stack(**self.config.empty_stack_data)
         empty_moves = empty_box * empty.household * empty.digout
 
         # Todo: wellicht reefer and laden nog scheiden van elkaar in alles
 
         # calculate laden and reefer stack moves
         if self.laden_stack == 'rtg':  # Rubber Tired Gantry crane
-            stack = Laden_Stack(**rtg_stack_data)
+            stack = Laden_Stack(**self.config.rtg_stack_data)
         elif self.laden_stack == 'rmg':  # Rail Mounted Gantry crane
-            stack = Laden_Stack(**rmg_stack_data)
+            stack = Laden_Stack(**self.config.rmg_stack_data)
         elif self.laden_stack == 'sc':  # Straddle Carrier
-            stack = Laden_Stack(**sc_stack_data)
+            stack = Laden_Stack(**self.config.sc_stack_data)
         elif self.laden_stack == 'rs':  # Reach Stacker
-            stack = Laden_Stack(**rs_stack_data)
+            stack = Laden_Stack(**self.config.rs_stack_data)
 
         # The number of moves per laden box moves for transhipment (t/s)
         moves_t_s = 0.5 * ((2 + stack.household) * stack.digout_margin)
@@ -2091,6 +2106,9 @@ class System:
     # *** Plotting functions
     def terminal_elements_plot(self, width=0.08, alpha=0.6, fontsize=20, demand_step=50_000):
         """Gather data from Terminal and plot which elements come online when"""
+
+        import matplotlib.pyplot as plt
+
         years = []
         berths = []
         quays = []
@@ -2231,6 +2249,8 @@ class System:
     def land_use_plot(self, width=0.25, alpha=0.6, fontsize=20):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # get land use
         years = []
         quay_land_use = []
@@ -2322,6 +2342,8 @@ class System:
     def terminal_capacity_plot(self, width=0.25, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # get crane service capacity and storage capacity
         years = []
         cranes = []
@@ -2378,6 +2400,8 @@ class System:
     def laden_stack_area_plot(self, width=0.25, alpha=0.6):
         """Gather data from laden stack area and plot it against demand"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = []
         area = []
@@ -2430,6 +2454,8 @@ class System:
     def opex_plot(self, cash_flows):
         """Gather data from Terminal elements and combine into a cash flow plot"""
 
+        import matplotlib.pyplot as plt
+
         # prepare years, revenue, capex and opex for plotting
         years = cash_flows['year'].values
         insurance = cash_flows['insurance'].values
@@ -2438,7 +2464,6 @@ class System:
         labour = cash_flows['labour'].values
         fuel = cash_flows['fuel'].values
         # demurrage = cash_flows['demurrage'].values
-        print(cash_flows)
 
         # generate plot
         fig, ax = plt.subplots(figsize=(14, 5))
@@ -1,14 +1,83 @@
 """Core of the simulation Package."""
 
-from .core import report_element, find_elements, add_cashflow_data_to_element, add_cashflow_elements, NPV, WACC_nominal, WACC_real, occupancy_to_waitingfactor
+from .core import report_element, find_elements, scenario_key, throughput_timeline, add_cashflow_data_to_element, add_cashflow_elements, aggregate_cashflows, discount_cashflows, NPV, WACC_nominal, WACC_real, occupancy_to_waitingfactor
+from .profiling import Profiler
+from .persistence import save_results, load_results, collect_results, Results
+from .snapshot import snapshot, restore, TerminalSnapshot
+from .cache import ResultCache, terminal_key
+from .config import Config, FrozenDict, freeze
+from .elements import element_type, element_attributes, new_id
+from .scenarios import DemandEnsemble, random_growth, geometric_brownian, regime_switching, bootstrap_history
+from .ensemble import run_ensemble, EnsembleResult, element_counts
+from .evaluation import Evaluator, get_parameter, set_parameter, terminal_npv
+from .sensitivity import morris, sobol, morris_trajectories, saltelli_design
+from .breakeven import break_even_fee, discounted_throughput
+from .optimization import optimize_triggers, cost_per_unit, OptimizationResult
+from .scenario_tree import ScenarioNode, ScenarioTreeResult, run_scenario_tree, tree_from_scenarios
+from .berth_simulation import simulate_berths, compare_waiting_factors, BerthSimulationResult
+from .events import Event, EventLogger, NullSink, ListSink, JsonLinesSink, ConsoleSink
 
 __all__ = [
     "report_element",
     "find_elements",
+    "scenario_key",
+    "throughput_timeline",
     "add_cashflow_data_to_element",
     "add_cashflow_elements",
+    "aggregate_cashflows",
+    "discount_cashflows",
     "NPV",
     "WACC_nominal",
     "WACC_real",
     "occupancy_to_waitingfactor",
+    "Profiler",
+    "save_results",
+    "load_results",
+    "collect_results",
+    "Results",
+    "snapshot",
+    "restore",
+    "TerminalSnapshot",
+    "ResultCache",
+    "terminal_key",
+    "Config",
+    "FrozenDict",
+    "freeze",
+    "element_type",
+    "element_attributes",
+    "new_id",
+    "DemandEnsemble",
+    "random_growth",
+    "geometric_brownian",
+    "regime_switching",
+    "bootstrap_history",
+    "run_ensemble",
+    "EnsembleResult",
+    "element_counts",
+    "Evaluator",
+    "get_parameter",
+    "set_parameter",
+    "terminal_npv",
+    "morris",
+    "sobol",
+    "morris_trajectories",
+    "saltelli_design",
+    "break_even_fee",
+    "discounted_throughput",
+    "optimize_triggers",
+    "cost_per_unit",
+    "OptimizationResult",
+    "ScenarioNode",
+    "ScenarioTreeResult",
+    "run_scenario_tree",
+    "tree_from_scenarios",
+    "simulate_berths",
+    "compare_waiting_factors",
+    "BerthSimulationResult",
+    "Event",
+    "EventLogger",
+    "NullSink",
+    "ListSink",
+    "JsonLinesSink",
+    "ConsoleSink",
 ]
@@ -0,0 +1,210 @@
+"""Discrete-event simulation of vessels at berths (or jetties), to check the queueing tables.
+
+The investment decisions estimate the waiting time of vessels with occupancy_to_waitingfactor: the waiting time as a
+factor of the service time, interpolated in the tables of Groenveld (2007) for E2/E2/n and M/E2/n queues. In
+simulate_berths the vessel calls of a year arrive at n berths and wait for a free berth, in a simpy model:
+
+    result = opentisim.core.simulate_berths(calls={'Handysize': 120, 'Panamax': 60},
+                                            service_times={'Handysize': 20, 'Panamax': 45},
+                                            berths=2, operational_hours=5840, replications=50, seed=1)
+    result.waiting_time_percentiles(), result.compare()
+
+The interarrival and service times follow the Kendall notation of the table (M: exponential, Ek: Erlang-k, D:
+deterministic). All random numbers of a batch of replications are drawn at once from a numpy Generator, so a seed
+gives the same waiting times. compare_waiting_factors runs the model over a grid of occupancies and numbers of
+berths next to the table values, e.g. to check the investment timing at a high occupancy.
+
+simpy is an optional dependency (the simulation extra): it is only imported when a simulation is run.
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+
+def _import_simpy():
+    try:
+        import simpy
+    except ImportError:
+        raise ImportError('the berth simulation requires simpy, install it with pip install opentisim[simulation]')
+    return simpy
+
+
+def _distribution(symbol):
+    """Return the Erlang shape of a Kendall symbol (M: 1, Ek: k) or None for deterministic times (D)"""
+
+    if symbol == 'M':
+        return 1
+    elif symbol == 'D':
+        return None
+    elif symbol.startswith('E') and symbol[1:].isdigit():
+        return int(symbol[1:])
+    raise ValueError('can not interpret {!r}, use M, D or Ek (e.g. E2)'.format(symbol))
+
+
+def _draw(rng, shape, means):
+    """Draw times with the given means (an array) from an Erlang distribution with shape (None: deterministic)"""
+
+    means = np.asarray(means, dtype=float)
+    if shape is None:
+        return means.copy()
+    return rng.gamma(shape, means / shape)
+
+
+def _replication(simpy, interarrival_times, service_times, berths):
+    """Simulate one replication, return the waiting time of each vessel [hours]"""
+
+    env = simpy.Environment()
+    quay = simpy.Resource(env, capacity=berths)
+    waiting_times = np.empty(len(service_times))
+
+    def vessel(call, service_time):
+        arrival = env.now
+        with quay.request() as request:
+            yield request
+            waiting_times[call] = env.now - arrival
+            yield env.timeout(service_time)
+
+    def arrivals():
+        for call, (interarrival_time, service_time) in enumerate(zip(interarrival_times, service_times)):
+            yield env.timeout(interarrival_time)
+            env.process(vessel(call, service_time))
+
+    env.process(arrivals())
+    env.run()
+
+    return waiting_times
+
+
+class BerthSimulationResult(object):
+    """Waiting times of the vessel calls in a batch of replications
+
+    waiting_times: array of replications x calls with the waiting time of each call [hours]
+    service_times: array of replications x calls with the service time of each call [hours]
+    vessel_types: the vessel type of each call (replications x calls)
+    occupancy: the berth occupancy (total service time / (berths * operational hours))
+    berths: the number of berths
+    kendall: the queue type, e.g. 'E2/E2/n'"""
+
+    def __init__(self, waiting_times, service_times, vessel_types, occupancy, berths, kendall):
+        self.waiting_times = waiting_times
+        self.service_times = service_times
+        self.vessel_types = vessel_types
+        self.occupancy = occupancy
+        self.berths = berths
+        self.kendall = kendall
+
+    @property
+    def replications(self):
+        return self.waiting_times.shape[0]
+
+    def waiting_factors(self):
+        """Return the waiting factor of each replication (mean waiting time / mean service time)"""
+
+        return self.waiting_times.mean(axis=1) / self.service_times.mean(axis=1)
+
+    def waiting_factor(self, confidence=0.95):
+        """Return the mean waiting factor over the replications and the half width of its confidence interval"""
+
+        from scipy import stats
+
+        factors = self.waiting_factors()
+        if len(factors) < 2:
+            return float(factors.mean()), np.nan
+        half_width = stats.t.ppf(0.5 + confidence / 2, len(factors) - 1) * factors.std(ddof=1) / np.sqrt(len(factors))
+
+        return float(factors.mean()), float(half_width)
+
+    def waiting_time_percentiles(self, q=(50, 90, 95, 99)):
+        """Return the percentiles q of the waiting time [hours] per vessel type and of all calls, as a dataframe"""
+
+        rows = {'all': np.percentile(self.waiting_times, q)}
+        for vessel_type in pd.unique(self.vessel_types.ravel()):
+            rows[vessel_type] = np.percentile(self.waiting_times[self.vessel_types == vessel_type], q)
+
+        return pd.DataFrame.from_dict(rows, orient='index', columns=list(q))
+
+    def probability_of_waiting(self):
+        """Return the fraction of the calls that wait for a berth"""
+
+        return float((self.waiting_times > 0).mean())
+
+    def table_waiting_factor(self):
+        """Return the waiting factor of occupancy_to_waitingfactor for the occupancy and berths of the simulation"""
+
+        from opentisim.core.core import occupancy_to_waitingfactor
+
+        return float(occupancy_to_waitingfactor(utilisation=self.occupancy, nr_of_servers_to_chk=self.berths,
+                                                kendall=self.kendall))
+
+    def compare(self, confidence=0.95):
+        """Return the simulated and the table waiting factor as a series"""
+
+        simulated, half_width = self.waiting_factor(confidence)
+
+        return pd.Series({'occupancy': self.occupancy, 'berths': self.berths, 'simulated': simulated,
+                          'simulated_conf': half_width, 'table': self.table_waiting_factor(),
+                          'probability_of_waiting': self.probability_of_waiting()})
+
+
+def simulate_berths(calls, service_times, berths=1, operational_hours=8760, kendall='E2/E2/n', replications=10,
+                    warmup=0.1, seed=None):
+    """Simulate the vessel calls of a year at berths and return a BerthSimulationResult
+
+    calls: number of calls per vessel type in the year (a dict or series, e.g. the vessel calls of a terminal)
+    service_times: mean time at the berth per call of each vessel type [hours]
+    berths: number of berths (or jetties)
+    operational_hours: hours in the year in which the calls arrive
+    kendall: queue type, the interarrival and service time distributions (e.g. 'E2/E2/n' or 'M/E2/n')
+    replications: number of independent replications
+    warmup: fraction of extra calls simulated before the year (and not reported), so that the year does not start
+            with an empty quay
+    seed: seed of the numpy Generator (an integer, a SeedSequence or a Generator)"""
+
+    simpy = _import_simpy()
+
+    arrival_shape, service_shape = [_distribution(symbol) for symbol in kendall.split('/')[:2]]
+    calls = pd.Series(calls, dtype=float)
+    calls = calls[calls > 0]
+    mean_service_times = pd.Series(service_times, dtype=float)[calls.index]
+
+    total_calls = int(round(calls.sum()))
+    if total_calls == 0:
+        raise ValueError('there are no vessel calls to simulate')
+    extra_calls = int(np.ceil(warmup * total_calls))
+    nr_of_calls = extra_calls + total_calls
+
+    occupancy = float((calls * mean_service_times).sum() / (berths * operational_hours))
+
+    # draw the vessel types and the interarrival and service times of all replications at once
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    types = rng.choice(len(calls), size=(replications, nr_of_calls), p=(calls / calls.sum()).to_numpy())
+    interarrival_times = _draw(rng, arrival_shape, np.full((replications, nr_of_calls),
+                                                             operational_hours / calls.sum()))
+    services = _draw(rng, service_shape, mean_service_times.to_numpy()[types])
+
+    waiting_times = np.array([_replication(simpy, interarrival_times[replication], services[replication], berths)
+                              for replication in range(replications)])
+
+    return BerthSimulationResult(waiting_times[:, extra_calls:], services[:, extra_calls:],
+                                 calls.index.to_numpy()[types[:, extra_calls:]], occupancy, berths, kendall)
+
+
+def compare_waiting_factors(occupancies=(0.3, 0.5, 0.7, 0.8), berths=(1, 2, 3, 4), kendall='E2/E2/n', calls=500,
+                            replications=20, warmup=0.1, seed=None):
+    """Return the simulated and the table waiting factors over a grid of occupancies and numbers of berths, as a
+    dataframe with a row per (berths, occupancy)
+
+    calls: number of calls per replication (of one vessel type, with a service time of 1 hour)"""
+
+    rng = np.random.default_rng(seed)
+
+    rows = []
+    for nr_of_berths in berths:
+        for occupancy in occupancies:
+            operational_hours = calls / (occupancy * nr_of_berths)
+            result = simulate_berths({'vessel': calls}, {'vessel': 1}, nr_of_berths, operational_hours, kendall,
+                                     replications, warmup, rng)
+            rows.append(result.compare())
+
+    return pd.DataFrame(rows).astype({'berths': int}).set_index(['berths', 'occupancy'])
@@ -0,0 +1,66 @@
+"""Break-even handling fee of a simulated terminal.
+
+The revenues of the container and liquid bulk terminals are the throughput online times the handling fee, and the
+throughput does not depend on the fee. The NPV is therefore linear in the fee:
+
+    NPV(fee) = fee * sum(discounted throughput) - sum(discounted CAPEX and OPEX)
+
+so one simulation gives the NPV for every fee, and the fee at which the NPV is zero:
+
+    Terminal.simulate()
+    fee, curve = opentisim.core.break_even_fee(Terminal)
+
+The terminal needs a throughput_timeline method (the throughput online in each of its years) and a modelframe, like
+for opentisim.core.NPV. The throughput is discounted in the same way as the cash flows (see discount_cashflows).
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+
+def discounted_throughput(Terminal):
+    """Return the throughput online in each year of Terminal.modelframe, discounted like the cash flows, as a dataframe
+    with year and throughput"""
+
+    from opentisim.core.core import discount_cashflows
+
+    if not hasattr(Terminal, 'throughput_timeline'):
+        raise TypeError('{} has no throughput_timeline, the break-even fee can not be determined'.format(
+            type(Terminal).__name__))
+
+    timeline = dict(zip(Terminal.years, Terminal.throughput_timeline()))
+
+    throughput = pd.DataFrame()
+    throughput['year'] = Terminal.modelframe
+    throughput['throughput'] = [timeline.get(year, 0) for year in Terminal.modelframe]
+
+    return discount_cashflows(Terminal, throughput)
+
+
+def break_even_fee(Terminal, labour=None, fees=None):
+    """Return the handling fee at which the NPV of the simulated Terminal is zero, and the NPV as a function of the fee
+
+    labour: labour element passed to NPV
+    fees: the fees of the curve (by default 21 fees from 0 to twice the break-even fee)
+
+    Returns (fee, curve), curve is a series of the NPV indexed by fee. The revenues that the terminal computed with
+    its own handling fee are not used. The container terminal books no revenues in simulate, so for containers the
+    curve is a what-if: the NPV the terminal would have if it charged the fee, not the NPV of the simulated terminal
+    (which is the curve at a fee of zero)."""
+
+    from opentisim.core.core import NPV
+
+    cash_flows = NPV(Terminal, labour)
+    costs = -float((cash_flows['CAPEX'] + cash_flows['OPEX']).sum())
+    throughput = float(discounted_throughput(Terminal)['throughput'].sum())
+    if throughput <= 0:
+        raise ValueError('the terminal has no throughput online, so there is no break-even fee')
+
+    fee = costs / throughput
+
+    if fees is None:
+        fees = np.linspace(0, 2 * fee, 21)
+    fees = np.asarray(fees, dtype=float)
+
+    return fee, pd.Series(fees * throughput - costs, index=pd.Index(fees, name='fee'), name='NPV')
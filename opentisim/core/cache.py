@@ -0,0 +1,207 @@
+"""On-disk cache of simulated terminals, keyed on the simulation inputs.
+
+The key of a terminal is a hash of everything that determines the outcome of simulate:
+
+- the terminal class and its attributes (kwargs, type defaults, years simulated so far)
+- its configuration: the frozen defaults dicts (e.g. berth_data, quay_wall_data) that the investment methods read
+- its elements: class and attributes, including the scenario_data of the commodities
+- the opentisim version, so that a new version never returns results of an older one
+
+A hit returns the stored terminal (restored from a compact snapshot, see opentisim.core.snapshot) instead of running
+the simulation. Entries are evicted least recently used first when the cache grows beyond max_bytes.
+"""
+
+# package(s) for data handling
+import hashlib
+import os
+import pickle
+import types
+
+import numpy as np
+import pandas as pd
+
+from .config import Config
+from .elements import element_attributes
+
+# terminal and element attributes that do not influence the results
+IGNORED_ATTRIBUTES = ['logger', 'debug', 'id']
+
+
+def _feed(hasher, value, seen):
+    """Add a canonical representation of value to hasher"""
+
+    if value is None or isinstance(value, (bool, int, float, str, np.number, np.bool_)):
+        hasher.update(repr((type(value).__name__, value)).encode())
+    elif isinstance(value, pd.DataFrame):
+        hasher.update(repr(('DataFrame', list(value.columns), [str(dtype) for dtype in value.dtypes])).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        hasher.update(repr(('Series', value.name, str(value.dtype))).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        hasher.update(repr(('ndarray', value.dtype.str, value.shape)).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, Config):
+        _feed(hasher, ('Config', value.to_dict()), seen)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(repr((type(value).__name__, len(value))).encode())
+        for item in value:
+            _feed(hasher, item, seen)
+    elif isinstance(value, (set, frozenset)):
+        hasher.update(repr(('set', sorted(repr(item) for item in value))).encode())
+    elif isinstance(value, dict):
+        hasher.update(repr(('dict', len(value))).encode())
+        for key in sorted(value, key=repr):
+            _feed(hasher, key, seen)
+            _feed(hasher, value[key], seen)
+    elif isinstance(value, (types.FunctionType, types.ModuleType, type)):
+        hasher.update(repr((type(value).__name__, getattr(value, '__module__', None), value.__name__)).encode())
+    elif hasattr(value, '__dict__'):
+        # element objects: class and attributes (objects that were already hashed are referred to by position)
+        if id(value) in seen:
+            hasher.update(repr(('seen', seen[id(value)])).encode())
+            return
+        seen[id(value)] = len(seen)
+        hasher.update(repr(('object', type(value).__module__, type(value).__name__)).encode())
+        _feed(hasher, {key: item for key, item in element_attributes(value).items()
+                       if key not in IGNORED_ATTRIBUTES and not key.startswith('_')}, seen)
+    else:
+        hasher.update(repr(value).encode())
+
+
+def terminal_key(Terminal, version=None):
+    """Return the hex digest that identifies the simulation inputs of Terminal"""
+
+    if version is None:
+        import opentisim
+        version = opentisim.__version__
+
+    hasher = hashlib.sha256()
+    _feed(hasher, ('opentisim', version), {})
+    _feed(hasher, Terminal, {})
+
+    return hasher.hexdigest()
+
+
+class ResultCache(object):
+    """Opt-in on-disk cache of simulated terminals
+
+    directory: directory to store the entries in (created if needed)
+    max_bytes: the least recently used entries are removed when the entries together are larger than this
+    version: part of the key, the opentisim version by default
+
+    Use simulate instead of Terminal.simulate(); it returns the simulated terminal, which on a hit is a new terminal
+    object restored from the cache:
+
+        cache = opentisim.core.ResultCache('opentisim_cache')
+        Terminal = cache.simulate(Terminal)
+    """
+
+    def __init__(self, directory, max_bytes=1_000_000_000, version=None):
+        if version is None:
+            import opentisim
+            version = opentisim.__version__
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, Terminal):
+        return terminal_key(Terminal, self.version)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key):
+        """Return the terminal stored under key, or None"""
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # mark the entry as recently used
+        os.utime(path)
+
+        return snapshot.restore()
+
+    def put(self, key, Terminal):
+        """Store the (simulated) Terminal under key and evict old entries if the cache is too large"""
+
+        from opentisim.core.snapshot import snapshot
+
+        state = snapshot(Terminal)
+        # the sink belongs to the run that filled the cache, restored terminals do not log
+        state.sink = None
+
+        path = self._path(key)
+        temporary = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+        self.evict()
+
+    def simulate(self, Terminal):
+        """Return Terminal after simulate, from the cache if the same inputs were simulated before"""
+
+        key = self.key(Terminal)
+
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            cached.logger = Terminal.logger
+            return cached
+
+        self.misses += 1
+        Terminal.simulate()
+        self.put(key, Terminal)
+
+        return Terminal
+
+    def entries(self):
+        """Return (path, size, last used) of all entries, least recently used first"""
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                path = os.path.join(self.directory, name)
+                try:
+                    status = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, status.st_size, status.st_mtime))
+
+        return sorted(entries, key=lambda entry: entry[2])
+
+    @property
+    def size(self):
+        """Total size of the entries in bytes"""
+
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Remove the least recently used entries until the cache is not larger than max_bytes"""
+
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove all entries"""
+
+        for path, _, _ in self.entries():
+            os.remove(path)
@@ -0,0 +1,137 @@
+"""Frozen configuration of a terminal run.
+
+The defaults modules (container_defaults, hydrogen_defaults, agribulk_defaults) hold the element data as module-level
+dicts. A terminal takes a frozen copy of them when it is created (or the Config it is given) and its methods read the
+values from Terminal.config, so changing a module-level dict after a terminal was created does not change its run and
+differently configured terminals can be simulated at the same time in one process:
+
+    config = opentisim.containers.default_config().replace(sts_crane_data={'hourly_cycles': 30})
+    Terminal = opentisim.containers.System(..., config=config)
+
+Terminal.config.berth_data['max_cranes'] reads a value; a Config can not be changed, replace returns a changed copy.
+"""
+
+# package(s) for data handling
+import pandas as pd
+
+
+class FrozenDict(dict):
+    """dict that can not be changed after it is created (it can be copied with dict(frozen) and used with **)"""
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError('the configuration can not be changed, use Config.replace to create a changed copy')
+
+    __setitem__ = __delitem__ = __ior__ = _frozen
+    clear = pop = popitem = setdefault = update = _frozen
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(value):
+    """Return a frozen copy of value: dicts become FrozenDicts, lists and sets tuples and frozensets, dataframes are
+    copied (the other values are immutable already)"""
+
+    if isinstance(value, FrozenDict):
+        return value
+    elif isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    elif isinstance(value, set):
+        return frozenset(value)
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+
+    return value
+
+
+class Config(object):
+    """Frozen set of defaults dicts, read as attributes (config.berth_data) or items (config['berth_data'])
+
+    defaults: dict of name: defaults dict"""
+
+    __slots__ = ['_defaults']
+
+    def __init__(self, defaults):
+        object.__setattr__(self, '_defaults', FrozenDict({name: freeze(value) for name, value in defaults.items()}))
+
+    @classmethod
+    def from_module(cls, module):
+        """Return the current values of the module-level defaults dicts of module (e.g. container_defaults)"""
+
+        return cls({name: value for name, value in vars(module).items()
+                    if isinstance(value, dict) and not name.startswith('_')})
+
+    def replace(self, **changes):
+        """Return a copy in which the given defaults dicts are updated with the given values, for example
+        config.replace(berth_data={'max_cranes': 4}) changes only max_cranes of berth_data"""
+
+        defaults = dict(self._defaults)
+        for name, values in changes.items():
+            if name not in defaults:
+                raise KeyError('no defaults {!r} in the configuration'.format(name))
+            defaults[name] = dict(defaults[name], **values)
+
+        return type(self)(defaults)
+
+    def to_dict(self):
+        """Return the configuration as a dict of name: FrozenDict"""
+
+        return dict(self._defaults)
+
+    def __getattr__(self, name):
+        try:
+            return self._defaults[name]
+        except KeyError:
+            raise AttributeError('no defaults {!r} in the configuration'.format(name)) from None
+
+    def __setattr__(self, name, value):
+        raise TypeError('the configuration can not be changed, use Config.replace to create a changed copy')
+
+    def __getitem__(self, name):
+        return self._defaults[name]
+
+    def __contains__(self, name):
+        return name in self._defaults
+
+    def __iter__(self):
+        return iter(self._defaults)
+
+    def __len__(self):
+        return len(self._defaults)
+
+    def __eq__(self, other):
+        return isinstance(other, Config) and self._defaults.keys() == other._defaults.keys() and all(
+            _equal(value, other._defaults[name]) for name, value in self._defaults.items())
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return type(self), (self.to_dict(),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return 'Config({})'.format(', '.join(self._defaults))
+
+
+def _equal(a, b):
+    if isinstance(a, (pd.DataFrame, pd.Series)) or isinstance(b, (pd.DataFrame, pd.Series)):
+        return type(a) is type(b) and a.equals(b)
+    elif isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[key], b[key]) for key in a)
+    elif isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+
+    return a == b
@@ -16,9 +16,11 @@ def report_element(Terminal, Element, year):
             if year >= element.year_online:
                 elements_online += 1
 
-    if Terminal.debug:
+    if Terminal.logger.enabled:
         if elements_online or elements:
-            print('     a total of {} {} is online; a total of {} is still pending'.format(elements_online, element_name, elements - elements_online))
+            Terminal.logger.message(
+                '     a total of {} {} is online; a total of {} is still pending',
+                elements_online, element_name, elements - elements_online)
 
     return elements_online, elements
 
@@ -35,6 +37,42 @@ def find_elements(Terminal, obj):
     return list_of_elements
 
 
+def scenario_key(Terminal, commodities=None):
+    """Return a key that changes when the commodities or the contents of their scenario data change (scenario data
+    that is replaced or changed in place)
+
+    commodities: the elements to include, by default all elements of Terminal that have scenario data"""
+
+    if commodities is None:
+        commodities = [element for element in Terminal.elements if hasattr(element, 'scenario_data')]
+
+    scenarios = []
+    for commodity in commodities:
+        scenario_data = getattr(commodity, 'scenario_data', None)
+        try:
+            scenarios.append((id(commodity), scenario_data['year'].to_numpy().tobytes(),
+                              scenario_data['volume'].to_numpy().tobytes()))
+        except (KeyError, TypeError, AttributeError):
+            scenarios.append((id(commodity), None))
+
+    return tuple(scenarios)
+
+
+def throughput_timeline(Terminal, throughput, key=()):
+    """Return throughput(year) for each year in Terminal.years as an array
+
+    The timeline is computed once and cached on the terminal. Elements are only ever appended to Terminal.elements,
+    so the cache is recomputed when the years, the number of elements or the extra key have changed since the last
+    call. Pass the scenario_key of the terminal as key when the throughput depends on the demand."""
+
+    key = (tuple(Terminal.years), len(Terminal.elements), key)
+    if getattr(Terminal, '_throughput_timeline_key', None) != key:
+        Terminal._throughput_timeline = np.array([throughput(year) for year in Terminal.years], dtype=float)
+        Terminal._throughput_timeline_key = key
+
+    return Terminal._throughput_timeline
+
+
 def add_cashflow_data_to_element(Terminal, element):
     """Place cashflow data in element dataframe
     Elements that take two years to build are assign 60% to year one and 40% to year two."""
@@ -136,27 +174,70 @@ def add_cashflow_elements(Terminal, labour):
 #         labour.international_staff * labour.international_salary + labour.local_staff * labour.local_salary
     # todo: check the labour costs of the container terminals (they are not included now)
 
-    for element in Terminal.elements:
+    return aggregate_cashflows(Terminal, Terminal.elements, cash_flows)
+
+
+def aggregate_cashflows(Terminal, elements, cash_flows):
+    """Add the cash flows of all elements to the initialised cash_flows dataframe and discount them.
+
+    The element dataframes are stacked into one (elements x years x columns) cost matrix that is summed in a single
+    numpy operation, after which discount_cashflows is applied. Returns the nominal and the discounted cash flows."""
+
+    columns = [column for column in cash_flows.columns if column != "year"]
+    nr_of_years = len(cash_flows)
+
+    # stack the cash flows of the elements (missing columns and values count as zero)
+    stacked = []
+    present = np.zeros(len(columns), dtype=bool)
+    layouts = {}
+    for element in elements:
         if hasattr(element, 'df'):
-            element.df = element.df.fillna(0)
-            for column in cash_flows.columns:
-                if column in element.df.columns and column != "year":
-                    cash_flows[column] += element.df[column]
+            # elements of the same type share a dataframe layout: map its columns onto the cash flow columns once
+            layout = tuple(element.df.columns)
+            if layout not in layouts:
+                source = [layout.index(column) for column in columns if column in layout]
+                target = [index for index, column in enumerate(columns) if column in layout]
+                layouts[layout] = (source, target)
+            source, target = layouts[layout]
+
+            matrix = np.zeros((nr_of_years, len(columns)))
+            matrix[:, target] = element.df.to_numpy(dtype=float)[:, source]
+            present[target] = True
+            stacked.append(matrix)
+
+    if stacked:
+        stacked = np.stack(stacked)
+        totals = np.where(np.isnan(stacked), 0, stacked).sum(axis=0)
+        for index, column in enumerate(columns):
+            if present[index]:
+                cash_flows[column] = cash_flows[column] + totals[:, index]
+
+    cash_flows_WACC_real = discount_cashflows(Terminal, cash_flows)
+
+    cash_flows = cash_flows.fillna(0)
+
+    return cash_flows, cash_flows_WACC_real
+
+
+def discount_cashflows(Terminal, cash_flows):
+    """Discount all cash flow columns with WACC_real relative to the first year of Terminal.modelframe.
+
+    Only the years in Terminal.years are discounted; the other years of the model frame are set to zero."""
+
+    years = cash_flows['year'].to_numpy()
+    discount = (1 + WACC_real()) ** (years - Terminal.modelframe[0] + 1)
+    in_years = np.isin(years, list(Terminal.years))
 
-    # calculate WACC real cashflows
     cash_flows_WACC_real = pd.DataFrame()
     cash_flows_WACC_real['year'] = cash_flows['year']
-    for year in Terminal.years:
-        for column in cash_flows.columns:
-            if column != "year":
-                cash_flows_WACC_real.loc[cash_flows_WACC_real['year'] == year, column] = \
-                    cash_flows.loc[cash_flows['year'] == year, column] /\
-                            ((1 + WACC_real()) ** (year - Terminal.modelframe[0]+1))
+    for column in cash_flows.columns:
+        if column != "year":
+            values = cash_flows[column].to_numpy(dtype=float) / discount
+            cash_flows_WACC_real[column] = np.where(in_years, values, 0)
 
-    cash_flows = cash_flows.fillna(0)
     cash_flows_WACC_real = cash_flows_WACC_real.fillna(0)
 
-    return cash_flows, cash_flows_WACC_real
+    return cash_flows_WACC_real
 
 
 def NPV(Terminal, labour):
@@ -0,0 +1,78 @@
+"""Compact element classes.
+
+The element classes of the terminal packages (Quay_wall, Berth, Storage, Vessel, ...) combine property mixins. The
+mixins declare no instance dict of their own (__slots__ = ()), and element_type gives the combined class a slot for
+every __init__ argument of its mixins, plus df for the cash flows. An element then stores its attributes in slots;
+only attributes without a slot (e.g. the length that is added to a quay wall) go to an instance __dict__, which is
+created when the first such attribute is set. The attribute API is the same as that of a plain object, use
+element_attributes instead of vars(element) to get all attributes.
+
+Elements get sequential integer ids (new_id), unique within the process, instead of uuid strings.
+"""
+
+# package(s) for data handling
+import functools
+import inspect
+import itertools
+import sys
+
+# attributes that are given a slot in all element classes
+ELEMENT_SLOTS = ['df']
+
+_ids = itertools.count(1)
+
+
+def new_id():
+    """Return a new element id (sequential, unique within the process)"""
+
+    return next(_ids)
+
+
+def element_type(name, bases, namespace=None):
+    """Create an element class like type(name, bases, namespace), with slots for the __init__ arguments of bases"""
+
+    slots = []
+    for base in bases:
+        for parameter in inspect.signature(base.__init__).parameters.values():
+            if parameter.kind == parameter.POSITIONAL_OR_KEYWORD and parameter.name != 'self' \
+                    and parameter.name not in slots:
+                slots.append(parameter.name)
+    slots += [slot for slot in ELEMENT_SLOTS if slot not in slots]
+
+    namespace = dict(namespace or {})
+    namespace['__slots__'] = tuple(slots) + ('__dict__',)
+    # like type, place the class in the module it is created in (needed to pickle its elements)
+    namespace.setdefault('__module__', sys._getframe(1).f_globals['__name__'])
+
+    return type(name, bases, namespace)
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls):
+    names = []
+    for klass in cls.__mro__:
+        for name in klass.__dict__.get('__slots__', ()):
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def element_attributes(element):
+    """Return the attributes of element as a dict (the values in its slots and in its __dict__)"""
+
+    attributes = {}
+    for name in _slot_names(type(element)):
+        try:
+            attributes[name] = getattr(element, name)
+        except AttributeError:
+            pass
+    attributes.update(getattr(element, '__dict__', {}))
+
+    return attributes
+
+
+def set_element_attributes(element, attributes):
+    """Set the attributes of element from a dict (the inverse of element_attributes)"""
+
+    for name, value in attributes.items():
+        setattr(element, name, value)
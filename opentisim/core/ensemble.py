@@ -0,0 +1,162 @@
+"""Ensembles of terminal simulations under different demand paths.
+
+run_ensemble simulates a template terminal once for every path of a demand ensemble, in chunks on an executor (e.g. a
+concurrent.futures.ProcessPoolExecutor) or one by one in the calling process:
+
+    demand = opentisim.core.geometric_brownian(1_000_000, years, n=1000, seed=1)
+    with ProcessPoolExecutor() as executor:
+        result = opentisim.core.run_ensemble(Terminal, demand, executor=executor, seed=2)
+    result.npv_percentiles(), result.count_percentiles()
+
+The template terminal is not simulated itself; each run starts from a copy (a snapshot of the template) in which the
+scenario_data of the commodity is replaced by the demand path. Run i gets its own numpy Generator from the i-th child
+of a SeedSequence, so the results do not depend on the executor or the number of workers. Only the NPV and the number
+of elements per class and year of each run are sent back and collected, the simulated terminals are dropped.
+"""
+
+# package(s) for data handling
+import collections
+
+import numpy as np
+import pandas as pd
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def element_counts(Terminal, years):
+    """Return per element class the number of elements online in each year of years (elements without a year online,
+    e.g. commodities and vessels, are not counted)"""
+
+    online = collections.defaultdict(list)
+    for element in Terminal.elements:
+        year_online = getattr(element, 'year_online', None)
+        if isinstance(year_online, (int, float, np.number)) and not isinstance(year_online, bool):
+            online[type(element).__name__].append(year_online)
+
+    years = np.asarray(years)
+    return {name: (np.asarray(values)[:, None] <= years[None, :]).sum(axis=0) for name, values in online.items()}
+
+
+def _run_chunk(task):
+    """Simulate the runs of one chunk, return (run, NPV, years, element counts) per run"""
+
+    from opentisim.core.core import NPV
+
+    template, runs, demand, prepare, commodity, labour = task
+
+    results = []
+    for run, seed, scenario in runs:
+        rng = np.random.default_rng(seed)
+        Terminal = template.restore()
+
+        commodities = [element for element in Terminal.elements if hasattr(element, 'scenario_data')]
+        commodities[commodity].scenario_data = scenario if demand is None else demand(rng)
+        if prepare is not None:
+            prepare(Terminal, rng)
+
+        Terminal.simulate()
+        years = list(Terminal.years)
+        results.append((run, float(NPV(Terminal, labour)['PV'].sum()), years, element_counts(Terminal, years)))
+
+    return results
+
+
+class EnsembleResult(object):
+    """NPVs and element counts of an ensemble of runs, collected while the runs come in
+
+    npv: NPV of each run (in the order of the demand paths)
+    years: simulated years
+    The element counts are kept as a histogram per element class and year."""
+
+    def __init__(self, n):
+        self.npv = np.full(n, np.nan)
+        self.years = None
+        self.runs = 0
+        self._histograms = {}
+
+    def add(self, run, npv, years, counts):
+        """Add the outcome of one run"""
+
+        if self.years is None:
+            self.years = list(years)
+        elif list(years) != self.years:
+            raise ValueError('run {} simulated years {}, not {}'.format(run, years, self.years))
+
+        self.npv[run] = npv
+        self.runs += 1
+
+        for name, values in counts.items():
+            histogram = self._histograms.setdefault(name, np.zeros((len(self.years), 1), dtype=np.int64))
+            if values.max() >= histogram.shape[1]:
+                histogram = np.pad(histogram, ((0, 0), (0, values.max() + 1 - histogram.shape[1])))
+                self._histograms[name] = histogram
+            histogram[np.arange(len(self.years)), values] += 1
+
+    def npv_percentiles(self, q=(5, 50, 95)):
+        """Return the percentiles q of the NPV as a series"""
+
+        return pd.Series(np.nanpercentile(self.npv, q), index=list(q), name='NPV')
+
+    def count_percentiles(self, q=(5, 50, 95)):
+        """Return the percentiles q of the number of elements per class and year as a dataframe with a row per
+        (element, year) and a column per percentile"""
+
+        rows = []
+        index = []
+        for name in sorted(self._histograms):
+            histogram = self._histograms[name]
+            for position, year in enumerate(self.years):
+                frequencies = histogram[position].copy()
+                # runs that have no element of this class at all
+                frequencies[0] += self.runs - frequencies.sum()
+                rows.append(np.percentile(np.repeat(np.arange(len(frequencies)), frequencies), q))
+                index.append((name, year))
+
+        return pd.DataFrame(rows, index=pd.MultiIndex.from_tuples(index, names=['element', 'year']), columns=list(q))
+
+
+def run_ensemble(Terminal, demand, n=None, executor=None, chunksize=10, seed=None, prepare=None, commodity=0,
+                 labour=None):
+    """Simulate Terminal for each demand path and return an EnsembleResult
+
+    Terminal: template terminal (not simulated), it is not changed
+    demand: a DemandEnsemble (one run per path) or a function of a numpy Generator that returns scenario_data (then
+            n is the number of runs)
+    executor: concurrent.futures executor to run the chunks on (None: run them in the calling process)
+    chunksize: number of runs per task
+    seed: seed of the SeedSequence from which each run gets its random stream (used by demand and prepare)
+    prepare: optional function(Terminal, rng) that changes other inputs of a run before it is simulated
+    commodity: index of the commodity that gets the demand path, among the elements with scenario_data
+    labour: labour element passed to NPV
+
+    demand and prepare are sent to the workers, so for a process pool they must be module-level functions."""
+
+    from opentisim.core.snapshot import snapshot
+
+    if callable(demand):
+        if n is None:
+            raise ValueError('give the number of runs n when demand is a function')
+        scenarios = [None] * n
+        demand_function = demand
+    else:
+        n = len(demand)
+        scenarios = list(demand.scenarios())
+        demand_function = None
+
+    template = snapshot(Terminal)
+    template.sink = None
+
+    seeds = np.random.SeedSequence(seed).spawn(n)
+    runs = list(zip(range(n), seeds, scenarios))
+    tasks = [(template, chunk, demand_function, prepare, commodity, labour) for chunk in _chunks(runs, chunksize)]
+
+    result = EnsembleResult(n)
+    outcomes = map(_run_chunk, tasks) if executor is None else executor.map(_run_chunk, tasks)
+    for outcome in outcomes:
+        for run in outcome:
+            result.add(*run)
+
+    return result
@@ -0,0 +1,150 @@
+"""Batch evaluation of a terminal for many parameter values.
+
+An Evaluator simulates copies of a template terminal with changed parameters and returns one output per parameter
+point (by default the NPV). It is the evaluation engine of the sensitivity analysis and the trigger optimization:
+
+- points that were evaluated before (or occur more than once in a batch) are simulated only once
+- the simulations run in chunks on a concurrent.futures executor, or in the calling process
+- with a ResultCache the simulated terminals are also reused between sessions
+
+A parameter is named after what it changes in the terminal:
+
+- 'allowable_berth_occupancy': a terminal attribute
+- 'crane_type_defaults.hourly_cycles': a value of a defaults dict attribute of the terminal
+- 'config.energy_data.price': a value of a defaults dict in the configuration (Terminal.config)
+"""
+
+# package(s) for data handling
+import numpy as np
+
+
+def terminal_npv(Terminal):
+    """Return the NPV of a simulated terminal (the sum of the present values)"""
+
+    from opentisim.core.core import NPV
+
+    return float(NPV(Terminal, None)['PV'].sum())
+
+
+def _parts(Terminal, name):
+    parts = name.split('.')
+    if not (len(parts) == 1 or len(parts) == 2 or (len(parts) == 3 and parts[0] == 'config')):
+        raise ValueError('can not interpret parameter name {!r}'.format(name))
+    if not hasattr(Terminal, parts[0]):
+        raise AttributeError('{} has no parameter {!r}'.format(type(Terminal).__name__, parts[0]))
+    if len(parts) == 3 and parts[2] not in Terminal.config[parts[1]]:
+        raise KeyError('no {!r} in the {} of the configuration'.format(parts[2], parts[1]))
+    if len(parts) == 2 and parts[1] not in getattr(Terminal, parts[0]):
+        raise KeyError('no {!r} in {}'.format(parts[1], parts[0]))
+
+    return parts
+
+
+def get_parameter(Terminal, name):
+    """Return the value of parameter name (see the module documentation) of Terminal"""
+
+    parts = _parts(Terminal, name)
+    if len(parts) == 3:
+        return Terminal.config[parts[1]][parts[2]]
+    elif len(parts) == 2:
+        return getattr(Terminal, parts[0])[parts[1]]
+
+    return getattr(Terminal, name)
+
+
+def set_parameter(Terminal, name, value):
+    """Set parameter name (see the module documentation) of Terminal to value"""
+
+    from opentisim.core.config import freeze
+
+    parts = _parts(Terminal, name)
+    if len(parts) == 3:
+        Terminal.config = Terminal.config.replace(**{parts[1]: {parts[2]: value}})
+    elif len(parts) == 2:
+        setattr(Terminal, parts[0], freeze(dict(getattr(Terminal, parts[0]), **{parts[1]: value})))
+    else:
+        setattr(Terminal, name, value)
+
+
+def _evaluate_chunk(task):
+    """Simulate the points of one chunk, return the output per point"""
+
+    template, names, points, output, cache = task
+
+    outputs = []
+    for point in points:
+        Terminal = template.restore()
+        for name, value in zip(names, point):
+            set_parameter(Terminal, name, value)
+
+        if cache is None:
+            Terminal.simulate()
+        else:
+            Terminal = cache.simulate(Terminal)
+        outputs.append(output(Terminal))
+
+    return outputs
+
+
+class Evaluator(object):
+    """Evaluate a template terminal for points in parameter space
+
+    Terminal: template terminal (not simulated), it is not changed
+    names: parameter names (see the module documentation)
+    output: function of a simulated terminal that returns the output (a number or a tuple of numbers), by default the
+            NPV
+    executor: concurrent.futures executor to run the chunks on (None: run them in the calling process)
+    chunksize: number of simulations per task
+    cache: optional ResultCache to reuse simulations between sessions
+
+    output is sent to the workers, so for a process pool it must be a module-level function. The outputs of all
+    evaluated points are kept in memo, so a point is never simulated twice."""
+
+    def __init__(self, Terminal, names, output=terminal_npv, executor=None, chunksize=10, cache=None):
+        from opentisim.core.snapshot import snapshot
+
+        self.names = list(names)
+        self.output = output
+        self.executor = executor
+        self.chunksize = chunksize
+        self.cache = cache
+
+        # check the parameter names before anything is simulated
+        for name in self.names:
+            get_parameter(Terminal, name)
+
+        self.template = snapshot(Terminal)
+        self.template.sink = None
+
+        self.memo = {}
+        self.simulations = 0
+
+    def evaluate(self, points):
+        """Return the outputs for points (an array of points x parameters), an array with an output per point (or of
+        points x outputs when output returns tuples)"""
+
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        if points.shape[1] != len(self.names):
+            raise ValueError('points should have {} columns, one per parameter'.format(len(self.names)))
+
+        keys = [tuple(point) for point in points.tolist()]
+        new = list(dict.fromkeys(key for key in keys if key not in self.memo))
+
+        tasks = [(self.template, self.names, new[start:start + self.chunksize], self.output, self.cache)
+                 for start in range(0, len(new), self.chunksize)]
+        outcomes = map(_evaluate_chunk, tasks) if self.executor is None else self.executor.map(_evaluate_chunk, tasks)
+
+        position = 0
+        for outcome in outcomes:
+            for value in outcome:
+                self.memo[new[position]] = value
+                position += 1
+        self.simulations += len(new)
+
+        return np.array([self.memo[key] for key in keys], dtype=float)
+
+    def __call__(self, point):
+        """Return the output for a single point"""
+
+        value = self.evaluate([point])[0]
+        return float(value) if np.ndim(value) == 0 else value
@@ -0,0 +1,168 @@
+"""Structured event log of the terminal simulations.
+
+The terminal classes report what they do as events instead of printing it:
+
+- year: start of the simulation of a year
+- invest: an element is added to the terminal (name: element name)
+- kpi: per-year performance indicators (name: indicator group, data: the values)
+- message: free text trace of the investment analysis (data: template and arguments, formatted only by the sinks
+  that show it)
+- warning: something unexpected that does not stop the simulation
+
+Each terminal has an EventLogger that passes its events to a sink: NullSink (default, the events are not even
+created), ListSink (keep the events in memory), JsonLinesSink (write one JSON record per event) or ConsoleSink (print
+the events, used when a terminal is created with debug=True).
+"""
+
+# package(s) for data handling
+import collections
+import json
+
+Event = collections.namedtuple('Event', ['kind', 'year', 'name', 'data'])
+
+
+def format_event(event):
+    """Return the event as a line of text"""
+
+    if event.kind == 'year':
+        return '### Simulate year: {} ############################'.format(event.year)
+    elif event.kind == 'invest':
+        return '  *** add {} to elements'.format(event.name)
+    elif event.kind == 'kpi':
+        return '     {} ({}): {}'.format(event.name, event.year, ', '.join(
+            '{}: {}'.format(key, value) for key, value in event.data.items()))
+    elif event.kind in ['message', 'warning']:
+        return event.data['template'].format(*event.data['args'])
+
+    return '{} {} {} {}'.format(*event)
+
+
+def event_to_dict(event):
+    """Return the event as a dict that can be written to JSON (numpy values are converted to Python values)"""
+
+    record = {'kind': event.kind, 'year': event.year, 'name': event.name, 'data': dict(event.data)}
+    if event.kind in ['message', 'warning']:
+        record['data']['text'] = format_event(event)
+
+    return record
+
+
+def _to_json(value):
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class NullSink(object):
+    """Sink that drops all events; the logger does not create events for a disabled sink"""
+
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+
+class ListSink(object):
+    """Sink that keeps the events in memory in the list records"""
+
+    enabled = True
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, event):
+        self.records.append(event)
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame([event_to_dict(event) for event in self.records], columns=Event._fields)
+
+
+class JsonLinesSink(object):
+    """Sink that writes each event as a JSON record on its own line to path (or an open text file)"""
+
+    enabled = True
+
+    def __init__(self, path, mode='w'):
+        if hasattr(path, 'write'):
+            self.file = path
+            self._owner = False
+        else:
+            self.file = open(path, mode)
+            self._owner = True
+
+    def emit(self, event):
+        self.file.write(json.dumps(event_to_dict(event), default=_to_json) + '\n')
+
+    def close(self):
+        if self._owner:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ConsoleSink(object):
+    """Sink that prints the events (the debug output of the terminal classes)"""
+
+    enabled = True
+
+    def emit(self, event):
+        text = format_event(event)
+        if event.kind == 'year' or text.startswith('---') or text.startswith('$$$'):
+            print('')
+        print(text)
+
+
+class EventLogger(object):
+    """Create events and pass them to sink
+
+    sink: one of the sinks of this module (or an object with an enabled attribute and an emit method)
+    debug: if no sink is given, print the events (True) or drop them (False)
+
+    Check enabled before computing values that are only needed for the log; the methods below do nothing when the
+    sink is disabled."""
+
+    def __init__(self, sink=None, debug=False):
+        if sink is None:
+            sink = ConsoleSink() if debug else NullSink()
+        self.sink = sink
+        self.enabled = self.sink.enabled
+        self.year = None
+
+    def start_year(self, year):
+        """Set the year the next events belong to"""
+
+        self.year = year
+        if self.enabled:
+            self.sink.emit(Event('year', year, None, {}))
+
+    def invest(self, name, **data):
+        """Log that an element with name is added to the terminal"""
+
+        if self.enabled:
+            self.sink.emit(Event('invest', self.year, name, data))
+
+    def kpi(self, name, year=None, **values):
+        """Log performance indicators, for year (the current year if not given)"""
+
+        if self.enabled:
+            self.sink.emit(Event('kpi', self.year if year is None else year, name, values))
+
+    def message(self, template, *args):
+        """Log a text message, template is formatted with args only when the message is shown"""
+
+        if self.enabled:
+            self.sink.emit(Event('message', self.year, None, {'template': template, 'args': args}))
+
+    def warning(self, template, *args):
+        """Log a warning, template is formatted with args only when the warning is shown"""
+
+        if self.enabled:
+            self.sink.emit(Event('warning', self.year, None, {'template': template, 'args': args}))
@@ -4,22 +4,8 @@
 # In[ ]:
 
 
-import datetime, time
-import numpy as np
-import numpy.matlib as npml
-import pandas as pd
-import statistics as st
-from copy import deepcopy
-
-import networkx as nx
-import simpy
-
-import matplotlib.pyplot as plt
-from simplekml import Kml, Style   # for graph_kml
-import math
-
-import shapely.geometry
-import pyproj
+# the geo and graph packages (networkx, shapely, pyproj and simplekml) are imported in the methods that use them, so
+# that they are only loaded when these methods are called
 
 
 # In[ ]:
@@ -31,6 +17,8 @@ def length_section(section):
     where sections are defined as shapely.geometry.LineString
     """
 
+    import pyproj
+
     wgs84 = pyproj.Geod(ellps='WGS84')
 
     # intitialise distance over path
@@ -54,7 +42,10 @@ def section_to_points(section):
 
 def convert_path_to_graph(path):
     """This method converts points in a path to a networkx graph object"""
-        
+
+    import networkx as nx
+    import shapely.geometry
+
     FG = nx.Graph()
     positions = {}
     names = {}
@@ -71,6 +62,10 @@ def distance_over_path(FG, loc1, loc2):
     """This method determines the distance over a path between two points
     (NB: loc1 and loc2 are strings that define the names on the graph)"""
 
+    import networkx as nx
+    import shapely.geometry
+    import pyproj
+
     wgs84 = pyproj.Geod(ellps='WGS84')
 
     # get path from graph
@@ -101,6 +96,10 @@ def graph_kml(
     width=5):
     """Create a kml visualisation of graph."""
 
+    import networkx as nx
+    from simplekml import Kml, Style
+
+
     # create a kml file containing the visualisation
     kml = Kml()
     fol = kml.newfolder(name="Graph")
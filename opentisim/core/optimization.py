@@ -0,0 +1,135 @@
+"""Optimization of the investment triggers of a terminal.
+
+The triggers (allowable_waiting_service_time_ratio_berth, allowable_berth_occupancy, allowable_dwelltime,
+h2retrieval_trigger, ...) decide when the terminal invests. optimize_triggers searches the triggers within bounds
+with scipy's differential evolution, to maximize the NPV or to minimize the cost per tonne (or TEU), subject to
+service constraints:
+
+    bounds = {'allowable_waiting_service_time_ratio_berth': (0.1, 0.5),
+              'allowable_dwelltime': (10 / 365, 40 / 365)}
+    with ProcessPoolExecutor() as executor:
+        result = opentisim.core.optimize_triggers(Terminal, bounds, objective=opentisim.core.cost_per_unit,
+                                                  maximize=False, constraints=[(max_waiting_factor, 0.3)],
+                                                  executor=executor, seed=1)
+    result.parameters, result.objective, result.evaluations()
+
+A constraint is a pair (function, limit): the function of the simulated terminal should not exceed the limit. All
+points of a generation are evaluated in one batch with an Evaluator (see opentisim.core.evaluation), so they run in
+parallel on the executor and points that were evaluated before are not simulated again. The points are rounded to
+decimals, so that the generations of a converging search share their evaluations.
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+
+def cost_per_unit(Terminal):
+    """Return the discounted CAPEX and OPEX per unit of discounted throughput [per t or TEU] of a simulated terminal
+    (the break-even handling fee, see opentisim.core.break_even_fee)"""
+
+    from opentisim.core.breakeven import break_even_fee
+
+    return break_even_fee(Terminal, fees=[])[0]
+
+
+class TriggerOutputs(object):
+    """Output function for an Evaluator that returns the objective and the constraint functions of a terminal
+
+    For a process pool the objective and the constraint functions must be module-level functions."""
+
+    def __init__(self, objective, constraints):
+        self.objective = objective
+        self.constraints = [function for function, limit in constraints]
+
+    def __call__(self, Terminal):
+        return (self.objective(Terminal),) + tuple(function(Terminal) for function in self.constraints)
+
+
+class OptimizationResult(object):
+    """Outcome of a trigger optimization
+
+    parameters: the best triggers found (a dict of parameter name: value)
+    objective: the objective at the best triggers
+    constraints: the constraint function values at the best triggers
+    feasible: True when the best triggers meet all constraints
+    simulations: number of terminal simulations
+    evaluator: the Evaluator, whose memo holds all evaluated points
+    scipy_result: the OptimizeResult of differential_evolution"""
+
+    def __init__(self, evaluator, point, limits, scipy_result):
+        values = evaluator.evaluate([point])[0]
+
+        self.parameters = {name: float(value) for name, value in zip(evaluator.names, point)}
+        self.objective = float(values[0])
+        self.constraints = [float(value) for value in values[1:]]
+        self.feasible = all(value <= limit for value, limit in zip(self.constraints, limits))
+        self.simulations = evaluator.simulations
+        self.evaluator = evaluator
+        self.scipy_result = scipy_result
+
+    def evaluations(self):
+        """Return all evaluated points as a dataframe with a column per parameter, the objective and a column per
+        constraint (constraint_0, constraint_1, ...)"""
+
+        columns = list(self.evaluator.names) + ['objective'] + \
+            ['constraint_{}'.format(i) for i in range(len(self.constraints))]
+
+        return pd.DataFrame([key + tuple(values) for key, values in self.evaluator.memo.items()], columns=columns)
+
+
+def optimize_triggers(Terminal, bounds, objective=None, maximize=True, constraints=(), penalty=None, decimals=4,
+                      popsize=10, maxiter=20, tol=0.01, seed=None, evaluator=None, **options):
+    """Search the triggers in bounds that give the best objective, return an OptimizationResult
+
+    Terminal: template terminal (not simulated), it is not changed
+    bounds: dict of parameter name (see opentisim.core.evaluation): (lower bound, upper bound)
+    objective: function of a simulated terminal, by default the NPV (terminal_npv)
+    maximize: maximize the objective (e.g. the NPV) or minimize it (e.g. cost_per_unit)
+    constraints: sequence of (function of a simulated terminal, limit) that should hold as function <= limit
+    penalty: added to the (minimized) objective per unit of relative constraint violation, by default 10 times the
+             largest absolute objective of the first generation
+    decimals: the points are rounded to this number of decimals before they are evaluated (None: no rounding)
+    popsize, maxiter, tol, seed: passed to scipy.optimize.differential_evolution
+    options: passed to the Evaluator (executor, chunksize, cache)"""
+
+    from scipy import optimize
+
+    from opentisim.core.evaluation import Evaluator, terminal_npv
+
+    if objective is None:
+        objective = terminal_npv
+    constraints = list(constraints)
+    limits = np.array([limit for function, limit in constraints], dtype=float)
+
+    names = list(bounds)
+    if evaluator is None:
+        evaluator = Evaluator(Terminal, names, output=TriggerOutputs(objective, constraints), **options)
+    elif evaluator.names != names:
+        raise ValueError('the evaluator evaluates {}, not {}'.format(evaluator.names, names))
+
+    sign = -1 if maximize else 1
+
+    def energies(x):
+        nonlocal penalty
+
+        # differential_evolution passes a generation as an array of parameters x points
+        points = x.T if decimals is None else np.round(x.T, decimals)
+        values = evaluator.evaluate(points).reshape(len(points), -1)
+
+        energy = sign * values[:, 0]
+        if len(limits):
+            violation = np.maximum(values[:, 1:] - limits, 0) / np.maximum(np.abs(limits), 1e-12)
+            if penalty is None:
+                penalty = 10 * max(np.abs(values[:, 0]).max(), 1)
+            energy = energy + penalty * violation.sum(axis=1)
+
+        return energy
+
+    scipy_result = optimize.differential_evolution(
+        energies, [tuple(bound) for bound in bounds.values()], popsize=popsize, maxiter=maxiter, tol=tol, seed=seed,
+        polish=False, vectorized=True, updating='deferred')
+
+    point = scipy_result.x if decimals is None else np.round(scipy_result.x, decimals)
+
+    return OptimizationResult(evaluator, point, limits, scipy_result)
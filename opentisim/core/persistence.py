@@ -0,0 +1,247 @@
+"""Columnar storage of simulation results.
+
+save_results writes the results of a simulated terminal to a directory of column oriented tables, without the
+terminal and element objects themselves:
+
+- elements: the element register, one row per element with its class and scalar attributes
+- element_cash_flows: the cash flows of each element, one row per element and year
+- cash_flows: the nominal cash flows of the terminal per year
+- cash_flows_discounted: the cash flows discounted with WACC_real per year
+- timelines: throughput, occupancy, revenue and demurrage per simulated year
+- npv: the NPV table (CAPEX, OPEX, REVENUES, PV, cum-PV) per year
+
+Each table is written as a Parquet file (compressed, requires pyarrow) or otherwise as a compressed NPZ file with one
+array per column. The terminal type, lifecycle, opentisim version and NPV are stored in metadata.json.
+
+load_results opens such a directory; the tables are only read when they are accessed (Parquet files are memory mapped,
+NPZ columns are read on access). collect_results stacks a table of many runs into one dataframe for querying.
+"""
+
+# package(s) for data handling
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .elements import element_attributes
+
+TABLES = ['elements', 'element_cash_flows', 'cash_flows', 'cash_flows_discounted', 'timelines', 'npv']
+FORMATS = ['parquet', 'npz']
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, (bool, int, float, str, np.number, np.bool_))
+
+
+def element_register(Terminal):
+    """Return a dataframe with one row per element in Terminal.elements: its position ('element'), class ('class') and
+    all scalar attributes (numbers become floats, other values strings)"""
+
+    rows = []
+    columns = {}
+    for element in Terminal.elements:
+        row = {key: value for key, value in element_attributes(element).items() if _is_scalar(value)}
+        rows.append(row)
+        for key in row:
+            columns.setdefault(key, None)
+
+    register = pd.DataFrame({'element': np.arange(len(rows)),
+                             'class': [type(element).__name__ for element in Terminal.elements]})
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        if all(value is None or (isinstance(value, (int, float, np.number)) and not isinstance(value, bool))
+               for value in values):
+            register[column] = np.array([np.nan if value is None else value for value in values], dtype=float)
+        else:
+            register[column] = ['' if value is None else str(value) for value in values]
+
+    return register
+
+
+def element_cash_flows(Terminal):
+    """Return the cash flows of all elements that have cash flow data as one dataframe with a row per element and
+    year ('element' refers to the row in the element register)"""
+
+    frames = [(index, element.df) for index, element in enumerate(Terminal.elements) if hasattr(element, 'df')]
+
+    columns = []
+    for _, df in frames:
+        columns += [column for column in df.columns if column != 'year' and column not in columns]
+
+    if not frames:
+        return pd.DataFrame(columns=['element', 'year'] + columns)
+
+    index = np.concatenate([np.full(len(df), element) for element, df in frames])
+    years = np.concatenate([df['year'].to_numpy() for _, df in frames])
+    values = np.concatenate([df.reindex(columns=columns).to_numpy(dtype=float) for _, df in frames])
+
+    table = pd.DataFrame(values, columns=columns)
+    table.insert(0, 'year', years)
+    table.insert(0, 'element', index)
+
+    return table
+
+
+def timelines(Terminal):
+    """Return throughput, occupancies, revenues and demurrage for each year in Terminal.years as a dataframe
+
+    Which columns are available depends on the terminal type: the drybulk terminal stores its occupancy snapshots, the
+    liquid bulk and container terminals their throughput timeline and the occupancies of their berth_occupancies
+    method."""
+
+    years = list(Terminal.years)
+    table = pd.DataFrame({'year': years})
+
+    if hasattr(Terminal, 'occupancy_snapshot'):
+        snapshots = [Terminal.occupancy_snapshot(year) for year in years]
+        for key in snapshots[0] if snapshots else []:
+            table[key] = [float(snapshot[key]) for snapshot in snapshots]
+    else:
+        if hasattr(Terminal, 'throughput_timeline'):
+            table['throughput'] = Terminal.throughput_timeline()
+        elif hasattr(Terminal, 'calculate_throughput'):
+            table['throughput'] = [Terminal.calculate_throughput(year) for year in years]
+
+        if hasattr(Terminal, 'berth_occupancies'):
+            occupancies = [Terminal.berth_occupancies(year) for year in years]
+            for name in occupancies[0] if occupancies else []:
+                table[name] = [float(occupancy[name]) for occupancy in occupancies]
+
+    for name in ['revenues', 'demurrage']:
+        values = getattr(Terminal, name, None)
+        if isinstance(values, list) and len(values) == len(years):
+            table[name] = np.array(values, dtype=float)
+
+    return table
+
+
+def result_tables(Terminal, labour=None):
+    """Return the result tables of a simulated Terminal as a dict of dataframes (see TABLES)"""
+
+    from opentisim import core
+
+    cash_flows, cash_flows_discounted = core.add_cashflow_elements(Terminal, labour)
+    npv = core.NPV(Terminal, labour)
+    npv.index.name = 'year'
+
+    return {'elements': element_register(Terminal),
+            'element_cash_flows': element_cash_flows(Terminal),
+            'cash_flows': cash_flows,
+            'cash_flows_discounted': cash_flows_discounted,
+            'timelines': timelines(Terminal),
+            'npv': npv.reset_index()}
+
+
+def _write_table(table, path, format):
+    if format == 'parquet':
+        table.to_parquet(path + '.parquet', engine='pyarrow', compression='zstd', index=False)
+    else:
+        columns = {}
+        for column in table.columns:
+            values = table[column].to_numpy()
+            columns[str(column)] = values.astype(str) if values.dtype == object else values
+        np.savez_compressed(path + '.npz', **columns)
+
+
+def save_results(Terminal, path, labour=None, format=None):
+    """Write the result tables of a simulated Terminal to directory path
+
+    format: 'parquet' or 'npz'; by default Parquet if pyarrow is installed and NPZ otherwise
+    Returns the metadata that is written to metadata.json."""
+
+    if format is None:
+        format = 'parquet' if _has_pyarrow() else 'npz'
+    if format not in FORMATS:
+        raise ValueError('format should be one of {}, not {!r}'.format(FORMATS, format))
+    if format == 'parquet' and not _has_pyarrow():
+        raise ImportError('writing Parquet files requires pyarrow, use format="npz" or install pyarrow')
+
+    import opentisim
+
+    tables = result_tables(Terminal, labour)
+
+    os.makedirs(path, exist_ok=True)
+    for name, table in tables.items():
+        _write_table(table, os.path.join(path, name), format)
+
+    metadata = {'format': format,
+                'terminal': type(Terminal).__module__ + '.' + type(Terminal).__name__,
+                'startyear': Terminal.startyear,
+                'lifecycle': Terminal.lifecycle,
+                'elements': len(Terminal.elements),
+                'NPV': float(tables['npv']['PV'].sum()),
+                'version': opentisim.__version__}
+    with open(os.path.join(path, 'metadata.json'), 'w') as f:
+        json.dump(metadata, f, indent=1)
+
+    return metadata
+
+
+class Results(object):
+    """Result tables of a terminal simulation stored with save_results
+
+    path: directory with the result tables
+
+    The tables are attributes (elements, element_cash_flows, cash_flows, cash_flows_discounted, timelines, npv) that
+    are read from disk on first access."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'metadata.json')) as f:
+            self.metadata = json.load(f)
+        self.format = self.metadata['format']
+        self._tables = {}
+
+    def table(self, name, columns=None):
+        """Return table name as a dataframe, optionally only the given columns"""
+
+        if name not in TABLES:
+            raise KeyError('no table {!r}, the tables are {}'.format(name, TABLES))
+
+        if name in self._tables:
+            return self._tables[name] if columns is None else self._tables[name][columns]
+
+        file = os.path.join(self.path, name + '.' + self.format)
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+            table = pq.read_table(file, columns=columns, memory_map=True).to_pandas()
+        else:
+            with np.load(file) as data:
+                table = pd.DataFrame({column: data[column] for column in (columns or data.files)})
+
+        if columns is None:
+            self._tables[name] = table
+
+        return table
+
+    def __getattr__(self, name):
+        if name in TABLES:
+            return self.table(name)
+        raise AttributeError("{!r} object has no attribute {!r}".format(type(self).__name__, name))
+
+
+def load_results(path):
+    """Open the result tables that save_results wrote to directory path"""
+
+    return Results(path)
+
+
+def collect_results(paths, name, columns=None):
+    """Return table name of all result directories in paths as one dataframe, with the directory in column 'run'"""
+
+    frames = []
+    for path in paths:
+        table = Results(path).table(name, columns)
+        table.insert(0, 'run', str(path))
+        frames.append(table)
+
+    return pd.concat(frames, ignore_index=True)
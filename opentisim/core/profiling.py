@@ -0,0 +1,159 @@
+# package(s) for data handling
+import functools
+import fnmatch
+import inspect
+import time
+import tracemalloc
+
+import pandas as pd
+
+# terminal methods and core functions that are instrumented by default
+TERMINAL_METHODS = ['*_invest', 'calculate_*', 'throughput_elements']
+CORE_FUNCTIONS = ['add_cashflow_data_to_element', 'add_cashflow_elements', 'aggregate_cashflows',
+                  'discount_cashflows', 'NPV']
+
+
+class Profiler(object):
+    """Opt-in profiler of the per-year methods of a terminal
+
+    Terminal: terminal object to instrument (any of the terminal System classes)
+    methods: name patterns of the terminal methods to instrument
+    functions: names of the opentisim.core functions to instrument
+    memory: if True also record the net memory allocated by each call (with tracemalloc, which slows the run down)
+
+    The terminal methods are wrapped on the terminal object and the core functions in the opentisim.core namespace,
+    only while the profiler is active, so a terminal that is not profiled runs the unmodified methods. Use it as a
+    context manager around simulate (or call start and stop):
+
+        with opentisim.core.Profiler(Terminal) as profiler:
+            Terminal.simulate()
+        profiler.table()
+
+    Each call is booked on the year it was made for: the year argument of the method, or for the core functions
+    (that take no year) the year of the instrumented method they were called from. Times are cumulative, i.e. they
+    include the time of the instrumented calls made from within a call. The core functions are replaced module wide,
+    so do not profile terminals in different threads at the same time."""
+
+    def __init__(self, Terminal, methods=TERMINAL_METHODS, functions=CORE_FUNCTIONS, memory=False):
+        self.Terminal = Terminal
+        self.methods = methods
+        self.functions = functions
+        self.memory = memory
+
+        self.records = {}
+        self._years = []
+        self._patched = []
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def start(self):
+        """Instrument the terminal methods and core functions"""
+
+        if self._patched:
+            raise RuntimeError('the profiler is already active')
+
+        from opentisim import core
+        from opentisim.core import core as core_module
+
+        for name in sorted(dir(type(self.Terminal))):
+            if any(fnmatch.fnmatchcase(name, pattern) for pattern in self.methods):
+                method = getattr(self.Terminal, name)
+                if callable(method):
+                    self._patch(self.Terminal, name, self._wrap(name, method))
+
+        for name in self.functions:
+            wrapper = self._wrap('core.' + name, getattr(core_module, name))
+            self._patch(core_module, name, wrapper)
+            if hasattr(core, name):
+                self._patch(core, name, wrapper)
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        """Restore the original terminal methods and core functions"""
+
+        for owner, name, original in reversed(self._patched):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._patched = []
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _patch(self, owner, name, wrapper):
+        # methods are looked up on the class, so the instance has no own attribute to restore
+        original = owner.__dict__.get(name) if not inspect.ismodule(owner) else getattr(owner, name)
+        self._patched.append((owner, name, original))
+        setattr(owner, name, wrapper)
+
+    def _wrap(self, name, func):
+        try:
+            parameters = list(inspect.signature(func).parameters)
+        except (TypeError, ValueError):
+            parameters = []
+        year_index = parameters.index('year') if 'year' in parameters else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if 'year' in kwargs:
+                year = kwargs['year']
+            elif year_index is not None and year_index < len(args):
+                year = args[year_index]
+            else:
+                year = self._years[-1] if self._years else None
+
+            self._years.append(year)
+            memory = self.memory and tracemalloc.is_tracing()
+            if memory:
+                allocated = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._years.pop()
+
+                record = self.records.setdefault((year, name), [0, 0.0, 0])
+                record[0] += 1
+                record[1] += elapsed
+                if memory:
+                    record[2] += max(tracemalloc.get_traced_memory()[0] - allocated, 0)
+
+        return wrapper
+
+    def table(self):
+        """Return a dataframe with the number of calls, the cumulative time [s] and the net allocated memory [bytes]
+        per year and method (year is None for calls outside the per-year methods, e.g. NPV after the simulation)"""
+
+        data = [[year, method, calls, seconds, allocated]
+                for (year, method), (calls, seconds, allocated) in self.records.items()]
+        table = pd.DataFrame(data, columns=['year', 'method', 'calls', 'time', 'allocated'])
+        table['year'] = table['year'].astype('Int64')
+        if not self.memory:
+            table = table.drop(columns='allocated')
+
+        return table.sort_values(['year', 'method'], na_position='last').reset_index(drop=True)
+
+    def summary(self):
+        """Return the table summed over the years per method, slowest method first"""
+
+        table = self.table().drop(columns='year')
+
+        return table.groupby('method').sum().sort_values('time', ascending=False)
+
+    def reset(self):
+        """Forget the recorded calls"""
+
+        self.records = {}
@@ -0,0 +1,180 @@
+"""Simulation of demand scenario trees with shared prefixes.
+
+In a scenario tree the demand paths share their early years and branch later on. Each node holds the demand of a span
+of years; a path from the root to a leaf is one scenario. run_scenario_tree simulates the terminal year by year
+through the tree: every node is simulated once, a snapshot is taken where the tree branches and each branch
+continues from that snapshot. The work is the number of node years, instead of leaves x years.
+
+    tree = ScenarioNode([2020, 2021, 2022], [1e6, 1.2e6, 1.4e6], children=[
+        ScenarioNode([2023, 2024], [1.6e6, 1.8e6], probability=0.5),
+        ScenarioNode([2023, 2024], [1.2e6, 1.0e6], probability=0.5)])
+    result = opentisim.core.run_scenario_tree(Terminal, tree)
+    result.leaves, result.expected()
+
+Scenarios that were generated as separate paths (e.g. the scenario_data of an ensemble) are merged into a tree of
+their common prefixes with tree_from_scenarios. While a node is simulated the commodity knows the demand of the path
+up to the end of the node only, so the investment decisions in the shared years can not depend on the branches.
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+
+class ScenarioNode(object):
+    """Node of a demand scenario tree
+
+    years: the consecutive years of the node (following the years of its parent)
+    volumes: the demand in each of these years [t/y or TEU/y]
+    children: the nodes that follow (none for a leaf)
+    probability: probability of the node given its parent
+    name: name of the node (by default its position in the tree: '0', '0.1', ...)"""
+
+    def __init__(self, years, volumes, children=(), probability=1.0, name=None):
+        self.years = [int(year) for year in years]
+        self.volumes = [float(volume) for volume in volumes]
+        self.children = list(children)
+        self.probability = probability
+        self.name = name
+
+        if len(self.years) != len(self.volumes):
+            raise ValueError('a node needs a volume for each of its {} years'.format(len(self.years)))
+        for child in self.children:
+            if self.years and child.years and child.years[0] != self.years[-1] + 1:
+                raise ValueError('node starting in {} does not follow a node ending in {}'.format(
+                    child.years[0], self.years[-1]))
+
+    def nodes(self, name='0'):
+        """Iterate over (name, node) of the node and all nodes below it, parents before their children"""
+
+        name = self.name if self.name is not None else name
+        yield name, self
+        for position, child in enumerate(self.children):
+            yield from child.nodes('{}.{}'.format(name, position))
+
+    def leaves(self):
+        """Return the number of leaves (scenarios) below the node"""
+
+        return 1 if not self.children else sum(child.leaves() for child in self.children)
+
+    def depth(self):
+        """Return the number of years from the start of the node to the end of its longest path"""
+
+        return len(self.years) + max([child.depth() for child in self.children], default=0)
+
+
+def tree_from_scenarios(scenarios, probabilities=None):
+    """Return the ScenarioNode tree of scenarios (dataframes with year and volume over the same years) in which the
+    scenarios share the nodes of their common first years
+
+    probabilities: probability of each scenario (by default all scenarios are equally likely)"""
+
+    scenarios = [scenario.sort_values('year') for scenario in scenarios]
+    years = list(scenarios[0]['year'])
+    if any(list(scenario['year']) != years for scenario in scenarios):
+        raise ValueError('all scenarios should cover the same years')
+
+    volumes = np.array([scenario['volume'].to_numpy(dtype=float) for scenario in scenarios])
+    if probabilities is None:
+        probabilities = np.full(len(scenarios), 1 / len(scenarios))
+    probabilities = np.asarray(probabilities, dtype=float)
+
+    def branch(members, start, probability):
+        # extend the node while all member scenarios have the same volumes
+        end = start + 1
+        while end < len(years) and np.all(volumes[members, end] == volumes[members[0], end]):
+            end += 1
+
+        children = []
+        if end < len(years):
+            groups = {}
+            for member in members:
+                groups.setdefault(volumes[member, end], []).append(member)
+            children = [branch(group, end, probabilities[group].sum() / probabilities[members].sum())
+                        for group in groups.values()]
+
+        return ScenarioNode(years[start:end], volumes[members[0], start:end], children, probability)
+
+    return branch(list(range(len(scenarios))), 0, 1.0)
+
+
+class ScenarioTreeResult(object):
+    """Outcome of a scenario tree run
+
+    leaves: dataframe with a row per leaf (scenario): its name, probability and output
+    terminals: the simulated terminal of each leaf (if they were kept)
+    simulated_years: number of simulated terminal years"""
+
+    def __init__(self, leaves, terminals, simulated_years):
+        self.leaves = leaves
+        self.terminals = terminals
+        self.simulated_years = simulated_years
+
+    def expected(self):
+        """Return the probability weighted output of the leaves"""
+
+        return float((self.leaves['probability'] * self.leaves['output']).sum() / self.leaves['probability'].sum())
+
+
+def _path_scenario(path):
+    """Return the scenario_data of a path of nodes (the years and volumes of the nodes in order)"""
+
+    years = [year for node in path for year in node.years]
+    volumes = [volume for node in path for volume in node.volumes]
+
+    return pd.DataFrame(data={'year': years, 'volume': np.asarray(volumes).astype(np.int64)})
+
+
+def run_scenario_tree(Terminal, tree, output=None, commodity=0, keep_terminals=False):
+    """Simulate Terminal through the scenario tree and return a ScenarioTreeResult
+
+    Terminal: template terminal (not simulated), it is not changed
+    tree: the root ScenarioNode
+    output: function of the simulated terminal of a leaf, by default the NPV (terminal_npv)
+    commodity: index of the commodity that gets the demand, among the elements with scenario_data
+    keep_terminals: keep the simulated terminal of each leaf in the result"""
+
+    from opentisim.core.evaluation import terminal_npv
+    from opentisim.core.snapshot import snapshot
+
+    if output is None:
+        output = terminal_npv
+
+    template = snapshot(Terminal)
+    template.sink = None
+
+    rows = []
+    terminals = {}
+    simulated_years = 0
+
+    # depth first, so that only the snapshots of the branch points on the current path are kept
+    stack = [(template, [], '0', tree, 1.0)]
+    while stack:
+        state, path, name, node, probability = stack.pop()
+        name = node.name if node.name is not None else name
+        path = path + [node]
+        probability = probability * node.probability
+
+        Terminal = state.restore()
+        Terminal.lifecycle = 1
+        commodities = [element for element in Terminal.elements if hasattr(element, 'scenario_data')]
+        commodities[commodity].scenario_data = _path_scenario(path)
+
+        for year in node.years:
+            Terminal.startyear = year
+            Terminal.simulate()
+        simulated_years += len(node.years)
+
+        if node.children:
+            branch_point = snapshot(Terminal)
+            for position in reversed(range(len(node.children))):
+                stack.append((branch_point, path, '{}.{}'.format(name, position), node.children[position],
+                              probability))
+        else:
+            rows.append({'leaf': name, 'probability': probability, 'output': output(Terminal)})
+            if keep_terminals:
+                terminals[name] = Terminal
+
+    leaves = pd.DataFrame(rows, columns=['leaf', 'probability', 'output'])
+
+    return ScenarioTreeResult(leaves, terminals, simulated_years)
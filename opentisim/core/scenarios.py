@@ -0,0 +1,146 @@
+"""Monte Carlo ensembles of demand scenarios.
+
+Each generator returns a DemandEnsemble: n demand paths over the given years as an (n x years) array, drawn at once
+from a numpy.random.Generator. Pass an integer seed (or a Generator) to get reproducible paths.
+
+- random_growth: the yearly volume is multiplied by rate plus a normally distributed increment (the scenario_random
+  model of the Commodity elements)
+- geometric_brownian: geometric Brownian motion with a yearly drift and volatility
+- regime_switching: the growth rate and volatility follow a Markov chain of regimes (e.g. growth and recession)
+- bootstrap_history: the yearly growth factors are resampled from the historic data
+
+An ensemble path is turned into the scenario_data of a commodity with ensemble.scenario(i):
+
+    ensemble = opentisim.core.geometric_brownian(1_000_000, years, n=1000, drift=0.02, volatility=0.05, seed=1)
+    commodity.scenario_data = ensemble.scenario(0)
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+
+def _rng(seed):
+    """Return a numpy.random.Generator for seed (None, an integer, a SeedSequence or a Generator)"""
+
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+
+def _start_volume(start):
+    """Return the start volume: a number, or the last volume of historic data (a dataframe with year and volume)"""
+
+    if isinstance(start, pd.DataFrame):
+        return float(start.sort_values('year')['volume'].iloc[-1])
+    return float(start)
+
+
+class DemandEnsemble(object):
+    """Ensemble of demand paths
+
+    years: the years of the paths
+    volumes: array of n paths x years with the demand [t/y or TEU/y]"""
+
+    def __init__(self, years, volumes):
+        self.years = np.asarray(list(years))
+        self.volumes = np.asarray(volumes, dtype=float)
+        # regime of each path and year (regime_switching only)
+        self.regimes = None
+
+        if self.volumes.ndim != 2 or self.volumes.shape[1] != len(self.years):
+            raise ValueError('volumes should be an array of paths x {} years, not of shape {}'.format(
+                len(self.years), self.volumes.shape))
+
+    def __len__(self):
+        return self.volumes.shape[0]
+
+    def scenario(self, i):
+        """Return path i as scenario_data for a commodity (a dataframe with year and volume, volumes as integers)"""
+
+        return pd.DataFrame(data={'year': self.years, 'volume': self.volumes[i].astype(np.int64)})
+
+    def scenarios(self):
+        """Iterate over the scenario_data of all paths"""
+
+        for i in range(len(self)):
+            yield self.scenario(i)
+
+    def percentiles(self, q=(5, 50, 95)):
+        """Return the percentiles q of the demand per year as a dataframe (a row per year, a column per percentile)"""
+
+        return pd.DataFrame(np.percentile(self.volumes, q, axis=0).T, index=pd.Index(self.years, name='year'),
+                            columns=list(q))
+
+
+def random_growth(start, years, n=1, rate=1.02, mu=0.01, sigma=0.065, seed=None):
+    """Paths in which each year the volume is multiplied by rate + a normal increment with mean mu and deviation sigma
+
+    start: the volume in the year before the first year (or historic data, of which the last volume is taken)"""
+
+    years = list(years)
+    factors = rate + _rng(seed).normal(mu, sigma, size=(n, len(years)))
+
+    return DemandEnsemble(years, _start_volume(start) * np.cumprod(factors, axis=1))
+
+
+def geometric_brownian(start, years, n=1, drift=0.02, volatility=0.05, seed=None):
+    """Geometric Brownian motion paths: the expected volume grows with exp(drift) per year, the log volume has a
+    yearly standard deviation volatility
+
+    start: the volume in the year before the first year (or historic data, of which the last volume is taken)"""
+
+    years = list(years)
+    increments = (drift - volatility ** 2 / 2) + volatility * _rng(seed).standard_normal(size=(n, len(years)))
+
+    return DemandEnsemble(years, _start_volume(start) * np.exp(np.cumsum(increments, axis=1)))
+
+
+def regime_switching(start, years, n=1, growth=(0.03, -0.02), volatility=(0.02, 0.05),
+                     transition=((0.9, 0.1), (0.3, 0.7)), initial_regime=0, seed=None):
+    """Paths with regime dependent growth: each year the regime of a path changes according to the transition matrix
+    (transition[i][j] is the probability to go from regime i to regime j) and the log volume grows with the growth
+    rate and volatility of the regime
+
+    start: the volume in the year before the first year (or historic data, of which the last volume is taken)"""
+
+    years = list(years)
+    growth = np.asarray(growth, dtype=float)
+    volatility = np.asarray(volatility, dtype=float)
+    transition = np.asarray(transition, dtype=float)
+    if transition.shape != (len(growth), len(growth)) or not np.allclose(transition.sum(axis=1), 1):
+        raise ValueError('transition should be a square matrix with a row per regime that sums to 1')
+
+    rng = _rng(seed)
+    uniforms = rng.random(size=(n, len(years)))
+    normals = rng.standard_normal(size=(n, len(years)))
+
+    # the regimes are a Markov chain over the years, drawn for all paths at once
+    cumulative = np.cumsum(transition, axis=1)
+    regimes = np.empty((n, len(years)), dtype=int)
+    regime = np.full(n, initial_regime)
+    for t in range(len(years)):
+        regime = np.minimum((uniforms[:, t, None] > cumulative[regime]).sum(axis=1), len(growth) - 1)
+        regimes[:, t] = regime
+
+    increments = growth[regimes] - volatility[regimes] ** 2 / 2 + volatility[regimes] * normals
+
+    ensemble = DemandEnsemble(years, _start_volume(start) * np.exp(np.cumsum(increments, axis=1)))
+    ensemble.regimes = regimes
+
+    return ensemble
+
+
+def bootstrap_history(historic_data, years, n=1, seed=None):
+    """Paths that continue the historic data with yearly growth factors drawn (with replacement) from the historic
+    year on year growth factors
+
+    historic_data: dataframe with year and volume (at least two years)"""
+
+    historic = historic_data.sort_values('year')['volume'].to_numpy(dtype=float)
+    if len(historic) < 2:
+        raise ValueError('bootstrapping needs the volumes of at least two historic years')
+
+    years = list(years)
+    factors = historic[1:] / historic[:-1]
+    draws = factors[_rng(seed).integers(0, len(factors), size=(n, len(years)))]
+
+    return DemandEnsemble(years, historic[-1] * np.cumprod(draws, axis=1))
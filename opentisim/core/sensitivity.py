@@ -0,0 +1,153 @@
+"""Global sensitivity analysis of terminal outputs (NPV by default) to terminal parameters.
+
+- morris: elementary effects along Morris trajectories (mu, mu_star and sigma per parameter), a cheap screening of
+  which parameters matter
+- sobol: first order and total Sobol indices from a Saltelli design on a scrambled Sobol sequence
+
+Both take the template terminal and the bounds of the parameters, e.g.
+
+    bounds = {'allowable_berth_occupancy': (0.3, 0.6),
+              'crane_type_defaults.hourly_cycles': (15, 35),
+              'config.energy_data.price': (0.1, 0.3)}
+    opentisim.core.morris(Terminal, bounds, trajectories=20, seed=1, executor=executor)
+
+and evaluate all points of the design in one batch with an Evaluator (see opentisim.core.evaluation), so that the
+simulations run in parallel on the executor, can use a ResultCache and are not repeated for points that occur more
+than once. Pass the same evaluator to several analyses to also share the points between them. The confidence
+intervals (half widths at the given confidence level) are estimated by bootstrapping the design.
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+
+def _evaluator(Terminal, bounds, evaluator, options):
+    from opentisim.core.evaluation import Evaluator
+
+    names = list(bounds)
+    if evaluator is None:
+        return Evaluator(Terminal, names, **options)
+    if evaluator.names != names:
+        raise ValueError('the evaluator evaluates {}, not {}'.format(evaluator.names, names))
+    return evaluator
+
+
+def _scale(unit, bounds):
+    low = np.array([bound[0] for bound in bounds.values()], dtype=float)
+    high = np.array([bound[1] for bound in bounds.values()], dtype=float)
+    return low + unit * (high - low)
+
+
+def _half_width(samples, confidence):
+    from scipy import stats
+
+    return stats.norm.ppf(0.5 + confidence / 2) * np.std(samples, ddof=1, axis=0)
+
+
+def morris_trajectories(k, trajectories=10, levels=4, seed=None):
+    """Return Morris trajectories in the unit cube as an array of trajectories x (k + 1) points x k parameters
+
+    Each trajectory starts at a random point of the grid of levels and changes the parameters one by one, in random
+    order, by delta = levels / (2 * (levels - 1))."""
+
+    rng = np.random.default_rng(seed)
+    delta = levels / (2 * (levels - 1))
+    starts = np.arange(levels) / (levels - 1)
+    starts = starts[starts + delta <= 1 + 1e-12]
+
+    design = np.empty((trajectories, k + 1, k))
+    for trajectory in range(trajectories):
+        point = rng.choice(starts, size=k)
+        design[trajectory, 0] = point
+        for step, parameter in enumerate(rng.permutation(k)):
+            point = point.copy()
+            point[parameter] += delta
+            design[trajectory, step + 1] = point
+
+    return design
+
+
+def morris(Terminal, bounds, trajectories=10, levels=4, seed=None, confidence=0.95, bootstrap=1000, evaluator=None,
+           **options):
+    """Return the Morris screening of the parameters in bounds as a dataframe with a row per parameter and columns
+    mu, mu_star (mean of the absolute elementary effects), sigma and mu_star_conf
+
+    The elementary effects are changes of the output per unit of the scaled parameter (the parameter range is 1).
+    options are passed to the Evaluator (output, executor, chunksize, cache)."""
+
+    evaluator = _evaluator(Terminal, bounds, evaluator, options)
+    k = len(bounds)
+    rng = np.random.default_rng(seed)
+
+    design = morris_trajectories(k, trajectories, levels, rng)
+    outputs = evaluator.evaluate(_scale(design.reshape(-1, k), bounds)).reshape(trajectories, k + 1)
+
+    delta = levels / (2 * (levels - 1))
+    effects = np.empty((trajectories, k))
+    for trajectory in range(trajectories):
+        changed = np.argmax(np.diff(design[trajectory], axis=0) != 0, axis=1)
+        effects[trajectory, changed] = np.diff(outputs[trajectory]) / delta
+
+    resamples = rng.integers(0, trajectories, size=(bootstrap, trajectories))
+    mu_star_samples = np.abs(effects)[resamples].mean(axis=1)
+
+    return pd.DataFrame({'mu': effects.mean(axis=0),
+                         'mu_star': np.abs(effects).mean(axis=0),
+                         'sigma': effects.std(axis=0, ddof=1) if trajectories > 1 else np.nan,
+                         'mu_star_conf': _half_width(mu_star_samples, confidence)},
+                        index=pd.Index(list(bounds), name='parameter'))
+
+
+def saltelli_design(k, n=64, seed=None):
+    """Return the matrices A and B (n x k, in the unit cube) of a Saltelli design, from a scrambled Sobol sequence"""
+
+    from scipy.stats import qmc
+
+    sampler = qmc.Sobol(d=2 * k, scramble=True, seed=np.random.default_rng(seed))
+    if n & (n - 1) == 0:
+        base = sampler.random_base2(int(np.log2(n)))
+    else:
+        base = sampler.random(n)
+
+    return base[:, :k], base[:, k:]
+
+
+def _sobol_indices(f_a, f_b, f_ab):
+    variance = np.var(np.concatenate([f_a, f_b], axis=-1), axis=-1, ddof=1)[..., None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = np.mean(f_b[..., None] * (f_ab - f_a[..., None]), axis=-2) / variance
+        total = 0.5 * np.mean((f_a[..., None] - f_ab) ** 2, axis=-2) / variance
+    return first, total
+
+
+def sobol(Terminal, bounds, n=64, seed=None, confidence=0.95, bootstrap=1000, evaluator=None, **options):
+    """Return the Sobol indices of the parameters in bounds as a dataframe with a row per parameter and columns S1,
+    S1_conf, ST and ST_conf
+
+    The design takes n * (k + 2) evaluations for k parameters (n preferably a power of 2). The first order indices
+    follow Saltelli et al. (2010), the total indices Jansen (1999). options are passed to the Evaluator (output,
+    executor, chunksize, cache)."""
+
+    evaluator = _evaluator(Terminal, bounds, evaluator, options)
+    k = len(bounds)
+    rng = np.random.default_rng(seed)
+
+    a, b = saltelli_design(k, n, rng)
+    ab = np.repeat(a[None, :, :], k, axis=0)
+    for parameter in range(k):
+        ab[parameter, :, parameter] = b[:, parameter]
+
+    outputs = evaluator.evaluate(_scale(np.concatenate([a, b, ab.reshape(-1, k)]), bounds))
+    f_a, f_b, f_ab = outputs[:n], outputs[n:2 * n], outputs[2 * n:].reshape(k, n).T
+
+    first, total = _sobol_indices(f_a, f_b, f_ab)
+
+    resamples = rng.integers(0, n, size=(bootstrap, n))
+    first_samples, total_samples = _sobol_indices(f_a[resamples], f_b[resamples], f_ab[resamples])
+
+    return pd.DataFrame({'S1': first,
+                         'S1_conf': _half_width(first_samples, confidence),
+                         'ST': total,
+                         'ST_conf': _half_width(total_samples, confidence)},
+                        index=pd.Index(list(bounds), name='parameter'))
@@ -0,0 +1,159 @@
+"""Snapshots of the state of a terminal, to branch year-by-year runs into several futures.
+
+A terminal simulated year by year (lifecycle=1, startyear stepping) can be stopped, captured with snapshot and
+continued from the snapshot as often as needed:
+
+    state = opentisim.core.snapshot(Terminal)        # after simulating up to and including year N
+    branch = opentisim.core.restore(state)           # a new terminal, continue with branch.startyear = N + 1
+
+A snapshot holds the terminal attributes, one attribute dict per element and a cash flow ledger: the cash flow
+dataframes of all elements with the same columns stacked into one numpy array. Element attribute values are shared
+between the snapshot and all terminals restored from it (only the dicts are copied), so a restore costs one small
+object per element plus a copy of its cash flow dataframe, instead of a deep copy of every element and its
+attributes. Give elements of a restored terminal new attribute values (e.g. commodity.scenario_data = ...) instead of
+changing the shared values in place.
+"""
+
+# package(s) for data handling
+import numpy as np
+import pandas as pd
+
+from .elements import element_attributes
+
+
+def _copy_value(value):
+    """Copy the mutable containers the terminal classes keep in their attributes (lists, dicts, sets), share the rest"""
+
+    if isinstance(value, list):
+        return list(value)
+    elif isinstance(value, dict):
+        return dict(value)
+    elif isinstance(value, set):
+        return set(value)
+    elif isinstance(value, pd.DataFrame):
+        return value.copy()
+
+    return value
+
+
+class TerminalSnapshot(object):
+    """State of a terminal, created with snapshot and turned back into a terminal with restore
+
+    terminal_class: class of the terminal
+    state: terminal attributes (without its elements, logger and cached values)
+    elements: per element its class, its attribute dict (without df) and the position of its cash flows in the ledger
+    ledger: per dataframe layout the column names, the column dtypes and an (elements x years x columns) array
+    sink: sink of the terminal logger, shared by the restored terminals"""
+
+    def __init__(self, terminal_class, state, elements, ledger, sink=None):
+        self.terminal_class = terminal_class
+        self.state = state
+        self.elements = elements
+        self.ledger = ledger
+        self.sink = sink
+        self._dataframes = None
+
+    @property
+    def year(self):
+        """Last simulated year of the terminal (None if no year was simulated)"""
+
+        years = self.state.get('years')
+        return years[-1] if years else None
+
+    @property
+    def nbytes(self):
+        """Size of the cash flow ledger arrays in bytes"""
+
+        return sum(array.nbytes for _, _, array in self.ledger)
+
+    def dataframes(self):
+        """Return the cash flow dataframe of each element (None for elements without cash flows)
+
+        The dataframes are built from the ledger on first use and kept, so that every next restore only copies them."""
+
+        if self._dataframes is None:
+            dataframes = []
+            for _, attributes, layout, row in self.elements:
+                if layout is not None:
+                    columns, dtypes, array = self.ledger[layout]
+                    dataframes.append(pd.DataFrame({column: array[row, :, index].astype(dtype)
+                                                    for index, (column, dtype) in enumerate(zip(columns, dtypes))}))
+                else:
+                    dataframes.append(attributes.get('df'))
+            self._dataframes = dataframes
+
+        return self._dataframes
+
+    def restore(self):
+        """Return a new terminal in the state of the snapshot"""
+
+        from opentisim.core.events import EventLogger
+        from opentisim.core.elements import set_element_attributes
+
+        Terminal = self.terminal_class.__new__(self.terminal_class)
+        for key, value in self.state.items():
+            setattr(Terminal, key, _copy_value(value))
+        Terminal.logger = EventLogger(self.sink)
+
+        elements = []
+        for (element_class, attributes, _, _), df in zip(self.elements, self.dataframes()):
+            element = element_class.__new__(element_class)
+            set_element_attributes(element, attributes)
+            if df is not None:
+                element.df = df.copy()
+            elements.append(element)
+        Terminal.elements = elements
+
+        return Terminal
+
+    def __getstate__(self):
+        # the dataframes are rebuilt from the ledger after unpickling
+        state = dict(self.__dict__)
+        state['_dataframes'] = None
+        return state
+
+
+def snapshot(Terminal):
+    """Return a TerminalSnapshot of the current state of Terminal
+
+    Cached values (attributes starting with an underscore) are not stored, a restored terminal computes them again."""
+
+    state = {key: _copy_value(value) for key, value in vars(Terminal).items()
+             if key not in ['elements', 'logger'] and not key.startswith('_')}
+
+    # group the numeric cash flow dataframes by layout to stack them into one array per layout
+    layouts = {}
+    frames = []
+    elements = []
+    for element in Terminal.elements:
+        attributes = {key: value for key, value in element_attributes(element).items() if key != 'df'}
+        layout = row = None
+        df = getattr(element, 'df', None)
+        if isinstance(df, pd.DataFrame):
+            dtypes = tuple(df.dtypes)
+            if isinstance(df.index, pd.RangeIndex) and all(
+                    isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number) for dtype in dtypes):
+                key = (tuple(df.columns), dtypes, len(df))
+                if key not in layouts:
+                    layouts[key] = len(layouts)
+                    frames.append([])
+                layout = layouts[key]
+                row = len(frames[layout])
+                frames[layout].append(df.to_numpy(dtype=float))
+            else:
+                attributes['df'] = df.copy()
+        elements.append((type(element), attributes, layout, row))
+
+    ledger = [None] * len(layouts)
+    for (columns, dtypes, _), index in layouts.items():
+        ledger[index] = (list(columns), dtypes, np.stack(frames[index]))
+
+    logger = getattr(Terminal, 'logger', None)
+
+    return TerminalSnapshot(type(Terminal), state, tuple(elements), ledger, logger.sink if logger else None)
+
+
+def restore(snapshot):
+    """Return a new terminal in the state of snapshot (see TerminalSnapshot.restore)"""
+
+    return snapshot.restore()
@@ -0,0 +1,6 @@
+"""Directory for the simulation activities."""
+
+from .agribulk_defaults import *
+from .agribulk_mixins import *
+from .agribulk_objects import *
+from .agribulk_system import *
@@ -287,3 +287,12 @@ energy_data = {"name": 'Energy',
 
 train_data = {"wagon_payload": 60,
               "number_of_wagons": 60}
+
+
+def default_config():
+    """Return the current values of the defaults dicts of this module as a frozen opentisim.core.Config"""
+
+    import sys
+    from opentisim.core.config import Config
+
+    return Config.from_module(sys.modules[__name__])
@@ -21,26 +21,28 @@
 """
 
 # package for unique identifiers
-import uuid
 
 import numpy as np
-import pandas as pd
 
-import matplotlib.pyplot as plt
+from opentisim.core.elements import new_id
+from opentisim.core.scenarios import random_growth
+
 
 
 class identifiable_properties_mixin(object):
     """Something that has a name and id
 
     name: a name
-    id: a unique id generated with uuid"""
+    id: a unique id (sequential number)"""
+
+    __slots__ = ()
 
-    def __init__(self, name=[], id=None, *args, **kwargs):
+    def __init__(self, name=(), id=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.name = name
-        # generate some id, in this case based on m
-        self.id = id if id else str(uuid.uuid1())
+        # generate a sequential id
+        self.id = id if id else new_id()
 
 
 class history_properties_mixin(object):
@@ -49,7 +51,9 @@ class history_properties_mixin(object):
     purchase_date: year in which the decision was made to add another element
     online_date: year by which the elements starts to perform"""
 
-    def __init__(self, year_purchase=[], year_online=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, year_purchase=(), year_online=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.year_purchase = year_purchase
@@ -61,7 +65,9 @@ class hascapex_properties_mixin(object):
 
     capex: list with cost to be applied from investment year"""
 
-    def __init__(self, capex=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, capex=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.capex = capex
@@ -72,8 +78,10 @@ class hasopex_properties_mixin(object):
 
     opex: list with cost to be applied from investment year"""
 
-    def __init__(self, labour=[], maintenance=[], energy=[], insurance=[],
-                 lease=[], demurrage=[], residual=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, labour=(), maintenance=(), energy=(), insurance=(),
+                 lease=(), demurrage=(), residual=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.labour = labour
@@ -90,7 +98,9 @@ class hasrevenue_properties_mixin(object):
 
     revenue: list with revenues to be applied from investment year"""
 
-    def __init__(self, renevue=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, renevue=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.renevue = renevue
@@ -101,13 +111,17 @@ class hastriggers_properties_mixin(object):
 
     triggers: list with revenues to be applied from investment year"""
 
-    def __init__(self, triggers=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, triggers=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.triggers = triggers
 
 
 class quay_wall_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation_min, mobilisation_perc,
                  maintenance_perc, insurance_perc, freeboard, Gijt_constant_2, Gijt_constant, Gijt_coefficient, max_sinkage, wave_motion,
                  safety_margin, *args, **kwargs):
@@ -129,6 +143,8 @@ class quay_wall_properties_mixin(object):
         self.safety_margin= safety_margin
 
 class berth_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, crane_type, max_cranes, delivery_time, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -138,6 +154,8 @@ class berth_properties_mixin(object):
 
 
 class cyclic_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, unit_rate, mobilisation_perc, maintenance_perc,
                  consumption, insurance_perc, crew, crane_type, lifting_capacity, hourly_cycles, eff_fact,
                  *args, **kwargs):
@@ -162,6 +180,8 @@ class cyclic_properties_mixin(object):
 
 
 class continuous_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, unit_rate, mobilisation_perc, maintenance_perc,
                  consumption, insurance_perc, crew, crane_type, peak_capacity, eff_fact, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -183,6 +203,8 @@ class continuous_properties_mixin(object):
 
 
 class conveyor_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, length, ownership, delivery_time, lifespan, unit_rate_factor, mobilisation,
                  maintenance_perc, insurance_perc,
                  consumption_constant, consumption_coefficient, crew, utilisation, capacity_steps, *args, **kwargs):
@@ -205,6 +227,8 @@ class conveyor_properties_mixin(object):
 
 
 class storage_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc,
                  maintenance_perc, crew, insurance_perc, storage_type, consumption, capacity,  *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -225,6 +249,8 @@ class storage_properties_mixin(object):
 
 
 class unloading_station_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, unit_rate, mobilisation, maintenance_perc,
                  insurance_perc, consumption, crew, production, wagon_payload, number_of_wagons, prep_time, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -246,6 +272,8 @@ class unloading_station_properties_mixin(object):
         self.service_rate = int(self.call_size / (self.call_size/self.production + self.prep_time)) #TUE/hour, IJzermans 2019, P30
 
 class commodity_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, handling_fee, handysize_perc, handymax_perc, panamax_perc, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -256,6 +284,8 @@ class commodity_properties_mixin(object):
 
 
 class vessel_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self,
                  type, call_size, LOA, draft, beam, max_cranes, all_turn_time, mooring_time, demurrage_rate,
                  *args, **kwargs):
@@ -273,6 +303,8 @@ class vessel_properties_mixin(object):
 
 
 class labour_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, international_salary, international_staff, local_salary, local_staff, operational_salary,
                  shift_length, annual_shifts, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -286,11 +318,15 @@ class labour_properties_mixin(object):
 
 
 class energy_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, price, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.price = price
 
 class train_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, wagon_payload, number_of_wagons, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -306,31 +342,29 @@ class hasscenario_properties_mixin(object):
     historic_data: observed demand
     scenario_data: generated estimates of future demand"""
 
-    def __init__(self, historic_data=[], scenario_data=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, historic_data=(), scenario_data=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.historic_data = historic_data
         self.scenario_data = scenario_data
 
-    def scenario_random(self, startyear=2019, lifecycle=20, rate=1.02, mu=0.01, sigma=0.065):
-        """trend generated from random growth rate increments"""
-        # package(s) used for probability
+    def scenario_random(self, startyear=2019, lifecycle=20, rate=1.02, mu=0.01, sigma=0.065, seed=None):
+        """trend generated from random growth rate increments
+
+        seed: integer or numpy.random.Generator for a reproducible trend (see opentisim.core.random_growth for
+        ensembles of many trends)"""
         years = range(startyear, startyear + lifecycle)
         volume = self.historic_data[self.historic_data.year == startyear - 1].volume.item()
 
-        volumes = []
-        for year in years:
-            change = np.random.normal(mu, sigma, 1)
-            new_rate = rate + change
-            volume = volume * new_rate
-            volumes.append(np.int(volume))
-
-        scenario_data = {'year': years, 'volume': volumes}
-
-        self.scenario_data = pd.DataFrame(data=scenario_data)
+        self.scenario_data = random_growth(volume, years, 1, rate, mu, sigma, seed).scenario(0)
 
     def plot_demand(self, width=0.1, alpha=0.6, fontsize=20):
         """generate a histogram of the demand data"""
+
+        import matplotlib.pyplot as plt
+
         # generate plot
         fig, ax = plt.subplots(figsize=(20, 10))
 
@@ -1,12 +1,10 @@
 # package(s) for data handling
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib
 
 # opentisim package
-from opentisim.agribulk_objects import *
-from opentisim import agribulk_defaults
+from .agribulk_objects import *
+from . import agribulk_defaults
 from opentisim import core
 
 
@@ -19,26 +17,39 @@ class System:
     - the allowable waiting time as a factor of service time at the berth
     - the allowable dwell time of cargo in the storage area, and
     - the allowable waiting time as a factor of service time at the station."""
-    def __init__(self, startyear=2019, lifecycle=20, operational_hours=5840, debug=False, elements=[],
-                 crane_type_defaults=agribulk_defaults.mobile_crane_data,
-                 storage_type_defaults=agribulk_defaults.silo_data,
+    def __init__(self, startyear=2019, lifecycle=20, operational_hours=5840, debug=False, elements=None,
+                 crane_type_defaults=None,
+                 storage_type_defaults=None,
                  allowable_waiting_service_time_ratio_berth=0.3, allowable_berth_occupancy=0.4,
                  allowable_dwelltime=18 / 365,
-                 allowable_waiting_service_time_ratio_station=0.5, allowable_station_occupancy=0.4):
+                 allowable_waiting_service_time_ratio_station=0.5, allowable_station_occupancy=0.4,
+                 sink=None, config=None):
         # time inputs
         self.startyear = startyear
         self.lifecycle = lifecycle
         self.operational_hours = operational_hours
+        self.years = []
 
-        # provide intermediate outputs via print statements if debug = True
+        # the drybulk model is run stand-alone, so the model frame for the cash flows is the terminal lifecycle
+        self.modelframe = list(range(startyear, startyear + lifecycle))
+
+        # log investment decisions and per-year KPIs to sink (printed to the console if debug = True)
         self.debug = debug
+        self.logger = core.EventLogger(sink, debug=debug)
+
+        # frozen copy of the defaults dicts that the methods read (see opentisim.core.config)
+        self.config = config if config is not None else agribulk_defaults.default_config()
 
-        # collection of all terminal objects
-        self.elements = elements
+        # collection of all terminal objects (a list of its own, so terminals never share their elements list)
+        self.elements = [] if elements is None else list(elements)
 
         # default values to use in case various types can be selected
-        self.crane_type_defaults = crane_type_defaults
-        self.storage_type_defaults = storage_type_defaults
+        if crane_type_defaults is None:
+            crane_type_defaults = self.config.mobile_crane_data
+        self.crane_type_defaults = core.freeze(crane_type_defaults)
+        if storage_type_defaults is None:
+            storage_type_defaults = self.config.silo_data
+        self.storage_type_defaults = core.freeze(storage_type_defaults)
 
         # triggers for the various elements (berth, storage and station)
         self.allowable_waiting_service_time_ratio_berth = allowable_waiting_service_time_ratio_berth
@@ -92,42 +103,35 @@ class System:
             - operational objective: Annually invest in infrastructure upgrades when performance criteria are triggered
             """
 
-            if self.debug:
-                print('')
-                print('### Simulate year: {} ############################'.format(year))
+            self.years.append(year)
+
+            self.logger.start_year(year)
 
             # 1. for each year estimate the anticipated vessel arrivals based on the expected demand
-            handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
-            if self.debug:
-                print('--- Cargo volume and vessel calls for {} ---------'.format(year))
-                print('  Total cargo volume: {}'.format(total_vol))
-                print('  Total vessel calls: {}'.format(total_calls))
-                print('     Handysize calls: {}'.format(handysize))
-                print('     Handymax calls: {}'.format(handymax))
-                print('     Panamax calls: {}'.format(panamax))
-                print('----------------------------------------------------')
+            snapshot = self.occupancy_snapshot(year)
+            handysize, handymax, panamax = \
+                snapshot['handysize_calls'], snapshot['handymax_calls'], snapshot['panamax_calls']
+            total_calls, total_vol = snapshot['total_calls'], snapshot['total_vol']
+            self.logger.kpi('vessel_calls', total_vol=total_vol, total_calls=total_calls, handysize_calls=handysize,
+                            handymax_calls=handymax, panamax_calls=panamax)
 
             # 2. for each year evaluate which investment are needed given the strategic and operational objectives
             self.berth_invest(year, handysize, handymax, panamax)
 
-            if self.debug:
-                print('')
-                print('$$$ Check quay conveyors (coupled with quay crane capacity) -----------')
-            self.conveyor_quay_invest(year, agribulk_defaults.quay_conveyor_data)
+            if self.logger.enabled:
+                self.logger.message('$$$ Check quay conveyors (coupled with quay crane capacity) -----------')
+            self.conveyor_quay_invest(year, self.config.quay_conveyor_data)
 
-            if self.debug:
-                print('')
-                print('$$$ Check storage (coupled with max call size and dwell time) ---------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check storage (coupled with max call size and dwell time) ---------')
             self.storage_invest(year, self.storage_type_defaults)
 
-            if self.debug:
-                print('')
-                print('$$$ Check hinterland conveyors (coupled with unloading stations) ------')
-            self.conveyor_hinter_invest(year, agribulk_defaults.hinterland_conveyor_data)
+            if self.logger.enabled:
+                self.logger.message('$$$ Check hinterland conveyors (coupled with unloading stations) ------')
+            self.conveyor_hinter_invest(year, self.config.hinterland_conveyor_data)
 
-            if self.debug:
-                print('')
-                print('$$$ Check unloading station (coupled with quay cranes) ----------------')
+            if self.logger.enabled:
+                self.logger.message('$$$ Check unloading station (coupled with quay cranes) ----------------')
             self.unloading_station_invest(year)
 
         # 3. for each year calculate the energy costs (requires insight in realized demands)
@@ -148,7 +152,7 @@ class System:
         # cash_flows, cash_flows_WACC_real = core.add_cashflow_elements(self)
 
         # 7. calculate PV's and aggregate to NPV
-        core.NPV(self, Labour(**agribulk_defaults.labour_data))
+        core.NPV(self, Labour(**self.config.labour_data))
 
     # *** Individual investment methods for terminal elements
     def berth_invest(self, year, handysize, handymax, panamax):
@@ -175,9 +179,8 @@ class System:
         """
 
         # report on the status of all berth elements
-        if self.debug:
-            print('')
-            print('--- Status terminal @ start of year ----------------')
+        if self.logger.enabled:
+            self.logger.message('--- Status terminal @ start of year ----------------')
 
         core.report_element(self, Berth, year)
         core.report_element(self, Quay_wall, year)
@@ -189,8 +192,7 @@ class System:
         core.report_element(self, Unloading_station, year)
 
         # calculate planned berth occupancy and planned nr of berths
-        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-            self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+        berth_occupancy_planned, berth_occupancy_online = self.berth_occupancy(year)
         berths = len(core.find_elements(self, Berth))
 
         # get the waiting time as a factor of service time
@@ -200,15 +202,19 @@ class System:
         else:
             planned_waiting_service_time_ratio_berth = np.inf
 
-        if self.debug:
-            print('     Berth occupancy online (@ start of year): {:.2f} (trigger level: {:.2f})'.format(berth_occupancy_online, self.allowable_berth_occupancy))
-            print('     Berth occupancy planned (@ start of year): {:.2f} (trigger level: {:.2f})'.format(berth_occupancy_planned, self.allowable_berth_occupancy))
-            print('     Planned waiting time service time factor (@ start of year): {:.2f} (trigger level: {:.2f})'.format(planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth))
+        if self.logger.enabled:
+            self.logger.message(
+                '     Berth occupancy online (@ start of year): {:.2f} (trigger level: {:.2f})',
+                berth_occupancy_online, self.allowable_berth_occupancy)
+            self.logger.message(
+                '     Berth occupancy planned (@ start of year): {:.2f} (trigger level: {:.2f})',
+                berth_occupancy_planned, self.allowable_berth_occupancy)
+            self.logger.message(
+                '     Planned waiting time service time factor (@ start of year): {:.2f} (trigger level: {:.2f})',
+                planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth)
 
-            print('')
-            print('--- Start investment analysis ----------------------')
-            print('')
-            print('$$$ Check berth elements (coupled with berth occupancy) ---------------')
+            self.logger.message('--- Start investment analysis ----------------------')
+            self.logger.message('$$$ Check berth elements (coupled with berth occupancy) ---------------')
 
         core.report_element(self, Berth, year)
         core.report_element(self, Quay_wall, year)
@@ -219,24 +225,25 @@ class System:
 
             # while planned waiting service time ratio is too large add a berth when no crane slots are available
             if not (self.check_crane_slot_available()):
-                if self.debug:
-                    print('  *** add Berth to elements')
+                if self.logger.enabled:
+                    self.logger.invest('Berth')
 
-                berth = Berth(**agribulk_defaults.berth_data)
+                berth = Berth(**self.config.berth_data)
                 berth.year_online = year + berth.delivery_time
                 self.elements.append(berth)
                 berths = len(core.find_elements(self, Berth))
 
-                berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-                    self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+                berth_occupancy_planned, berth_occupancy_online = self.berth_occupancy(year)
                 planned_waiting_service_time_ratio_berth = core.occupancy_to_waitingfactor(
                     utilisation=berth_occupancy_planned, nr_of_servers_to_chk=berths)
 
-                if self.debug:
-                    print('     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})'.format(
-                        berth_occupancy_planned, self.allowable_berth_occupancy))
-                    print('     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})'.format(
-                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth))
+                if self.logger.enabled:
+                    self.logger.message(
+                        '     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})',
+                        berth_occupancy_planned, self.allowable_berth_occupancy)
+                    self.logger.message(
+                        '     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})',
+                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth)
 
             # while planned waiting service time ratio is too large add a berth if a quay is needed
             berths = len(core.find_elements(self, Berth))
@@ -245,13 +252,13 @@ class System:
                 # bug fixed, should only take the value of the vessels that actually come
                 # Todo: make sure that also other commodities are included
                 length_v = max(
-                    (not agribulk_defaults.maize_data['handysize_perc'] == 0) * agribulk_defaults.handysize_data["LOA"],
-                    (not agribulk_defaults.maize_data['handymax_perc'] == 0) * agribulk_defaults.handymax_data["LOA"],
-                    (not agribulk_defaults.maize_data['panamax_perc'] == 0) * agribulk_defaults.panamax_data["LOA"])  # max size
+                    (not self.config.maize_data['handysize_perc'] == 0) * self.config.handysize_data["LOA"],
+                    (not self.config.maize_data['handymax_perc'] == 0) * self.config.handymax_data["LOA"],
+                    (not self.config.maize_data['panamax_perc'] == 0) * self.config.panamax_data["LOA"])  # max size
                 draft = max(
-                    (not agribulk_defaults.maize_data['handysize_perc'] == 0) * agribulk_defaults.handysize_data["draft"],
-                    (not agribulk_defaults.maize_data['handymax_perc'] == 0) * agribulk_defaults.handymax_data["draft"],
-                    (not agribulk_defaults.maize_data['panamax_perc'] == 0) * agribulk_defaults.panamax_data["draft"])
+                    (not self.config.maize_data['handysize_perc'] == 0) * self.config.handysize_data["draft"],
+                    (not self.config.maize_data['handymax_perc'] == 0) * self.config.handymax_data["draft"],
+                    (not self.config.maize_data['panamax_perc'] == 0) * self.config.panamax_data["draft"])
 
                 # apply PIANC 2014:
                 # see Ijzermans, 2019 - infrastructure.py line 107 - 111
@@ -265,35 +272,37 @@ class System:
                     length = 1.1 * berths * (length_v + 15) - 1.1 * (berths - 1) * (length_v + 15)
 
                 # - depth
-                quay_wall = Quay_wall(**agribulk_defaults.quay_wall_data)
+                quay_wall = Quay_wall(**self.config.quay_wall_data)
                 depth = np.sum([draft, quay_wall.max_sinkage, quay_wall.wave_motion, quay_wall.safety_margin])
                 self.quay_invest(year, length, depth)
 
-                berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-                    self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+                berth_occupancy_planned, berth_occupancy_online = self.berth_occupancy(year)
                 planned_waiting_service_time_ratio_berth = core.occupancy_to_waitingfactor(
                     utilisation=berth_occupancy_planned, nr_of_servers_to_chk=berths)
 
-                if self.debug:
-                    print('     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})'.format(
-                        berth_occupancy_planned, self.allowable_berth_occupancy))
-                    print('     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})'.format(
-                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth))
+                if self.logger.enabled:
+                    self.logger.message(
+                        '     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})',
+                        berth_occupancy_planned, self.allowable_berth_occupancy)
+                    self.logger.message(
+                        '     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})',
+                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth)
 
             # while planned berth occupancy is too large add a crane if a crane is needed
             if self.check_crane_slot_available():
                 self.crane_invest(year)
 
-                berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-                    self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+                berth_occupancy_planned, berth_occupancy_online = self.berth_occupancy(year)
                 planned_waiting_service_time_ratio_berth = core.occupancy_to_waitingfactor(
                     utilisation=berth_occupancy_planned, nr_of_servers_to_chk=berths)
 
-                if self.debug:
-                    print('     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})'.format(
-                        berth_occupancy_planned, self.allowable_berth_occupancy))
-                    print('     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})'.format(
-                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth))
+                if self.logger.enabled:
+                    self.logger.message(
+                        '     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})',
+                        berth_occupancy_planned, self.allowable_berth_occupancy)
+                    self.logger.message(
+                        '     Planned waiting time service time factor : {:.2f} (trigger level: {:.2f})',
+                        planned_waiting_service_time_ratio_berth, self.allowable_waiting_service_time_ratio_berth)
 
     def quay_invest(self, year, length, depth):
         """
@@ -313,10 +322,10 @@ class System:
               - quay_wall.freeboard must be high enough to accommodate largest expected vessel
         """
 
-        if self.debug:
-            print('  *** add Quay to elements')
+        if self.logger.enabled:
+            self.logger.invest('Quay')
         # add a Quay_wall element
-        quay_wall = Quay_wall(**agribulk_defaults.quay_wall_data)
+        quay_wall = Quay_wall(**self.config.quay_wall_data)
 
         # add length and depth to the elements (useful for later reporting)
         quay_wall.length = length
@@ -356,8 +365,8 @@ class System:
            waiting over service time ratio
         """
 
-        if self.debug:
-            print('  *** add Harbour crane to elements')
+        if self.logger.enabled:
+            self.logger.invest('Harbour crane')
         # add unloader object
         if (self.crane_type_defaults["crane_type"] == 'Gantry crane' or
                 self.crane_type_defaults["crane_type"] == 'Harbour crane' or
@@ -376,7 +385,7 @@ class System:
         crane.maintenance = unit_rate * crane.maintenance_perc
 
         # - labour
-        labour = Labour(**agribulk_defaults.labour_data)
+        labour = Labour(**self.config.labour_data)
         crane.shift = ((crane.crew * self.operational_hours) / (
                 labour.shift_length * labour.annual_shifts))
         crane.labour = crane.shift * labour.operational_salary
@@ -423,9 +432,10 @@ class System:
                 if year >= element.year_online:
                     quay_conveyor_capacity_online += element.capacity_steps
 
-        if self.debug:
-            print('     a total of {} ton of quay conveyor service capacity is online; {} ton still pending'.format(
-                quay_conveyor_capacity_online, quay_conveyor_capacity_planned-quay_conveyor_capacity_online))
+        if self.logger.enabled:
+            self.logger.message(
+                '     a total of {} ton of quay conveyor service capacity is online; {} ton still pending',
+                quay_conveyor_capacity_online, quay_conveyor_capacity_planned-quay_conveyor_capacity_online)
 
         # find the total quay crane service rate,
         quay_crane_service_rate_planned = 0
@@ -435,57 +445,29 @@ class System:
             years_online.append(element.year_online)
 
         # check if total planned capacity of the quay conveyor is smaller than planned capacity of the quay cranes,
-        # if so add a conveyor
-        while quay_conveyor_capacity_planned < quay_crane_service_rate_planned:
-            if self.debug:
-                print('  *** add Quay Conveyor to elements')
-            conveyor_quay = Conveyor_Quay(**agribulk_defaults_quay_conveyor_data)
-
-            # - capex
-            capacity = conveyor_quay.capacity_steps
-            unit_rate = conveyor_quay.unit_rate_factor * conveyor_quay.length
-            mobilisation = conveyor_quay.mobilisation
-            conveyor_quay.capex = int(capacity * unit_rate + mobilisation)
-
-            # - opex
-            conveyor_quay.insurance = capacity * unit_rate * conveyor_quay.insurance_perc
-            conveyor_quay.maintenance = capacity * unit_rate * conveyor_quay.maintenance_perc
-
-            # - labour
-            labour = Labour(**agribulk_defaults.labour_data)
-            conveyor_quay.shift = (
-                    (conveyor_quay.crew * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
-            conveyor_quay.labour = conveyor_quay.shift * labour.operational_salary
-
-            # apply proper timing for the crane to come online (in the same year as the latest Quay_wall)
-            new_crane_years = [x for x in years_online if x >= year]
-
-            # find the maximum online year of Conveyor_Quay or make it []
-            if core.find_elements(self, Conveyor_Quay) != []:
-                max_conveyor_years = max([x.year_online for x in core.find_elements(self, Conveyor_Quay)])
-            else:
-                max_conveyor_years = []
-
-            # decide what online year to use
-            if max_conveyor_years == []:
-                conveyor_quay.year_online = min(new_crane_years)
-            elif max_conveyor_years < min(new_crane_years):
-                conveyor_quay.year_online = min(new_crane_years)
-            elif max_conveyor_years == min(new_crane_years):
-                conveyor_quay.year_online = max(new_crane_years)
-            elif max_conveyor_years > min(new_crane_years):
-                conveyor_quay.year_online = max(new_crane_years)
-
-            # add cash flow information to quay_wall object in a dataframe
-            conveyor_quay = core.add_cashflow_data_to_element(self, conveyor_quay)
-
-            self.elements.append(conveyor_quay)
+        # if so add the number of conveyors needed to match the quay crane capacity in one step
+        conveyors = self.conveyors_needed(
+            quay_conveyor_capacity_planned, quay_crane_service_rate_planned, agribulk_defaults_quay_conveyor_data)
+        if conveyors == 0:
+            return
+
+        # apply proper timing for the conveyors to come online (in the same year as the new quay cranes): the first
+        # conveyor comes online with the first new crane unless conveyors are already planned from then on, all other
+        # conveyors come online with the last new crane
+        new_crane_years = [x for x in years_online if x >= year]
+        if list_of_elements == [] or max([x.year_online for x in list_of_elements]) < min(new_crane_years):
+            conveyor_years = [min(new_crane_years)] + [max(new_crane_years)] * (conveyors - 1)
+        else:
+            conveyor_years = [max(new_crane_years)] * conveyors
 
+        for conveyor_quay in self.conveyor_invest(Conveyor_Quay, agribulk_defaults_quay_conveyor_data, conveyor_years):
             quay_conveyor_capacity_planned += conveyor_quay.capacity_steps
 
-            if self.debug:
-                print('     a total of {} ton of conveyor quay service capacity is online; {} ton still pending'.format(
-                    quay_conveyor_capacity_online, quay_conveyor_capacity_planned-quay_conveyor_capacity_online))
+            if self.logger.enabled:
+                self.logger.invest('Quay Conveyor')
+                self.logger.message(
+                    '     a total of {} ton of conveyor quay service capacity is online; {} ton still pending',
+                    quay_conveyor_capacity_online, quay_conveyor_capacity_planned-quay_conveyor_capacity_online)
 
     def storage_invest(self, year, agribulk_defaults_storage_data):
         """
@@ -515,13 +497,15 @@ class System:
                     if year >= element.year_online:
                         storage_capacity_online += element.capacity
 
-        if self.debug:
-            print('     a total of {} ton of {} storage capacity is online; {} ton still pending'.format(
-                storage_capacity_online, agribulk_defaults_storage_data['type'], storage_capacity-storage_capacity_online))
+        if self.logger.enabled:
+            self.logger.message(
+                '     a total of {} ton of {} storage capacity is online; {} ton still pending',
+                storage_capacity_online, agribulk_defaults_storage_data['type'], storage_capacity-storage_capacity_online)
 
-        handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
-        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-            self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+        snapshot = self.occupancy_snapshot(year)
+        handysize, handymax, panamax = \
+            snapshot['handysize_calls'], snapshot['handymax_calls'], snapshot['panamax_calls']
+        total_vol = snapshot['total_vol']
 
         # here an important bug was fixed! Previous code took the max call size of all vessels,
         # but it needs to take the max call size of the vessels that actually arrive
@@ -536,22 +520,12 @@ class System:
             if vessel.type == 'Panamax' and panamax != 0:
                 max_vessel_call_size = max(vessel.call_size, max_vessel_call_size)
 
-        # find the total service rate,
-        service_rate = 0
-        for element in (core.find_elements(self, Cyclic_Unloader) + core.find_elements(self, Continuous_Unloader)):
-            if year >= element.year_online:
-                service_rate += element.effective_capacity * crane_occupancy_online
-
-        commodities = core.find_elements(self, Commodity)
-        if commodities != []:
-            for commodity in commodities:
-                volume = commodity.scenario_data.loc[commodity.scenario_data['year'] == year]['volume'].item()
-                storage_capacity_dwelltime = round((volume * 0.05) * 1.1)  # see IJzermans (2019) p.26 & PIANC (2014) p.148
+        storage_capacity_dwelltime = round((total_vol * 0.05) * 1.1)  # see IJzermans (2019) p.26 & PIANC (2014) p.148
 
         # check if sufficient storage capacity is available
         while storage_capacity < max(max_vessel_call_size, storage_capacity_dwelltime):
-            if self.debug:
-                print('  *** add storage to elements')
+            if self.logger.enabled:
+                self.logger.invest('storage')
 
             # add storage object
             storage = Storage(**agribulk_defaults_storage_data)
@@ -564,7 +538,7 @@ class System:
             storage.maintenance = storage.unit_rate * storage.capacity * storage.maintenance_perc
 
             # - labour
-            labour = Labour(**agribulk_defaults.labour_data)
+            labour = Labour(**self.config.labour_data)
             storage.shift = ((storage.crew * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             storage.labour = storage.shift * labour.operational_salary
 
@@ -580,10 +554,10 @@ class System:
 
             storage_capacity += storage.capacity
 
-            if self.debug:
-                print('     a total of {} ton of {} storage capacity is online; {} ton still pending'.format(
-                    storage_capacity_online, agribulk_defaults_storage_data['type'],
-                    storage_capacity - storage_capacity_online))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of {} storage capacity is online; {} ton still pending',
+                    storage_capacity_online, agribulk_defaults_storage_data['type'], storage_capacity - storage_capacity_online)
 
     def unloading_station_invest(self, year):
         """The operational objective for the investment strategy for unloading stations is to have sufficient planned
@@ -606,21 +580,23 @@ class System:
         else:
             planned_waiting_service_time_ratio_station = np.inf
 
-        if self.debug:
-            print('     Station occupancy planned (@ start of year): {:.2f}'.format(station_occupancy_planned))
-            print('     Waiting factor (@ start of year): {:.2f}'.format(planned_waiting_service_time_ratio_station))
-            print('     Number of stations planned (@start of year): {:.2f}'.format(unloading_stations))
-            print('     Number of trains (@start of year): {:.2f}'.format(train_calls))
+        if self.logger.enabled:
+            self.logger.message('     Station occupancy planned (@ start of year): {:.2f}', station_occupancy_planned)
+            self.logger.message(
+                '     Waiting factor (@ start of year): {:.2f}',
+                planned_waiting_service_time_ratio_station)
+            self.logger.message('     Number of stations planned (@start of year): {:.2f}', unloading_stations)
+            self.logger.message('     Number of trains (@start of year): {:.2f}', train_calls)
 
         # todo: check this trigger
         # Ijzemans (2019): "In the end, based on reference projects in eastern Europe, the loading bay was modelled
         # using queuing theory and an assumed allowable train waiting time equal to 50 % of service time."
         while planned_waiting_service_time_ratio_station > self.allowable_waiting_service_time_ratio_station:
             # add a station when station occupancy is too high
-            if self.debug:
-                print('  *** add unloading station to elements')
+            if self.logger.enabled:
+                self.logger.invest('unloading station')
 
-            station = Unloading_station(**agribulk_defaults.hinterland_station_data)
+            station = Unloading_station(**self.config.hinterland_station_data)
 
             # - capex
             unit_rate = station.unit_rate
@@ -632,7 +608,7 @@ class System:
             station.maintenance = unit_rate * station.maintenance_perc
 
             # - labour
-            labour = Labour(**agribulk_defaults.labour_data)
+            labour = Labour(**self.config.labour_data)
             station.shift = ((station.crew * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             station.labour = station.shift * labour.operational_salary
 
@@ -680,11 +656,10 @@ class System:
                 if year >= element.year_online:
                     hinter_conveyor_capacity_online += element.capacity_steps
 
-        if self.debug:
-            print(
-                '     a total of {} ton of hinterland conveyor service capacity is online; {} ton still pending'.format(
-                    hinter_conveyor_capacity_online,
-                    hinter_conveyor_capacity_planned - hinter_conveyor_capacity_online))
+        if self.logger.enabled:
+            self.logger.message(
+                '     a total of {} ton of hinterland conveyor service capacity is online; {} ton still pending',
+                hinter_conveyor_capacity_online, hinter_conveyor_capacity_planned - hinter_conveyor_capacity_online)
 
         # find the total station service rate planned,
         station_service_rate_planned = 0
@@ -693,43 +668,79 @@ class System:
             station_service_rate_planned += element.production
             years_online.append(element.year_online)
 
-        # check if the hinter conveyor capacity (planned) at least matches the station unloading rate (planned)
-        while hinter_conveyor_capacity_planned < station_service_rate_planned:
-            if self.debug:
-                print('  *** add Hinter Conveyor to elements')
-            conveyor_hinter = Conveyor_Hinter(**agribulk_defaults_hinterland_conveyor_data)
+        # check if the hinter conveyor capacity (planned) at least matches the station unloading rate (planned),
+        # if not add the number of conveyors needed to match the station unloading rate in one step
+        conveyors = self.conveyors_needed(
+            hinter_conveyor_capacity_planned, station_service_rate_planned, agribulk_defaults_hinterland_conveyor_data)
+        if conveyors == 0:
+            return
 
-            # - capex
-            capacity = conveyor_hinter.capacity_steps
-            unit_rate = conveyor_hinter.unit_rate_factor * conveyor_hinter.length
-            mobilisation = conveyor_hinter.mobilisation
-            conveyor_hinter.capex = int(capacity * unit_rate + mobilisation)
+        # - online year
+        conveyor_years = [max(years_online)] * conveyors
 
-            # - opex
-            conveyor_hinter.insurance = capacity * unit_rate * conveyor_hinter.insurance_perc
-            conveyor_hinter.maintenance = capacity * unit_rate * conveyor_hinter.maintenance_perc
+        for conveyor_hinter in self.conveyor_invest(
+                Conveyor_Hinter, agribulk_defaults_hinterland_conveyor_data, conveyor_years):
+            hinter_conveyor_capacity_planned += conveyor_hinter.capacity_steps
 
-            # - labour
-            labour = Labour(**agribulk_defaults.labour_data)
-            conveyor_hinter.shift = (
-                    (conveyor_hinter.crew * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
-            conveyor_hinter.labour = conveyor_hinter.shift * labour.operational_salary
+            if self.logger.enabled:
+                self.logger.invest('Hinter Conveyor')
+                self.logger.message(
+                    '     a total of {} ton of hinterland conveyor service capacity is online; {} ton still pending',
+                    hinter_conveyor_capacity_online, hinter_conveyor_capacity_planned - hinter_conveyor_capacity_online)
 
-            # - online year
-            conveyor_hinter.year_online = max(years_online)
+    def conveyors_needed(self, conveyor_capacity_planned, service_rate_planned, agribulk_defaults_conveyor_data):
+        """Return the number of conveyors to add so that the planned conveyor capacity at least matches the planned
+        service rate, given the capacity steps of the conveyor type"""
 
-            # add cash flow information to quay_wall object in a dataframe
-            conveyor_hinter = core.add_cashflow_data_to_element(self, conveyor_hinter)
+        shortfall = service_rate_planned - conveyor_capacity_planned
+        if shortfall <= 0:
+            return 0
 
-            self.elements.append(conveyor_hinter)
+        return int(np.ceil(shortfall / agribulk_defaults_conveyor_data['capacity_steps']))
 
-            hinter_conveyor_capacity_planned += conveyor_hinter.capacity_steps
+    def conveyor_invest(self, conveyor_type, agribulk_defaults_conveyor_data, conveyor_years):
+        """Add one conveyor of conveyor_type for each online year in conveyor_years and return the new conveyors
+
+        All conveyors of one type have the same costs, so capex, opex and labour are derived once and the cash flow
+        data is only built once per online year."""
+
+        conveyor = conveyor_type(**agribulk_defaults_conveyor_data)
+
+        # - capex
+        capacity = conveyor.capacity_steps
+        unit_rate = conveyor.unit_rate_factor * conveyor.length
+        mobilisation = conveyor.mobilisation
+        capex = int(capacity * unit_rate + mobilisation)
+
+        # - opex
+        insurance = capacity * unit_rate * conveyor.insurance_perc
+        maintenance = capacity * unit_rate * conveyor.maintenance_perc
+
+        # - labour
+        labour = Labour(**self.config.labour_data)
+        shift = ((conveyor.crew * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
+
+        conveyors = []
+        cash_flows = {}
+        for year_online in conveyor_years:
+            conveyor = conveyor_type(**agribulk_defaults_conveyor_data)
+            conveyor.capex = capex
+            conveyor.insurance = insurance
+            conveyor.maintenance = maintenance
+            conveyor.shift = shift
+            conveyor.labour = shift * labour.operational_salary
+            conveyor.year_online = year_online
+
+            # add cash flow information to the conveyor object in a dataframe
+            if year_online not in cash_flows:
+                cash_flows[year_online] = core.add_cashflow_data_to_element(self, conveyor).df
+            conveyor.df = cash_flows[year_online].copy()
 
-            if self.debug:
-                print(
-                    '     a total of {} ton of hinterland conveyor service capacity is online; {} ton still pending'.format(
-                        hinter_conveyor_capacity_online,
-                        hinter_conveyor_capacity_planned - hinter_conveyor_capacity_online))
+            conveyors.append(conveyor)
+
+        self.elements.extend(conveyors)
+
+        return conveyors
 
     # *** Various cost calculation methods
     def calculate_energy_cost(self, year):
@@ -739,11 +750,10 @@ class System:
         Terminal.revenues is the minimum of 1. and 2.
         """
 
-        energy = Energy(**agribulk_defaults.energy_data)
-        handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
-        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = self.calculate_berth_occupancy(
-            year, handysize, handymax, panamax)
-        station_occupancy_planned, station_occupancy_online = self.calculate_station_occupancy(year)
+        energy = Energy(**self.config.energy_data)
+        snapshot = self.occupancy_snapshot(year)
+        crane_occupancy_online = snapshot['crane_occupancy_online']
+        station_occupancy_online = snapshot['station_occupancy_online']
 
         # calculate crane energy
         list_of_elements_1 = core.find_elements(self, Cyclic_Unloader)
@@ -805,8 +815,6 @@ class System:
                 element.df.loc[element.df['year'] == year, 'energy'] = 0
 
         # calculate hinterland station energy
-        station_occupancy_planned, station_occupancy_online = self.calculate_station_occupancy(year)
-
         list_of_elements_Station = core.find_elements(self, Unloading_station)
 
         for element in list_of_elements_Station:
@@ -823,9 +831,12 @@ class System:
 
         """Find the demurrage cost per type of vessel and sum all demurrage cost"""
 
-        handysize_calls, handymax_calls, panamax_calls, total_calls, total_vol = self.calculate_vessel_calls(year)
-        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-            self.calculate_berth_occupancy(year, handysize_calls, handymax_calls, panamax_calls)
+        snapshot = self.occupancy_snapshot(year)
+        handysize_calls, handymax_calls, panamax_calls = \
+            snapshot['handysize_calls'], snapshot['handymax_calls'], snapshot['panamax_calls']
+        total_calls = snapshot['total_calls']
+        berth_occupancy_online = snapshot['berth_occupancy_online']
+        crane_occupancy_online = snapshot['crane_occupancy_online']
 
         berths = len(core.find_elements(self, Berth))
 
@@ -845,7 +856,7 @@ class System:
 
         # Find the demurrage cost per type of vessel
         if service_rate != 0:
-            handymax = Vessel(**agribulk_defaults.handymax_data)
+            handymax = Vessel(**self.config.handymax_data)
             service_time_handymax = handymax.call_size / service_rate
             waiting_time_hours_handymax = waiting_factor * service_time_handymax
             port_time_handymax = waiting_time_hours_handymax + service_time_handymax + handymax.mooring_time
@@ -853,7 +864,7 @@ class System:
             demurrage_time_handymax = penalty_time_handymax * handymax_calls
             demurrage_cost_handymax = demurrage_time_handymax * handymax.demurrage_rate
 
-            handysize = Vessel(**agribulk_defaults.handysize_data)
+            handysize = Vessel(**self.config.handysize_data)
             service_time_handysize = handysize.call_size / service_rate
             waiting_time_hours_handysize = waiting_factor * service_time_handysize
             port_time_handysize = waiting_time_hours_handysize + service_time_handysize + handysize.mooring_time
@@ -861,7 +872,7 @@ class System:
             demurrage_time_handysize = penalty_time_handysize * handysize_calls
             demurrage_cost_handysize = demurrage_time_handysize * handysize.demurrage_rate
 
-            panamax = Vessel(**agribulk_defaults.panamax_data)
+            panamax = Vessel(**self.config.panamax_data)
             service_time_panamax = panamax.call_size / service_rate
             waiting_time_hours_panamax = waiting_factor * service_time_panamax
             port_time_panamax = waiting_time_hours_panamax + service_time_panamax + panamax.mooring_time
@@ -901,32 +912,26 @@ class System:
 
         # gather volumes from each commodity, calculate how much revenue it would yield, and add
         revenues = 0
-        for commodity in core.find_elements(self, Commodity):
+        volumes = self.volume_timeline()[:, self.modelframe.index(year)] if year in self.modelframe else []
+        for commodity, volume in zip(core.find_elements(self, Commodity), volumes):
             fee = commodity.handling_fee
-            try:
-                volume = commodity.scenario_data.loc[commodity.scenario_data['year'] == year]['volume'].item()
-                revenues += (volume * fee * safety_factor)
-            except:
-                pass
-        if self.debug:
-            print('     Revenues (potential - given demand): {:.2f}'.format(revenues))
+            revenues += (volume * fee * safety_factor)
+        if self.logger.enabled:
+            self.logger.message('     Revenues (potential - given demand): {:.2f}', revenues)
 
-        handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
-        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = self.calculate_berth_occupancy(
-            year, handysize, handymax, panamax)
+        snapshot = self.occupancy_snapshot(year)
+        total_vol = snapshot['total_vol']
 
         # find the total service rate,
-        service_rate = 0
-        for element in (core.find_elements(self, Cyclic_Unloader) + core.find_elements(self, Continuous_Unloader)):
-            if year >= element.year_online:
-                service_rate += element.effective_capacity * crane_occupancy_online
+        service_rate = snapshot['service_rate_throughput']
 
         # find the rate between volume and throughput
         rate_throughput_volume = service_rate * self.operational_hours / total_vol
 
-        if self.debug:
-            print('     Revenues (realised - throughput): {}'.format(
-                int(service_rate * self.operational_hours * fee * safety_factor)))
+        if self.logger.enabled:
+            self.logger.message(
+                '     Revenues (realised - throughput): {}',
+                int(service_rate * self.operational_hours * fee * safety_factor))
 
         try:
             self.revenues.append(
@@ -937,26 +942,153 @@ class System:
         # todo: check if rest value is included at the end of the simulation
 
     # *** General functions
+    def volume_key(self, commodities=None):
+        """Return a key that changes when the model frame, the commodities or the contents of their scenario data
+        change (see opentisim.core.scenario_key)"""
+
+        if commodities is None:
+            commodities = core.find_elements(self, Commodity)
+
+        return tuple(self.modelframe), core.scenario_key(self, commodities)
+
+    def volume_timeline(self):
+        """Return the cargo volume of each commodity for each year in self.modelframe as an array
+
+        The array has one row per commodity and one column per year; years without scenario data have zero volume.
+        The timeline is computed once and cached on the terminal, and is recomputed when the model frame, the
+        commodities in self.elements or their scenario data have changed since the last call."""
+
+        commodities = core.find_elements(self, Commodity)
+        key = self.volume_key(commodities)
+        if getattr(self, '_volume_timeline_key', None) != key:
+            volume_years = np.zeros((len(commodities), len(self.modelframe)))
+            for i, commodity in enumerate(commodities):
+                for j, year in enumerate(self.modelframe):
+                    try:
+                        volume_years[i, j] = \
+                            commodity.scenario_data.loc[commodity.scenario_data['year'] == year]['volume'].item()
+                    except:
+                        pass
+
+            self._volume_timeline = volume_years
+            self._volume_timeline_key = key
+
+        return self._volume_timeline
+
+    def calculate_throughput(self, year):
+        """Return the throughput in year: the demand, limited by the service rate of the online quay unloaders (as in
+        calculate_revenue)"""
+
+        snapshot = self.occupancy_snapshot(year)
+
+        return min(snapshot['total_vol'], snapshot['service_rate_throughput'] * self.operational_hours)
+
+    def throughput_timeline(self):
+        """Return the throughput for each year in self.years as an array (cached, see
+        opentisim.core.throughput_timeline)"""
+
+        return core.throughput_timeline(self, self.calculate_throughput, key=self.volume_key())
+
+    def calculate_volumes(self, year):
+        """Calculate the volumes to be transported by each vessel type and in total, read from the volume timeline"""
+
+        if year not in self.modelframe:
+            return 0, 0, 0, 0
+
+        volumes = self.volume_timeline()[:, self.modelframe.index(year)]
+        commodities = core.find_elements(self, Commodity)
+        handysize_vol = sum(volume * commodity.handysize_perc / 100 for commodity, volume in zip(commodities, volumes))
+        handymax_vol = sum(volume * commodity.handymax_perc / 100 for commodity, volume in zip(commodities, volumes))
+        panamax_vol = sum(volume * commodity.panamax_perc / 100 for commodity, volume in zip(commodities, volumes))
+        total_vol = sum(volumes)
+
+        return handysize_vol, handymax_vol, panamax_vol, total_vol
+
+    def occupancy_snapshot(self, year):
+        """Return the vessel calls, occupancies and online service rates of the terminal in year as a dict
+
+        The snapshot is computed once per year and cached on the terminal. Elements are only ever appended to
+        self.elements, so the cached snapshots are discarded when the number of elements, the operational hours or the
+        demand (see volume_key) have changed since they were made. All investment, energy, demurrage and revenue
+        methods read the occupancies from here."""
+
+        key = (len(self.elements), self.operational_hours, self.volume_key())
+        if getattr(self, '_occupancy_snapshots_key', None) != key:
+            self._occupancy_snapshots = {}
+            self._occupancy_snapshots_key = key
+
+        if year in self._occupancy_snapshots:
+            return self._occupancy_snapshots[year]
+
+        # vessel calls and berth occupancy
+        handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
+        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
+            self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+
+        # find the service rate for the throughput of the online quay unloaders (effective capacity * occupancy)
+        service_rate_throughput = 0
+        for element in (core.find_elements(self, Cyclic_Unloader) + core.find_elements(self, Continuous_Unloader)):
+            if year >= element.year_online:
+                service_rate_throughput += element.effective_capacity * crane_occupancy_online
+
+        # find the total station service rate and determine the time at station
+        list_of_elements = core.find_elements(self, Unloading_station)
+        service_rate_planned = 0
+        service_rate_online = 0
+        if list_of_elements != []:
+            # find planned service rate and online service rate
+            for element in list_of_elements:
+                service_rate_planned += element.service_rate
+                if year >= element.year_online:
+                    service_rate_online += element.service_rate
+
+            # determine time at stations planned (given the current throughput and planned service rate)
+            if service_rate_planned != 0:
+                time_at_station_planned = service_rate_throughput * self.operational_hours / service_rate_planned  # element.service_rate
+                station_occupancy_planned = time_at_station_planned / self.operational_hours
+            else:
+                station_occupancy_planned = float("inf")
+
+            # determine time at stations online (given the current throughput and online service rate)
+            if service_rate_online != 0:
+                time_at_station_online = service_rate_throughput * self.operational_hours / service_rate_online  # element.capacity
+                station_occupancy_online = time_at_station_online / self.operational_hours
+            else:
+                station_occupancy_online = float("inf")
+
+        else:
+            # if there are no unloading stations the station occupancy is 'infinite' so a station is certainly needed
+            station_occupancy_planned = float("inf")
+            station_occupancy_online = float("inf")
+
+        self._occupancy_snapshots[year] = {
+            'handysize_calls': handysize,
+            'handymax_calls': handymax,
+            'panamax_calls': panamax,
+            'total_calls': total_calls,
+            'total_vol': total_vol,
+            'berth_occupancy_planned': berth_occupancy_planned,
+            'berth_occupancy_online': berth_occupancy_online,
+            'crane_occupancy_planned': crane_occupancy_planned,
+            'crane_occupancy_online': crane_occupancy_online,
+            'service_rate_throughput': service_rate_throughput,
+            'station_occupancy_planned': station_occupancy_planned,
+            'station_occupancy_online': station_occupancy_online}
+
+        return self._occupancy_snapshots[year]
+
+    def berth_occupancy(self, year):
+        """Return the planned and online berth occupancy in year, read from the occupancy snapshot"""
+
+        snapshot = self.occupancy_snapshot(year)
+
+        return snapshot['berth_occupancy_planned'], snapshot['berth_occupancy_online']
+
     def calculate_vessel_calls(self, year=2019):
         """Calculate volumes to be transported and the number of vessel calls (both per vessel type and in total) """
 
-        # intialize values to be returned
-        handysize_vol = 0
-        handymax_vol = 0
-        panamax_vol = 0
-        total_vol = 0
-
         # gather volumes from each commodity scenario and calculate how much is transported with which vessel
-        commodities = core.find_elements(self, Commodity)
-        for commodity in commodities:
-            try:
-                volume = commodity.scenario_data.loc[commodity.scenario_data['year'] == year]['volume'].item()
-                handysize_vol += volume * commodity.handysize_perc / 100
-                handymax_vol += volume * commodity.handymax_perc / 100
-                panamax_vol += volume * commodity.panamax_perc / 100
-                total_vol += volume
-            except:
-                pass
+        handysize_vol, handymax_vol, panamax_vol, total_vol = self.calculate_volumes(year)
 
         # gather vessels and calculate the number of calls each vessel type needs to make
         vessels = core.find_elements(self, Vessel)
@@ -978,17 +1110,8 @@ class System:
         - Occupancy is total_time_at_berth divided by operational hours
         """
 
-        # intialize values to be returned
-        total_vol = 0
-
         # gather volumes from each commodity scenario
-        commodities = core.find_elements(self, Commodity)
-        for commodity in commodities:
-            try:
-                volume = commodity.scenario_data.loc[commodity.scenario_data['year'] == year]['volume'].item()
-                total_vol += volume
-            except:
-                pass
+        total_vol = self.calculate_volumes(year)[3]
 
         # list all crane objects in system
         list_of_elements_1 = core.find_elements(self, Cyclic_Unloader)
@@ -1005,9 +1128,9 @@ class System:
                     service_rate_online += element.effective_capacity
 
             # calculate mooring and unmooring times for each vessel type
-            time_at_berth_planned_handysize = handysize_calls * agribulk_defaults.handysize_data["mooring_time"]
-            time_at_berth_planned_handymax = handymax_calls * agribulk_defaults.handymax_data["mooring_time"]
-            time_at_berth_planned_panamax = panamax_calls * agribulk_defaults.panamax_data["mooring_time"]
+            time_at_berth_planned_handysize = handysize_calls * self.config.handysize_data["mooring_time"]
+            time_at_berth_planned_handymax = handymax_calls * self.config.handymax_data["mooring_time"]
+            time_at_berth_planned_panamax = panamax_calls * self.config.panamax_data["mooring_time"]
             # calculate the time that the cranes require to load/unload the commodity
             time_at_cranes_planned = total_vol / service_rate_planned
 
@@ -1024,9 +1147,9 @@ class System:
 
             if service_rate_online != 0:  # when some cranes are actually online
                 # calculate mooring and unmooring times for each vessel type
-                time_at_berth_online_handysize = handysize_calls * agribulk_defaults.handysize_data["mooring_time"]
-                time_at_berth_online_handymax = handymax_calls * agribulk_defaults.handymax_data["mooring_time"]
-                time_at_berth_online_panamax = panamax_calls * agribulk_defaults.panamax_data["mooring_time"]
+                time_at_berth_online_handysize = handysize_calls * self.config.handysize_data["mooring_time"]
+                time_at_berth_online_handymax = handymax_calls * self.config.handymax_data["mooring_time"]
+                time_at_berth_online_panamax = panamax_calls * self.config.panamax_data["mooring_time"]
                 # calculate the time that the cranes require to load/unload the commodity
                 time_at_cranes_online = total_vol / service_rate_online
 
@@ -1059,48 +1182,9 @@ class System:
         (effective capacity * occupancy). The unloading station should at least be able to handle the throughput by the
         online quay unloaders at a level that the station occupancy planned remains below the target occupancy level."""
 
-        list_of_elements = core.find_elements(self, Unloading_station)
-
-        # find the total service rate and determine the time at station
-        service_rate_planned = 0
-        service_rate_online = 0
-        if list_of_elements != []:
-            # find planned service rate and online service rate
-            for element in list_of_elements:
-                service_rate_planned += element.service_rate
-                if year >= element.year_online:
-                    service_rate_online += element.service_rate
-
-            handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
-            berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-                self.calculate_berth_occupancy(year, handysize, handymax, panamax)
+        snapshot = self.occupancy_snapshot(year)
 
-            # find the service rate for the throughput of the online quay unloaders (effective capacity * occupancy)
-            service_rate_throughput = 0
-            for element in (core.find_elements(self, Cyclic_Unloader) + core.find_elements(self, Continuous_Unloader)):
-                if year >= element.year_online:
-                    service_rate_throughput += element.effective_capacity * crane_occupancy_online
-
-            # determine time at stations planned (given the current throughput and planned service rate)
-            if service_rate_planned != 0:
-                time_at_station_planned = service_rate_throughput * self.operational_hours / service_rate_planned  # element.service_rate
-                station_occupancy_planned = time_at_station_planned / self.operational_hours
-            else:
-                station_occupancy_planned = float("inf")
-
-            # determine time at stations online (given the current throughput and online service rate)
-            if service_rate_online != 0:
-                time_at_station_online = service_rate_throughput * self.operational_hours / service_rate_online  # element.capacity
-                station_occupancy_online = time_at_station_online / self.operational_hours
-            else:
-                station_occupancy_online = float("inf")
-
-        else:
-            # if there are no unloading stations the station occupancy is 'infinite' so a station is certainly needed
-            station_occupancy_planned = float("inf")
-            station_occupancy_online = float("inf")
-
-        return station_occupancy_planned, station_occupancy_online
+        return snapshot['station_occupancy_planned'], snapshot['station_occupancy_online']
 
     def check_crane_slot_available(self):
         # find number of available crane slots
@@ -1127,17 +1211,10 @@ class System:
         - calculate the numbers of train calls"""
 
         # create default station object (to get the train call size)
-        station = Unloading_station(**agribulk_defaults.hinterland_station_data)
+        station = Unloading_station(**self.config.hinterland_station_data)
 
         # - Trains calculated with the throughput
-        handysize, handymax, panamax, total_calls, total_vol = self.calculate_vessel_calls(year)
-        berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = \
-            self.calculate_berth_occupancy(year, handysize, handymax, panamax)
-
-        service_rate_throughput_online = 0
-        for element in (core.find_elements(self, Cyclic_Unloader) + core.find_elements(self, Continuous_Unloader)):
-            if year >= element.year_online:
-                service_rate_throughput_online += element.effective_capacity * crane_occupancy_online
+        service_rate_throughput_online = self.occupancy_snapshot(year)['service_rate_throughput']
 
         train_calls = service_rate_throughput_online * self.operational_hours / station.call_size
 
@@ -1147,6 +1224,9 @@ class System:
     def terminal_elements_plot(self, width=0.1, alpha=0.6, fontsize=20, demand_step=100_000):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = []
         berths = []
@@ -1279,6 +1359,8 @@ class System:
     def terminal_capacity_plot(self, width=0.25, alpha=0.6, fontsize=20):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # get crane service capacity and storage capacity
         years = []
         cranes = []
@@ -1294,9 +1376,7 @@ class System:
             storages.append(0)
             storages_capacity.append(0)
 
-            handysize_calls, handymax_calls, panamax_calls, total_calls, total_vol = self.calculate_vessel_calls(year)
-            berth_occupancy_planned, berth_occupancy_online, crane_occupancy_planned, crane_occupancy_online = self.calculate_berth_occupancy(
-                year, handysize_calls, handymax_calls, panamax_calls)
+            crane_occupancy_online = self.occupancy_snapshot(year)['crane_occupancy_online']
 
             for element in self.elements:
                 if isinstance(element, Cyclic_Unloader) | isinstance(element, Continuous_Unloader):
@@ -4,3 +4,5 @@ from .hydrogen_defaults import *
 from .hydrogen_mixins import *
 from .hydrogen_objects import *
 from .hydrogen_system import *
+from .hydrogen_system_export import *
+from .end_use_system import *
@@ -7,7 +7,6 @@
 # package(s) for data handling
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .hydrogen_defaults import *
 from .hydrogen_objects import *
@@ -19,32 +18,42 @@ class EndUseLocation:
     Terminal development is governed by three triggers: the allowable waiting time as factor of service time,
     the allowable dwell time and an h2conversion trigger."""
 
-    def __init__(self, startyear=2020, lifecycle=10, operational_hours=5840, debug=False, elements=[],
+    def __init__(self, startyear=2020, lifecycle=10, operational_hours=5840, debug=False, elements=None,
                  terminal_supply_chain={'storage','h2_retrieval'},
-                 commodity_type_defaults=commodity_ammonia_data,
-                 storage_type_defaults=storage_nh3_data,
+                 commodity_type_defaults=None,
+                 storage_type_defaults=None,
                  kendall='E2/E2/n',
-                 h2retrieval_type_defaults=h2retrieval_nh3_data,
+                 h2retrieval_type_defaults=None,
                  allowable_dwelltime=15 / 365, 
-                 h2retrieval_trigger=1):
+                 h2retrieval_trigger=1, sink=None, config=None):
         
         # time inputs
         self.years = []
         self.startyear = startyear
         self.lifecycle = lifecycle
         self.operational_hours = operational_hours
-        self.terminal_supply_chain = terminal_supply_chain
+        self.terminal_supply_chain = set(terminal_supply_chain)
 
-        # provide intermediate outputs via print statements if debug = True
+        # log investment decisions and per-year KPIs to sink (printed to the console if debug = True)
         self.debug = debug
+        self.logger = opentisim.core.EventLogger(sink, debug=debug)
 
-        # collection of all terminal objects
-        self.elements = elements
+        # frozen copy of the defaults dicts that the methods read (see opentisim.core.config)
+        self.config = config if config is not None else default_config()
+
+        # collection of all terminal objects (a list of its own, so terminals never share their elements list)
+        self.elements = [] if elements is None else list(elements)
 
         # default values to use in selecting which commodity is imported
-        self.commodity_type_defaults = commodity_type_defaults
-        self.storage_type_defaults = storage_type_defaults
-        self.h2retrieval_type_defaults = h2retrieval_type_defaults
+        if commodity_type_defaults is None:
+            commodity_type_defaults = self.config.commodity_ammonia_data
+        self.commodity_type_defaults = opentisim.core.freeze(commodity_type_defaults)
+        if storage_type_defaults is None:
+            storage_type_defaults = self.config.storage_nh3_data
+        self.storage_type_defaults = opentisim.core.freeze(storage_type_defaults)
+        if h2retrieval_type_defaults is None:
+            h2retrieval_type_defaults = self.config.h2retrieval_nh3_data
+        self.h2retrieval_type_defaults = opentisim.core.freeze(h2retrieval_type_defaults)
 
         # triggers for the various elements (berth, storage and h2conversion)
         self.allowable_dwelltime = allowable_dwelltime
@@ -100,9 +109,7 @@ class EndUseLocation:
             - operational objective: Annually invest in infrastructure upgrades when performance criteria are triggered
             """
             self.years.append(year)
-            if self.debug:
-                print('')
-                print('### Simulate year: {} ############################'.format(year))
+            self.logger.start_year(year)
 
             # 1. for each year estimate the volume that is deliverd based on the demand
             #smallhydrogen_calls, largehydrogen_calls, smallammonia_calls, largeammonia_calls,             handysize_calls, panamax_calls, vlcc_calls, total_calls, total_vol,             smallhydrogen_calls_planned, largehydrogen_calls_planned,             smallammonia_calls_planned, largeammonia_calls_planned,             handysize_calls_planned, panamax_calls_planned, vlcc_calls_planned,             total_calls_planned, total_vol_planned = self.calculate_vessel_calls(year)
@@ -128,22 +135,18 @@ class EndUseLocation:
                 except:
                     pass
 
-            if self.debug:
-                print('--- Cargo volume for {} ---------'.format(year))
-                print('  Total demand volume transport out: {}'.format(volume_transport_out))
-                print('----------------------------------------------------')
+            if self.logger.enabled:
+                self.logger.kpi('volume', demand_volume=volume_transport_out)
 
             # 2. for each year evaluate which investment are needed given the strategic and operational objectives
             if 'storage' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check storage ----------------------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check storage ----------------------------------')
                 self.storage_invest(year, self.storage_type_defaults)
 
             if 'h2_retrieval' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check H2 retrieval plants ----------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check H2 retrieval plants ----------------------')
                 self.h2retrieval_invest(year, self.h2retrieval_type_defaults)
 
         # 3. for each year calculate the energy costs (requires insight in realized demands)
@@ -166,16 +169,16 @@ class EndUseLocation:
             throughput_plant_in = throughput_online_plant_in
             throughput_storage_in = throughput_online_stor_in
     
-            if self.debug:
-                print('--- Throughput online and in elements for {} ---------'.format(year))
-                print('  Total demand at end-use: {}'.format(Demand))
-                print('  Total demand plant in: {}'.format(Demand_plant_in))
-                print('  Total demand storage in: {}'.format(Demand_storage_in))
+            if self.logger.enabled:
+                self.logger.message('--- Throughput online and in elements for {} ---------', year)
+                self.logger.message('  Total demand at end-use: {}', Demand)
+                self.logger.message('  Total demand plant in: {}', Demand_plant_in)
+                self.logger.message('  Total demand storage in: {}', Demand_storage_in)
 
-                print('  Total throughput online at end-use: {}'.format(throughput_online))
-                print('  Total throughput online plant in: {}'.format(throughput_plant_in))
-                print('  Total throughput online storage in: {}'.format(throughput_storage_in))
-                print('----------------------------------------------------')
+                self.logger.message('  Total throughput online at end-use: {}', throughput_online)
+                self.logger.message('  Total throughput online plant in: {}', throughput_plant_in)
+                self.logger.message('  Total throughput online storage in: {}', throughput_storage_in)
+                self.logger.message('----------------------------------------------------')
 
         # # 7. collect all cash flows (capex, opex, revenues)
         # cash_flows, cash_flows_WACC_nominal = self.add_cashflow_elements()
@@ -203,20 +206,21 @@ class EndUseLocation:
                     if year >= element.year_online:
                         storage_capacity_online += element.capacity
 
-        if self.debug:
-            print('     a total of {} ton of {} storage capacity is online; {} ton total planned'.format(
-                storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity))
+        if self.logger.enabled:
+            self.logger.message(
+                '     a total of {} ton of {} storage capacity is online; {} ton total planned',
+                storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity)
 
         # max_vessel_call_size = max([x.call_size for x in opentisim.core.find_elements(self, Vessel)])
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH': 
-                max_vessel_call_size = MCH_barge_data["call_size"]
+                max_vessel_call_size = self.config.MCH_barge_data["call_size"]
             elif commodity.type == 'DBT': 
-                max_vessel_call_size = DBT_barge_data["call_size"]
+                max_vessel_call_size = self.config.DBT_barge_data["call_size"]
             elif commodity.type == 'Liquid hydrogen':
-                max_vessel_call_size = hydrogen_barge_data["call_size"]
+                max_vessel_call_size = self.config.hydrogen_barge_data["call_size"]
             else:
-                max_vessel_call_size = ammonia_barge_data["call_size"]
+                max_vessel_call_size = self.config.ammonia_barge_data["call_size"]
         
 
         # find the total throughput
@@ -230,8 +234,8 @@ class EndUseLocation:
         while storage_capacity < max_vessel_call_size or storage_capacity < storage_capacity_dwelltime_demand:
         #(
 #                 storage_capacity < storage_capacity_dwelltime_demand and storage_capacity < storage_capacity_dwelltime_throughput):
-            if self.debug:
-                print('  *** add storage to elements')
+            if self.logger.enabled:
+                self.logger.invest('storage')
 
             # add storage object
             storage = Storage(**hydrogen_defaults_storage_data)
@@ -248,7 +252,7 @@ class EndUseLocation:
             storage.purchase_material = 0 
 
             #   labour**hydrogen_defaults
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             storage.shift = (
                         (storage.crew_for5 * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             storage.labour = storage.shift * labour.operational_salary
@@ -275,9 +279,10 @@ class EndUseLocation:
             
             storage_capacity += storage.capacity
 
-            if self.debug:
-                print('     a total of {} ton of {} storage capacity is online; {} ton total planned'.format(
-                    storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of {} storage capacity is online; {} ton total planned',
+                    storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity)
         
     def h2retrieval_invest(self, year, hydrogen_defaults_h2retrieval_data):
 #     """current strategy is to add h2 retrieval as long as target h2 retrieval is not yet achieved
@@ -289,15 +294,15 @@ class EndUseLocation:
 
         plant_occupancy_planned, plant_occupancy_online, h2retrieval_capacity_planned, h2retrieval_capacity_online = self.calculate_h2retrieval_occupancy(year, hydrogen_defaults_h2retrieval_data)
 
-        if self.debug:
-            print('     Plant occupancy planned (@ start of year): {:.2f}'.format(plant_occupancy_planned))
-            print('     Plant occupancy online (@ start of year): {:.2f}'.format(plant_occupancy_online))
+        if self.logger.enabled:
+            self.logger.message('     Plant occupancy planned (@ start of year): {:.2f}', plant_occupancy_planned)
+            self.logger.message('     Plant occupancy online (@ start of year): {:.2f}', plant_occupancy_online)
 
         # check if sufficient h2retrieval capacity is available
         while plant_occupancy_planned > self.h2retrieval_trigger:
 
-            if self.debug:
-                print('  *** add h2retrieval to elements')
+            if self.logger.enabled:
+                self.logger.invest('h2retrieval')
 
             # add h2retrieval object
             h2retrieval = H2retrieval(**hydrogen_defaults_h2retrieval_data)
@@ -314,7 +319,7 @@ class EndUseLocation:
             h2retrieval.purchase_material = 0
 
             #   labour**hydrogen_defaults
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             h2retrieval.shift = (
                         (h2retrieval.crew_for5 * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             h2retrieval.labour = h2retrieval.shift * labour.operational_salary
@@ -342,10 +347,10 @@ class EndUseLocation:
             plant_occupancy_planned, plant_occupancy_online, h2retrieval_capacity_planned, h2retrieval_capacity_online = self.calculate_h2retrieval_occupancy(
                 year, hydrogen_defaults_h2retrieval_data)
 
-            if self.debug:
-                print(
-                    '     a total of {} ton of h2retrieval capacity is online; {} ton total planned'.format(
-                        h2retrieval_capacity_online, h2retrieval_capacity_planned))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of h2retrieval capacity is online; {} ton total planned',
+                    h2retrieval_capacity_online, h2retrieval_capacity_planned)
 
     def calculate_energy_cost(self, year):
         """
@@ -354,7 +359,7 @@ class EndUseLocation:
         2. Find the total energy price to multiply the consumption with the energy price
         """
 
-        energy = Energy(**energy_data)
+        energy = Energy(**self.config.energy_data)
         
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in = self.throughput_elements(year)
 
@@ -364,13 +369,13 @@ class EndUseLocation:
         # calculate storage energy
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH': 
-                max_vessel_call_size = MCH_barge_data["call_size"]
+                max_vessel_call_size = self.config.MCH_barge_data["call_size"]
             elif commodity.type == 'DBT': 
-                max_vessel_call_size = DBT_barge_data["call_size"]
+                max_vessel_call_size = self.config.DBT_barge_data["call_size"]
             elif commodity.type == 'Liquid hydrogen':
-                max_vessel_call_size = hydrogen_barge_data["call_size"]
+                max_vessel_call_size = self.config.hydrogen_barge_data["call_size"]
             else:
-                max_vessel_call_size = ammonia_barge_data["call_size"]
+                max_vessel_call_size = self.config.ammonia_barge_data["call_size"]
         
         
         list_of_elements_Storage = opentisim.core.find_elements(self, Storage)
@@ -448,8 +453,8 @@ class EndUseLocation:
 
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in = self.throughput_elements(year)
         
-        if self.debug:
-            print('     Revenues: {}'.format(int(throughput_online * fee)))
+        if self.logger.enabled:
+            self.logger.message('     Revenues: {}', int(throughput_online * fee))
 
         try:
             self.revenues.append(throughput_online * fee)
@@ -615,7 +620,7 @@ class EndUseLocation:
                 Demand_plant_in = (Demand*(100+plantloss))/100
                 Demand_storage_in = (Demand*(100+(plantloss+storloss)))/100
             except:
-                print('problem occurs at {}'.format(year))
+                self.logger.warning('problem occurs at {}', year)
                 pass
 
         x = np.array(fullarray)
@@ -674,9 +679,18 @@ class EndUseLocation:
        
         self.throughput.append(throughput_online)
         
+    def throughput_timeline(self):
+        """Return the online throughput for each year in self.years as an array (cached, see
+        opentisim.core.throughput_timeline)"""
+
+        return opentisim.core.throughput_timeline(self, lambda year: self.throughput_elements(year)[0],
+                                                  key=opentisim.core.scenario_key(self))
+
     def terminal_elements_plot(self, width=0.2, alpha=0.6, fontsize=20):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         storages = []
@@ -1043,3 +1043,10 @@ pipe_nh3_data = {"name": 'pipe_nh3_01',
                 "rho": 682}
 
 
+def default_config():
+    """Return the current values of the defaults dicts of this module as a frozen opentisim.core.Config"""
+
+    import sys
+    from opentisim.core.config import Config
+
+    return Config.from_module(sys.modules[__name__])
@@ -16,30 +16,33 @@
 - vessel_properties_mixin
 - labour_properties_mixin
 - hasscenario_properties_mixin
+- hascohort_properties_mixin
 
 """
 
 # package for unique identifiers
-import uuid
 
 import numpy as np
-import pandas as pd
 
-import matplotlib.pyplot as plt
+from opentisim.core.elements import new_id
+from opentisim.core.scenarios import random_growth
+
 
 
 class identifiable_properties_mixin(object):
     """Something that has a name and id
 
     name: a name
-    id: a unique id generated with uuid"""
+    id: a unique id (sequential number)"""
+
+    __slots__ = ()
 
-    def __init__(self, name=[], id=None, *args, **kwargs):
+    def __init__(self, name=(), id=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.name = name
-        # generate some id, in this case based on m
-        self.id = id if id else str(uuid.uuid1())
+        # generate a sequential id
+        self.id = id if id else new_id()
 
 
 class history_properties_mixin(object):
@@ -48,7 +51,9 @@ class history_properties_mixin(object):
     purchase_date: year in which the decision was made to add another element
     online_date: year by which the elements starts to perform"""
 
-    def __init__(self, year_purchase=[], year_online=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, year_purchase=(), year_online=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.year_purchase = year_purchase
@@ -60,7 +65,9 @@ class hascapex_properties_mixin(object):
 
     capex: list with cost to be applied from investment year"""
 
-    def __init__(self, capex=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, capex=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.capex = capex
@@ -71,8 +78,10 @@ class hasopex_properties_mixin(object):
 
     opex: list with cost to be applied from investment year"""
 
-    def __init__(self, labour=[], maintenance=[], energy=[], insurance=[],
-                 lease=[], demurrage=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, labour=(), maintenance=(), energy=(), insurance=(),
+                 lease=(), demurrage=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.labour = labour
@@ -88,7 +97,9 @@ class hasrevenue_properties_mixin(object):
 
     revenue: list with revenues to be applied from investment year"""
 
-    def __init__(self, renevue=[], residual=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, renevue=(), residual=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.renevue = renevue
@@ -100,13 +111,17 @@ class hastriggers_properties_mixin(object):
 
     triggers: list with revenues to be applied from investment year"""
 
-    def __init__(self, triggers=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, triggers=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.triggers = triggers
 
 
 class jetty_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, ownership, delivery_time, lifespan, mobilisation_min, mobilisation_perc,
                  maintenance_perc, insurance_perc, Gijt_constant_jetty, jettywidth,jettylength, mooring_dolphins, catwalkwidth,catwalklength, Catwalk_rate, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -129,6 +144,8 @@ class jetty_properties_mixin(object):
 
 
 class berth_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, crane_type, delivery_time, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -136,6 +153,8 @@ class berth_properties_mixin(object):
         self.delivery_time = delivery_time
 
 class pipeline_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, length, ownership, delivery_time, lifespan, unit_rate_factor, mobilisation,
                  maintenance_perc, insurance_perc, consumption_coefficient, crew, utilisation, capacity, losses, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -156,6 +175,8 @@ class pipeline_properties_mixin(object):
         self.losses = losses
 
 class storage_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc,
                  maintenance_perc, crew_min, crew_for5, insurance_perc, storage_type, consumption, capacity, losses, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -177,6 +198,8 @@ class storage_properties_mixin(object):
         self.losses = losses
 
 class h2retrieval_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc,
                  maintenance_perc, crew_min, crew_for5, insurance_perc, h2retrieval_type, consumption, capacity, losses, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -198,6 +221,8 @@ class h2retrieval_properties_mixin(object):
         self.losses = losses
         
 class h2conversion_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc,
                  maintenance_perc, crew_min, crew_for5, insurance_perc, h2conversion_type, consumption, capacity, losses, recycle_rate, priceH2, sell_mat, sell_rate,  *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -223,6 +248,8 @@ class h2conversion_properties_mixin(object):
         self.sell_rate = sell_rate
 
 class commodity_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, handling_fee, Hcontent, material_price, smallhydrogen_perc, largehydrogen_perc, smallammonia_perc, largeammonia_perc,handysize_perc, panamax_perc, vlcc_perc, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -239,6 +266,8 @@ class commodity_properties_mixin(object):
         self.vlcc_perc = vlcc_perc
 
 class vessel_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, call_size, LOA, draft, beam, max_cranes, all_turn_time,
                  pump_capacity, mooring_time, demurrage_rate, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc, maintenance_perc, crew_min, crew_for5,insurance_perc,losses,utilization,avspeed, consumption, ship_weight, DWT, gamma, fuelprice, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -273,6 +302,8 @@ class vessel_properties_mixin(object):
         
         
 class barge_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, call_size, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc, maintenance_perc, crew_min, crew_for5,insurance_perc,losses,utilization,avspeed, consumption, ship_weight, loadingtime, unloadingtime, uncertainty  ,fuelprice, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -298,6 +329,8 @@ class barge_properties_mixin(object):
         self.fuelprice = fuelprice 
         
 class train_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, call_size, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc, maintenance_perc, crew_min, crew_for5,insurance_perc,losses,utilization,avspeed, consumption, train_weight, loadingtime, unloadingtime, uncertainty  ,fuelprice, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -324,6 +357,8 @@ class train_properties_mixin(object):
         
 
 class truck_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, unit_rate, mobilisation_min, mobilisation_perc, maintenance_perc, crew_min, crew_for5, insurance_perc, truck_type, consumption, capacity, utilization, avspeed, loadingtime, unloadingtime, uncertainty, losses, fuelprice , *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -353,6 +388,8 @@ class truck_properties_mixin(object):
         
         
 class pipe_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, type, ownership, delivery_time, lifespan, mobilisation_min, mobilisation_perc, maintenance_perc, crew_min, crew_for5,insurance_perc, pipe_type, utilization, speed, losses, unit_rate_com, delivery_time_com, lifespan_com, crew_min_com, consumption_com, pressure_com, capacity_com, losses_com, rho, *args, **kwargs):
         super().__init__(*args, **kwargs)
         "initialize"
@@ -381,7 +418,22 @@ class pipe_properties_mixin(object):
         self.rho = rho 
                     
 
+class hascohort_properties_mixin(object):
+    """Something that represents a cohort of identical units
+
+    count: number of identical units that come online in year_online"""
+
+    __slots__ = ()
+
+    def __init__(self, count=1, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        """Initialization"""
+        self.count = count
+
+
 class labour_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, international_salary, international_staff, local_salary, local_staff, operational_salary,
                  shift_length, annual_shifts, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -395,6 +447,8 @@ class labour_properties_mixin(object):
 
 
 class energy_properties_mixin(object):
+    __slots__ = ()
+
     def __init__(self, price, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.price = price
@@ -406,31 +460,29 @@ class hasscenario_properties_mixin(object):
     historic_data: observed demand
     scenario_data: generated estimates of future demand"""
 
-    def __init__(self, historic_data=[], scenario_data=[], *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, historic_data=(), scenario_data=(), *args, **kwargs):
         super().__init__(*args, **kwargs)
         """Initialization"""
         self.historic_data = historic_data
         self.scenario_data = scenario_data
 
-    def scenario_random(self, startyear=2019, lifecycle=20, rate=1.02, mu=0.01, sigma=0.065):
-        """trend generated from random growth rate increments"""
-        # package(s) used for probability
+    def scenario_random(self, startyear=2019, lifecycle=20, rate=1.02, mu=0.01, sigma=0.065, seed=None):
+        """trend generated from random growth rate increments
+
+        seed: integer or numpy.random.Generator for a reproducible trend (see opentisim.core.random_growth for
+        ensembles of many trends)"""
         years = range(startyear, startyear + lifecycle)
         volume = self.historic_data[self.historic_data.year == startyear - 1].volume.item()
 
-        volumes = []
-        for year in years:
-            change = np.random.normal(mu, sigma, 1)
-            new_rate = rate + change
-            volume = volume * new_rate
-            volumes.append(np.int(volume))
-
-        scenario_data = {'year': years, 'volume': volumes}
-
-        self.scenario_data = pd.DataFrame(data=scenario_data)
+        self.scenario_data = random_growth(volume, years, 1, rate, mu, sigma, seed).scenario(0)
 
     def plot_demand(self,  width=0.1, alpha=0.6, fontsize=20):
         """generate a histogram of the demand data"""
+
+        import matplotlib.pyplot as plt
+
         # generate plot
         fig, ax = plt.subplots(figsize=(20, 10))
 
@@ -33,93 +33,94 @@ Defaults for following objects:
 """
 
 from .hydrogen_mixins import *
+from opentisim.core.elements import element_type
 
 # The generic jetty class
-Jetty = type('Jetty', (identifiable_properties_mixin,  # Give it a name
-                       jetty_properties_mixin,
-                       history_properties_mixin,  # Give it procurement history
-                       hascapex_properties_mixin,  # Give it capex info
-                       hasopex_properties_mixin,  # Give it opex info
-                       hasrevenue_properties_mixin,  # Give it revenue info
-                       hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-                 {})  # The dictionary is empty because the site type is generic
+Jetty = element_type('Jetty', (identifiable_properties_mixin,  # Give it a name
+                               jetty_properties_mixin,
+                               history_properties_mixin,  # Give it procurement history
+                               hascapex_properties_mixin,  # Give it capex info
+                               hasopex_properties_mixin,  # Give it opex info
+                               hasrevenue_properties_mixin,  # Give it revenue info
+                               hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                         {})  # The dictionary is empty because the site type is generic
 
 # The generic Berth class
-Berth = type('Berth', (identifiable_properties_mixin,  # Give it a name
-                       history_properties_mixin,  # Give it procurement history
-                       berth_properties_mixin,
-                       hascapex_properties_mixin,  # Give it capex info
-                       hasopex_properties_mixin,  # Give it opex info
-                       hasrevenue_properties_mixin,  # Give it revenue info
-                       hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-             {})  # The dictionary is empty because the site type is generic
+Berth = element_type('Berth', (identifiable_properties_mixin,  # Give it a name
+                               history_properties_mixin,  # Give it procurement history
+                               berth_properties_mixin,
+                               hascapex_properties_mixin,  # Give it capex info
+                               hasopex_properties_mixin,  # Give it opex info
+                               hasrevenue_properties_mixin,  # Give it revenue info
+                               hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                     {})  # The dictionary is empty because the site type is generic
 
 
 # The generic Conveyor class
 # - Quay_conveyor
 # - Hinterland_conveyor
-Pipeline_Jetty = type('Pipeline_Jetty', (identifiable_properties_mixin,  # Give it a name
-                             history_properties_mixin,  # Give it procurement history
-                             pipeline_properties_mixin,
-                             hascapex_properties_mixin,  # Give it capex info
-                             hasopex_properties_mixin,  # Give it opex info
-                             hasrevenue_properties_mixin,  # Give it revenue info
-                             hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-                {})  # The dictionary is empty because the site type is generic
-
-Pipeline_Hinter = type('Pipeline_Hinter', (identifiable_properties_mixin,  # Give it a name
-                             history_properties_mixin,  # Give it procurement history
-                             pipeline_properties_mixin,
-                             hascapex_properties_mixin,  # Give it capex info
-                             hasopex_properties_mixin,  # Give it opex info
-                             hasrevenue_properties_mixin,  # Give it revenue info
-                             hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-                {})  # The dictionary is empty because the site type is generic
+Pipeline_Jetty = element_type('Pipeline_Jetty', (identifiable_properties_mixin,  # Give it a name
+                                     history_properties_mixin,  # Give it procurement history
+                                     pipeline_properties_mixin,
+                                     hascapex_properties_mixin,  # Give it capex info
+                                     hasopex_properties_mixin,  # Give it opex info
+                                     hasrevenue_properties_mixin,  # Give it revenue info
+                                     hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                        {})  # The dictionary is empty because the site type is generic
+
+Pipeline_Hinter = element_type('Pipeline_Hinter', (identifiable_properties_mixin,  # Give it a name
+                                     history_properties_mixin,  # Give it procurement history
+                                     pipeline_properties_mixin,
+                                     hascapex_properties_mixin,  # Give it capex info
+                                     hasopex_properties_mixin,  # Give it opex info
+                                     hasrevenue_properties_mixin,  # Give it revenue info
+                                     hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                        {})  # The dictionary is empty because the site type is generic
 
 # The generic Storage class
 # - LH2
 # - NH3
 # - MCH
-Storage = type('Storage', (identifiable_properties_mixin,  # Give it a name
-                           history_properties_mixin,  # Give it procurement history
-                           storage_properties_mixin,
-                           hascapex_properties_mixin,  # Give it capex info
-                           hasopex_properties_mixin,  # Give it opex info
-                           hasrevenue_properties_mixin,  # Give it revenue info
-                           hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-               {})  # The dictionary is empty because the site type is generic
+Storage = element_type('Storage', (identifiable_properties_mixin,  # Give it a name
+                                   history_properties_mixin,  # Give it procurement history
+                                   storage_properties_mixin,
+                                   hascapex_properties_mixin,  # Give it capex info
+                                   hasopex_properties_mixin,  # Give it opex info
+                                   hasrevenue_properties_mixin,  # Give it revenue info
+                                   hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                       {})  # The dictionary is empty because the site type is generic
 
 # The generic H2retrieval class
 # - LH2
 # - NH3
 # - MCH
 
-H2retrieval = type('H2retrieval', (identifiable_properties_mixin,  # Give it a name
-                           history_properties_mixin,  # Give it procurement history
-                           h2retrieval_properties_mixin,
-                           hascapex_properties_mixin,  # Give it capex info
-                           hasopex_properties_mixin,  # Give it opex info
-                           hasrevenue_properties_mixin,  # Give it revenue info
-                           hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-               {})  # The dictionary is empty because the site type is generic
-
-H2conversion = type('H2conversion', (identifiable_properties_mixin,  # Give it a name
-                           history_properties_mixin,  # Give it procurement history
-                           h2conversion_properties_mixin,
-                           hascapex_properties_mixin,  # Give it capex info
-                           hasopex_properties_mixin,  # Give it opex info
-                           hasrevenue_properties_mixin,  # Give it revenue info
-                           hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
-               {})  # The dictionary is empty because the site type is generic
+H2retrieval = element_type('H2retrieval', (identifiable_properties_mixin,  # Give it a name
+                                   history_properties_mixin,  # Give it procurement history
+                                   h2retrieval_properties_mixin,
+                                   hascapex_properties_mixin,  # Give it capex info
+                                   hasopex_properties_mixin,  # Give it opex info
+                                   hasrevenue_properties_mixin,  # Give it revenue info
+                                   hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                       {})  # The dictionary is empty because the site type is generic
+
+H2conversion = element_type('H2conversion', (identifiable_properties_mixin,  # Give it a name
+                                   history_properties_mixin,  # Give it procurement history
+                                   h2conversion_properties_mixin,
+                                   hascapex_properties_mixin,  # Give it capex info
+                                   hasopex_properties_mixin,  # Give it opex info
+                                   hasrevenue_properties_mixin,  # Give it revenue info
+                                   hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
+                       {})  # The dictionary is empty because the site type is generic
 
 # The generic Commodity class
 # - Liquid hydrogen
 # - Ammonia
 # - MCH
-Commodity = type('Commodity', (identifiable_properties_mixin,  # Give it a name
-                               commodity_properties_mixin,
-                               hasscenario_properties_mixin),
-                 {})  # The dictionary is empty because the site type is generic
+Commodity = element_type('Commodity', (identifiable_properties_mixin,  # Give it a name
+                                       commodity_properties_mixin,
+                                       hasscenario_properties_mixin),
+                         {})  # The dictionary is empty because the site type is generic
 
 # The general Vessel class
 # - smallhydrogen
@@ -139,36 +140,40 @@ Commodity = type('Commodity', (identifiable_properties_mixin,  # Give it a name
 #                            hastriggers_properties_mixin),  # Give it investment triggers (lambda?)
 #                {})  # The dictionary is empty because the site type is generic
 
-Vessel = type('Vessel', (identifiable_properties_mixin,
-                         vessel_properties_mixin),
-              {})  # The dictionary is empty because the site type is generic
+Vessel = element_type('Vessel', (identifiable_properties_mixin,
+                                 vessel_properties_mixin,
+                                 hascohort_properties_mixin),  # Allow a fleet cohort to be represented by one element
+                      {})  # The dictionary is empty because the site type is generic
 
 # The general Labour class
-Labour = type('Labour', (identifiable_properties_mixin,
-                         labour_properties_mixin),
-              {})  # The dictionary is empty because the site type is generic
+Labour = element_type('Labour', (identifiable_properties_mixin,
+                                 labour_properties_mixin),
+                      {})  # The dictionary is empty because the site type is generic
 
 # The general Energy class
-Energy = type('Energy', (identifiable_properties_mixin,
-                         energy_properties_mixin),
-              {})  # The dictionary is empty because the site type is generic
+Energy = element_type('Energy', (identifiable_properties_mixin,
+                                 energy_properties_mixin),
+                      {})  # The dictionary is empty because the site type is generic
 
 # The general Train class
-Train = type('Train', (identifiable_properties_mixin,
-                       train_properties_mixin),
-             {})  # The dictionary is empty because the site type is generic
+Train = element_type('Train', (identifiable_properties_mixin,
+                               train_properties_mixin,
+                               hascohort_properties_mixin),
+                     {})  # The dictionary is empty because the site type is generic
 
 
-Barge = type('Barge', (identifiable_properties_mixin,
-                         barge_properties_mixin),
-              {})  # The dictionary is empty because the site type is generic
+Barge = element_type('Barge', (identifiable_properties_mixin,
+                                 barge_properties_mixin,
+                                 hascohort_properties_mixin),
+                      {})  # The dictionary is empty because the site type is generic
 
-Truck = type('Truck', (identifiable_properties_mixin,
-                         truck_properties_mixin),
-              {})  # The dictionary is empty because the site type is generic
+Truck = element_type('Truck', (identifiable_properties_mixin,
+                                 truck_properties_mixin,
+                                 hascohort_properties_mixin),
+                      {})  # The dictionary is empty because the site type is generic
 
-Pipe = type('Pipe', (identifiable_properties_mixin,
-                         pipe_properties_mixin),
-              {})  # The dictionary is empty because the site type is generic
+Pipe = element_type('Pipe', (identifiable_properties_mixin,
+                                 pipe_properties_mixin),
+                      {})  # The dictionary is empty because the site type is generic
 
 
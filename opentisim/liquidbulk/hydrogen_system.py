@@ -12,7 +12,6 @@
 # package(s) for data handling
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .hydrogen_defaults import *
 from .hydrogen_objects import *
@@ -26,31 +25,41 @@ class System:
     Terminal development is governed by three triggers: the allowable waiting time as factor of service time,
     the allowable dwell time and an h2retrieval trigger."""
 
-    def __init__(self, startyear=2020, lifecycle=10, operational_hours=5840, debug=False, elements=[],
+    def __init__(self, startyear=2020, lifecycle=10, operational_hours=5840, debug=False, elements=None,
                  terminal_supply_chain={'berth_jetty', 'pipeline_jetty_-_terminal', 'storage', 'h2_retrieval'},
-                 commodity_type_defaults=commodity_ammonia_data,
-                 storage_type_defaults=storage_nh3_data,
+                 commodity_type_defaults=None,
+                 storage_type_defaults=None,
                  kendall='E2/E2/n',
                  allowable_waiting_service_time_ratio_berth=0.3,
-                 h2retrieval_type_defaults=h2retrieval_nh3_data,
-                 allowable_berth_occupancy=0.5, allowable_dwelltime=30 / 365, h2retrieval_trigger=1):
+                 h2retrieval_type_defaults=None,
+                 allowable_berth_occupancy=0.5, allowable_dwelltime=30 / 365, h2retrieval_trigger=1, sink=None, config=None):
         # time inputs
         self.years = []
         self.startyear = startyear
         self.lifecycle = lifecycle
         self.operational_hours = operational_hours
-        self.terminal_supply_chain = terminal_supply_chain
+        self.terminal_supply_chain = set(terminal_supply_chain)
 
-        # provide intermediate outputs via print statements if debug = True
+        # log investment decisions and per-year KPIs to sink (printed to the console if debug = True)
         self.debug = debug
+        self.logger = opentisim.core.EventLogger(sink, debug=debug)
 
-        # collection of all terminal objects
-        self.elements = elements
+        # frozen copy of the defaults dicts that the methods read (see opentisim.core.config)
+        self.config = config if config is not None else default_config()
+
+        # collection of all terminal objects (a list of its own, so terminals never share their elements list)
+        self.elements = [] if elements is None else list(elements)
 
         # default values to use in selecting which commodity is imported
-        self.commodity_type_defaults = commodity_type_defaults
-        self.storage_type_defaults = storage_type_defaults
-        self.h2retrieval_type_defaults = h2retrieval_type_defaults
+        if commodity_type_defaults is None:
+            commodity_type_defaults = self.config.commodity_ammonia_data
+        self.commodity_type_defaults = opentisim.core.freeze(commodity_type_defaults)
+        if storage_type_defaults is None:
+            storage_type_defaults = self.config.storage_nh3_data
+        self.storage_type_defaults = opentisim.core.freeze(storage_type_defaults)
+        if h2retrieval_type_defaults is None:
+            h2retrieval_type_defaults = self.config.h2retrieval_nh3_data
+        self.h2retrieval_type_defaults = opentisim.core.freeze(h2retrieval_type_defaults)
 
         # triggers for the various elements (berth, storage and h2retrieval)
         self.kendall = kendall
@@ -113,9 +122,7 @@ class System:
             - operational objective: Annually invest in infrastructure upgrades when performance criteria are triggered
             """
             self.years.append(year)
-            if self.debug:
-                print('')
-                print('### Simulate year: {} ############################'.format(year))
+            self.logger.start_year(year)
 
             # 1. for each year estimate the anticipated vessel arrivals based on the expected demand
             smallhydrogen_calls, largehydrogen_calls, smallammonia_calls, largeammonia_calls,             handysize_calls, panamax_calls, vlcc_calls, total_calls, total_vol,             smallhydrogen_calls_planned, largehydrogen_calls_planned,             smallammonia_calls_planned, largeammonia_calls_planned,             handysize_calls_planned, panamax_calls_planned, vlcc_calls_planned,             total_calls_planned, total_vol_planned = self.calculate_vessel_calls(year)
@@ -128,7 +135,7 @@ class System:
             storage = Storage(**hydrogen_defaults_storage_data)
             #storloss = (storage.losses) * (self.allowable_dwelltime * 365) 
             storloss = storage.losses  * ((self.allowable_dwelltime) *365)
-            jettyloss = jetty_pipeline_data["losses"]
+            jettyloss = self.config.jetty_pipeline_data["losses"]
             #Demand_jetty_in = (Demand*(100+(plantloss+storloss+jettyloss)))/100
 
             commodities = opentisim.core.find_elements(self, Commodity)
@@ -139,40 +146,29 @@ class System:
                 except:
                     pass
 
-            if self.debug:
-                print('--- Cargo volume and vessel calls for {} ---------'.format(year))
-                print('  Total demand volume vessel out: {}'.format(volume_vessel_out))
-                print('  Total actual throughput volume: {}'.format(total_vol))
-                print('  Total actual vessel calls: {}'.format(total_calls))
-                print('     Small Hydrogen calls: {}'.format(smallhydrogen_calls))
-                print('     Large Hydrogen calls: {}'.format(largehydrogen_calls))
-                print('     Small ammonia calls: {}'.format(smallammonia_calls))
-                print('     Large ammonia calls: {}'.format(largeammonia_calls))
-                print('     Handysize calls: {}'.format(handysize_calls))
-                print('     Panamax calls: {}'.format(panamax_calls))
-                print('     VLCC calls: {}'.format(vlcc_calls))
-                print('----------------------------------------------------')
+            if self.logger.enabled:
+                self.logger.kpi('vessel_calls', demand_volume=volume_vessel_out, total_vol=total_vol, total_calls=total_calls,
+                                smallhydrogen_calls=smallhydrogen_calls, largehydrogen_calls=largehydrogen_calls,
+                                smallammonia_calls=smallammonia_calls, largeammonia_calls=largeammonia_calls,
+                                handysize_calls=handysize_calls, panamax_calls=panamax_calls, vlcc_calls=vlcc_calls)
 
             # 2. for each year evaluate which investment are needed given the strategic and operational objectives
             if 'berth_jetty' in self.terminal_supply_chain:
                 self.berth_invest(year)
 
             if 'pipeline_jetty_-_terminal' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check pipeline jetty ---------------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check pipeline jetty ---------------------------')
                 self.pipeline_jetty_invest(year)
 
             if 'storage' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check storage ----------------------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check storage ----------------------------------')
                 self.storage_invest(year, self.storage_type_defaults)
 
             if 'h2_retrieval' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check H2 retrieval plants ----------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check H2 retrieval plants ----------------------')
                 self.h2retrieval_invest(year, self.h2retrieval_type_defaults)
 
 #             if 'pipeline_terminal_-_hinterland' in self.terminal_supply_chain:
@@ -212,18 +208,18 @@ class System:
             throughput_jetty_in = throughput_online_jetty_in
             #Demand_jetty_in = (Demand*(100+(plantloss+storloss+jettyloss)))/100
             
-            if self.debug:
-                print('--- Throughput online and in elements for {} ---------'.format(year))
-                print('  Total demand: {}'.format(Demand))
-                print('  Total demand plant in: {}'.format(Demand_plant_in))
-                print('  Total demand storage in: {}'.format(Demand_storage_in))
-                print('  Total demand jetty in: {}'.format(Demand_jetty_in))
-
-                print('  Total throughput online: {}'.format(throughput_online))
-                print('  Total throughput online plant in: {}'.format(throughput_plant_in))
-                print('  Total throughput online storage in: {}'.format(throughput_storage_in))
-                print('  Total throughput online jetty in: {}'.format(throughput_jetty_in))
-                print('----------------------------------------------------')
+            if self.logger.enabled:
+                self.logger.message('--- Throughput online and in elements for {} ---------', year)
+                self.logger.message('  Total demand: {}', Demand)
+                self.logger.message('  Total demand plant in: {}', Demand_plant_in)
+                self.logger.message('  Total demand storage in: {}', Demand_storage_in)
+                self.logger.message('  Total demand jetty in: {}', Demand_jetty_in)
+
+                self.logger.message('  Total throughput online: {}', throughput_online)
+                self.logger.message('  Total throughput online plant in: {}', throughput_plant_in)
+                self.logger.message('  Total throughput online storage in: {}', throughput_storage_in)
+                self.logger.message('  Total throughput online jetty in: {}', throughput_jetty_in)
+                self.logger.message('----------------------------------------------------')
 
         # # 7. collect all cash flows (capex, opex, revenues)
         # cash_flows, cash_flows_WACC_nominal = self.add_cashflow_elements()
@@ -250,9 +246,8 @@ class System:
         """
 
         # report on the status of all berth elements
-        if self.debug:
-            print('')
-            print('--- Status terminal @ start of year ----------------')
+        if self.logger.enabled:
+            self.logger.message('--- Status terminal @ start of year ----------------')
 
         opentisim.core.report_element(self, Berth, year)
         opentisim.core.report_element(self, Jetty, year)
@@ -302,20 +297,22 @@ class System:
         storage = Storage(**hydrogen_defaults_storage_data)
         #storloss = (storage.losses) * (self.allowable_dwelltime * 365) 
         storloss = storage.losses * ((self.allowable_dwelltime) *365)
-        jettyloss = jetty_pipeline_data["losses"]
+        jettyloss = self.config.jetty_pipeline_data["losses"]
         #Demand_jetty_in = (Demand*(100+(plantloss+storloss+jettyloss)))/100
 
-        if self.debug:
+        if self.logger.enabled:
             # print('     Berth occupancy planned (@ start of year): {:.2f} (trigger level: {:.2f})'.format(
             #     berth_occupancy_planned, self.allowable_berth_occupancy))
-            print('     Unloading occupancy planned (@ start of year): {:.2f}'.format(unloading_occupancy_planned))
-            print('     waiting time as factor of service time (@ start of year): {:.2f}'.format(waiting_factor))
-            print('     throughput planned berth in{:.2f}'.format((throughput_planned*(100+(plantloss+storloss+jettyloss)))/100))
+            self.logger.message(
+                '     Unloading occupancy planned (@ start of year): {:.2f}',
+                unloading_occupancy_planned)
+            self.logger.message('     waiting time as factor of service time (@ start of year): {:.2f}', waiting_factor)
+            self.logger.message(
+                '     throughput planned berth in{:.2f}',
+                (throughput_planned*(100+(plantloss+storloss+jettyloss)))/100)
 
-            print('')
-            print('--- Start investment analysis ----------------------')
-            print('')
-            print('$$$ Check berth elements ---------------------------')
+            self.logger.message('--- Start investment analysis ----------------------')
+            self.logger.message('$$$ Check berth elements ---------------------------')
 
         opentisim.core.report_element(self, Berth, year)
         opentisim.core.report_element(self, Jetty, year)
@@ -325,9 +322,9 @@ class System:
 
             # while planned berth occupancy is too large add a berth when no crane slots are available
             # NB: this setup makes sense here since there can be only one jetty per berth (compare containers)
-            if self.debug:
-                print('  *** add Berth to elements')
-            berth = Berth(**berth_data)
+            if self.logger.enabled:
+                self.logger.invest('Berth')
+            berth = Berth(**self.config.berth_data)
             berth.year_online = year + berth.delivery_time
             self.elements.append(berth)
 
@@ -344,11 +341,12 @@ class System:
             # waiting_factor = opentisim.core.occupancy_to_waitingfactor(utilisation=berth_occupancy_planned,
             #                                               nr_of_servers_to_chk=berths, kendall=self.kendall)
 
-            if self.debug:
+            if self.logger.enabled:
                 # print('     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})'.format(
                 #     berth_occupancy_planned, self.allowable_berth_occupancy))
-                print('     Waiting time as factor of service time (after adding berth): {:.2f} (trigger level: {:.2f})'.format(waiting_factor,
-                                                                                                     self.allowable_waiting_service_time_ratio_berth))
+                self.logger.message(
+                    '     Waiting time as factor of service time (after adding berth): {:.2f} (trigger level: {:.2f})',
+                    waiting_factor, self.allowable_waiting_service_time_ratio_berth)
 
                 # print('     Berth occupancy planned (after adding berth): {:.2f}'.format(berth_occupancy_planned))
                 # print('     Berth occupancy online (after adding berth): {}'.format(berth_occupancy_online))
@@ -359,18 +357,18 @@ class System:
             
             for commodity in opentisim.core.find_elements(self, Commodity):
                 if commodity.type == 'MCH' or commodity.type == 'DBT': 
-                    vessel_size_1 = vlcc_data["LOA"]
-                    vessel_size_2 = handysize_data["LOA"]
-                    vessel_size_3 = panamax_data["LOA"]
+                    vessel_size_1 = self.config.vlcc_data["LOA"]
+                    vessel_size_2 = self.config.handysize_data["LOA"]
+                    vessel_size_3 = self.config.panamax_data["LOA"]
                     a = np.array([vessel_size_1, vessel_size_2, vessel_size_3])
                 elif commodity.type == 'Liquid hydrogen':
-                    vessel_size_1 = smallhydrogen_data["LOA"]
-                    vessel_size_2 = largehydrogen_data["LOA"]
+                    vessel_size_1 = self.config.smallhydrogen_data["LOA"]
+                    vessel_size_2 = self.config.largehydrogen_data["LOA"]
                     vessel_size_3 = 0
                     a = np.array([vessel_size_1, vessel_size_2, vessel_size_3])
                 else:
-                    vessel_size_1 = smallammonia_data["LOA"]
-                    vessel_size_2 = largeammonia_data["LOA"]
+                    vessel_size_1 = self.config.smallammonia_data["LOA"]
+                    vessel_size_2 = self.config.largeammonia_data["LOA"]
                     vessel_size_3 = 0
                     a = np.array([vessel_size_1, vessel_size_2, vessel_size_3])
 
@@ -396,11 +394,12 @@ class System:
                 waiting_factor = opentisim.core.occupancy_to_waitingfactor(utilisation=berth_occupancy_planned,
                                                               nr_of_servers_to_chk=berths, kendall=self.kendall)
 
-                if self.debug:
+                if self.logger.enabled:
                     # print('     Berth occupancy planned (after adding jetty): {:.2f} (trigger level: {:.2f})'.format(
                     #     berth_occupancy_planned, self.allowable_berth_occupancy))
-                    print('     Waiting time as factor of service time (after adding jetty): {:.2f} (trigger level: {:.2f})'.format(waiting_factor,
-                                                                                                     self.allowable_waiting_service_time_ratio_berth))
+                    self.logger.message(
+                        '     Waiting time as factor of service time (after adding jetty): {:.2f} (trigger level: {:.2f})',
+                        waiting_factor, self.allowable_waiting_service_time_ratio_berth)
                     
                  
                   
@@ -415,10 +414,10 @@ class System:
             - adding jetty will increase jettys
         """
 
-        if self.debug:
-            print('  *** add jetty to elements')
+        if self.logger.enabled:
+            self.logger.invest('jetty')
         # add a Jetty element
-        jetty = Jetty(**jetty_data)
+        jetty = Jetty(**self.config.jetty_data)
 
         # - capex
         unit_rate = int((nrofdolphins * jetty.mooring_dolphins) + (jetty.Gijt_constant_jetty * jetty.jettywidth *
@@ -459,26 +458,26 @@ class System:
         
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH': 
-                pump1 = handysize_data["pump_capacity"]
-                pump2 = panamax_data["pump_capacity"]
-                pump3 = vlcc_data["pump_capacity"]
+                pump1 = self.config.handysize_data["pump_capacity"]
+                pump2 = self.config.panamax_data["pump_capacity"]
+                pump3 = self.config.vlcc_data["pump_capacity"]
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'DBT': 
-                pump1 = vlcc_data_DBT["pump_capacity"]
+                pump1 = self.config.vlcc_data_DBT["pump_capacity"]
                 pump2 = 0
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'Liquid hydrogen':
-                pump1 = smallhydrogen_data["pump_capacity"]
-                pump2 = largehydrogen_data["pump_capacity"]
+                pump1 = self.config.smallhydrogen_data["pump_capacity"]
+                pump2 = self.config.largehydrogen_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'Ammonia':
-                pump1 = smallammonia_data["pump_capacity"] 
-                pump2 = largeammonia_data["pump_capacity"]
+                pump1 = self.config.smallammonia_data["pump_capacity"] 
+                pump2 = self.config.largeammonia_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
@@ -517,9 +516,9 @@ class System:
         pipelines = len(opentisim.core.find_elements(self, Pipeline_Jetty))
         jettys = len(opentisim.core.find_elements(self, Jetty))
         if jettys > pipelines:
-            if self.debug:
-                print('  *** add jetty pipeline to elements')
-            pipeline_jetty = Pipeline_Jetty(**jetty_pipeline_data)
+            if self.logger.enabled:
+                self.logger.invest('jetty pipeline')
+            pipeline_jetty = Pipeline_Jetty(**self.config.jetty_pipeline_data)
 
             # - capex
             unit_rate = pipeline_jetty.unit_rate_factor * pipeline_jetty.length
@@ -535,7 +534,7 @@ class System:
             pipeline_jetty.purchase_material = 0 
 
             #   labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             pipeline_jetty.shift = (pipeline_jetty.crew * self.operational_hours) / (
                         labour.shift_length * labour.annual_shifts)
             pipeline_jetty.labour = pipeline_jetty.shift * labour.operational_salary
@@ -607,18 +606,19 @@ class System:
                     if year >= element.year_online:
                         storage_capacity_online += element.capacity
 
-        if self.debug:
-            print('     a total of {} ton of {} storage capacity is online; {} ton total planned'.format(
-                storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity))
+        if self.logger.enabled:
+            self.logger.message(
+                '     a total of {} ton of {} storage capacity is online; {} ton total planned',
+                storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity)
 
         # max_vessel_call_size = max([x.call_size for x in opentisim.core.find_elements(self, Vessel)])
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH' or commodity.type == 'DBT': 
-                max_vessel_call_size = vlcc_data["call_size"]
+                max_vessel_call_size = self.config.vlcc_data["call_size"]
             elif commodity.type == 'Liquid hydrogen':
-                max_vessel_call_size = largehydrogen_data["call_size"]
+                max_vessel_call_size = self.config.largehydrogen_data["call_size"]
             else:
-                max_vessel_call_size = largeammonia_data["call_size"]
+                max_vessel_call_size = self.config.largeammonia_data["call_size"]
         
         #max_vessel_call_size = largeammonia_data["call_size"]
 
@@ -642,8 +642,8 @@ class System:
         while storage_capacity < max_vessel_call_size or storage_capacity < storage_capacity_dwelltime_demand:
         #(
 #                 storage_capacity < storage_capacity_dwelltime_demand and storage_capacity < storage_capacity_dwelltime_throughput):
-            if self.debug:
-                print('  *** add storage to elements')
+            if self.logger.enabled:
+                self.logger.invest('storage')
 
             # add storage object
             storage = Storage(**hydrogen_defaults_storage_data)
@@ -660,7 +660,7 @@ class System:
             storage.purchase_material = 0 
 
             #   labour**hydrogen_defaults
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             storage.shift = (
                         (storage.crew_for5 * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             storage.labour = storage.shift * labour.operational_salary
@@ -690,9 +690,10 @@ class System:
 
 #             storage_capacity_dwelltime_throughput = (throughput_planned_storage * self.allowable_dwelltime) * 1.1
             
-            if self.debug:
-                print('     a total of {} ton of {} storage capacity is online; {} ton total planned'.format(
-                    storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of {} storage capacity is online; {} ton total planned',
+                    storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity)
 
     def h2retrieval_invest(self, year, hydrogen_defaults_h2retrieval_data):
         """current strategy is to add h2 retrieval as long as target h2 retrieval is not yet achieved
@@ -705,15 +706,15 @@ class System:
         plant_occupancy_planned, plant_occupancy_online, h2retrieval_capacity_planned, h2retrieval_capacity_online = self.calculate_h2retrieval_occupancy(
             year, hydrogen_defaults_h2retrieval_data)
 
-        if self.debug:
-            print('     Plant occupancy planned (@ start of year): {:.2f}'.format(plant_occupancy_planned))
-            print('     Plant occupancy online (@ start of year): {:.2f}'.format(plant_occupancy_online))
+        if self.logger.enabled:
+            self.logger.message('     Plant occupancy planned (@ start of year): {:.2f}', plant_occupancy_planned)
+            self.logger.message('     Plant occupancy online (@ start of year): {:.2f}', plant_occupancy_online)
 
         # check if sufficient h2retrieval capacity is available
         while plant_occupancy_planned > self.h2retrieval_trigger:
 
-            if self.debug:
-                print('  *** add h2retrieval to elements')
+            if self.logger.enabled:
+                self.logger.invest('h2retrieval')
 
             # add h2retrieval object
             h2retrieval = H2retrieval(**hydrogen_defaults_h2retrieval_data)
@@ -730,7 +731,7 @@ class System:
             h2retrieval.purchase_material = 0
 
             #   labour**hydrogen_defaults
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             h2retrieval.shift = (
                         (h2retrieval.crew_for5 * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             h2retrieval.labour = h2retrieval.shift * labour.operational_salary
@@ -757,10 +758,10 @@ class System:
             plant_occupancy_planned, plant_occupancy_online, h2retrieval_capacity_planned, h2retrieval_capacity_online = self.calculate_h2retrieval_occupancy(
                 year, hydrogen_defaults_h2retrieval_data)
 
-            if self.debug:
-                print(
-                    '     a total of {} ton of h2retrieval capacity is online; {} ton total planned'.format(
-                        h2retrieval_capacity_online, h2retrieval_capacity_planned))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of h2retrieval capacity is online; {} ton total planned',
+                    h2retrieval_capacity_online, h2retrieval_capacity_planned)
 
 #     def pipeline_hinter_invest(self, year):
 #         """current strategy is to add pipeline as soon as a service trigger is achieved
@@ -844,7 +845,7 @@ class System:
         2. Find the total energy price to multiply the consumption with the energy price
         """
 
-        energy = Energy(**energy_data)
+        energy = Energy(**self.config.energy_data)
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in =             self.throughput_elements(year)
         
 
@@ -870,7 +871,7 @@ class System:
 
         # calculate storage energy
         list_of_elements_Storage = opentisim.core.find_elements(self, Storage)
-        max_vessel_call_size = largeammonia_data["call_size"]
+        max_vessel_call_size = self.config.largeammonia_data["call_size"]
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in =             self.throughput_elements(year)
         
         
@@ -970,42 +971,42 @@ class System:
 
         # Find the demurrage cost per type of vessel
         # if service_rate != 0:
-        smallhydrogen = Vessel(**smallhydrogen_data)
+        smallhydrogen = Vessel(**self.config.smallhydrogen_data)
         service_time_smallhydrogen = smallhydrogen.call_size / smallhydrogen.pump_capacity
         waiting_time_hours_smallhydrogen = waiting_factor * service_time_smallhydrogen
         penalty_time_smallhydrogen = max(0, waiting_time_hours_smallhydrogen - smallhydrogen.all_turn_time)
         demurrage_time_smallhydrogen = penalty_time_smallhydrogen * smallhydrogen_calls
         demurrage_cost_smallhydrogen = demurrage_time_smallhydrogen * smallhydrogen.demurrage_rate
 
-        largehydrogen = Vessel(**largehydrogen_data)
+        largehydrogen = Vessel(**self.config.largehydrogen_data)
         service_time_largehydrogen = largehydrogen.call_size / largehydrogen.pump_capacity
         waiting_time_hours_largehydrogen = waiting_factor * service_time_largehydrogen
         penalty_time_largehydrogen = max(0, waiting_time_hours_largehydrogen - largehydrogen.all_turn_time)
         demurrage_time_largehydrogen = penalty_time_largehydrogen * largehydrogen_calls
         demurrage_cost_largehydrogen = demurrage_time_largehydrogen * largehydrogen.demurrage_rate
 
-        smallammonia = Vessel(**smallammonia_data)
+        smallammonia = Vessel(**self.config.smallammonia_data)
         service_time_smallammonia = smallammonia.call_size / smallammonia.pump_capacity
         waiting_time_hours_smallammonia = waiting_factor * service_time_smallammonia
         penalty_time_smallammonia = max(0, waiting_time_hours_smallammonia - smallammonia.all_turn_time)
         demurrage_time_smallammonia = penalty_time_smallammonia * smallammonia_calls
         demurrage_cost_smallammonia = demurrage_time_smallammonia * smallammonia.demurrage_rate
 
-        largeammonia = Vessel(**largeammonia_data)
+        largeammonia = Vessel(**self.config.largeammonia_data)
         service_time_largeammonia = largeammonia.call_size / largeammonia.pump_capacity
         waiting_time_hours_largeammonia = waiting_factor * service_time_largeammonia
         penalty_time_largeammonia = max(0, waiting_time_hours_largeammonia - largeammonia.all_turn_time)
         demurrage_time_largeammonia = penalty_time_largeammonia * largeammonia_calls
         demurrage_cost_largeammonia = demurrage_time_largeammonia * largeammonia.demurrage_rate
 
-        handysize = Vessel(**handysize_data)
+        handysize = Vessel(**self.config.handysize_data)
         service_time_handysize = handysize.call_size / handysize.pump_capacity
         waiting_time_hours_handysize = waiting_factor * service_time_handysize
         penalty_time_handysize = max(0, waiting_time_hours_handysize - handysize.all_turn_time)
         demurrage_time_handysize = penalty_time_handysize * handysize_calls
         demurrage_cost_handysize = demurrage_time_handysize * handysize.demurrage_rate
 
-        panamax = Vessel(**panamax_data)
+        panamax = Vessel(**self.config.panamax_data)
         service_time_panamax = panamax.call_size / panamax.pump_capacity
         waiting_time_hours_panamax = waiting_factor * service_time_panamax
         penalty_time_panamax = max(0, waiting_time_hours_panamax - panamax.all_turn_time)
@@ -1014,11 +1015,11 @@ class System:
            
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH':
-                vlcc = Vessel(**vlcc_data)
+                vlcc = Vessel(**self.config.vlcc_data)
             elif commodity.type == 'DBT': 
-                vlcc = Vessel(**vlcc_data_DBT)
+                vlcc = Vessel(**self.config.vlcc_data_DBT)
             else:
-                vlcc = Vessel(**vlcc_data)
+                vlcc = Vessel(**self.config.vlcc_data)
                    
         service_time_vlcc = vlcc.call_size / vlcc.pump_capacity
         waiting_time_hours_vlcc = waiting_factor * service_time_vlcc
@@ -1041,8 +1042,8 @@ class System:
 
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in =             self.throughput_elements(year)
    
-        if self.debug:
-            print('     Revenues: {}'.format(int(throughput_online * fee)))
+        if self.logger.enabled:
+            self.logger.message('     Revenues: {}', int(throughput_online * fee))
 
         try:
             self.revenues.append(throughput_online * fee)
@@ -1173,11 +1174,11 @@ class System:
         
         for commodity in opentisim.core.find_elements(self, Commodity):
                 if commodity.type == 'MCH':
-                    vlcc_data_real = vlcc_data
+                    vlcc_data_real = self.config.vlcc_data
                 elif commodity.type == 'DBT': 
-                    vlcc_data_real = vlcc_data_DBT
+                    vlcc_data_real = self.config.vlcc_data_DBT
                 else:
-                    vlcc_data_real = vlcc_data
+                    vlcc_data_real = self.config.vlcc_data
         
         # find the total service rate and determine the time at berth (in hours, per vessel type and in total)
         nr_of_jetty_planned = 0
@@ -1191,23 +1192,23 @@ class System:
             
             # estimate berth occupancy
             time_at_berth_smallhydrogen_planned = smallhydrogen_calls_planned * (
-                    (smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"]) +
-                    smallhydrogen_data["mooring_time"])
+                    (self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"]) +
+                    self.config.smallhydrogen_data["mooring_time"])
             time_at_berth_largehydrogen_planned = largehydrogen_calls_planned * (
-                    (largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"]) +
-                    largehydrogen_data["mooring_time"])
+                    (self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"]) +
+                    self.config.largehydrogen_data["mooring_time"])
             time_at_berth_smallammonia_planned = smallammonia_calls_planned * (
-                    (smallammonia_data["call_size"] / smallammonia_data["pump_capacity"]) +
-                    smallammonia_data["mooring_time"])
+                    (self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"]) +
+                    self.config.smallammonia_data["mooring_time"])
             time_at_berth_largeammonia_planned = largeammonia_calls_planned * (
-                    (largeammonia_data["call_size"] / largeammonia_data["pump_capacity"]) +
-                    largeammonia_data["mooring_time"])
+                    (self.config.largeammonia_data["call_size"] / self.config.largeammonia_data["pump_capacity"]) +
+                    self.config.largeammonia_data["mooring_time"])
             time_at_berth_handysize_planned = handysize_calls_planned * (
-                    (handysize_data["call_size"] / handysize_data["pump_capacity"]) +
-                    handysize_data["mooring_time"])
+                    (self.config.handysize_data["call_size"] / self.config.handysize_data["pump_capacity"]) +
+                    self.config.handysize_data["mooring_time"])
             time_at_berth_panamax_planned = panamax_calls_planned * (
-                    (panamax_data["call_size"] / panamax_data["pump_capacity"]) +
-                    panamax_data["mooring_time"])
+                    (self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"]) +
+                    self.config.panamax_data["mooring_time"])
             time_at_berth_vlcc_planned = vlcc_calls_planned * (
                     (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"]) +
                     vlcc_data_real["mooring_time"])
@@ -1228,17 +1229,17 @@ class System:
             
             # estimate crane occupancy
             time_at_unloading_smallhydrogen_planned = smallhydrogen_calls * (
-                        smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"])
+                        self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"])
             time_at_unloading_largehydrogen_planned = largehydrogen_calls * (
-                        largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"])
+                        self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"])
             time_at_unloading_smallammonia_planned = smallammonia_calls * (
-                        smallammonia_data["call_size"] / smallammonia_data["pump_capacity"])
+                        self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"])
             time_at_unloading_largeammonia_planned = largeammonia_calls * (
-                        largeammonia_data["call_size"] / handysize_data["pump_capacity"])
+                        self.config.largeammonia_data["call_size"] / self.config.handysize_data["pump_capacity"])
             time_at_unloading_handysize_planned = handysize_calls * (
-                        handysize_data["call_size"] / largeammonia_data["pump_capacity"])
+                        self.config.handysize_data["call_size"] / self.config.largeammonia_data["pump_capacity"])
             time_at_unloading_panamax_planned = panamax_calls * (
-                        panamax_data["call_size"] / panamax_data["pump_capacity"])
+                        self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"])
             time_at_unloading_vlcc_planned = vlcc_calls * (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"])
 
             total_time_at_unloading_planned = np.sum(
@@ -1253,23 +1254,23 @@ class System:
 
             if nr_of_jetty_online != 0:
                 time_at_berth_smallhydrogen_online = smallhydrogen_calls * (
-                        (smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"]) +
-                        smallhydrogen_data["mooring_time"])
+                        (self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"]) +
+                        self.config.smallhydrogen_data["mooring_time"])
                 time_at_berth_largehydrogen_online = largehydrogen_calls * (
-                        (largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"]) +
-                        largehydrogen_data["mooring_time"])
+                        (self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"]) +
+                        self.config.largehydrogen_data["mooring_time"])
                 time_at_berth_smallammonia_online = smallammonia_calls * (
-                        (smallammonia_data["call_size"] / smallammonia_data["pump_capacity"]) +
-                        smallammonia_data["mooring_time"])
+                        (self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"]) +
+                        self.config.smallammonia_data["mooring_time"])
                 time_at_berth_largeammonia_online = largeammonia_calls * (
-                        (largeammonia_data["call_size"] / largeammonia_data["pump_capacity"]) +
-                        largeammonia_data["mooring_time"])
+                        (self.config.largeammonia_data["call_size"] / self.config.largeammonia_data["pump_capacity"]) +
+                        self.config.largeammonia_data["mooring_time"])
                 time_at_berth_handysize_online = handysize_calls * (
-                        (handysize_data["call_size"] / handysize_data["pump_capacity"]) +
-                        handysize_data["mooring_time"])
+                        (self.config.handysize_data["call_size"] / self.config.handysize_data["pump_capacity"]) +
+                        self.config.handysize_data["mooring_time"])
                 time_at_berth_panamax_online = panamax_calls * (
-                        (panamax_data["call_size"] / panamax_data["pump_capacity"]) +
-                        panamax_data["mooring_time"])
+                        (self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"]) +
+                        self.config.panamax_data["mooring_time"])
                 time_at_berth_vlcc_online = vlcc_calls * (
                         (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"]) +
                         vlcc_data_real["mooring_time"])
@@ -1284,17 +1285,17 @@ class System:
                     [total_time_at_berth_online / (self.operational_hours * nr_of_jetty_online), 1])
 
                 time_at_unloading_smallhydrogen_online = smallhydrogen_calls * (
-                            smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"])
+                            self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"])
                 time_at_unloading_largehydrogen_online = largehydrogen_calls * (
-                            largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"])
+                            self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"])
                 time_at_unloading_smallammonia_online = smallammonia_calls * (
-                            smallammonia_data["call_size"] / smallammonia_data["pump_capacity"])
+                            self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"])
                 time_at_unloading_largeammonia_online = largeammonia_calls * (
-                            largeammonia_data["call_size"] / largeammonia_data["pump_capacity"])
+                            self.config.largeammonia_data["call_size"] / self.config.largeammonia_data["pump_capacity"])
                 time_at_unloading_handysize_online = handysize_calls * (
-                            handysize_data["call_size"] / handysize_data["pump_capacity"])
+                            self.config.handysize_data["call_size"] / self.config.handysize_data["pump_capacity"])
                 time_at_unloading_panamax_online = panamax_calls * (
-                            panamax_data["call_size"] / panamax_data["pump_capacity"])
+                            self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"])
                 time_at_unloading_vlcc_online = vlcc_calls * (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"])
 
                 total_time_at_unloading_online = np.sum(
@@ -1320,7 +1321,18 @@ class System:
          
         
         return berth_occupancy_planned, berth_occupancy_online, unloading_occupancy_planned, unloading_occupancy_online
-    
+
+    def berth_occupancies(self, year):
+        """Return the planned and online berth and unloading occupancy in year as a dict"""
+
+        # the online and the planned vessel calls per vessel type, without the totals
+        calls = self.calculate_vessel_calls(year)
+        occupancies = self.calculate_berth_occupancy(year, *calls[0:7], *calls[9:16])
+        names = ['berth_occupancy_planned', 'berth_occupancy_online', 'unloading_occupancy_planned',
+                 'unloading_occupancy_online']
+
+        return dict(zip(names, occupancies))
+
     def calculate_storage_occupancy(self, year, hydrogen_defaults_storage_data):
         """
         - Divide the throughput by the service rate to get the total hours in a year
@@ -1439,26 +1451,26 @@ class System:
         
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH': 
-                pump1 = handysize_data["pump_capacity"]
-                pump2 = panamax_data["pump_capacity"]
-                pump3 = vlcc_data["pump_capacity"]
+                pump1 = self.config.handysize_data["pump_capacity"]
+                pump2 = self.config.panamax_data["pump_capacity"]
+                pump3 = self.config.vlcc_data["pump_capacity"]
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'DBT': 
-                pump1 = vlcc_data_DBT["pump_capacity"]
+                pump1 = self.config.vlcc_data_DBT["pump_capacity"]
                 pump2 = 0
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'Liquid hydrogen':
-                pump1 = smallhydrogen_data["pump_capacity"]
-                pump2 = largehydrogen_data["pump_capacity"]
+                pump1 = self.config.smallhydrogen_data["pump_capacity"]
+                pump2 = self.config.largehydrogen_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             else:
-                pump1 = smallammonia_data["pump_capacity"] 
-                pump2 = largeammonia_data["pump_capacity"]
+                pump1 = self.config.smallammonia_data["pump_capacity"] 
+                pump2 = self.config.largeammonia_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
@@ -1519,7 +1531,7 @@ class System:
         storage = Storage(**hydrogen_defaults_storage_data)
         #storloss = (storage.losses) * (self.allowable_dwelltime * 365) 
         storloss = storage.losses * ((self.allowable_dwelltime) *365)
-        jettyloss = jetty_pipeline_data["losses"]
+        jettyloss = self.config.jetty_pipeline_data["losses"]
 
         
 #         # Find demand
@@ -1569,7 +1581,7 @@ class System:
                 Demand_storage_in = (Demand*(100+(plantloss+storloss)))/100
                 Demand_jetty_in = (Demand*(100+(plantloss+storloss+jettyloss)))/100
             except:
-                print('problem occurs at {}'.format(year))
+                self.logger.warning('problem occurs at {}', year)
                 pass
 
         x = np.array(fullarray)
@@ -1658,10 +1670,19 @@ class System:
         else:
             return False
 
+    def throughput_timeline(self):
+        """Return the online throughput for each year in self.years as an array (cached, see
+        opentisim.core.throughput_timeline)"""
+
+        return opentisim.core.throughput_timeline(self, lambda year: self.throughput_elements(year)[0],
+                                                  key=opentisim.core.scenario_key(self))
+
     # *** Plotting functions
     def terminal_elements_plot(self, width=0.1, alpha=0.6, fontsize=20):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         berths = []
@@ -1792,6 +1813,9 @@ class System:
 
     def demand_terminal_plot(self, width=0.1, alpha=0.6):
         # Adding the throughput
+
+        import matplotlib.pyplot as plt
+
         years = self.years
         throughputs_online = []
         storage_capacity_online = []
@@ -1872,6 +1896,8 @@ class System:
     def terminal_occupancy_plot(self, width=0.2, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         # years = []
         years = self.years
@@ -2023,6 +2049,8 @@ class System:
     def plant_occupancy_plot(self, width=0.3, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         plants_occupancy = []
@@ -2110,6 +2138,8 @@ class System:
     def Jetty_capacity_plot(self, width=0.3, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         jettys = []
@@ -2188,6 +2218,8 @@ class System:
     def Pipeline1_capacity_plot(self, width=0.2, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         pipeline_jetty = []
@@ -2218,7 +2250,7 @@ class System:
             for element in opentisim.core.find_elements(self, Jetty):
                 if isinstance(element, Jetty):
                     if year >= element.year_online:
-                        jettys_cap[-1] += largeammonia_data["pump_capacity"]
+                        jettys_cap[-1] += self.config.largeammonia_data["pump_capacity"]
 
         # get demand
         demand = pd.DataFrame()
@@ -2284,6 +2316,8 @@ class System:
     def Storage_capacity_plot(self, width=0.25, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # get crane service capacity and storage capacity
         years = self.years
         storages = []
@@ -2364,6 +2398,8 @@ class System:
     def H2_capacity_plot(self, width=0.3, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         h2retrievals = []
@@ -12,7 +12,6 @@
 # package(s) for data handling
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .hydrogen_defaults import *
 from .hydrogen_objects import *
@@ -26,31 +25,42 @@ class ExportTerminal:
     Terminal development is governed by three triggers: the allowable waiting time as factor of service time,
     the allowable dwell time and an h2conversion trigger."""
 
-    def __init__(self, startyear=2020, lifecycle=10, operational_hours=5840, debug=False, elements=[],
+    def __init__(self, startyear=2020, lifecycle=10, operational_hours=5840, debug=False, elements=None,
                  terminal_supply_chain={'berth_jetty', 'pipeline_jetty_-_terminal', 'storage','h2_conversion'},
-                 commodity_type_defaults=commodity_ammonia_data,
-                 storage_type_defaults=storage_nh3_data,
+                 commodity_type_defaults=None,
+                 storage_type_defaults=None,
                  kendall='E2/E2/n',
                  allowable_waiting_service_time_ratio_berth=0.5,
-                 h2conversion_type_defaults=h2conversion_nh3_data,
-                 allowable_berth_occupancy=0.5, allowable_dwelltime=30 / 365, h2conversion_trigger=1):
+                 h2conversion_type_defaults=None,
+                 allowable_berth_occupancy=0.5, allowable_dwelltime=30 / 365, h2conversion_trigger=1,
+                 sink=None, config=None):
         # time inputs
         self.years = []
         self.startyear = startyear
         self.lifecycle = lifecycle
         self.operational_hours = operational_hours
-        self.terminal_supply_chain = terminal_supply_chain
+        self.terminal_supply_chain = set(terminal_supply_chain)
 
-        # provide intermediate outputs via print statements if debug = True
+        # log investment decisions and per-year KPIs to sink (printed to the console if debug = True)
         self.debug = debug
+        self.logger = opentisim.core.EventLogger(sink, debug=debug)
 
-        # collection of all terminal objects
-        self.elements = elements
+        # frozen copy of the defaults dicts that the methods read (see opentisim.core.config)
+        self.config = config if config is not None else default_config()
+
+        # collection of all terminal objects (a list of its own, so terminals never share their elements list)
+        self.elements = [] if elements is None else list(elements)
 
         # default values to use in selecting which commodity is imported
-        self.commodity_type_defaults = commodity_type_defaults
-        self.storage_type_defaults = storage_type_defaults
-        self.h2conversion_type_defaults = h2conversion_type_defaults
+        if commodity_type_defaults is None:
+            commodity_type_defaults = self.config.commodity_ammonia_data
+        self.commodity_type_defaults = opentisim.core.freeze(commodity_type_defaults)
+        if storage_type_defaults is None:
+            storage_type_defaults = self.config.storage_nh3_data
+        self.storage_type_defaults = opentisim.core.freeze(storage_type_defaults)
+        if h2conversion_type_defaults is None:
+            h2conversion_type_defaults = self.config.h2conversion_nh3_data
+        self.h2conversion_type_defaults = opentisim.core.freeze(h2conversion_type_defaults)
 
         # triggers for the various elements (berth, storage and h2conversion)
         self.kendall = kendall
@@ -114,9 +124,7 @@ class ExportTerminal:
             - operational objective: Annually invest in infrastructure upgrades when performance criteria are triggered
             """
             self.years.append(year)
-            if self.debug:
-                print('')
-                print('### Simulate year: {} ############################'.format(year))
+            self.logger.start_year(year)
 
             # 1. for each year estimate the anticipated vessel arrivals based on the expected demand
             smallhydrogen_calls, largehydrogen_calls, smallammonia_calls, largeammonia_calls,             handysize_calls, panamax_calls, vlcc_calls, total_calls, total_vol,             smallhydrogen_calls_planned, largehydrogen_calls_planned,             smallammonia_calls_planned, largeammonia_calls_planned,             handysize_calls_planned, panamax_calls_planned, vlcc_calls_planned,             total_calls_planned, total_vol_planned = self.calculate_vessel_calls(year)
@@ -129,7 +137,7 @@ class ExportTerminal:
             storage = Storage(**hydrogen_defaults_storage_data)
             #storloss = (storage.losses) * (self.allowable_dwelltime * 365)
             storloss = storage.losses * ((self.allowable_dwelltime) *365)
-            jettyloss = jetty_pipeline_data["losses"]
+            jettyloss = self.config.jetty_pipeline_data["losses"]
             #Demand_jetty_in = (Demand*(100+(plantloss+storloss+jettyloss)))/100
 
             commodities = opentisim.core.find_elements(self, Commodity)
@@ -140,40 +148,29 @@ class ExportTerminal:
                 except:
                     pass
 
-            if self.debug:
-                print('--- Cargo volume and vessel calls for {} ---------'.format(year))
-                print('  Total demand volume vessel out: {}'.format(volume_vessel_in))
-                print('  Total actual throughput volume: {}'.format(total_vol))
-                print('  Total actual vessel calls: {}'.format(total_calls))
-                print('     Small Hydrogen calls: {}'.format(smallhydrogen_calls))
-                print('     Large Hydrogen calls: {}'.format(largehydrogen_calls))
-                print('     Small ammonia calls: {}'.format(smallammonia_calls))
-                print('     Large ammonia calls: {}'.format(largeammonia_calls))
-                print('     Handysize calls: {}'.format(handysize_calls))
-                print('     Panamax calls: {}'.format(panamax_calls))
-                print('     VLCC calls: {}'.format(vlcc_calls))
-                print('----------------------------------------------------')
+            if self.logger.enabled:
+                self.logger.kpi('vessel_calls', demand_volume=volume_vessel_in, total_vol=total_vol, total_calls=total_calls,
+                                smallhydrogen_calls=smallhydrogen_calls, largehydrogen_calls=largehydrogen_calls,
+                                smallammonia_calls=smallammonia_calls, largeammonia_calls=largeammonia_calls,
+                                handysize_calls=handysize_calls, panamax_calls=panamax_calls, vlcc_calls=vlcc_calls)
 
             # 2. for each year evaluate which investment are needed given the strategic and operational objectives
             if 'berth_jetty' in self.terminal_supply_chain:
                 self.berth_invest(year)
 
             if 'pipeline_jetty_-_terminal' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check pipeline jetty ---------------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check pipeline jetty ---------------------------')
                 self.pipeline_jetty_invest(year)
 
             if 'storage' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check storage ----------------------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check storage ----------------------------------')
                 self.storage_invest(year, self.storage_type_defaults)
 
             if 'h2_conversion' in self.terminal_supply_chain:
-                if self.debug:
-                    print('')
-                    print('$$$ Check H2 conversion plants ----------------------')
+                if self.logger.enabled:
+                    self.logger.message('$$$ Check H2 conversion plants ----------------------')
                 self.h2conversion_invest(year, self.h2conversion_type_defaults)
 
         # 3. for each year calculate the energy costs (requires insight in realized demands)
@@ -207,18 +204,18 @@ class ExportTerminal:
             throughput_jetty_in = throughput_online_jetty_in
             #Demand_jetty_in = (Demand*(100+(plantloss+storloss+jettyloss)))/100
             
-            if self.debug:
-                print('--- Throughput online and in elements for {} ---------'.format(year))
-                print('  Total demand: {}'.format(Demand))
-                print('  Total demand plant in: {}'.format(Demand_plant_in))
-                print('  Total demand storage in: {}'.format(Demand_storage_in))
-                print('  Total demand jetty in: {}'.format(Demand_jetty_in))
-
-                print('  Total throughput online: {}'.format(throughput_online))
-                print('  Total throughput online plant in: {}'.format(throughput_plant_in))
-                print('  Total throughput online storage in: {}'.format(throughput_storage_in))
-                print('  Total throughput online jetty in: {}'.format(throughput_jetty_in))
-                print('----------------------------------------------------')
+            if self.logger.enabled:
+                self.logger.message('--- Throughput online and in elements for {} ---------', year)
+                self.logger.message('  Total demand: {}', Demand)
+                self.logger.message('  Total demand plant in: {}', Demand_plant_in)
+                self.logger.message('  Total demand storage in: {}', Demand_storage_in)
+                self.logger.message('  Total demand jetty in: {}', Demand_jetty_in)
+
+                self.logger.message('  Total throughput online: {}', throughput_online)
+                self.logger.message('  Total throughput online plant in: {}', throughput_plant_in)
+                self.logger.message('  Total throughput online storage in: {}', throughput_storage_in)
+                self.logger.message('  Total throughput online jetty in: {}', throughput_jetty_in)
+                self.logger.message('----------------------------------------------------')
 
         # # 7. collect all cash flows (capex, opex, revenues)
         # cash_flows, cash_flows_WACC_nominal = self.add_cashflow_elements()
@@ -245,9 +242,8 @@ class ExportTerminal:
         """
 
         # report on the status of all berth elements
-        if self.debug:
-            print('')
-            print('--- Status terminal @ start of year ----------------')
+        if self.logger.enabled:
+            self.logger.message('--- Status terminal @ start of year ----------------')
 
         opentisim.core.report_element(self, Berth, year)
         opentisim.core.report_element(self, Jetty, year)
@@ -288,17 +284,17 @@ class ExportTerminal:
         hydrogen_defaults_h2conversion_data = self.h2conversion_type_defaults
         hydrogen_defaults_storage_data = self.storage_type_defaults
 
-        if self.debug:
+        if self.logger.enabled:
             # print('     Berth occupancy planned (@ start of year): {:.2f} (trigger level: {:.2f})'.format(
             #     berth_occupancy_planned, self.allowable_berth_occupancy))
-            print('     Unloading occupancy planned (@ start of year): {:.2f}'.format(unloading_occupancy_planned))
-            print('     waiting time as factor of service time (@ start of year): {:.2f}'.format(waiting_factor))
-            print('     throughput planned berth out {:.2f}'.format(throughput_planned))
+            self.logger.message(
+                '     Unloading occupancy planned (@ start of year): {:.2f}',
+                unloading_occupancy_planned)
+            self.logger.message('     waiting time as factor of service time (@ start of year): {:.2f}', waiting_factor)
+            self.logger.message('     throughput planned berth out {:.2f}', throughput_planned)
 
-            print('')
-            print('--- Start investment analysis ----------------------')
-            print('')
-            print('$$$ Check berth elements ---------------------------')
+            self.logger.message('--- Start investment analysis ----------------------')
+            self.logger.message('$$$ Check berth elements ---------------------------')
 
         opentisim.core.report_element(self, Berth, year)
         opentisim.core.report_element(self, Jetty, year)
@@ -308,9 +304,9 @@ class ExportTerminal:
 
             # while planned berth occupancy is too large add a berth when no crane slots are available
             # NB: this setup makes sense here since there can be only one jetty per berth (compare containers)
-            if self.debug:
-                print('  *** add Berth to elements')
-            berth = Berth(**berth_data)
+            if self.logger.enabled:
+                self.logger.invest('Berth')
+            berth = Berth(**self.config.berth_data)
             berth.year_online = year + berth.delivery_time
             self.elements.append(berth)
 
@@ -327,11 +323,12 @@ class ExportTerminal:
             # waiting_factor = opentisim.core.occupancy_to_waitingfactor(utilisation=berth_occupancy_planned,
             #                                               nr_of_servers_to_chk=berths, kendall=self.kendall)
 
-            if self.debug:
+            if self.logger.enabled:
                 # print('     Berth occupancy planned (after adding berth): {:.2f} (trigger level: {:.2f})'.format(
                 #     berth_occupancy_planned, self.allowable_berth_occupancy))
-                print('     Waiting time as factor of service time (after adding berth): {:.2f} (trigger level: {:.2f})'.format(waiting_factor,
-                                                                                                     self.allowable_waiting_service_time_ratio_berth))
+                self.logger.message(
+                    '     Waiting time as factor of service time (after adding berth): {:.2f} (trigger level: {:.2f})',
+                    waiting_factor, self.allowable_waiting_service_time_ratio_berth)
 
                 # print('     Berth occupancy planned (after adding berth): {:.2f}'.format(berth_occupancy_planned))
                 # print('     Berth occupancy online (after adding berth): {}'.format(berth_occupancy_online))
@@ -342,18 +339,18 @@ class ExportTerminal:
             
             for commodity in opentisim.core.find_elements(self, Commodity):
                 if commodity.type == 'MCH' or commodity.type == 'DBT': 
-                    vessel_size_1 = vlcc_data["LOA"]
-                    vessel_size_2 = handysize_data["LOA"]
-                    vessel_size_3 = panamax_data["LOA"]
+                    vessel_size_1 = self.config.vlcc_data["LOA"]
+                    vessel_size_2 = self.config.handysize_data["LOA"]
+                    vessel_size_3 = self.config.panamax_data["LOA"]
                     a = np.array([vessel_size_1, vessel_size_2, vessel_size_3])
                 elif commodity.type == 'Liquid hydrogen':
-                    vessel_size_1 = smallhydrogen_data["LOA"]
-                    vessel_size_2 = largehydrogen_data["LOA"]
+                    vessel_size_1 = self.config.smallhydrogen_data["LOA"]
+                    vessel_size_2 = self.config.largehydrogen_data["LOA"]
                     vessel_size_3 = 0
                     a = np.array([vessel_size_1, vessel_size_2, vessel_size_3])
                 else:
-                    vessel_size_1 = smallammonia_data["LOA"]
-                    vessel_size_2 = largeammonia_data["LOA"]
+                    vessel_size_1 = self.config.smallammonia_data["LOA"]
+                    vessel_size_2 = self.config.largeammonia_data["LOA"]
                     vessel_size_3 = 0
                     a = np.array([vessel_size_1, vessel_size_2, vessel_size_3])
 
@@ -379,11 +376,12 @@ class ExportTerminal:
                 waiting_factor = opentisim.core.occupancy_to_waitingfactor(utilisation=berth_occupancy_planned,
                                                               nr_of_servers_to_chk=berths, kendall=self.kendall)
 
-                if self.debug:
+                if self.logger.enabled:
                     # print('     Berth occupancy planned (after adding jetty): {:.2f} (trigger level: {:.2f})'.format(
                     #     berth_occupancy_planned, self.allowable_berth_occupancy))
-                    print('     Waiting time as factor of service time (after adding jetty): {:.2f} (trigger level: {:.2f})'.format(waiting_factor,
-                                                                                                     self.allowable_waiting_service_time_ratio_berth))
+                    self.logger.message(
+                        '     Waiting time as factor of service time (after adding jetty): {:.2f} (trigger level: {:.2f})',
+                        waiting_factor, self.allowable_waiting_service_time_ratio_berth)
 
     def jetty_invest(self, year, nrofdolphins):
         """
@@ -394,10 +392,10 @@ class ExportTerminal:
             - adding jetty will increase jettys
         """
 
-        if self.debug:
-            print('  *** add jetty to elements')
+        if self.logger.enabled:
+            self.logger.invest('jetty')
         # add a Jetty element
-        jetty = Jetty(**jetty_data)
+        jetty = Jetty(**self.config.jetty_data)
 
         # - capex
         unit_rate = int((nrofdolphins * jetty.mooring_dolphins) + (jetty.Gijt_constant_jetty * jetty.jettywidth *
@@ -437,26 +435,26 @@ class ExportTerminal:
         
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH': 
-                pump1 = handysize_data["pump_capacity"]
-                pump2 = panamax_data["pump_capacity"]
-                pump3 = vlcc_data["pump_capacity"]
+                pump1 = self.config.handysize_data["pump_capacity"]
+                pump2 = self.config.panamax_data["pump_capacity"]
+                pump3 = self.config.vlcc_data["pump_capacity"]
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'DBT': 
-                pump1 = vlcc_data_DBT["pump_capacity"]
+                pump1 = self.config.vlcc_data_DBT["pump_capacity"]
                 pump2 = 0
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'Liquid hydrogen':
-                pump1 = smallhydrogen_data["pump_capacity"]
-                pump2 = largehydrogen_data["pump_capacity"]
+                pump1 = self.config.smallhydrogen_data["pump_capacity"]
+                pump2 = self.config.largehydrogen_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'Ammonia':
-                pump1 = smallammonia_data["pump_capacity"] 
-                pump2 = largeammonia_data["pump_capacity"]
+                pump1 = self.config.smallammonia_data["pump_capacity"] 
+                pump2 = self.config.largeammonia_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
@@ -495,9 +493,9 @@ class ExportTerminal:
         pipelines = len(opentisim.core.find_elements(self, Pipeline_Jetty))
         jettys = len(opentisim.core.find_elements(self, Jetty))
         if jettys > pipelines:
-            if self.debug:
-                print('  *** add jetty pipeline to elements')
-            pipeline_jetty = Pipeline_Jetty(**jetty_pipeline_data)
+            if self.logger.enabled:
+                self.logger.invest('jetty pipeline')
+            pipeline_jetty = Pipeline_Jetty(**self.config.jetty_pipeline_data)
 
             # - capex
             unit_rate = pipeline_jetty.unit_rate_factor * pipeline_jetty.length
@@ -513,7 +511,7 @@ class ExportTerminal:
             
 
             #   labour
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             pipeline_jetty.shift = (pipeline_jetty.crew * self.operational_hours) / (
                         labour.shift_length * labour.annual_shifts)
             pipeline_jetty.labour = pipeline_jetty.shift * labour.operational_salary
@@ -589,18 +587,19 @@ class ExportTerminal:
                     if year >= element.year_online:
                         storage_capacity_online += element.capacity
 
-        if self.debug:
-            print('     a total of {} ton of {} storage capacity is online; {} ton total planned'.format(
-                storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity))
+        if self.logger.enabled:
+            self.logger.message(
+                '     a total of {} ton of {} storage capacity is online; {} ton total planned',
+                storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity)
 
         # max_vessel_call_size = max([x.call_size for x in opentisim.core.find_elements(self, Vessel)])
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH' or commodity.type == 'DBT': 
-                max_vessel_call_size = largeammonia_data["call_size"]
+                max_vessel_call_size = self.config.largeammonia_data["call_size"]
             elif commodity.type == 'Liquid hydrogen':
-                max_vessel_call_size = largehydrogen_data["call_size"]
+                max_vessel_call_size = self.config.largehydrogen_data["call_size"]
             else:
-                max_vessel_call_size = vlcc_data["call_size"]
+                max_vessel_call_size = self.config.vlcc_data["call_size"]
         
         #max_vessel_call_size = largeammonia_data["call_size"]
 
@@ -624,8 +623,8 @@ class ExportTerminal:
         while storage_capacity < max_vessel_call_size or storage_capacity < storage_capacity_dwelltime_demand:
         #(
 #                 storage_capacity < storage_capacity_dwelltime_demand and storage_capacity < storage_capacity_dwelltime_throughput):
-            if self.debug:
-                print('  *** add storage to elements')
+            if self.logger.enabled:
+                self.logger.invest('storage')
 
             # add storage object
             storage = Storage(**hydrogen_defaults_storage_data)
@@ -641,7 +640,7 @@ class ExportTerminal:
             storage.purchase_material = 0  
 
             #   labour**hydrogen_defaults
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             storage.shift = (
                         (storage.crew_for5 * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             storage.labour = storage.shift * labour.operational_salary
@@ -671,9 +670,10 @@ class ExportTerminal:
 
 #             storage_capacity_dwelltime_throughput = (throughput_planned_storage * self.allowable_dwelltime) * 1.1
             
-            if self.debug:
-                print('     a total of {} ton of {} storage capacity is online; {} ton total planned'.format(
-                    storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of {} storage capacity is online; {} ton total planned',
+                    storage_capacity_online, hydrogen_defaults_storage_data['type'], storage_capacity)
 
     def h2conversion_invest(self, year, hydrogen_defaults_h2conversion_data):
         """current strategy is to add h2 conversion as long as target h2 conversion is not yet achieved
@@ -686,15 +686,15 @@ class ExportTerminal:
         plant_occupancy_planned, plant_occupancy_online, h2conversion_capacity_planned, h2conversion_capacity_online = self.calculate_h2conversion_occupancy(
             year, hydrogen_defaults_h2conversion_data)
 
-        if self.debug:
-            print('     Plant occupancy planned (@ start of year): {:.2f}'.format(plant_occupancy_planned))
-            print('     Plant occupancy online (@ start of year): {:.2f}'.format(plant_occupancy_online))
+        if self.logger.enabled:
+            self.logger.message('     Plant occupancy planned (@ start of year): {:.2f}', plant_occupancy_planned)
+            self.logger.message('     Plant occupancy online (@ start of year): {:.2f}', plant_occupancy_online)
 
         # check if sufficient h2retrieval capacity is available
         while plant_occupancy_planned > self.h2conversion_trigger:
 
-            if self.debug:
-                print('  *** add h2conversion to elements')
+            if self.logger.enabled:
+                self.logger.invest('h2conversion')
 
             # add h2retrieval object
             h2conversion = H2conversion(**hydrogen_defaults_h2conversion_data)
@@ -737,7 +737,7 @@ class ExportTerminal:
             h2conversion.purchase_material = (tonmat * (100-h2conversion.recycle_rate)/100)*price_mat
 
             #   labour**hydrogen_defaults
-            labour = Labour(**labour_data)
+            labour = Labour(**self.config.labour_data)
             h2conversion.shift = (
                         (h2conversion.crew_for5 * self.operational_hours) / (labour.shift_length * labour.annual_shifts))
             h2conversion.labour = h2conversion.shift * labour.operational_salary
@@ -764,10 +764,10 @@ class ExportTerminal:
             plant_occupancy_planned, plant_occupancy_online, h2conversion_capacity_planned, h2conversion_capacity_online = self.calculate_h2conversion_occupancy(
                 year, hydrogen_defaults_h2conversion_data)
 
-            if self.debug:
-                print(
-                    '     a total of {} ton of h2conversion capacity is online; {} ton total planned'.format(
-                        h2conversion_capacity_online, h2conversion_capacity_planned))
+            if self.logger.enabled:
+                self.logger.message(
+                    '     a total of {} ton of h2conversion capacity is online; {} ton total planned',
+                    h2conversion_capacity_online, h2conversion_capacity_planned)
 
     
     # *** Energy costs, demurrage costs and revenue calculation methods
@@ -778,7 +778,7 @@ class ExportTerminal:
         2. Find the total energy price to multiply the consumption with the energy price
         """
 
-        energy = Energy(**energy_data)
+        energy = Energy(**self.config.energy_data)
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in  =             self.throughput_elements(year)
      
 
@@ -805,7 +805,7 @@ class ExportTerminal:
 
         # calculate storage energy
         list_of_elements_Storage = opentisim.core.find_elements(self, Storage)
-        max_vessel_call_size = largeammonia_data["call_size"]
+        max_vessel_call_size = self.config.largeammonia_data["call_size"]
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in 
        
         
@@ -885,42 +885,42 @@ class ExportTerminal:
 
         # Find the demurrage cost per type of vessel
         # if service_rate != 0:
-        smallhydrogen = Vessel(**smallhydrogen_data)
+        smallhydrogen = Vessel(**self.config.smallhydrogen_data)
         service_time_smallhydrogen = smallhydrogen.call_size / smallhydrogen.pump_capacity
         waiting_time_hours_smallhydrogen = waiting_factor * service_time_smallhydrogen
         penalty_time_smallhydrogen = max(0, waiting_time_hours_smallhydrogen - smallhydrogen.all_turn_time)
         demurrage_time_smallhydrogen = penalty_time_smallhydrogen * smallhydrogen_calls
         demurrage_cost_smallhydrogen = demurrage_time_smallhydrogen * smallhydrogen.demurrage_rate
 
-        largehydrogen = Vessel(**largehydrogen_data)
+        largehydrogen = Vessel(**self.config.largehydrogen_data)
         service_time_largehydrogen = largehydrogen.call_size / largehydrogen.pump_capacity
         waiting_time_hours_largehydrogen = waiting_factor * service_time_largehydrogen
         penalty_time_largehydrogen = max(0, waiting_time_hours_largehydrogen - largehydrogen.all_turn_time)
         demurrage_time_largehydrogen = penalty_time_largehydrogen * largehydrogen_calls
         demurrage_cost_largehydrogen = demurrage_time_largehydrogen * largehydrogen.demurrage_rate
 
-        smallammonia = Vessel(**smallammonia_data)
+        smallammonia = Vessel(**self.config.smallammonia_data)
         service_time_smallammonia = smallammonia.call_size / smallammonia.pump_capacity
         waiting_time_hours_smallammonia = waiting_factor * service_time_smallammonia
         penalty_time_smallammonia = max(0, waiting_time_hours_smallammonia - smallammonia.all_turn_time)
         demurrage_time_smallammonia = penalty_time_smallammonia * smallammonia_calls
         demurrage_cost_smallammonia = demurrage_time_smallammonia * smallammonia.demurrage_rate
 
-        largeammonia = Vessel(**largeammonia_data)
+        largeammonia = Vessel(**self.config.largeammonia_data)
         service_time_largeammonia = largeammonia.call_size / largeammonia.pump_capacity
         waiting_time_hours_largeammonia = waiting_factor * service_time_largeammonia
         penalty_time_largeammonia = max(0, waiting_time_hours_largeammonia - largeammonia.all_turn_time)
         demurrage_time_largeammonia = penalty_time_largeammonia * largeammonia_calls
         demurrage_cost_largeammonia = demurrage_time_largeammonia * largeammonia.demurrage_rate
 
-        handysize = Vessel(**handysize_data)
+        handysize = Vessel(**self.config.handysize_data)
         service_time_handysize = handysize.call_size / handysize.pump_capacity
         waiting_time_hours_handysize = waiting_factor * service_time_handysize
         penalty_time_handysize = max(0, waiting_time_hours_handysize - handysize.all_turn_time)
         demurrage_time_handysize = penalty_time_handysize * handysize_calls
         demurrage_cost_handysize = demurrage_time_handysize * handysize.demurrage_rate
 
-        panamax = Vessel(**panamax_data)
+        panamax = Vessel(**self.config.panamax_data)
         service_time_panamax = panamax.call_size / panamax.pump_capacity
         waiting_time_hours_panamax = waiting_factor * service_time_panamax
         penalty_time_panamax = max(0, waiting_time_hours_panamax - panamax.all_turn_time)
@@ -929,11 +929,11 @@ class ExportTerminal:
 
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH':
-                vlcc = Vessel(**vlcc_data)
+                vlcc = Vessel(**self.config.vlcc_data)
             elif commodity.type == 'DBT': 
-                vlcc = Vessel(**vlcc_data_DBT)
+                vlcc = Vessel(**self.config.vlcc_data_DBT)
             else:
-                vlcc = Vessel(**vlcc_data)
+                vlcc = Vessel(**self.config.vlcc_data)
                 
         service_time_vlcc = vlcc.call_size / vlcc.pump_capacity
         waiting_time_hours_vlcc = waiting_factor * service_time_vlcc
@@ -957,8 +957,8 @@ class ExportTerminal:
         throughput_online, throughput_terminal_in,throughput_online_jetty_in, throughput_online_stor_in, throughput_online_plant_in, throughput_planned, throughput_planned_jetty,throughput_planned_pipej,  throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in,Demand_jetty_in  =             self.throughput_elements(year)
      
         
-        if self.debug:
-            print('     Revenues: {}'.format(int(throughput_online * fee)))
+        if self.logger.enabled:
+            self.logger.message('     Revenues: {}', int(throughput_online * fee))
 
         try:
             self.revenues.append(throughput_online * fee)
@@ -1090,11 +1090,11 @@ class ExportTerminal:
             
         for commodity in opentisim.core.find_elements(self, Commodity):
                 if commodity.type == 'MCH':
-                    vlcc_data_real = vlcc_data
+                    vlcc_data_real = self.config.vlcc_data
                 elif commodity.type == 'DBT': 
-                    vlcc_data_real = vlcc_data_DBT
+                    vlcc_data_real = self.config.vlcc_data_DBT
                 else:
-                    vlcc_data_real = vlcc_data
+                    vlcc_data_real = self.config.vlcc_data
                     
         # find the total service rate and determine the time at berth (in hours, per vessel type and in total)
         nr_of_jetty_planned = 0
@@ -1107,23 +1107,23 @@ class ExportTerminal:
 
             # estimate berth occupancy
             time_at_berth_smallhydrogen_planned = smallhydrogen_calls_planned * (
-                    (smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"]) +
-                    smallhydrogen_data["mooring_time"])
+                    (self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"]) +
+                    self.config.smallhydrogen_data["mooring_time"])
             time_at_berth_largehydrogen_planned = largehydrogen_calls_planned * (
-                    (largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"]) +
-                    largehydrogen_data["mooring_time"])
+                    (self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"]) +
+                    self.config.largehydrogen_data["mooring_time"])
             time_at_berth_smallammonia_planned = smallammonia_calls_planned * (
-                    (smallammonia_data["call_size"] / smallammonia_data["pump_capacity"]) +
-                    smallammonia_data["mooring_time"])
+                    (self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"]) +
+                    self.config.smallammonia_data["mooring_time"])
             time_at_berth_largeammonia_planned = largeammonia_calls_planned * (
-                    (largeammonia_data["call_size"] / largeammonia_data["pump_capacity"]) +
-                    largeammonia_data["mooring_time"])
+                    (self.config.largeammonia_data["call_size"] / self.config.largeammonia_data["pump_capacity"]) +
+                    self.config.largeammonia_data["mooring_time"])
             time_at_berth_handysize_planned = handysize_calls_planned * (
-                    (handysize_data["call_size"] / handysize_data["pump_capacity"]) +
-                    handysize_data["mooring_time"])
+                    (self.config.handysize_data["call_size"] / self.config.handysize_data["pump_capacity"]) +
+                    self.config.handysize_data["mooring_time"])
             time_at_berth_panamax_planned = panamax_calls_planned * (
-                    (panamax_data["call_size"] / panamax_data["pump_capacity"]) +
-                    panamax_data["mooring_time"])
+                    (self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"]) +
+                    self.config.panamax_data["mooring_time"])
             time_at_berth_vlcc_planned = vlcc_calls_planned * (
                     (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"]) +
                     vlcc_data_real["mooring_time"])
@@ -1138,17 +1138,17 @@ class ExportTerminal:
 
             # estimate crane occupancy
             time_at_unloading_smallhydrogen_planned = smallhydrogen_calls * (
-                        smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"])
+                        self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"])
             time_at_unloading_largehydrogen_planned = largehydrogen_calls * (
-                        largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"])
+                        self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"])
             time_at_unloading_smallammonia_planned = smallammonia_calls * (
-                        smallammonia_data["call_size"] / smallammonia_data["pump_capacity"])
+                        self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"])
             time_at_unloading_largeammonia_planned = largeammonia_calls * (
-                        largeammonia_data["call_size"] / handysize_data["pump_capacity"])
+                        self.config.largeammonia_data["call_size"] / self.config.handysize_data["pump_capacity"])
             time_at_unloading_handysize_planned = handysize_calls * (
-                        handysize_data["call_size"] / largeammonia_data["pump_capacity"])
+                        self.config.handysize_data["call_size"] / self.config.largeammonia_data["pump_capacity"])
             time_at_unloading_panamax_planned = panamax_calls * (
-                        panamax_data["call_size"] / panamax_data["pump_capacity"])
+                        self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"])
             time_at_unloading_vlcc_planned = vlcc_calls * (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"])
 
             total_time_at_unloading_planned = np.sum(
@@ -1163,23 +1163,23 @@ class ExportTerminal:
 
             if nr_of_jetty_online != 0:
                 time_at_berth_smallhydrogen_online = smallhydrogen_calls * (
-                        (smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"]) +
-                        smallhydrogen_data["mooring_time"])
+                        (self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"]) +
+                        self.config.smallhydrogen_data["mooring_time"])
                 time_at_berth_largehydrogen_online = largehydrogen_calls * (
-                        (largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"]) +
-                        largehydrogen_data["mooring_time"])
+                        (self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"]) +
+                        self.config.largehydrogen_data["mooring_time"])
                 time_at_berth_smallammonia_online = smallammonia_calls * (
-                        (smallammonia_data["call_size"] / smallammonia_data["pump_capacity"]) +
-                        smallammonia_data["mooring_time"])
+                        (self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"]) +
+                        self.config.smallammonia_data["mooring_time"])
                 time_at_berth_largeammonia_online = largeammonia_calls * (
-                        (largeammonia_data["call_size"] / largeammonia_data["pump_capacity"]) +
-                        largeammonia_data["mooring_time"])
+                        (self.config.largeammonia_data["call_size"] / self.config.largeammonia_data["pump_capacity"]) +
+                        self.config.largeammonia_data["mooring_time"])
                 time_at_berth_handysize_online = handysize_calls * (
-                        (handysize_data["call_size"] / handysize_data["pump_capacity"]) +
-                        handysize_data["mooring_time"])
+                        (self.config.handysize_data["call_size"] / self.config.handysize_data["pump_capacity"]) +
+                        self.config.handysize_data["mooring_time"])
                 time_at_berth_panamax_online = panamax_calls * (
-                        (panamax_data["call_size"] / panamax_data["pump_capacity"]) +
-                        panamax_data["mooring_time"])
+                        (self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"]) +
+                        self.config.panamax_data["mooring_time"])
                 time_at_berth_vlcc_online = vlcc_calls * (
                         (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"]) +
                         vlcc_data_real["mooring_time"])
@@ -1194,17 +1194,17 @@ class ExportTerminal:
                     [total_time_at_berth_online / (self.operational_hours * nr_of_jetty_online), 1])
 
                 time_at_unloading_smallhydrogen_online = smallhydrogen_calls * (
-                            smallhydrogen_data["call_size"] / smallhydrogen_data["pump_capacity"])
+                            self.config.smallhydrogen_data["call_size"] / self.config.smallhydrogen_data["pump_capacity"])
                 time_at_unloading_largehydrogen_online = largehydrogen_calls * (
-                            largehydrogen_data["call_size"] / largehydrogen_data["pump_capacity"])
+                            self.config.largehydrogen_data["call_size"] / self.config.largehydrogen_data["pump_capacity"])
                 time_at_unloading_smallammonia_online = smallammonia_calls * (
-                            smallammonia_data["call_size"] / smallammonia_data["pump_capacity"])
+                            self.config.smallammonia_data["call_size"] / self.config.smallammonia_data["pump_capacity"])
                 time_at_unloading_largeammonia_online = largeammonia_calls * (
-                            largeammonia_data["call_size"] / largeammonia_data["pump_capacity"])
+                            self.config.largeammonia_data["call_size"] / self.config.largeammonia_data["pump_capacity"])
                 time_at_unloading_handysize_online = handysize_calls * (
-                            handysize_data["call_size"] / handysize_data["pump_capacity"])
+                            self.config.handysize_data["call_size"] / self.config.handysize_data["pump_capacity"])
                 time_at_unloading_panamax_online = panamax_calls * (
-                            panamax_data["call_size"] / panamax_data["pump_capacity"])
+                            self.config.panamax_data["call_size"] / self.config.panamax_data["pump_capacity"])
                 time_at_unloading_vlcc_online = vlcc_calls * (vlcc_data_real["call_size"] / vlcc_data_real["pump_capacity"])
 
                 total_time_at_unloading_online = np.sum(
@@ -1229,7 +1229,18 @@ class ExportTerminal:
             unloading_occupancy_online = float("inf")
 
         return berth_occupancy_planned, berth_occupancy_online,                unloading_occupancy_planned, unloading_occupancy_online
-    
+
+    def berth_occupancies(self, year):
+        """Return the planned and online berth and unloading occupancy in year as a dict"""
+
+        # the online and the planned vessel calls per vessel type, without the totals
+        calls = self.calculate_vessel_calls(year)
+        occupancies = self.calculate_berth_occupancy(year, *calls[0:7], *calls[9:16])
+        names = ['berth_occupancy_planned', 'berth_occupancy_online', 'unloading_occupancy_planned',
+                 'unloading_occupancy_online']
+
+        return dict(zip(names, occupancies))
+
     def calculate_storage_occupancy(self, year, hydrogen_defaults_storage_data):
         """
         - Divide the throughput by the service rate to get the total hours in a year
@@ -1346,26 +1357,26 @@ class ExportTerminal:
         
         for commodity in opentisim.core.find_elements(self, Commodity):
             if commodity.type == 'MCH': 
-                pump1 = handysize_data["pump_capacity"]
-                pump2 = panamax_data["pump_capacity"]
-                pump3 = vlcc_data["pump_capacity"]
+                pump1 = self.config.handysize_data["pump_capacity"]
+                pump2 = self.config.panamax_data["pump_capacity"]
+                pump3 = self.config.vlcc_data["pump_capacity"]
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'DBT': 
-                pump1 = vlcc_data_DBT["pump_capacity"]
+                pump1 = self.config.vlcc_data_DBT["pump_capacity"]
                 pump2 = 0
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             elif commodity.type == 'Liquid hydrogen':
-                pump1 = smallhydrogen_data["pump_capacity"]
-                pump2 = largehydrogen_data["pump_capacity"]
+                pump1 = self.config.smallhydrogen_data["pump_capacity"]
+                pump2 = self.config.largehydrogen_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
             else:
-                pump1 = smallammonia_data["pump_capacity"] 
-                pump2 = largeammonia_data["pump_capacity"]
+                pump1 = self.config.smallammonia_data["pump_capacity"] 
+                pump2 = self.config.largeammonia_data["pump_capacity"]
                 pump3 = 0
                 pumpall = np.array([pump1, pump2, pump3])
                 pumpall = pumpall[np.nonzero(pumpall)]
@@ -1418,7 +1429,7 @@ class ExportTerminal:
         storage = Storage(**hydrogen_defaults_storage_data)
         #storloss = (storage.losses) * (self.allowable_dwelltime * 365) 
         storloss = storage.losses * ((self.allowable_dwelltime) *365)
-        jettyloss = jetty_pipeline_data["losses"]
+        jettyloss = self.config.jetty_pipeline_data["losses"]
        
             
         fullarray = [0, 0, 0, 0]
@@ -1454,7 +1465,7 @@ class ExportTerminal:
                 Demand_storage_in = (Demand*(100+(storloss+jettyloss)))/100
                 Demand_jetty_in = (Demand*(100+(jettyloss)))/100
             except:
-                print('problem occurs at {}'.format(year))
+                self.logger.warning('problem occurs at {}', year)
                 pass
 
         x = np.array(fullarray)
@@ -1534,10 +1545,19 @@ class ExportTerminal:
         else:
             return False
 
+    def throughput_timeline(self):
+        """Return the online throughput for each year in self.years as an array (cached, see
+        opentisim.core.throughput_timeline)"""
+
+        return opentisim.core.throughput_timeline(self, lambda year: self.throughput_elements(year)[0],
+                                                  key=opentisim.core.scenario_key(self))
+
     # *** Plotting functions
     def terminal_elements_plot(self, width=0.1, alpha=0.6, fontsize=20):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         berths = []
@@ -1662,6 +1682,9 @@ class ExportTerminal:
 
     def demand_terminal_plot(self, width=0.1, alpha=0.6):
         # Adding the throughput
+
+        import matplotlib.pyplot as plt
+
         years = self.years
         throughputs_online = []
         storage_capacity_online = []
@@ -1742,6 +1765,8 @@ class ExportTerminal:
     def terminal_occupancy_plot(self, width=0.2, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         # years = []
         years = self.years
@@ -1874,6 +1899,8 @@ class ExportTerminal:
     def plant_occupancy_plot(self, width=0.3, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         plants_occupancy = []
@@ -1962,6 +1989,8 @@ class ExportTerminal:
     def Jetty_capacity_plot(self, width=0.3, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         jettys = []
@@ -2041,6 +2070,8 @@ class ExportTerminal:
     def Pipeline1_capacity_plot(self, width=0.2, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         pipeline_jetty = []
@@ -2071,7 +2102,7 @@ class ExportTerminal:
             for element in opentisim.core.find_elements(self, Jetty):
                 if isinstance(element, Jetty):
                     if year >= element.year_online:
-                        jettys_cap[-1] += largeammonia_data["pump_capacity"] #klopt niet 
+                        jettys_cap[-1] += self.config.largeammonia_data["pump_capacity"] #klopt niet 
 
         # get demand
         demand = pd.DataFrame()
@@ -2138,6 +2169,8 @@ class ExportTerminal:
     def Storage_capacity_plot(self, width=0.25, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # get crane service capacity and storage capacity
         years = self.years
         storages = []
@@ -2219,6 +2252,8 @@ class ExportTerminal:
     def H2_capacity_plot(self, width=0.3, alpha=0.6):
         """Gather data from Terminal and plot which elements come online when"""
 
+        import matplotlib.pyplot as plt
+
         # collect elements to add to plot
         years = self.years
         h2conversions = []
@@ -5,22 +5,11 @@
 
 
 import numpy as np
-import numpy.matlib as npml
 import pandas as pd
-import statistics as st
 from copy import deepcopy
 
-import networkx as nx
-import simpy
-
-import matplotlib.pyplot as plt
-from simplekml import Kml, Style   # for graph_kml
 import math
 
-import shapely.geometry
-import pyproj
-
-import pandas as pd
 from opentisim.liquidbulk.hydrogen_defaults import *
 from opentisim.liquidbulk.hydrogen_objects import *
 import opentisim
@@ -91,21 +80,28 @@ def cashflow_data_pipe(terminal, element):  #(Terminal, element):
 
 def cashflow_data(terminal, element):  #(Terminal, element):
     """Place cashflow data in element dataframe
-    Elements that take two years to build are assign 60% to year one and 40% to year two."""
+    Elements that take two years to build are assign 60% to year one and 40% to year two.
+    Capex and opex of a fleet cohort are given per unit and are scaled by the number of units in the cohort."""
 
     # years
     years = terminal.modelframe
     #years = list(range(Terminal.startyear, Terminal.startyear + Terminal.lifecycle))
-    
+
+    # number of units represented by the element
+    if hasattr(element, 'count'):
+        count = element.count
+    else:
+        count = 1
+
     # capex
-    capex = element.capex
+    capex = element.capex * count
     #capex_material = element.capex_material
 
     # opex
-    maintenance = element.maintenance
-    insurance = element.insurance
-    labour = element.labour
-    fuel = element.fuel
+    maintenance = element.maintenance * count
+    insurance = element.insurance * count
+    labour = element.labour * count
+    fuel = element.fuel * count
     #purchaseH2 = element.purchaseH2
     #purchase_material = element.purchase_material     
 
@@ -153,304 +149,358 @@ def cashflow_data(terminal, element):  #(Terminal, element):
 # In[ ]:
 
 
-def vessel_objects(terminal, dataframe_vessel, vessel_defaults,durationdays,numberoftrips):
-        
-    list_year = dataframe_vessel['year'].tolist()
-    list_vessels = dataframe_vessel['vessel count'].tolist()
-    
-    new_array = np.zeros(len(list_vessels))
-    for i in range(len(list_vessels)):
-        new_array[i] = list_vessels[i]-list_vessels[i-1]
-    
-    new_array[0] = list_vessels[1]
-    #print(new_array)
-    
-    seaborne_transport = []
+def fleet_cohorts(terminal, unit, list_year, new_array):
+    """Create one element per year in which units are added (a cohort) and add its cash flows
+
+    unit: element with the per unit capex, opex and fuel costs that is used as template for each cohort"""
+
+    cohorts = []
     for year_index, vessels_year in enumerate(new_array):
         new = int(vessels_year)
-        if vessels_year != 0:
-            for i in range(new):
-                #print(years[year_index])
-                #print('** Add vessel to elements')
-                vessel = Vessel(**vessel_defaults)
-
-                # - capex
-                vessel.capex = vessel.unit_rate + vessel.mobilisation_min
-
-                # - opex
-                vessel.insurance = vessel.unit_rate * vessel.insurance_perc
-                vessel.maintenance = vessel.unit_rate * vessel.maintenance_perc
-
-                #   labour**hydrogen_defaults
-                labour = Labour(**labour_data)
-                vessel.shift = (
-                            (vessel.crew_for5 * vessel.utilization) / (labour.shift_length * labour.annual_shifts))
-                vessel.labour = vessel.shift * labour.operational_salary
-                vessel.year_online = list_year[year_index]
-
-                #Add fuel  
-                displacement = vessel.call_size + vessel.ship_weight + (1-vessel.gamma)*vessel.DWT
-                avspeedknots = vessel.avspeed * 0.54
-                fuelconsumption_load = (1/120000)*(displacement)**(2/3)*(avspeedknots)**(3)
-                fuelconsumption_unload = (1/120000)*(vessel.ship_weight + vessel.call_size)**(2/3)*(avspeedknots)**(3)
-
-#                 average_fuelconsumption = (fuelconsumption_load + fuelconsumption_unload)/2 #t/d 
-#                 fuelcon_trip = (durationdays*2)*average_fuelconsumption
-#                 tripsperyear = numberoftrips
-#                 fuelcon_year = tripsperyear * fuelcon_trip #ton 
-#                 fuelcost_year = fuelcon_year * vessel.fuelprice #€/ton --> € 
-            
-                for commodity in opentisim.core.find_elements(terminal, Commodity):
-                    if commodity.type == 'MCH' or commodity.type == 'DBT': 
-                        average_fuelconsumption = fuelconsumption_load
-                        fuelcon_trip = (durationdays*2)*average_fuelconsumption
-                        tripsperyear = numberoftrips
-                        fuelcon_year = tripsperyear * fuelcon_trip #ton 
-                        fuelcost_year = fuelcon_year * vessel.fuelprice #€/ton --> € 
-                        #loaded and unloaded is the same 
-                    elif commodity.type == 'Liquid hydrogen':
-                        average_fuelconsumption = fuelconsumption_unload 
-                        fuelcon_trip = (durationdays)*average_fuelconsumption
-                        tripsperyear = numberoftrips
-                        fuelcon_year = tripsperyear * fuelcon_trip #ton 
-                        fuelcost_year = fuelcon_year * vessel.fuelprice #€/ton --> €  
-                        #unloaded back on diesel/hydrogen?  
-                    elif commodity.type == 'Ammonia':
-                        average_fuelconsumption = fuelconsumption_unload 
-                        fuelcon_trip = (durationdays)*average_fuelconsumption
-                        tripsperyear = numberoftrips
-                        fuelcon_year = tripsperyear * fuelcon_trip #ton 
-                        fuelcost_year = fuelcon_year * vessel.fuelprice #€/ton --> €  
-                        #unloaded back on diesel/hydrogen?
-                
-                vessel.fuel = fuelcost_year
-                #add cashflow to vessel 
-                vessel = cashflow_data(terminal, vessel)
-                #vessel = opentisim.core.add_cashflow_data_to_element(self, jetty)
+        if new > 0:
+            cohort = deepcopy(unit)
+            cohort.id = opentisim.core.new_id()
+            cohort.count = new
+            cohort.year_online = list_year[year_index]
+
+            # add cashflow to cohort
+            cohort = cashflow_data(terminal, cohort)
+
+            cohorts.append(cohort)
+
+    return cohorts
+
+
+def unit_costs(transport, labour):
+    """Add the per unit capex, insurance, maintenance and labour costs to a transport element"""
+
+    # - capex
+    transport.capex = transport.unit_rate + transport.mobilisation_min
+
+    # - opex
+    transport.insurance = transport.unit_rate * transport.insurance_perc
+    transport.maintenance = transport.unit_rate * transport.maintenance_perc
+
+    #   labour**hydrogen_defaults
+    transport.shift = (
+                (transport.crew_for5 * transport.utilization) / (labour.shift_length * labour.annual_shifts))
+    transport.labour = transport.shift * labour.operational_salary
+
+    return transport
+
+
+def class_parameters(transport_classes, *keys):
+    """Return, for each key, an array with the value of that key for each of the transport classes
+
+    transport_classes: list of defaults dictionaries (e.g. [largehydrogen_data, vlcc_data])"""
+
+    return tuple(np.array([transport_class[key] for transport_class in transport_classes]) for key in keys)
+
+
+def vessel_fuel(call_size, ship_weight, DWT, gamma, fuelprice, avspeed, durationdays, numberoftrips, carrier):
+    """Vectorized fuel use [t/y] and fuel cost [€/y] per vessel for seaborne transport
+
+    The fuel consumption per day follows an admiralty-style formula: displacement^(2/3) * speed^3 / 120000. For the
+    LOHC carriers (MCH and DBT) the vessel sails loaded in both directions, for liquid hydrogen and ammonia only the
+    unloaded consumption over the one way duration is counted. All arguments are broadcast against each other, so
+    vessel classes, speeds [km/h], sailing durations [days], trips per year and carrier types can be scanned at once.
+    The sailing duration follows from the distance as distancekm / avspeed / 24."""
+
+    carrier = np.asarray(carrier)
+
+    displacement = call_size + ship_weight + (1-gamma)*DWT
+    avspeedknots = np.asarray(avspeed) * 0.54
+    fuelconsumption_load = (1/120000)*(displacement)**(2/3)*(avspeedknots)**(3)
+    fuelconsumption_unload = (1/120000)*(ship_weight + call_size)**(2/3)*(avspeedknots)**(3)
+
+    lohc = (carrier == 'MCH') | (carrier == 'DBT')
+    fuelcon_trip = np.where(lohc, (durationdays*2)*fuelconsumption_load, (durationdays)*fuelconsumption_unload)
+
+    fuelcon_year = numberoftrips * fuelcon_trip #ton 
+    fuelcost_year = fuelcon_year * fuelprice #€/ton --> € 
+
+    return fuelcon_year, fuelcost_year
+
+
+def inland_fuel(mode, call_size, weight, consumption, fuelprice, distancekm, numberoftrips, carrier):
+    """Vectorized fuel use and fuel cost [€/y] per unit for inland transport
+
+    mode: 'barge', 'train' or 'truck'
+    Barges and trains use weight/consumption litres per km in the loaded and unloaded state; the fuel use is given in
+    litres per year and fuelprice in €/litre. Trucks drive every trip back and forth with a fuelprice in €/km; their
+    fuel use is the travelled distance times the consumption per km. All arguments are broadcast against each other."""
+
+    mode = np.asarray(mode)
+    carrier = np.asarray(carrier)
+
+    # barges and trains
+    weightload = call_size + weight 
+    weightunload = weight 
+
+    traveldist = numberoftrips*distancekm
+
+    fuelusageload = weightload/consumption #L/km
+    fuelusageunload = weightunload/consumption #L/km
+
+    lohc = (carrier == 'MCH') | (carrier == 'DBT')
+    literperyear = np.where(lohc, fuelusageload * (traveldist * 2),
+                            np.where(carrier == 'Liquid hydrogen', fuelusageunload*traveldist,
+                                     fuelusageload * traveldist + fuelusageunload*traveldist))
+
+    # trucks
+    travelleddistance = numberoftrips * distancekm * 2 
+
+    truck = (mode == 'truck')
+    fuel_year = np.where(truck, travelleddistance * consumption, literperyear)
+    fuelcost_year = np.where(truck, travelleddistance * fuelprice, literperyear * fuelprice)
+
+    return fuel_year, fuelcost_year
+
+
+def vessel_objects(terminal, dataframe_vessel, vessel_defaults,durationdays,numberoftrips):
+    """Create the seaborne fleet as cohorts of identical vessels
+
+    The fleet is represented by one Vessel element per year in which vessels are added; its count attribute holds the
+    number of vessels in the cohort, so memory and time scale with the number of cohorts rather than vessels."""
+
+    list_year = dataframe_vessel['year'].tolist()
+    new_array = fleet_counts_to_additions(dataframe_vessel['vessel count'])
+
+    return vessel_cohorts(terminal, list_year, new_array, vessel_defaults, durationdays, numberoftrips)
+
+
+def vessel_cohorts(terminal, list_year, new_array, vessel_defaults, durationdays, numberoftrips):
+    """Create a cohort of vessels for each year in list_year in which new_array adds vessels"""
+
+    # all vessels in the fleet are identical: determine the per vessel costs once
+    vessel = Vessel(**vessel_defaults)
+    labour = Labour(**terminal.config.labour_data)
+    vessel = unit_costs(vessel, labour)
+
+    #Add fuel  
+    for commodity in opentisim.core.find_elements(terminal, Commodity):
+        carrier = commodity.type
+
+    fuelcon_year, fuelcost_year = vessel_fuel(
+        vessel.call_size, vessel.ship_weight, vessel.DWT, vessel.gamma, vessel.fuelprice, vessel.avspeed,
+        durationdays, numberoftrips, carrier)
+
+    vessel.fuel = float(fuelcost_year)
+
+    seaborne_transport = fleet_cohorts(terminal, vessel, list_year, new_array)
 
-                seaborne_transport.append(vessel)
     return seaborne_transport
 
 
 def inland_objects(terminal, dataframe_vessel, transport_defaults, durationdays, numberoftrips,distancekm):
+    """Create the inland fleet (barges, trains or trucks) as cohorts of identical units
+
+    The type of transport follows from terminal.transport_sc2. See vessel_objects for the cohort representation."""
+
     list_year = dataframe_vessel['year'].tolist()
-    list_vessels = dataframe_vessel['vessel count'].tolist()
-    #print(list_year)
-    #print(list_vessels)
-    
-    new_array = np.zeros(len(list_vessels))
-    for i in range(len(list_vessels)):
-        new_array[i] = list_vessels[i]-list_vessels[i-1]
-    
-    new_array[0] = list_vessels[1]
-    #print(new_array)
-    
-    inland_transport = []
-    for year_index, vessels_year in enumerate(new_array):
-        new = int(vessels_year)
-        if vessels_year != 0:
-            for i in range(new):
-                if terminal.transport_sc2 == 'barge':
-                    #print('** Add vessel to elements')
-                    transport = Barge(**transport_defaults)
-
-                    # - capex
-                    transport.capex = transport.unit_rate + transport.mobilisation_min
-
-                    # - opex
-                    transport.insurance = transport.unit_rate * transport.insurance_perc
-                    transport.maintenance =transport.unit_rate * transport.maintenance_perc
-
-                    #   labour**hydrogen_defaults
-                    labour = Labour(**labour_data)
-                    transport.shift = (
-                                (transport.crew_for5 * transport.utilization) / (labour.shift_length * labour.annual_shifts))
-                    transport.labour = transport.shift * labour.operational_salary
-                    transport.year_online = list_year[year_index]
-
-                    #Add fuel 
-                    commodity = Commodity(**terminal.commodity_type_defaults)
-                    capacity = transport.call_size
-                    fuelprice = transport.fuelprice
-                    hycontent = commodity.Hcontent
-
-                    weightship = transport.ship_weight 
-                    weightload = transport.call_size + weightship 
-                    weightunload = weightship 
-
-                    hoursperyear = transport.utilization #h/y 
-                    avspeed = transport.avspeed #km/h
-                    capacity = transport.call_size
-                    consumption = transport.consumption
-                    loadingtime = transport.loadingtime #h 
-                    unloadingtime = transport.unloadingtime #h
-
-                    distance = distancekm 
-                    tripsperyear = numberoftrips
-                    traveldist = numberoftrips*distancekm
-
-                    fuelusageload = weightload/consumption #L/km
-                    fuelusageunload = weightunload/consumption #L/km
-
-                    for commodity in opentisim.core.find_elements(terminal, Commodity):
-                        if commodity.type == 'MCH' or commodity.type =='DBT': 
-                            literperyear = fuelusageload * (traveldist * 2)
-                        elif commodity.type == 'Liquid hydrogen':
-                            literperyear = fuelusageunload*traveldist
-                        elif commodity.type == 'Ammonia':
-                            literload = fuelusageload * traveldist
-                            literunload = fuelusageunload*traveldist
-                            literperyear = literload + literunload 
-
-                    transport.fuel = literperyear * fuelprice
-
-                    #add cashflow to vessel 
-                    transport = cashflow_data(terminal, transport)
-                    #vessel = opentisim.core.add_cashflow_data_to_element(self, jetty)
-
-                    inland_transport.append(transport)
-                
-                if terminal.transport_sc2 == 'train':
-                    #print('** Add vessel to elements')
-                    transport = Train(**transport_defaults)
-
-                    # - capex
-                    transport.capex = transport.unit_rate + transport.mobilisation_min
-
-                    # - opex
-                    transport.insurance = transport.unit_rate * transport.insurance_perc
-                    transport.maintenance =transport.unit_rate * transport.maintenance_perc
-
-                    #   labour**hydrogen_defaults
-                    labour = Labour(**labour_data)
-                    transport.shift = (
-                                (transport.crew_for5 * transport.utilization) / (labour.shift_length * labour.annual_shifts))
-                    transport.labour = transport.shift * labour.operational_salary
-                    transport.year_online = list_year[year_index]
-
-                    #Add fuel 
-                    commodity = Commodity(**terminal.commodity_type_defaults)
-                    capacity = transport.call_size
-                    fuelprice = transport.fuelprice
-                    hycontent = commodity.Hcontent
-
-                    weightship = transport.train_weight 
-                    weightload = transport.call_size + weightship 
-                    weightunload = weightship 
-
-                    hoursperyear = transport.utilization #h/y 
-                    avspeed = transport.avspeed #km/h
-                    capacity = transport.call_size
-                    consumption = transport.consumption
-                    loadingtime = transport.loadingtime #h 
-                    unloadingtime = transport.unloadingtime #h
-
-                    distance = distancekm 
-                    tripsperyear = numberoftrips
-                    traveldist = numberoftrips*distancekm
-
-                    fuelusageload = weightload/consumption
-                    fuelusageunload = weightunload/consumption
-
-                    for commodity in opentisim.core.find_elements(terminal, Commodity):
-                        if commodity.type == 'MCH' or commodity.type == 'DBT': 
-                            literperyear = fuelusageload * (traveldist * 2)
-                        elif commodity.type == 'Liquid hydrogen':
-                            literperyear = fuelusageunload*traveldist
-                        elif commodity.type == 'Ammonia':
-                            literload = fuelusageload * traveldist
-                            literunload = fuelusageunload*traveldist
-                            literperyear = literload + literunload 
-
-                    transport.fuel = literperyear * fuelprice
-
-                    #add cashflow to vessel 
-                    transport = cashflow_data(terminal, transport)
-                    #vessel = opentisim.core.add_cashflow_data_to_element(self, jetty)
-
-                    inland_transport.append(transport)
-                    
-                if terminal.transport_sc2 == 'truck':
-                                        #print('** Add vessel to elements')
-                    transport = Truck(**transport_defaults)
-                    
-                    # - capex
-                    transport.capex = transport.unit_rate + transport.mobilisation_min
-
-                    # - opex
-                    transport.insurance = transport.unit_rate * transport.insurance_perc
-                    transport.maintenance =transport.unit_rate * transport.maintenance_perc
-
-                    #   labour**hydrogen_defaults
-                    labour = Labour(**labour_data)
-                    transport.shift = (
-                                (transport.crew_for5 * transport.utilization) / (labour.shift_length * labour.annual_shifts))
-                    transport.labour = transport.shift * labour.operational_salary
-                    transport.year_online = list_year[year_index]
-
-                    #Add fuel 
-                    
-
-                    capacity = truck.capacity
-                    hoursperyear = truck.utilization #h/y 
-
-                    avspeed = truck.avspeed #km/h
-                    distance = distancekm
-                    loadingtime = truck.loadingtime #h 
-                    unloadingtime = truck.unloadingtime #h 
-                    tripsperyear = numberoftrips
-
-                    travelleddistance = tripsperyear * distance * 2 
-                    fuelprice = truck.fuelprice #€/km
-                    
-                    transport.fuel = travelleddistance * fuelprice
-
-
-                    #add cashflow to vessel 
-                    transport = cashflow_data(terminal, transport)
-                    #vessel = opentisim.core.add_cashflow_data_to_element(self, jetty)
-                    inland_transport.append(transport)
-                    
+    new_array = fleet_counts_to_additions(dataframe_vessel['vessel count'])
+
+    return inland_cohorts(terminal, list_year, new_array, transport_defaults, numberoftrips, distancekm)
+
+
+def inland_cohorts(terminal, list_year, new_array, transport_defaults, numberoftrips, distancekm):
+    """Create a cohort of barges, trains or trucks for each year in list_year in which new_array adds units"""
+
+    labour = Labour(**terminal.config.labour_data)
+
+    if terminal.transport_sc2 == 'barge':
+        transport = Barge(**transport_defaults)
+        call_size = transport.call_size
+        weight = transport.ship_weight
+    elif terminal.transport_sc2 == 'train':
+        transport = Train(**transport_defaults)
+        call_size = transport.call_size
+        weight = transport.train_weight
+    elif terminal.transport_sc2 == 'truck':
+        transport = Truck(**transport_defaults)
+        call_size = transport.capacity
+        weight = 0
+    else:
+        return []
+
+    transport = unit_costs(transport, labour)
+
+    #Add fuel 
+    for commodity in opentisim.core.find_elements(terminal, Commodity):
+        carrier = commodity.type
+
+    fuel_year, fuelcost_year = inland_fuel(
+        terminal.transport_sc2, call_size, weight, transport.consumption, transport.fuelprice, distancekm,
+        numberoftrips, carrier)
+
+    transport.fuel = float(fuelcost_year)
+
+    inland_transport = fleet_cohorts(terminal, transport, list_year, new_array)
+
     return inland_transport
 
+# In[ ]:
+
+
+def transport_capacity(transport_defaults):
+    """Return the load per trip of a transport class [t]; trucks carry 'capacity', vessels, barges and trains 'call_size'"""
+
+    if 'call_size' in transport_defaults:
+        return transport_defaults['call_size']
+    else:
+        return transport_defaults['capacity']
+
+
+def handling_hours(transport_defaults, carrier):
+    """Return the loading and unloading time per trip [h] of a transport class
+
+    For sea vessels the (un)loading time follows from the pump capacity and the mooring time, the other transport
+    classes have a fixed loading and unloading time. LOHC carriers in MCH take twice as long to (un)load."""
+
+    if 'pump_capacity' in transport_defaults:
+        loadingtime = transport_defaults['call_size'] / transport_defaults['pump_capacity'] + \
+                      transport_defaults['mooring_time']
+        unloadingtime = loadingtime
+    else:
+        loadingtime = transport_defaults['loadingtime']
+        unloadingtime = transport_defaults['unloadingtime']
+
+    if carrier == 'MCH':
+        loadingtime = 2 * loadingtime
+        unloadingtime = 2 * unloadingtime
+
+    return loadingtime, unloadingtime
+
+
+def trips_per_year(durationdays, loadingtime, unloadingtime):
+    """Vectorized number of round trips a single unit makes per year
+
+    A round trip consists of loading, sailing (driving) to the destination, unloading and returning.
+    durationdays: one way duration [days]; loadingtime and unloadingtime in hours."""
+
+    secyear = 60*60*24*365
+    onetriptime = loadingtime*60*60 + np.asarray(durationdays)*60*60*24*2 + unloadingtime*60*60
+
+    return np.ceil(secyear / onetriptime)
+
+
+def required_fleet(throughput, capacity, numberoftrips):
+    """Vectorized number of units needed per year to transport a throughput timeline [t/y]"""
+
+    throughput = np.asarray(throughput, dtype=float)
+
+    return np.ceil(throughput / (capacity * numberoftrips)).astype(int)
+
+
+def fleet_counts_to_additions(counts):
+    """Return the number of units added per year for a required fleet size per year
+
+    Units are not retired, so the fleet in a year is the largest fleet required up to and including that year."""
+
+    fleet = np.maximum.accumulate(np.asarray(counts, dtype=int))
+
+    return np.diff(fleet, prepend=0)
+
+
+def seaborne_fleet(exportterminal, vessel_defaults, durationdays, throughput=None):
+    """Size the seaborne fleet from the throughput timeline of the export terminal and create it as cohorts
+
+    throughput: optional timeline [t/y] for exportterminal.years; by default exportterminal.throughput_timeline()
+    returns the vessel cohorts and the number of round trips per vessel per year"""
+
+    for commodity in opentisim.core.find_elements(exportterminal, Commodity):
+        carrier = commodity.type
+
+    if throughput is None:
+        throughput = exportterminal.throughput_timeline()
+
+    loadingtime, unloadingtime = handling_hours(vessel_defaults, carrier)
+    numberoftrips = trips_per_year(durationdays, loadingtime, unloadingtime)
+
+    counts = required_fleet(throughput, transport_capacity(vessel_defaults), numberoftrips)
+    new_array = fleet_counts_to_additions(counts)
+
+    seaborne_transport = vessel_cohorts(exportterminal, list(exportterminal.years), new_array, vessel_defaults,
+                                        durationdays, numberoftrips)
+
+    return seaborne_transport, numberoftrips
+
+
+def inland_fleet(importterminal, transport_defaults, durationdays, distancekm, throughput=None):
+    """Size the inland fleet (importterminal.transport_sc2) from the throughput timeline of the import terminal and
+    create it as cohorts
+
+    throughput: optional timeline [t/y] for importterminal.years; by default importterminal.throughput_timeline()
+    returns the cohorts and the number of round trips per unit per year"""
+
+    for commodity in opentisim.core.find_elements(importterminal, Commodity):
+        carrier = commodity.type
+
+    if throughput is None:
+        throughput = importterminal.throughput_timeline()
+
+    loadingtime, unloadingtime = handling_hours(transport_defaults, carrier)
+    numberoftrips = trips_per_year(durationdays, loadingtime, unloadingtime)
+
+    counts = required_fleet(throughput, transport_capacity(transport_defaults), numberoftrips)
+    new_array = fleet_counts_to_additions(counts)
+
+    inland_transport = inland_cohorts(importterminal, list(importterminal.years), new_array, transport_defaults,
+                                      numberoftrips, distancekm)
+
+    return inland_transport, numberoftrips
+
 # In[3]:
+def pipe_dimensions(pipe, throughput, Hcontent, operational_hours):
+    """Hydraulic sizing of a (compressed gaseous hydrogen) pipeline as a vectorized function of a throughput timeline
+
+    throughput: array with the (online) throughput of the import terminal per year [t/y]
+    returns arrays with per year the CGH2 volume [t/y], flow rate [m3/s], diameter [m], capacity [t/y],
+    compressor power [t/h] and the energy required for compression [kWh]"""
+
+    throughput = np.asarray(throughput, dtype=float)
+
+    volumeCGH2 = (Hcontent*throughput)/100
+    volumeCGH2kg = volumeCGH2 * 1000
+
+    rhos = (pipe.rho/1000)
+    flowrate = (volumeCGH2 * 1.1) / (rhos*31536000)
+    crosssection = flowrate / pipe.speed
+    diameter = np.ceil(np.sqrt(((crosssection*4)/np.pi))*10)/10
+
+    capacity = (flowrate * 60 * 60 * rhos) * operational_hours #t/h
+
+    Ecap = flowrate * rhos * 3600
+    Ereq = volumeCGH2kg * 0.2
+
+    return volumeCGH2, flowrate, diameter, capacity, Ecap, Ereq
+
+
 def pipe_objects(importterminal, distancekm,  percentage_new, percentage_existing, pipe_defaults):
     #hydrogen_defaults_pipe_data = self.pipe_type_defaults
     #hydrogen_defaults_h2retrieval_data = self.h2retrieval_type_defaults
     pipe_transport = []
     pipe = Pipe(**pipe_defaults)
-    
-    hydrogenspeed = pipe.speed
-    rho = pipe.rho
-    
-    years_frame = importterminal.years
-    throughput_years = np.zeros(len(years_frame))
-    for i,year in enumerate(years_frame):
-        #print(i,year)
-        throughput_online_im, throughput_terminal_in_im ,throughput_online_jetty_in_im, throughput_online_stor_in_im, throughput_online_plant_in_im, throughput_planned, throughput_planned_jetty,throughput_planned_pipej, throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in, Demand_jetty_in  = importterminal.throughput_elements(year)
-        throughput_years[i] = throughput_online_im
 
-    maxvolume = max(throughput_years)
-    maxvolumekg = maxvolume * 1000
+    # the pipeline is sized on the peak of the (cached) throughput timeline of the import terminal
+    years_frame = importterminal.years
+    throughput_years = importterminal.throughput_timeline()
+    year = years_frame[-1]
 
     for commodity in opentisim.core.find_elements(importterminal, Commodity):
         Hcontent = commodity.Hcontent
-        
-    maxvolumeCGH2 = (Hcontent*maxvolume)/100
-    maxvolumeCGH2kg = maxvolumeCGH2 * 1000 
-    compressors = math.ceil(distancekm /pipe.capacity_com)
-
-    losscomp = compressors * pipe.losses_com
-    transloss = pipe.losses + losscomp
 
-    rhos = (rho/1000)
-    max_value_in = maxvolumeCGH2
+    volumeCGH2, flowrate, diameter, capacity, Ecap, Ereq = pipe_dimensions(
+        pipe, throughput_years, Hcontent, importterminal.operational_hours)
 
-    flowrate = (max_value_in * 1.1) / (rhos*31536000)
-    crosssection = flowrate / hydrogenspeed 
-    diameter = math.ceil(np.sqrt(((crosssection*4)/np.pi))*10)/10
-
-    capacity = (flowrate * 60 * 60 * rhos)  * importterminal.operational_hours #t/h
+    peak = np.argmax(throughput_years)
+    maxvolumeCGH2 = volumeCGH2[peak]
+    maxvolumeCGH2kg = maxvolumeCGH2 * 1000
+    flowrate = flowrate[peak]
+    diameter = diameter[peak]
+    capacity = capacity[peak]
+    Ecap = Ecap[peak]
+    Ereq = Ereq[peak]
 
     # find the total service rate
     service_capacity = 0
@@ -470,54 +520,47 @@ def pipe_objects(importterminal, distancekm,  percentage_new, percentage_existin
         years_online.append(element.year_online)
     if importterminal.place == 'none':
         service_rate = 1 
-    # check if total planned length is smaller than target length, if so add a pipeline
-    #print(years_online)
-    
-    while service_rate > service_capacity:
-        if importterminal.debug:
-            print('  *** add Pipeline to elements')
 
-        pipe = Pipe(**pipe_defaults)
+    # - capex (identical for each pipeline that is added)
+    price_existing = (0.13/1000) #€/kgH2/km
+    capex_existing = ((percentage_existing/100) * distancekm) * price_existing * maxvolumeCGH2kg 
 
-        # - capex
-        price_existing = (0.13/1000) #€/kgH2/km
+    #capex pipeline 
+    unit_rate = ((diameter**2)*2200+diameter*860+247.5)*1000 #€/km
+    distance_new =  ((percentage_new/100) * distancekm)
+    invest = unit_rate * distance_new  #self.distance #investment of the pipeline 
 
-        years_frame = importterminal.years
-        throughput_years = np.zeros(len(years_frame))
-        for i,year in enumerate(years_frame):
-            #print(i,year)
-            throughput_online_im, throughput_terminal_in_im ,throughput_online_jetty_in_im, throughput_online_stor_in_im, throughput_online_plant_in_im, throughput_planned, throughput_planned_jetty,throughput_planned_pipej, throughput_planned_storage, throughput_planned_plant, Demand,Demand_plant_in, Demand_storage_in, Demand_jetty_in  = importterminal.throughput_elements(year)
-            throughput_years[i] = throughput_online_im
+    #capex compressors 
+    if importterminal.place == 'decentralized':
+        compressors = 0 
+    elif importterminal.place == 'none':
+        compressors = 0 
+    else:  
+        compressors = math.ceil(distance_new  /pipe.capacity_com)
 
-        maxvolume = max(throughput_years)
-        maxvolumekg = maxvolume * 1000
-        
-        maxvolumeCGH2 = (Hcontent*maxvolume)/100
-        maxvolumeCGH2kg = maxvolumeCGH2 * 1000 
+    Etot = (Ecap * 0.2)/1000 #0.2 energy needed to compress 
+    investunit = pipe.unit_rate_com * Etot 
+    investcom = compressors * investunit #investment of compressors #xxx
 
-        capex_existing = ((percentage_existing/100) * distancekm) * price_existing * maxvolumeCGH2kg 
+    investtotal = invest + investcom 
+    capex_new = int(investtotal)
 
-        #capex pipeline 
-        capacity = capacity #pipe capacity
-        unit_rate = ((diameter**2)*2200+diameter*860+247.5)*1000 #€/km
-        distance_new =  ((percentage_new/100) * distancekm)
-        invest = unit_rate * distance_new  #self.distance #investment of the pipeline 
+    # - labour
+    #labour for pipe & compressors --> now it is said that 2 people work per compressor station 
+    labour = Labour(**importterminal.config.labour_data)
+    compressors_tot = math.ceil(distancekm  /pipe.capacity_com)
 
-        #capex compressors 
-        if importterminal.place == 'decentralized':
-            compressors = 0 
-        elif importterminal.place == 'none':
-            compressors = 0 
-        else:  
-            compressors = math.ceil(distance_new  /pipe.capacity_com)
+    #pipe.energy 
+    energy = Energy(**importterminal.config.energy_data) 
+    Ecost = Ereq * energy.price
 
-        Ecap = flowrate * rhos * 3600 
-        Etot = (Ecap * 0.2)/1000 #0.2 energy needed to compress 
-        investunit = pipe.unit_rate_com * Etot 
-        investcom = compressors * investunit #investment of compressors #xxx
+    # check if total planned length is smaller than target length, if so add a pipeline
+    #print(years_online)
+    while service_rate > service_capacity:
+        if importterminal.logger.enabled:
+            importterminal.logger.invest('Pipeline')
 
-        investtotal = invest + investcom 
-        capex_new = int(investtotal)
+        pipe = Pipe(**pipe_defaults)
 
         pipe.capex = capex_existing + capex_new 
 
@@ -525,50 +568,39 @@ def pipe_objects(importterminal, distancekm,  percentage_new, percentage_existin
         pipe.insurance = pipe.capex * pipe.insurance_perc #insurance for pipe & compressor 
         pipe.maintenance = pipe.capex * pipe.maintenance_perc #maintenance for pipe & compressor 
 
-        # - labour
-        #labour for pipe & compressors --> now it is said that 2 people work per compressor station 
-        labour = Labour(**labour_data)
         pipe.shift = (
                 (pipe.crew_min * importterminal.operational_hours) / (labour.shift_length * labour.annual_shifts))
 
         pipe_labour = pipe.shift * labour.operational_salary
-        
-        compressors_tot = math.ceil(distancekm  /pipe.capacity_com)
-        
+
         comp_shift = (
                 (pipe.crew_min_com * importterminal.operational_hours) / (labour.shift_length * labour.annual_shifts))*compressors_tot
 
         compressor_labour =comp_shift * labour.operational_salary
-        
+
         pipe.labour = pipe_labour + compressor_labour 
-        
-        #pipe.energy 
-          
-        energy = Energy(**energy_data) 
-        Ereq =  maxvolumeCGH2kg * 0.2 
-        Ecost = Ereq * energy.price
-        
+
         pipe.energy =  Ecost * compressors_tot
-        
+
         #year.online 
         pipe.year_online = years_online[0]
-        
+
         pipe = cashflow_data_pipe(importterminal, pipe)
 
         pipe_transport.append(pipe)
-        
 
         service_capacity += capacity
 
-    if importterminal.debug:
-        print(
-            '     a total of {} ton of pipeline hinterland service capacity is online; {} ton total planned'.format(
-                service_capacity_online_pipe, service_capacity)) 
+    if importterminal.logger.enabled:
+        importterminal.logger.message(
+            '     a total of {} ton of pipeline hinterland service capacity is online; {} ton total planned',
+            service_capacity_online_pipe, service_capacity)
     return pipe_transport
 
 
 def transport_elements_plot(terminal, seaborne_transport, numberoftrips, width=0.25, alpha=0.6):
-    
+    import matplotlib.pyplot as plt
+
     vessels = []
     vessels_capacity = []
     
@@ -582,8 +614,8 @@ def transport_elements_plot(terminal, seaborne_transport, numberoftrips, width=0
         for element in seaborne_transport:
             if isinstance(element, Vessel):
                 if year >= element.year_online:
-                    vessels[-1] += 1
-                    vessels_capacity[-1] += (element.call_size * numberoftrips)
+                    vessels[-1] += element.count
+                    vessels_capacity[-1] += (element.call_size * numberoftrips * element.count)
 
                 
     demand = pd.DataFrame()
@@ -649,7 +681,8 @@ def transport_elements_plot(terminal, seaborne_transport, numberoftrips, width=0
 
 
 def inlandtransport_elements_plot(terminal, inland_transport, numberoftrips, width=0.25, alpha=0.6, fontsize=20):
-    
+    import matplotlib.pyplot as plt
+
     transportmodes = []
     modes_capacity = []
     
@@ -666,24 +699,24 @@ def inlandtransport_elements_plot(terminal, inland_transport, numberoftrips, wid
             for element in inland_transport:
                 if isinstance(element, Barge):
                     if year >= element.year_online:
-                        transportmodes[-1] += 1
-                        modes_capacity[-1] += (element.call_size * numberoftrips)
+                        transportmodes[-1] += element.count
+                        modes_capacity[-1] += (element.call_size * numberoftrips * element.count)
         
         if terminal.transport_sc2 == 'train':
             labelx = 'Trains'
             for element in inland_transport:
                 if isinstance(element, Train):
                     if year >= element.year_online:
-                        transportmodes[-1] += 1
-                        modes_capacity[-1] += (element.call_size * numberoftrips)    
+                        transportmodes[-1] += element.count
+                        modes_capacity[-1] += (element.call_size * numberoftrips * element.count)    
                         
         if terminal.transport_sc2 == 'truck':
             labelx = 'Trucks'
             for element in inland_transport:
                 if isinstance(element, Truck):
                     if year >= element.year_online:
-                        transportmodes[-1] += 1
-                        modes_capacity[-1] += (element.capacity * numberoftrips)                
+                        transportmodes[-1] += element.count
+                        modes_capacity[-1] += (element.capacity * numberoftrips * element.count)                
                 
     demand = pd.DataFrame()
     demand['year'] = years
@@ -756,7 +789,8 @@ def inlandtransport_elements_plot(terminal, inland_transport, numberoftrips, wid
 # In[ ]:
 
 def transport_elements_plot(terminal, seaborne_transport, numberoftrips, width=0.25, alpha=0.6, fontsize = 20):
-    
+    import matplotlib.pyplot as plt
+
     vessels = []
     vessels_capacity = []
     
@@ -770,8 +804,8 @@ def transport_elements_plot(terminal, seaborne_transport, numberoftrips, width=0
         for element in seaborne_transport:
             if isinstance(element, Vessel):
                 if year >= element.year_online:
-                    vessels[-1] += 1
-                    vessels_capacity[-1] += (element.call_size * numberoftrips)
+                    vessels[-1] += element.count
+                    vessels_capacity[-1] += (element.call_size * numberoftrips * element.count)
                 
                 
     demand = pd.DataFrame()
@@ -852,24 +886,7 @@ def add_cashflow_vessels(terminal, seaborne_transport):
     cash_flows['labour'] = 0
     cash_flows['fuel'] = 0
     
-    for element in seaborne_transport:
-        if hasattr(element, 'df'):
-            element.df = element.df.fillna(0)
-            for column in cash_flows.columns:
-                if column in element.df.columns and column != "year":
-                    cash_flows[column] += element.df[column]
-
-    cash_flows_WACC_real = pd.DataFrame()
-    cash_flows_WACC_real['year'] = cash_flows['year']
-    for year in terminal.years: #range(Terminal.startyear, Terminal.startyear + Terminal.lifecycle):
-        for column in cash_flows.columns:
-            if column != "year":
-                cash_flows_WACC_real.loc[cash_flows_WACC_real['year'] == year, column] =                     cash_flows.loc[cash_flows['year'] == year, column] /                            ((1 + opentisim.core.WACC_real()) ** (year - terminal.modelframe[0]+1))
-
-    cash_flows = cash_flows.fillna(0)
-    cash_flows_WACC_real = cash_flows_WACC_real.fillna(0)
-
-    return cash_flows,cash_flows_WACC_real 
+    return opentisim.core.aggregate_cashflows(terminal, seaborne_transport, cash_flows)
 
 
 # In[ ]:
@@ -885,29 +902,14 @@ def add_cashflow_pipe(terminal, pipe_transport):
     cash_flows['labour'] = 0
     #cash_flows['fuel'] = 0
     
-    for element in pipe_transport:
-        if hasattr(element, 'df'):
-            element.df = element.df.fillna(0)
-            for column in cash_flows.columns:
-                if column in element.df.columns and column != "year":
-                    cash_flows[column] += element.df[column]
-
-    cash_flows_WACC_real = pd.DataFrame()
-    cash_flows_WACC_real['year'] = cash_flows['year']
-    for year in terminal.years: #range(Terminal.startyear, Terminal.startyear + Terminal.lifecycle):
-        for column in cash_flows.columns:
-            if column != "year":
-                cash_flows_WACC_real.loc[cash_flows_WACC_real['year'] == year, column] =                     cash_flows.loc[cash_flows['year'] == year, column] /                            ((1 + opentisim.core.WACC_real()) ** (year - terminal.modelframe[0]+1))
-
-    cash_flows = cash_flows.fillna(0)
-    cash_flows_WACC_real = cash_flows_WACC_real.fillna(0)
-
-    return cash_flows,cash_flows_WACC_real 
+    return opentisim.core.aggregate_cashflows(terminal, pipe_transport, cash_flows)
 
 
 def cashflow_plot(cash_flows, title='Cash flow plot', width=0.2, alpha=0.6, fontsize=20):
     """Gather data from Terminal elements and combine into a cash flow plot"""
 
+    import matplotlib.pyplot as plt
+
     # prepare years, revenue, capex and opex for plotting
     years = cash_flows['year'].values
     #revenues = cash_flows['revenues'].values
@@ -1,10 +1,9 @@
-# package(s) for data handling
-import matplotlib.pyplot as plt
-
 # *** General functions
 def cashflow_plot(Terminal, cash_flows, title='Cash flow plot', width=0.2, alpha=0.6, fontsize=20):
     """Gather data from Terminal elements and combine into a cash flow plot"""
 
+    import matplotlib.pyplot as plt
+
     # prepare years, revenue, capex and opex for plotting
     years = cash_flows['year'].values
     revenues = cash_flows['revenues'].values
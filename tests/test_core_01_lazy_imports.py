@@ -0,0 +1,36 @@
+"""Tests for `opentisim` package."""
+
+def test_core_01_lazy_imports():
+	"""Test to see if importing opentisim and its terminal modules does not load the plotting, geo, DES and
+	scipy analysis packages, and if the plotting methods still load matplotlib when they are called
+	"""
+
+	import os
+	import subprocess
+	import sys
+
+	code = (
+		"import sys\n"
+		"import opentisim\n"
+		"import opentisim.drybulk\n"
+		"import opentisim.liquidbulk.transport_plots\n"
+		"import opentisim.core.mapping_methods\n"
+		"print(','.join(name for name in ['matplotlib', 'networkx', 'simpy', 'simplekml', 'shapely', 'pyproj',\n"
+		"                                 'numpy.matlib', 'scipy.stats', 'scipy.optimize'] if name in sys.modules))\n")
+
+	root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+	output = subprocess.run([sys.executable, '-c', code], cwd=root, check=True, capture_output=True, text=True)
+
+	# we expect none of the lazily imported packages to be loaded
+	assert output.stdout.strip() == ''
+
+	# a plot method imports matplotlib on first use
+	import matplotlib
+	matplotlib.use('Agg')
+	import pandas as pd
+	import opentisim
+
+	cash_flows = pd.DataFrame({'year': [2020, 2021], 'revenues': [0, 1], 'capex': [1, 0], 'insurance': [0, 0],
+							   'maintenance': [0, 0], 'energy': [0, 0], 'demurrage': [0, 0], 'fuel': [0, 0],
+							   'labour': [0, 0], 'capex_material': [0, 0], 'purchaseH2': [0, 0], 'purchase_material': [0, 0]})
+	opentisim.plot.cashflow_plot(None, cash_flows)
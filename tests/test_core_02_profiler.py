@@ -0,0 +1,55 @@
+"""Tests for `opentisim` package."""
+
+def test_core_02_profiler():
+	"""Test to see if the profiler records the per-year methods of a terminal simulation and the core cash flow
+	functions, and if the terminal and core functions are restored when the profiler is stopped
+	"""
+
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_000_000] * lifecycle})
+
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize,
+				  drybulk.Vessel(**drybulk.handysize_data),
+				  drybulk.Vessel(**drybulk.handymax_data),
+				  drybulk.Vessel(**drybulk.panamax_data)],
+		crane_type_defaults=drybulk.mobile_crane_data)
+
+	NPV = opentisim.core.NPV
+	with opentisim.core.Profiler(Terminal, memory=True) as profiler:
+		Terminal.simulate()
+		opentisim.core.NPV(Terminal, None)
+
+	# we expect the original methods and functions to be back in place
+	assert 'berth_invest' not in vars(Terminal)
+	assert opentisim.core.NPV is NPV
+	assert opentisim.core.core.aggregate_cashflows.__module__ == 'opentisim.core.core'
+	assert not hasattr(opentisim.core.aggregate_cashflows, '__wrapped__')
+
+	table = profiler.table()
+	assert list(table.columns) == ['year', 'method', 'calls', 'time', 'allocated']
+
+	# every investment method is called once per year
+	berth_invest = table[table['method'] == 'berth_invest']
+	assert list(berth_invest['year']) == years
+	assert list(berth_invest['calls']) == [1] * lifecycle
+
+	# the element cash flows are booked on the year of the investment, NPV after the simulation has no year
+	assert table[table['method'] == 'core.add_cashflow_data_to_element']['year'].notna().all()
+	assert table[table['method'] == 'core.NPV']['year'].isna().all()
+
+	summary = profiler.summary()
+	assert summary.loc['calculate_energy_cost', 'calls'] == lifecycle
+	assert (summary['time'] > 0).all()
@@ -0,0 +1,79 @@
+"""Tests for `opentisim` package."""
+
+def test_core_03_event_logging():
+	"""Test to see if a terminal simulation logs its investment decisions and per-year KPIs to the sink it is given,
+	and if a terminal without sink and without debug does not print anything
+	"""
+
+	import contextlib
+	import io
+	import json
+	import pandas as pd
+	import opentisim
+
+	containers = opentisim.containers
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	def container_terminal(**kwargs):
+		container = containers.Commodity(**dict(containers.container_data, fully_cellular_perc=0, panamax_perc=0,
+												panamax_max_perc=0, post_panamax_I_perc=40, post_panamax_II_perc=0,
+												new_panamax_perc=0, VLCS_perc=30, ULCS_perc=30))
+		container.scenario_data = pd.DataFrame(data={'year': years, 'volume': [300_000] * lifecycle})
+
+		vessels = [containers.Vessel(**vessel_data) for vessel_data in [
+			containers.fully_cellular_data, containers.panamax_data, containers.panamax_max_data,
+			containers.post_panamax_I_data, containers.post_panamax_II_data, containers.new_panamax_data,
+			containers.VLCS_data, containers.ULCS_data]]
+
+		Terminal = containers.System(startyear=startyear, lifecycle=lifecycle, elements=[container] + vessels,
+									 stack_equipment='sc', laden_stack='sc', **kwargs)
+		Terminal.modelframe = years
+		Terminal.revenues = []
+		Terminal.demurrage = []
+
+		return Terminal
+
+	# without a sink nothing is printed (also not the gate capacities)
+	output = io.StringIO()
+	with contextlib.redirect_stdout(output):
+		Terminal = container_terminal()
+		Terminal.simulate()
+	assert output.getvalue() == ''
+	assert not Terminal.logger.enabled
+
+	# with a list sink the events are kept in memory
+	sink = opentisim.core.ListSink()
+	Terminal = container_terminal(sink=sink)
+	with contextlib.redirect_stdout(io.StringIO()):
+		Terminal.simulate()
+
+	assert [event.year for event in sink.records if event.kind == 'year'] == years
+
+	# we expect an investment event for each element that was added to the terminal
+	invest = [event for event in sink.records if event.kind == 'invest']
+	berths = opentisim.core.find_elements(Terminal, containers.Berth)
+	assert len([event for event in invest if event.name == 'Berth']) == len(berths)
+	assert invest[0].year == startyear
+
+	# the vessel calls and gate capacities are logged as KPIs with their values
+	vessel_calls = [event for event in sink.records if event.kind == 'kpi' and event.name == 'vessel_calls']
+	assert [event.year for event in vessel_calls] == years
+	assert vessel_calls[0].data['total_vol'] == 300_000
+
+	exit_gate = [event for event in sink.records if event.kind == 'kpi' and event.name == 'exit_gate_minutes']
+	assert all(event.data['planned'] >= event.data['required'] for event in exit_gate)
+
+	# the JSON lines sink writes one record per event, messages include their text
+	file = io.StringIO()
+	Terminal = container_terminal(sink=opentisim.core.JsonLinesSink(file))
+	with contextlib.redirect_stdout(io.StringIO()):
+		Terminal.simulate()
+
+	records = [json.loads(line) for line in file.getvalue().splitlines()]
+	assert len(records) == len(sink.records)
+	assert [record['kind'] for record in records] == [event.kind for event in sink.records]
+	assert all('text' in record['data'] for record in records if record['kind'] == 'message')
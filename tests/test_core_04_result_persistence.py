@@ -0,0 +1,88 @@
+"""Tests for `opentisim` package."""
+
+def test_core_04_result_persistence(tmp_path):
+	"""Test to see if the results of a simulated terminal can be written to columnar files and read back without
+	the terminal objects
+	"""
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_000_000] * lifecycle})
+
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize,
+				  drybulk.Vessel(**drybulk.handysize_data),
+				  drybulk.Vessel(**drybulk.handymax_data),
+				  drybulk.Vessel(**drybulk.panamax_data)],
+		crane_type_defaults=drybulk.mobile_crane_data)
+	Terminal.simulate()
+
+	# the NPZ format is always available
+	metadata = opentisim.core.save_results(Terminal, str(tmp_path / 'run_1'), format='npz')
+	opentisim.core.save_results(Terminal, str(tmp_path / 'run_2'), format='npz')
+
+	results = opentisim.core.load_results(str(tmp_path / 'run_1'))
+	assert results.metadata == metadata
+	assert metadata['terminal'] == 'opentisim.drybulk.agribulk_system.System'
+
+	# we expect the element register to hold each element with its scalar attributes
+	assert len(results.elements) == len(Terminal.elements)
+	assert list(results.elements['class']) == [type(element).__name__ for element in Terminal.elements]
+	assert list(results.elements['id']) == [element.id for element in Terminal.elements]
+
+	# the cash flows and NPV are the same as those calculated from the terminal objects
+	cash_flows, cash_flows_discounted = opentisim.core.add_cashflow_elements(Terminal, None)
+	assert np.allclose(results.cash_flows['capex'], cash_flows['capex'])
+	assert np.allclose(results.npv['PV'], opentisim.core.NPV(Terminal, None)['PV'])
+	assert np.isclose(metadata['NPV'], results.npv['PV'].sum())
+
+	element_capex = results.element_cash_flows.groupby('year')['capex'].sum()
+	assert np.allclose(element_capex.reindex(years, fill_value=0), cash_flows['capex'])
+
+	# the timelines hold a value for every simulated year
+	assert list(results.timelines['year']) == years
+	assert list(results.timelines['total_vol']) == [1_000_000] * lifecycle
+
+	# tables of several runs can be queried together
+	npv = opentisim.core.collect_results([str(tmp_path / 'run_1'), str(tmp_path / 'run_2')], 'npv', ['year', 'PV'])
+	assert list(npv.columns) == ['run', 'year', 'PV']
+	assert len(npv) == 2 * lifecycle
+
+	# liquid bulk terminals give their throughput and the berth and unloading occupancies
+	liquidbulk = opentisim.liquidbulk
+
+	commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50)
+	lhydrogen = liquidbulk.Commodity(**commodity_data)
+	lhydrogen.scenario_data = pd.DataFrame(data={'year': years, 'volume': [2_000_000] * lifecycle})
+	vessels = [liquidbulk.Vessel(**data) for data in [
+		liquidbulk.smallhydrogen_data, liquidbulk.largehydrogen_data, liquidbulk.smallammonia_data,
+		liquidbulk.largeammonia_data, liquidbulk.handysize_data, liquidbulk.panamax_data, liquidbulk.vlcc_data]]
+
+	Terminal = liquidbulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[lhydrogen] + vessels,
+		commodity_type_defaults=commodity_data)
+	Terminal.modelframe = years
+	Terminal.revenues = []
+	Terminal.demurrage = []
+	Terminal.simulate()
+
+	timelines = opentisim.core.persistence.timelines(Terminal)
+	occupancies = [Terminal.berth_occupancies(year) for year in years]
+	assert np.allclose(timelines['throughput'], Terminal.throughput_timeline())
+	assert np.allclose(timelines['berth_occupancy_online'],
+					   [occupancy['berth_occupancy_online'] for occupancy in occupancies])
+	assert 'unloading_occupancy_planned' in timelines
@@ -0,0 +1,85 @@
+"""Tests for `opentisim` package."""
+
+def test_core_05_snapshot_branching():
+	"""Test to see if a terminal that is simulated year by year can be captured in a snapshot and continued in
+	several branches with different demand, each giving the same result as an uninterrupted run
+	"""
+
+	import pickle
+	import pandas as pd
+	import opentisim
+
+	liquidbulk = opentisim.liquidbulk
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 8
+	years = list(range(startyear, startyear + lifecycle))
+	branch_year = 2024
+
+	def scenario(growth):
+		return pd.DataFrame(data={'year': years, 'volume': [
+			2_000_000 if year < branch_year else 2_000_000 * growth for year in years]})
+
+	def terminal():
+		commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50)
+		lhydrogen = liquidbulk.Commodity(**commodity_data)
+		lhydrogen.scenario_data = scenario(1)
+
+		vessels = [liquidbulk.Vessel(**vessel_data) for vessel_data in [
+			liquidbulk.smallhydrogen_data, liquidbulk.largehydrogen_data, liquidbulk.smallammonia_data,
+			liquidbulk.largeammonia_data, liquidbulk.handysize_data, liquidbulk.panamax_data, liquidbulk.vlcc_data]]
+
+		Terminal = liquidbulk.System(
+			startyear=startyear,
+			lifecycle=1,
+			elements=[lhydrogen] + vessels,
+			operational_hours=16 * 365,
+			terminal_supply_chain={'berth_jetty', 'pipeline_jetty_-_terminal', 'storage', 'h2_retrieval'},
+			commodity_type_defaults=commodity_data,
+			storage_type_defaults=liquidbulk.storage_lh2_data,
+			h2retrieval_type_defaults=liquidbulk.h2retrieval_lh2_data,
+			allowable_dwelltime=14 / 365)
+		Terminal.modelframe = years
+		Terminal.revenues = []
+		Terminal.demurrage = []
+
+		return Terminal
+
+	def run(Terminal, run_years, growth=None):
+		if growth is not None:
+			commodity = opentisim.core.find_elements(Terminal, liquidbulk.Commodity)[0]
+			commodity.scenario_data = scenario(growth)
+		for year in run_years:
+			Terminal.startyear = year
+			Terminal.simulate()
+		return Terminal
+
+	# uninterrupted runs of the two futures
+	low = run(terminal(), years)
+	high = run(terminal(), years[:years.index(branch_year)])
+	run(high, years[years.index(branch_year):], growth=2)
+
+	# run up to the branch year, take a snapshot and continue in two branches
+	Terminal = run(terminal(), years[:years.index(branch_year)])
+	elements = len(Terminal.elements)
+	snapshot = opentisim.core.snapshot(Terminal)
+	assert snapshot.year == branch_year - 1
+
+	branch_low = run(opentisim.core.restore(snapshot), years[years.index(branch_year):])
+	branch_high = run(opentisim.core.restore(snapshot), years[years.index(branch_year):], growth=2)
+
+	# we expect each branch to end up where the uninterrupted run of its future ends up
+	for branch, reference in [(branch_low, low), (branch_high, high)]:
+		assert len(branch.elements) == len(reference.elements)
+		assert branch.years == reference.years
+		assert opentisim.core.NPV(branch, None)['PV'].sum() == opentisim.core.NPV(reference, None)['PV'].sum()
+	assert len(branch_high.elements) > len(branch_low.elements)
+
+	# the branches do not change the snapshot or the terminal it was taken from, also after pickling
+	assert len(Terminal.elements) == elements
+	restored = pickle.loads(pickle.dumps(snapshot)).restore()
+	assert len(restored.elements) == elements
+	assert restored.years == years[:years.index(branch_year)]
+	assert all(restored_element.df.equals(element.df) for restored_element, element in zip(
+		restored.elements, Terminal.elements) if hasattr(element, 'df'))
@@ -0,0 +1,64 @@
+"""Tests for `opentisim` package."""
+
+def test_core_06_result_cache(tmp_path):
+	"""Test to see if a simulated terminal is returned from the result cache for the same inputs, and simulated again
+	when an input or a module-level default changes
+	"""
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	def make_terminal(volume):
+		maize = drybulk.Commodity(**drybulk.maize_data)
+		maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [volume] * lifecycle})
+
+		return drybulk.System(
+			startyear=startyear,
+			lifecycle=lifecycle,
+			elements=[maize,
+					  drybulk.Vessel(**drybulk.handysize_data),
+					  drybulk.Vessel(**drybulk.handymax_data),
+					  drybulk.Vessel(**drybulk.panamax_data)],
+			crane_type_defaults=drybulk.mobile_crane_data)
+
+	cache = opentisim.core.ResultCache(str(tmp_path / 'cache'))
+
+	# the first run is simulated, the second is read from the cache
+	first = cache.simulate(make_terminal(1_000_000))
+	second = cache.simulate(make_terminal(1_000_000))
+	assert (cache.hits, cache.misses) == (1, 1)
+	assert second is not first
+	assert len(second.elements) == len(first.elements)
+	assert np.allclose(opentisim.core.NPV(second, None)['PV'], opentisim.core.NPV(first, None)['PV'])
+
+	# other scenario data, kwargs or module-level defaults give another key
+	key = cache.key(make_terminal(1_000_000))
+	assert cache.key(make_terminal(1_500_000)) != key
+	assert cache.key(make_terminal(1_000_000)) == key
+
+	original = drybulk.agribulk_defaults.berth_data['max_cranes']
+	try:
+		drybulk.agribulk_defaults.berth_data['max_cranes'] = original + 1
+		assert cache.key(make_terminal(1_000_000)) != key
+	finally:
+		drybulk.agribulk_defaults.berth_data['max_cranes'] = original
+	assert cache.key(make_terminal(1_000_000)) == key
+
+	# another package version invalidates the entries
+	assert opentisim.core.ResultCache(str(tmp_path / 'cache'), version='0.0.0').key(make_terminal(1_000_000)) != key
+
+	# the least recently used entries are evicted when the cache is full
+	cache.simulate(make_terminal(1_500_000))
+	assert len(cache.entries()) == 2
+	cache.max_bytes = cache.entries()[-1][1]
+	cache.evict()
+	assert len(cache.entries()) == 1
+	assert cache.entries()[0][0].endswith(cache.key(make_terminal(1_500_000)) + '.pkl')
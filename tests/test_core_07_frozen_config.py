@@ -0,0 +1,69 @@
+"""Tests for `opentisim` package."""
+
+def test_core_07_frozen_config():
+	"""Test to see if differently configured terminals can be simulated at the same time in one process, and if a
+	terminal is not affected by changes to the module-level defaults after it was created
+	"""
+
+	from concurrent.futures import ThreadPoolExecutor
+
+	import pandas as pd
+	import pytest
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	def make_terminal(config):
+		maize = drybulk.Commodity(**drybulk.maize_data)
+		maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_500_000] * lifecycle})
+
+		return drybulk.System(
+			startyear=startyear,
+			lifecycle=lifecycle,
+			elements=[maize,
+					  drybulk.Vessel(**drybulk.handysize_data),
+					  drybulk.Vessel(**drybulk.handymax_data),
+					  drybulk.Vessel(**drybulk.panamax_data)],
+			config=config)
+
+	def run(config):
+		Terminal = make_terminal(config)
+		Terminal.simulate()
+		return opentisim.core.NPV(Terminal, None)['PV'].sum()
+
+	# a configuration with slower cranes (the crane type defaults are taken from the configuration)
+	default = drybulk.default_config()
+	slow = default.replace(mobile_crane_data={'hourly_cycles': 10})
+	assert slow.mobile_crane_data['hourly_cycles'] == 10
+	assert default.mobile_crane_data['hourly_cycles'] == drybulk.mobile_crane_data['hourly_cycles']
+	assert make_terminal(slow).crane_type_defaults['hourly_cycles'] == 10
+
+	references = {'default': run(default), 'slow': run(slow)}
+	assert references['default'] != references['slow']
+
+	# the configurations can not be changed
+	with pytest.raises(TypeError):
+		default.mobile_crane_data['hourly_cycles'] = 10
+	with pytest.raises(TypeError):
+		default.mobile_crane_data = {}
+
+	# we expect interleaved runs in threads to give the results of the runs one by one
+	names = ['default', 'slow'] * 4
+	with ThreadPoolExecutor(max_workers=4) as executor:
+		results = list(executor.map(run, [default if name == 'default' else slow for name in names]))
+	assert results == [references[name] for name in names]
+
+	# changing a module-level default after the terminal was created does not change its run
+	Terminal = make_terminal(None)
+	original = drybulk.mobile_crane_data['hourly_cycles']
+	try:
+		drybulk.mobile_crane_data['hourly_cycles'] = 10
+		Terminal.simulate()
+	finally:
+		drybulk.mobile_crane_data['hourly_cycles'] = original
+	assert opentisim.core.NPV(Terminal, None)['PV'].sum() == references['default']
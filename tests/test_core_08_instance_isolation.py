@@ -0,0 +1,88 @@
+"""Tests for `opentisim` package."""
+
+def test_core_08_instance_isolation():
+	"""Test to see if terminals in one process do not share state: terminals simulated interleaved, in one thread
+	or in many threads, give the same results as terminals simulated one by one
+	"""
+
+	import inspect
+	from concurrent.futures import ThreadPoolExecutor
+
+	import pandas as pd
+	import opentisim
+
+	liquidbulk = opentisim.liquidbulk
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 6
+	years = list(range(startyear, startyear + lifecycle))
+	volumes = [1_000_000, 2_000_000, 3_000_000, 4_000_000]
+
+	# terminals and elements created with the default arguments get lists of their own
+	assert liquidbulk.System().elements is not liquidbulk.System().elements
+	assert liquidbulk.System().terminal_supply_chain is not liquidbulk.System().terminal_supply_chain
+
+	# the default arguments of the element mixins are immutable, so elements never share a mutable default
+	for base in liquidbulk.Jetty.__mro__:
+		if base is not object:
+			for parameter in inspect.signature(base.__init__).parameters.values():
+				assert not isinstance(parameter.default, (list, dict, set)), (base.__name__, parameter.name)
+
+	jetty_1, jetty_2 = liquidbulk.Jetty(**liquidbulk.jetty_data), liquidbulk.Jetty(**liquidbulk.jetty_data)
+	for attribute, value in opentisim.core.element_attributes(jetty_1).items():
+		if isinstance(value, (list, dict, set)) and attribute not in liquidbulk.jetty_data:
+			assert value is not getattr(jetty_2, attribute)
+
+	def terminal(volume):
+		commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50)
+		lhydrogen = liquidbulk.Commodity(**commodity_data)
+		lhydrogen.scenario_data = pd.DataFrame(data={'year': years, 'volume': [volume] * lifecycle})
+
+		vessels = [liquidbulk.Vessel(**vessel_data) for vessel_data in [
+			liquidbulk.smallhydrogen_data, liquidbulk.largehydrogen_data, liquidbulk.smallammonia_data,
+			liquidbulk.largeammonia_data, liquidbulk.handysize_data, liquidbulk.panamax_data, liquidbulk.vlcc_data]]
+
+		Terminal = liquidbulk.System(
+			startyear=startyear,
+			lifecycle=1,
+			elements=[lhydrogen] + vessels,
+			operational_hours=16 * 365,
+			commodity_type_defaults=commodity_data,
+			storage_type_defaults=liquidbulk.storage_lh2_data,
+			h2retrieval_type_defaults=liquidbulk.h2retrieval_lh2_data,
+			allowable_dwelltime=14 / 365)
+		Terminal.modelframe = years
+		Terminal.revenues = []
+		Terminal.demurrage = []
+
+		return Terminal
+
+	def step(Terminal, year):
+		Terminal.startyear = year
+		Terminal.simulate()
+
+	def result(Terminal):
+		return len(Terminal.elements), opentisim.core.NPV(Terminal, None)['PV'].sum()
+
+	def run(volume):
+		Terminal = terminal(volume)
+		for year in years:
+			step(Terminal, year)
+		return result(Terminal)
+
+	# reference: one terminal at a time
+	references = [run(volume) for volume in volumes]
+	assert len(set(references)) == len(volumes)
+
+	# all terminals stepped year by year in turn
+	terminals = [terminal(volume) for volume in volumes]
+	for year in years:
+		for Terminal in terminals:
+			step(Terminal, year)
+	assert [result(Terminal) for Terminal in terminals] == references
+
+	# many terminals in threads
+	with ThreadPoolExecutor(max_workers=8) as executor:
+		results = list(executor.map(run, volumes * 4))
+	assert results == references * 4
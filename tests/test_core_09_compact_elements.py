@@ -0,0 +1,43 @@
+"""Tests for `opentisim` package."""
+
+def test_core_09_compact_elements():
+	"""Test to see if elements keep their attributes in slots, get sequential ids and keep the attribute API of
+	plain objects (extra attributes, copies, pickling)
+	"""
+
+	import copy
+	import pickle
+	import tracemalloc
+	import opentisim
+
+	liquidbulk = opentisim.liquidbulk
+
+	storage_1 = liquidbulk.Storage(**liquidbulk.storage_lh2_data)
+	storage_2 = liquidbulk.Storage(**liquidbulk.storage_lh2_data)
+
+	# the attributes are in slots, no instance dict is created for them
+	assert storage_1.__dict__ == {}
+	assert storage_1.capacity == liquidbulk.storage_lh2_data['capacity']
+	assert isinstance(storage_1.id, int) and storage_2.id > storage_1.id
+
+	# attributes without a slot can still be added
+	storage_1.year_online = 2022
+	storage_1.extra = 'value'
+	attributes = opentisim.core.element_attributes(storage_1)
+	assert attributes['year_online'] == 2022 and attributes['extra'] == 'value'
+	assert attributes['capacity'] == storage_1.capacity
+
+	# copies and pickles hold the same attributes
+	for element in [copy.deepcopy(storage_1), pickle.loads(pickle.dumps(storage_1))]:
+		assert type(element) is liquidbulk.Storage
+		assert opentisim.core.element_attributes(element) == attributes
+
+	# we expect thousands of elements to take well under a kilobyte each
+	tracemalloc.start()
+	try:
+		start = tracemalloc.get_traced_memory()[0]
+		storages = [liquidbulk.Storage(**liquidbulk.storage_lh2_data) for _ in range(5_000)]
+		per_element = (tracemalloc.get_traced_memory()[0] - start) / len(storages)
+	finally:
+		tracemalloc.stop()
+	assert per_element < 600
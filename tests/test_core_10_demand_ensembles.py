@@ -0,0 +1,49 @@
+"""Tests for `opentisim` package."""
+
+def test_core_10_demand_ensembles():
+	"""Test to see if demand ensembles are drawn reproducibly as paths x years arrays and behave as their models
+	prescribe
+	"""
+
+	import numpy as np
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	years = list(range(2019, 2039))
+	n = 20_000
+
+	# random growth: the same seed gives the same paths, a path is scenario data for a commodity
+	ensemble = opentisim.core.random_growth(1_000_000, years, n=n, seed=1)
+	assert ensemble.volumes.shape == (n, len(years))
+	assert np.array_equal(ensemble.volumes, opentisim.core.random_growth(1_000_000, years, n=n, seed=1).volumes)
+	assert not np.array_equal(ensemble.volumes, opentisim.core.random_growth(1_000_000, years, n=n, seed=2).volumes)
+	assert list(ensemble.scenario(0)['year']) == years
+	assert np.isclose(ensemble.volumes[:, -1].mean(), 1_000_000 * 1.03 ** len(years), rtol=0.01)
+
+	# geometric Brownian motion: the expected volume grows with exp(drift)
+	ensemble = opentisim.core.geometric_brownian(1_000_000, years, n=n, drift=0.02, volatility=0.05, seed=1)
+	assert np.isclose(ensemble.volumes[:, -1].mean(), 1_000_000 * np.exp(0.02 * len(years)), rtol=0.01)
+	assert list(ensemble.percentiles().columns) == [5, 50, 95]
+
+	# regime switching: without volatility the paths only differ by their regimes
+	ensemble = opentisim.core.regime_switching(1_000_000, years, n=n, growth=(0.05, -0.05), volatility=(0, 0),
+											   transition=((0.8, 0.2), (0.5, 0.5)), seed=1)
+	log_growth = np.diff(np.log(ensemble.volumes), axis=1)
+	assert np.allclose(log_growth, np.where(ensemble.regimes[:, 1:] == 0, 0.05, -0.05))
+	assert np.isclose((ensemble.regimes == 1).mean(), 0.2 / 0.7, atol=0.02)
+
+	# bootstrap: the growth factors are those of the historic data
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	ensemble = opentisim.core.bootstrap_history(maize.historic_data, years, n=100, seed=1)
+	historic = maize.historic_data['volume'].to_numpy(dtype=float)
+	factors = np.concatenate([ensemble.volumes[:, :1] / historic[-1], ensemble.volumes[:, 1:] / ensemble.volumes[:, :-1]],
+							 axis=1)
+	assert np.isin(np.round(factors, 10), np.round(historic[1:] / historic[:-1], 10)).all()
+
+	# the scenario_random method of the commodities is reproducible with a seed
+	maize.scenario_random(startyear=2019, lifecycle=20, seed=3)
+	first = maize.scenario_data
+	maize.scenario_random(startyear=2019, lifecycle=20, seed=3)
+	assert first.equals(maize.scenario_data)
+	assert list(first['year']) == years
@@ -0,0 +1,65 @@
+"""Tests for `opentisim` package."""
+
+def test_core_11_ensemble_runner():
+	"""Test to see if an ensemble of terminal simulations gives the same results in the calling process, in a thread
+	pool and in a process pool, whatever the number of workers and the chunk size
+	"""
+
+	from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_000_000] * lifecycle})
+
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize,
+				  drybulk.Vessel(**drybulk.handysize_data),
+				  drybulk.Vessel(**drybulk.handymax_data),
+				  drybulk.Vessel(**drybulk.panamax_data)],
+		crane_type_defaults=drybulk.mobile_crane_data)
+
+	demand = opentisim.core.geometric_brownian(1_000_000, years, n=12, drift=0.1, volatility=0.2, seed=1)
+
+	serial = opentisim.core.run_ensemble(Terminal, demand)
+	assert serial.runs == len(demand) and not np.isnan(serial.npv).any()
+	assert len(np.unique(serial.npv)) > 1
+
+	# the template terminal is not simulated
+	assert Terminal.years == [] and len(Terminal.elements) == 4
+
+	# we expect the same results on other executors, whatever the chunk size
+	with ThreadPoolExecutor(max_workers=3) as executor:
+		threads = opentisim.core.run_ensemble(Terminal, demand, executor=executor, chunksize=1)
+	with ProcessPoolExecutor(max_workers=2) as executor:
+		processes = opentisim.core.run_ensemble(Terminal, demand, executor=executor, chunksize=5)
+	assert np.array_equal(threads.npv, serial.npv)
+	assert np.array_equal(processes.npv, serial.npv)
+	assert threads.count_percentiles().equals(serial.count_percentiles())
+
+	# the element counts are the percentiles over the runs per element class and year
+	percentiles = serial.count_percentiles(q=(0, 100))
+	assert set(percentiles.index.get_level_values('year')) == set(years)
+	assert percentiles.loc['Berth', 100].iloc[-1] >= 1
+	assert (percentiles[0] <= percentiles[100]).all()
+
+	# demand drawn in the runs from their own random streams does not depend on the workers either
+	def random_demand(rng):
+		return pd.DataFrame(data={'year': years, 'volume': rng.integers(500_000, 2_000_000, lifecycle)})
+
+	with ThreadPoolExecutor(max_workers=2) as executor:
+		two = opentisim.core.run_ensemble(Terminal, random_demand, n=8, executor=executor, chunksize=3, seed=7)
+	with ThreadPoolExecutor(max_workers=4) as executor:
+		four = opentisim.core.run_ensemble(Terminal, random_demand, n=8, executor=executor, chunksize=1, seed=7)
+	assert np.array_equal(two.npv, four.npv)
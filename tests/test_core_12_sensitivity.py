@@ -0,0 +1,63 @@
+"""Tests for `opentisim` package."""
+
+def test_core_12_sensitivity():
+	"""Test to see if the Morris and Sobol analyses find the parameters the NPV depends on, are reproducible with a
+	seed and reuse evaluations of points they share
+	"""
+
+	from concurrent.futures import ThreadPoolExecutor
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_000_000, 1_500_000, 2_000_000,
+																		 2_500_000, 3_000_000]})
+
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize,
+				  drybulk.Vessel(**drybulk.handysize_data),
+				  drybulk.Vessel(**drybulk.handymax_data),
+				  drybulk.Vessel(**drybulk.panamax_data)],
+		crane_type_defaults=drybulk.mobile_crane_data)
+
+	# the train data are not used by the drybulk terminal, so the NPV does not depend on the wagon payload
+	bounds = {'crane_type_defaults.hourly_cycles': (15, 35),
+			  'allowable_berth_occupancy': (0.3, 0.6),
+			  'config.train_data.wagon_payload': (40, 80)}
+
+	evaluator = opentisim.core.Evaluator(Terminal, list(bounds))
+	screening = opentisim.core.morris(Terminal, bounds, trajectories=3, seed=1, evaluator=evaluator)
+	assert list(screening.index) == list(bounds)
+	assert list(screening.columns) == ['mu', 'mu_star', 'sigma', 'mu_star_conf']
+	assert screening.loc['config.train_data.wagon_payload', 'mu_star'] == 0
+	assert screening.loc['crane_type_defaults.hourly_cycles', 'mu_star'] > 0
+
+	# the template terminal is not simulated and not changed
+	assert Terminal.years == [] and Terminal.allowable_berth_occupancy == 0.4
+	assert Terminal.config.train_data['wagon_payload'] == 60
+
+	# we expect the same screening with the same seed, from the evaluations in memory
+	simulations = evaluator.simulations
+	assert simulations <= 3 * (len(bounds) + 1)
+	again = opentisim.core.morris(Terminal, bounds, trajectories=3, seed=1, evaluator=evaluator)
+	assert evaluator.simulations == simulations
+	pd.testing.assert_frame_equal(again, screening)
+
+	# the Sobol indices take n * (k + 2) evaluations, which may run in parallel
+	with ThreadPoolExecutor(max_workers=2) as executor:
+		indices = opentisim.core.sobol(Terminal, bounds, n=4, seed=2, executor=executor, chunksize=4)
+	assert list(indices.columns) == ['S1', 'S1_conf', 'ST', 'ST_conf']
+	assert indices.loc['config.train_data.wagon_payload', 'ST'] == 0
+	assert indices.loc['crane_type_defaults.hourly_cycles', 'ST'] > 0
+	assert np.isfinite(indices[['S1_conf', 'ST_conf']].to_numpy()).all()
@@ -0,0 +1,120 @@
+"""Tests for `opentisim` package."""
+
+def test_core_13_break_even_fee():
+	"""Test to see if the break-even handling fee derived from one simulation gives an NPV of zero, and if the fee
+	versus NPV curve matches the NPV of the terminal at its own fee
+	"""
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	liquidbulk = opentisim.liquidbulk
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 10
+	years = list(range(startyear, startyear + lifecycle))
+
+	def terminal(System, handling_fee=None):
+		commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50)
+		if handling_fee is not None:
+			commodity_data['handling_fee'] = handling_fee
+
+		lhydrogen = liquidbulk.Commodity(**commodity_data)
+		lhydrogen.scenario_data = pd.DataFrame(data={'year': years, 'volume': [2_000_000] * 5 + [4_000_000] * 5})
+		vessels = [liquidbulk.Vessel(**data) for data in [
+			liquidbulk.smallhydrogen_data, liquidbulk.largehydrogen_data, liquidbulk.smallammonia_data,
+			liquidbulk.largeammonia_data, liquidbulk.handysize_data, liquidbulk.panamax_data, liquidbulk.vlcc_data]]
+
+		Terminal = System(
+			startyear=startyear,
+			lifecycle=lifecycle,
+			elements=[lhydrogen] + vessels,
+			commodity_type_defaults=commodity_data)
+		Terminal.modelframe = years
+		Terminal.revenues = []
+		Terminal.demurrage = []
+		Terminal.simulate()
+
+		return Terminal
+
+	Terminal = terminal(liquidbulk.System)
+	own_fee = Terminal.commodity_type_defaults['handling_fee']
+	fee, curve = opentisim.core.break_even_fee(Terminal, fees=[0, own_fee])
+	assert fee > 0
+
+	# the curve gives the NPV of the terminal at its own handling fee
+	npv = opentisim.core.NPV(Terminal, None)['PV'].sum()
+	assert np.isclose(curve[own_fee], npv)
+
+	# we expect an NPV of zero when the terminal charges the break-even fee
+	npv = opentisim.core.NPV(terminal(liquidbulk.System, fee), None)['PV'].sum()
+	assert abs(npv) < 1e-6 * abs(curve[0])
+
+	# the default curve runs from zero to twice the break-even fee and crosses zero halfway
+	fee, curve = opentisim.core.break_even_fee(terminal(liquidbulk.ExportTerminal))
+	assert len(curve) == 21 and curve.index[10] == fee
+	assert curve.iloc[0] < 0 and np.isclose(curve.iloc[10], 0, atol=1e-6 * abs(curve.iloc[0]))
+
+	# containers: the throughput is the online TEU throughput
+	containers = opentisim.containers
+
+	container_data = dict(containers.container_data, fully_cellular_perc=0, panamax_perc=0, panamax_max_perc=0,
+						  post_panamax_I_perc=40, post_panamax_II_perc=0, new_panamax_perc=0, VLCS_perc=30,
+						  ULCS_perc=30)
+	container = containers.Commodity(**container_data)
+	container.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_000_000] * lifecycle})
+	vessels = [containers.Vessel(**data) for data in [
+		containers.fully_cellular_data, containers.panamax_data, containers.panamax_max_data,
+		containers.post_panamax_I_data, containers.post_panamax_II_data, containers.new_panamax_data,
+		containers.VLCS_data, containers.ULCS_data]]
+
+	Terminal = containers.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[container] + vessels,
+		operational_hours=8592,
+		crane_type_defaults=containers.sts_crane_data,
+		stack_equipment='sc',
+		laden_stack='sc')
+	Terminal.modelframe = years
+	Terminal.revenues = []
+	Terminal.demurrage = []
+	Terminal.simulate()
+
+	fee, curve = opentisim.core.break_even_fee(Terminal)
+	assert np.isfinite(fee) and fee > 0
+
+	# the container terminal books no revenues, so its NPV is the curve at a fee of zero
+	npv = opentisim.core.NPV(Terminal, None)['PV'].sum()
+	assert np.isclose(curve.iloc[0], npv)
+
+	# end use location: the throughput is the online throughput of the supply chain
+	def end_use_location(handling_fee=None):
+		commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50)
+		if handling_fee is not None:
+			commodity_data['handling_fee'] = handling_fee
+
+		lhydrogen = liquidbulk.Commodity(**commodity_data)
+		lhydrogen.scenario_data = pd.DataFrame(data={'year': years, 'volume': [2_000_000] * lifecycle})
+
+		Terminal = liquidbulk.EndUseLocation(
+			startyear=startyear,
+			lifecycle=lifecycle,
+			elements=[lhydrogen],
+			commodity_type_defaults=commodity_data)
+		Terminal.place = 'centralized'
+		Terminal.modelframe = years
+		Terminal.revenues = []
+		Terminal.demurrage = []
+		Terminal.simulate()
+
+		return Terminal
+
+	fee, curve = opentisim.core.break_even_fee(end_use_location())
+	assert np.isfinite(fee) and fee > 0
+
+	# we expect an NPV of zero when the end use location charges the break-even fee
+	npv = opentisim.core.NPV(end_use_location(fee), None)['PV'].sum()
+	assert abs(npv) < 1e-6 * abs(curve.iloc[0])
@@ -0,0 +1,66 @@
+"""Tests for `opentisim` package."""
+
+def test_core_14_trigger_optimization():
+	"""Test to see if the trigger optimization finds the best evaluated triggers within their bounds, meets the
+	service constraint and does not simulate points twice
+	"""
+
+	from concurrent.futures import ThreadPoolExecutor
+
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [1_000_000, 1_500_000, 2_000_000,
+																		 2_500_000, 3_000_000]})
+
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize,
+				  drybulk.Vessel(**drybulk.handysize_data),
+				  drybulk.Vessel(**drybulk.handymax_data),
+				  drybulk.Vessel(**drybulk.panamax_data)],
+		crane_type_defaults=drybulk.mobile_crane_data)
+
+	# service constraint: the demurrage over the lifecycle
+	def total_demurrage(Terminal):
+		return sum(Terminal.demurrage)
+
+	bounds = {'allowable_waiting_service_time_ratio_berth': (0.05, 0.5),
+			  'allowable_berth_occupancy': (0.2, 0.7)}
+
+	with ThreadPoolExecutor(max_workers=2) as executor:
+		result = opentisim.core.optimize_triggers(
+			Terminal, bounds, constraints=[(total_demurrage, 3e7)], popsize=3, maxiter=3, seed=1, decimals=2,
+			executor=executor, chunksize=2)
+
+	for name, (low, high) in bounds.items():
+		assert low <= result.parameters[name] <= high
+	assert result.feasible and result.constraints[0] <= 3e7
+
+	# we expect the NPV of the result to be the best NPV of the feasible evaluated triggers
+	evaluations = result.evaluations()
+	assert len(evaluations) == result.simulations
+	assert result.objective == evaluations.loc[evaluations['constraint_0'] <= 3e7, 'objective'].max()
+
+	# the template terminal is not simulated and not changed
+	assert Terminal.years == [] and Terminal.allowable_berth_occupancy == 0.4
+
+	# the same search with the same evaluator finds all points in memory
+	again = opentisim.core.optimize_triggers(
+		Terminal, bounds, constraints=[(total_demurrage, 3e7)], popsize=3, maxiter=3, seed=1, decimals=2,
+		evaluator=result.evaluator)
+	assert again.simulations == result.simulations and again.parameters == result.parameters
+
+	# the cost per tonne of the terminal at the best triggers is the break-even handling fee
+	cheapest = opentisim.core.optimize_triggers(
+		Terminal, bounds, objective=opentisim.core.cost_per_unit, maximize=False, popsize=3, maxiter=2, seed=1)
+	assert 0 < cheapest.objective <= cheapest.evaluations()['objective'].min()
@@ -0,0 +1,75 @@
+"""Tests for `opentisim` package."""
+
+def test_core_15_scenario_tree():
+	"""Test to see if a scenario tree simulates each node once and continues the branches from snapshots, giving each
+	leaf the result of an uninterrupted run of its scenario
+	"""
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	years = list(range(startyear, startyear + 7))
+
+	def terminal(scenario_data=None):
+		maize = drybulk.Commodity(**drybulk.maize_data)
+		if scenario_data is not None:
+			maize.scenario_data = scenario_data
+
+		Terminal = drybulk.System(
+			startyear=startyear,
+			lifecycle=1,
+			elements=[maize,
+					  drybulk.Vessel(**drybulk.handysize_data),
+					  drybulk.Vessel(**drybulk.handymax_data),
+					  drybulk.Vessel(**drybulk.panamax_data)],
+			crane_type_defaults=drybulk.mobile_crane_data)
+		Terminal.modelframe = years
+
+		return Terminal
+
+	# four scenarios that share their first three years, and in pairs the next two years
+	volumes = opentisim.core.geometric_brownian(1_000_000, years, n=4, drift=0.1, volatility=0.2, seed=1).volumes
+	volumes[:, :3] = volumes[0, :3]
+	volumes[1::2, 3:5] = volumes[0::2, 3:5]
+	scenarios = [pd.DataFrame(data={'year': years, 'volume': path.astype(np.int64)}) for path in volumes]
+
+	tree = opentisim.core.tree_from_scenarios(scenarios)
+	assert tree.leaves() == 4 and tree.depth() == len(years)
+	assert [(name, len(node.years)) for name, node in tree.nodes()] == [
+		('0', 3), ('0.0', 2), ('0.0.0', 2), ('0.0.1', 2), ('0.1', 2), ('0.1.0', 2), ('0.1.1', 2)]
+
+	Terminal = terminal()
+	result = opentisim.core.run_scenario_tree(Terminal, tree, keep_terminals=True)
+
+	# each node year is simulated once, instead of every year for every scenario
+	assert result.simulated_years == 3 + 2 * 2 + 4 * 2
+	assert list(result.leaves['leaf']) == ['0.0.0', '0.0.1', '0.1.0', '0.1.1']
+	assert np.isclose(result.expected(), result.leaves['output'].mean())
+
+	# we expect each leaf to end up where an uninterrupted run of its scenario ends up
+	for leaf, scenario_data in zip(result.leaves['leaf'], scenarios):
+		reference = terminal(scenario_data)
+		for year in years:
+			reference.startyear = year
+			reference.simulate()
+
+		branch = result.terminals[leaf]
+		assert branch.years == reference.years
+		assert len(branch.elements) == len(reference.elements)
+		assert opentisim.core.NPV(branch, None)['PV'].sum() == opentisim.core.NPV(reference, None)['PV'].sum()
+
+	# the template terminal is not simulated
+	assert Terminal.years == [] and len(Terminal.elements) == 4
+
+	# a tree can also be given node by node, with probabilities per branch
+	tree = opentisim.core.ScenarioNode(years[:3], volumes[0, :3], children=[
+		opentisim.core.ScenarioNode(years[3:], volumes[0, 3:], probability=0.25, name='low'),
+		opentisim.core.ScenarioNode(years[3:], volumes[1, 3:] * 2, probability=0.75, name='high')])
+	result = opentisim.core.run_scenario_tree(terminal(), tree)
+	assert list(result.leaves['leaf']) == ['low', 'high'] and list(result.leaves['probability']) == [0.25, 0.75]
+	assert result.simulated_years == 3 + 2 * 4
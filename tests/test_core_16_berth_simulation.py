@@ -0,0 +1,42 @@
+"""Tests for `opentisim` package."""
+
+def test_core_16_berth_simulation():
+	"""Test to see if the discrete-event berth simulation reproduces known queueing results and the waiting factors
+	of occupancy_to_waitingfactor, and if it gives the same waiting times with the same seed
+	"""
+
+	import numpy as np
+	import pytest
+	import opentisim
+
+	pytest.importorskip('simpy')
+
+	calls = {'Handysize': 120, 'Panamax': 60}
+	service_times = {'Handysize': 20, 'Panamax': 45}
+	result = opentisim.core.simulate_berths(calls, service_times, berths=2, operational_hours=5840, replications=20,
+											seed=1)
+	assert result.waiting_times.shape == (20, 180)
+	assert np.isclose(result.occupancy, (120 * 20 + 60 * 45) / (2 * 5840))
+	assert set(np.unique(result.vessel_types)) == {'Handysize', 'Panamax'}
+
+	# the waiting time distribution per vessel type and of all calls
+	percentiles = result.waiting_time_percentiles(q=(50, 95))
+	assert list(percentiles.index) == ['all', 'Handysize', 'Panamax']
+	assert (percentiles[95] >= percentiles[50]).all() and 0 < result.probability_of_waiting() < 1
+
+	# we expect the same waiting times with the same seed
+	again = opentisim.core.simulate_berths(calls, service_times, berths=2, operational_hours=5840, replications=20,
+										   seed=1)
+	assert np.array_equal(again.waiting_times, result.waiting_times)
+
+	# M/M/1 at an occupancy of 0.5: the mean waiting time equals the mean service time
+	mm1 = opentisim.core.simulate_berths({'vessel': 2000}, {'vessel': 1}, berths=1, operational_hours=4000,
+										 kendall='M/M/n', replications=20, seed=2)
+	factor, half_width = mm1.waiting_factor()
+	assert abs(factor - 1) < max(2 * half_width, 0.1)
+
+	# E2/E2/n: the simulated waiting factors are close to the table of Groenveld (2007)
+	comparison = opentisim.core.compare_waiting_factors(occupancies=(0.3, 0.7), berths=(1, 2), calls=1000,
+														replications=10, seed=3)
+	assert list(comparison.index) == [(1, 0.3), (1, 0.7), (2, 0.3), (2, 0.7)]
+	assert np.allclose(comparison['simulated'], comparison['table'], rtol=0.25, atol=0.01)
@@ -0,0 +1,77 @@
+"""Tests for `opentisim` package."""
+
+def test_drybulk_01_complete_lifecycle():
+	"""Test to see if the drybulk subpackage is loaded on first access and if a complete lifecycle of an agribulk
+	terminal can be simulated with the cached volume timeline, which follows changes of the demand scenario
+	"""
+
+	import sys
+	import pandas as pd
+	import opentisim
+
+	# the drybulk subpackage is loaded lazily
+	drybulk = opentisim.drybulk
+	assert 'opentisim.drybulk' in sys.modules
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 10
+	years = list(range(startyear, startyear + lifecycle))
+
+	demand = []
+	for year in years:
+		if year < 2023:
+			demand.append(750_000)
+		else:
+			demand.append(1_600_000)
+
+	# instantiate a commodity object
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': demand})
+
+	# instantiate vessels
+	handysize = drybulk.Vessel(**drybulk.handysize_data)
+	handymax = drybulk.Vessel(**drybulk.handymax_data)
+	panamax = drybulk.Vessel(**drybulk.panamax_data)
+
+	# define terminal
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize, handysize, handymax, panamax],
+		operational_hours=5840,
+		crane_type_defaults=drybulk.mobile_crane_data,
+		storage_type_defaults=drybulk.silo_data)
+
+	Terminal.simulate()
+
+	# the volume timeline holds the scenario of each commodity and is reused between calls
+	timeline = Terminal.volume_timeline()
+	assert timeline.shape == (1, lifecycle)
+	assert list(timeline[0]) == demand
+	assert Terminal.volume_timeline() is timeline
+
+	# we expect the terminal to have been developed and to have a value for each year of the lifecycle
+	assert Terminal.years == years
+	assert len(opentisim.core.find_elements(Terminal, drybulk.Berth)) > 0
+	assert len(opentisim.core.find_elements(Terminal, drybulk.Storage)) > 0
+	assert len(Terminal.revenues) == lifecycle
+
+	# the occupancy snapshot is reused until an element is added to the terminal
+	snapshot = Terminal.occupancy_snapshot(years[-1])
+	assert Terminal.occupancy_snapshot(years[-1]) is snapshot
+	assert Terminal.calculate_station_occupancy(years[-1]) == (
+		snapshot['station_occupancy_planned'], snapshot['station_occupancy_online'])
+
+	Terminal.crane_invest(years[-1])
+	assert Terminal.occupancy_snapshot(years[-1]) is not snapshot
+
+	# a new demand scenario (assigned or changed in place) is picked up by the timeline and the snapshots
+	snapshot = Terminal.occupancy_snapshot(years[-1])
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [5_000_000] * lifecycle})
+	assert list(Terminal.volume_timeline()[0]) == [5_000_000] * lifecycle
+	assert Terminal.calculate_volumes(years[1])[-1] == 5_000_000
+	assert Terminal.occupancy_snapshot(years[-1])['total_vol'] == 5_000_000
+
+	maize.scenario_data.loc[1, 'volume'] = 6_000_000
+	assert Terminal.calculate_volumes(years[1])[-1] == 6_000_000
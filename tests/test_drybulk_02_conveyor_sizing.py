@@ -0,0 +1,54 @@
+"""Tests for `opentisim` package."""
+
+def test_drybulk_02_conveyor_sizing():
+	"""Test to see if the quay and hinterland conveyors are sized in one step to at least match the planned quay
+	crane and unloading station capacity
+	"""
+
+	import pandas as pd
+	import opentisim
+
+	drybulk = opentisim.drybulk
+
+	# basic inputs
+	startyear = 2018
+	lifecycle = 10
+	years = list(range(startyear, startyear + lifecycle))
+
+	# instantiate a commodity object with a demand that requires a number of cranes and stations
+	maize = drybulk.Commodity(**drybulk.maize_data)
+	maize.scenario_data = pd.DataFrame(data={'year': years, 'volume': [2_000_000] * 5 + [5_000_000] * 5})
+
+	# define terminal
+	Terminal = drybulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[maize,
+				  drybulk.Vessel(**drybulk.handysize_data),
+				  drybulk.Vessel(**drybulk.handymax_data),
+				  drybulk.Vessel(**drybulk.panamax_data)],
+		crane_type_defaults=drybulk.mobile_crane_data)
+
+	# the number of conveyors follows from the capacity shortfall and the capacity steps
+	assert Terminal.conveyors_needed(800, 800, drybulk.quay_conveyor_data) == 0
+	assert Terminal.conveyors_needed(0, 801, drybulk.quay_conveyor_data) == 3
+
+	Terminal.simulate()
+
+	cranes = opentisim.core.find_elements(Terminal, drybulk.Cyclic_Unloader)
+	stations = opentisim.core.find_elements(Terminal, drybulk.Unloading_station)
+	conveyors_quay = opentisim.core.find_elements(Terminal, drybulk.Conveyor_Quay)
+	conveyors_hinter = opentisim.core.find_elements(Terminal, drybulk.Conveyor_Hinter)
+
+	# we expect just enough conveyor capacity to match the quay cranes and unloading stations
+	crane_capacity = sum(crane.peak_capacity for crane in cranes)
+	quay_conveyor_capacity = sum(conveyor.capacity_steps for conveyor in conveyors_quay)
+	assert crane_capacity <= quay_conveyor_capacity < crane_capacity + drybulk.quay_conveyor_data['capacity_steps']
+
+	station_capacity = sum(station.production for station in stations)
+	hinter_conveyor_capacity = sum(conveyor.capacity_steps for conveyor in conveyors_hinter)
+	assert station_capacity <= hinter_conveyor_capacity
+
+	# conveyors come online together with the quay cranes and each conveyor has its own cash flow data
+	assert set(conveyor.year_online for conveyor in conveyors_quay) <= set(crane.year_online for crane in cranes)
+	assert len(set(id(conveyor.df) for conveyor in conveyors_quay)) == len(conveyors_quay)
@@ -0,0 +1,65 @@
+"""Tests for `opentisim` package."""
+
+def test_liquidbulk_08_transport_cohorts():
+	"""Test to see if a fleet is represented by one element per year in which units are added and if the
+	cash flows of a cohort equal the cash flows of the individual units it represents
+	"""
+
+	import copy
+	import pandas as pd
+	import opentisim
+	from opentisim.liquidbulk import transport_plots
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 10
+	years = list(range(startyear, startyear + lifecycle))
+
+	# instantiate a commodity object
+	lhydrogen = opentisim.liquidbulk.Commodity(**opentisim.liquidbulk.commodity_lhydrogen_data)
+
+	# define terminal
+	Terminal = opentisim.liquidbulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[lhydrogen],
+		commodity_type_defaults=opentisim.liquidbulk.commodity_lhydrogen_data)
+	Terminal.modelframe = years
+	Terminal.years = years
+
+	# define the fleet development
+	dataframe_vessel = pd.DataFrame({'year': years, 'vessel count': [3, 3, 3, 5, 5, 8, 8, 8, 12, 12]})
+
+	seaborne_transport = transport_plots.vessel_objects(
+		Terminal, dataframe_vessel, opentisim.liquidbulk.largehydrogen_data, 10.5, 14)
+
+	# we expect one cohort per year in which vessels are added and 3 + 0 + 2 + 3 + 4 vessels in total
+	assert len(seaborne_transport) == 4
+	assert sum(cohort.count for cohort in seaborne_transport) == 12
+
+	# the cash flows of a cohort are the cash flows of a single vessel times the number of vessels
+	cohort = seaborne_transport[-1]
+	single = copy.deepcopy(cohort)
+	single.count = 1
+	single = transport_plots.cashflow_data(Terminal, single)
+	for column in ['capex', 'insurance', 'maintenance', 'labour', 'fuel']:
+		assert (cohort.df[column] - cohort.count * single.df[column]).abs().max() < 1e-6
+
+	# inland trucks are created as cohorts as well
+	Terminal.transport_sc2 = 'truck'
+	inland_transport = transport_plots.inland_objects(
+		Terminal, dataframe_vessel, opentisim.liquidbulk.truck_lh2_data, 2.0, 40, 300)
+
+	assert sum(cohort.count for cohort in inland_transport) == 12
+
+	# the first cohort holds the fleet of the first year, also when the fleet grows in the second year
+	dataframe_vessel = pd.DataFrame({'year': years[:3], 'vessel count': [2, 5, 5]})
+	seaborne_transport = transport_plots.vessel_objects(
+		Terminal, dataframe_vessel, opentisim.liquidbulk.largehydrogen_data, 10.5, 14)
+	assert [cohort.count for cohort in seaborne_transport] == [2, 3]
+
+	# a fleet of a single year is a single cohort
+	dataframe_vessel = pd.DataFrame({'year': years[:1], 'vessel count': [4]})
+	seaborne_transport = transport_plots.vessel_objects(
+		Terminal, dataframe_vessel, opentisim.liquidbulk.largehydrogen_data, 10.5, 14)
+	assert [cohort.count for cohort in seaborne_transport] == [4]
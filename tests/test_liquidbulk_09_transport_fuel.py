@@ -0,0 +1,46 @@
+"""Tests for `opentisim` package."""
+
+def test_liquidbulk_09_transport_fuel():
+	"""Test to see if the vectorized fuel model returns a fuel and cost matrix for a scan over vessel classes and
+	sailing speeds, and if it matches the fuel costs of the vessels created by vessel_objects
+	"""
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+	from opentisim.liquidbulk import transport_plots
+
+	# vessel classes and sailing speeds to scan
+	vessel_classes = [opentisim.liquidbulk.largehydrogen_data, opentisim.liquidbulk.largeammonia_data,
+					  opentisim.liquidbulk.vlcc_data]
+	call_size, ship_weight, DWT, gamma, fuelprice = transport_plots.class_parameters(
+		vessel_classes, 'call_size', 'ship_weight', 'DWT', 'gamma', 'fuelprice')
+	avspeed = np.array([20, 25, 30, 35])
+	distancekm = 9_000
+	durationdays = distancekm / avspeed / 24
+
+	fuel, cost = transport_plots.vessel_fuel(
+		call_size[:, None], ship_weight[:, None], DWT[:, None], gamma[:, None], fuelprice[:, None],
+		avspeed[None, :], durationdays[None, :], 10, 'Liquid hydrogen')
+
+	# we expect one row per vessel class and one column per speed, with fuel use increasing with speed
+	assert fuel.shape == (3, 4)
+	assert cost.shape == (3, 4)
+	assert np.all(np.diff(fuel, axis=1) > 0)
+
+	# a single vessel class at its design speed gives the fuel costs used by vessel_objects
+	lhydrogen = opentisim.liquidbulk.Commodity(**opentisim.liquidbulk.commodity_lhydrogen_data)
+	Terminal = opentisim.liquidbulk.System(
+		elements=[lhydrogen],
+		commodity_type_defaults=opentisim.liquidbulk.commodity_lhydrogen_data)
+	Terminal.modelframe = list(range(2020, 2030))
+
+	dataframe_vessel = pd.DataFrame({'year': Terminal.modelframe, 'vessel count': [1] * 10})
+	seaborne_transport = transport_plots.vessel_objects(
+		Terminal, dataframe_vessel, opentisim.liquidbulk.largehydrogen_data, 10.5, 14)
+
+	fuel, cost = transport_plots.vessel_fuel(
+		call_size[0], ship_weight[0], DWT[0], gamma[0], fuelprice[0],
+		opentisim.liquidbulk.largehydrogen_data['avspeed'], 10.5, 14, 'Liquid hydrogen')
+
+	assert seaborne_transport[0].fuel == cost
@@ -0,0 +1,46 @@
+"""Tests for `opentisim` package."""
+
+def test_liquidbulk_10_fleet_sizing():
+	"""Test to see if the fleet needed for a throughput timeline is derived and created as cohorts, without a
+	hand-computed vessel count
+	"""
+
+	import numpy as np
+	import opentisim
+	from opentisim.liquidbulk import transport_plots
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 10
+	years = list(range(startyear, startyear + lifecycle))
+
+	# instantiate a commodity object
+	lhydrogen = opentisim.liquidbulk.Commodity(**opentisim.liquidbulk.commodity_lhydrogen_data)
+
+	# define terminal
+	Terminal = opentisim.liquidbulk.ExportTerminal(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[lhydrogen],
+		commodity_type_defaults=opentisim.liquidbulk.commodity_lhydrogen_data)
+	Terminal.modelframe = years
+	Terminal.years = years
+
+	# throughput timeline with a dip in 2024
+	throughput = np.array([0, 500_000, 1_000_000, 1_000_000, 800_000, 2_000_000, 2_000_000, 2_000_000, 3_000_000,
+						   3_000_000])
+
+	vessel_defaults = opentisim.liquidbulk.largehydrogen_data
+	seaborne_transport, numberoftrips = transport_plots.seaborne_fleet(
+		Terminal, vessel_defaults, 12, throughput=throughput)
+
+	# the fleet in the last year must be able to transport the largest throughput
+	fleet = sum(cohort.count for cohort in seaborne_transport)
+	assert fleet == np.ceil(3_000_000 / (vessel_defaults['call_size'] * numberoftrips))
+	assert fleet * vessel_defaults['call_size'] * numberoftrips >= 3_000_000
+
+	# vessels are never retired: additions are non-negative and vessels come online in increasing years
+	assert all(cohort.count > 0 for cohort in seaborne_transport)
+	assert [cohort.year_online for cohort in seaborne_transport] == \
+		   sorted(cohort.year_online for cohort in seaborne_transport)
+	assert list(transport_plots.fleet_counts_to_additions([0, 2, 4, 3, 5])) == [0, 2, 2, 0, 1]
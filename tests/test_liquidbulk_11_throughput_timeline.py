@@ -0,0 +1,45 @@
+"""Tests for `opentisim` package."""
+
+def test_liquidbulk_11_throughput_timeline():
+	"""Test to see if the cached throughput timeline of a simulated liquid bulk terminal follows changes of the
+	demand scenario
+	"""
+
+	import numpy as np
+	import pandas as pd
+	import opentisim
+
+	liquidbulk = opentisim.liquidbulk
+
+	# basic inputs
+	startyear = 2020
+	lifecycle = 5
+	years = list(range(startyear, startyear + lifecycle))
+
+	commodity_data = dict(liquidbulk.commodity_lhydrogen_data, smallhydrogen_perc=50, largehydrogen_perc=50)
+	lhydrogen = liquidbulk.Commodity(**commodity_data)
+	lhydrogen.scenario_data = pd.DataFrame(data={'year': years, 'volume': [2_000_000] * lifecycle})
+	vessels = [liquidbulk.Vessel(**data) for data in [
+		liquidbulk.smallhydrogen_data, liquidbulk.largehydrogen_data, liquidbulk.smallammonia_data,
+		liquidbulk.largeammonia_data, liquidbulk.handysize_data, liquidbulk.panamax_data, liquidbulk.vlcc_data]]
+
+	Terminal = liquidbulk.System(
+		startyear=startyear,
+		lifecycle=lifecycle,
+		elements=[lhydrogen] + vessels,
+		commodity_type_defaults=commodity_data)
+	Terminal.modelframe = years
+	Terminal.revenues = []
+	Terminal.demurrage = []
+	Terminal.simulate()
+
+	timeline = Terminal.throughput_timeline().copy()
+	assert timeline.max() == 2_000_000
+
+	# we expect the timeline to follow a new scenario
+	lhydrogen.scenario_data = pd.DataFrame(data={'year': years, 'volume': [500_000] * lifecycle})
+	assert np.array_equal(Terminal.throughput_timeline(), np.where(timeline > 0, 500_000, 0))
+
+	# and a scenario that is changed in place
+	lhydrogen.scenario_data.loc[lhydrogen.scenario_data['year'] == years[-1], 'volume'] = 400_000
+	assert Terminal.throughput_timeline()[-1] == 400_000